@@ -0,0 +1,181 @@
+"""
+Benchmark: one-shot `httpx.post` calls vs the pooled `pytoil.api.API` client.
+
+Starts a local stub GraphQL server that counts accepted TCP connections and
+replays the request pattern of a few pytoil commands against it, once with
+a fresh connection per request (how the API used to work) and once through
+a single `API` instance.
+
+Usage:
+    python -m benchmarks.api_client [--rounds N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from pytoil.api import API, queries
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    import socket
+    from collections.abc import Callable
+
+REPO = {
+    "name": "pytoil",
+    "description": "CLI to automate the development workflow.",
+    "createdAt": "2021-02-04T15:05:23Z",
+    "pushedAt": "2021-12-27T13:31:53Z",
+    "diskUsage": 3153,
+    "licenseInfo": {"name": "Apache License 2.0"},
+    "primaryLanguage": {"name": "Python"},
+}
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.connections = 0
+        self.lock = threading.Lock()
+
+    def process_request(
+        self,
+        request: socket.socket | tuple[bytes, socket.socket],
+        client_address: tuple[str, int],
+    ) -> None:
+        with self.lock:
+            self.connections += 1
+        super().process_request(request, client_address)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/graphql"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the server honours keep-alive, and no Nagle so
+    # the headers and body don't sit waiting on a delayed ACK
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_POST(self) -> None:  # noqa: N802
+        length = int(self.headers.get("Content-Length", 0))
+        query: str = json.loads(self.rfile.read(length))["query"]
+
+        data: dict[str, Any] = (
+            {"user": {"repositories": {"nodes": [REPO] * 50}}}
+            if "repositories" in query
+            else {"repository": REPO}
+        )
+
+        body = json.dumps({"data": data}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+def one_shot(url: str) -> Callable[[str, dict[str, Any]], None]:
+    def send(query: str, variables: dict[str, Any]) -> None:
+        httpx.post(
+            url, json={"query": query, "variables": variables}
+        ).raise_for_status()
+
+    return send
+
+
+# The GraphQL calls each command makes, in order
+COMMANDS: dict[str, list[tuple[str, dict[str, Any]]]] = {
+    "info": [
+        (queries.CHECK_REPO_EXISTS, {"username": "me", "name": "pytoil"}),
+        (queries.GET_REPO_INFO, {"username": "me", "name": "pytoil"}),
+    ],
+    "checkout (typo)": [
+        (queries.CHECK_REPO_EXISTS, {"username": "me", "name": "pytoli"}),
+        (queries.GET_REPO_NAMES, {"username": "me", "limit": 50}),
+    ],
+    "checkout owner/repo": [
+        (queries.CHECK_REPO_EXISTS, {"username": "owner", "name": "repo"}),
+        (queries.CHECK_REPO_EXISTS, {"username": "me", "name": "repo"}),
+        (queries.CHECK_REPO_EXISTS, {"username": "me", "name": "repo"}),
+    ],
+}
+
+
+def run(
+    server: StubServer,
+    calls: list[tuple[str, dict[str, Any]]],
+    send: Callable[[str, dict[str, Any]], Any],
+    rounds: int,
+) -> tuple[int, float]:
+    before = server.connections
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query, variables in calls:
+            send(query, variables)
+    elapsed = time.perf_counter() - start
+    return server.connections - before, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    table = Table(title=f"API round trips ({args.rounds} runs per command)")
+    table.add_column("Command")
+    table.add_column("Requests", justify="right")
+    table.add_column("Connections (one-shot)", justify="right")
+    table.add_column("Connections (pooled)", justify="right")
+    table.add_column("Time (one-shot)", justify="right")
+    table.add_column("Time (pooled)", justify="right")
+
+    try:
+        for name, calls in COMMANDS.items():
+            conns_old, time_old = run(server, calls, one_shot(server.url), args.rounds)
+            # One API per command invocation, as the CLI does
+            conns_new, time_new = 0, 0.0
+            for _ in range(args.rounds):
+                with API(username="me", token="notatoken", url=server.url) as api:
+                    conns, elapsed = run(server, calls, api._query, 1)  # noqa: SLF001
+                conns_new += conns
+                time_new += elapsed
+
+            table.add_row(
+                name,
+                str(len(calls) * args.rounds),
+                str(conns_old),
+                str(conns_new),
+                f"{time_old * 1000:.1f} ms",
+                f"{time_new * 1000:.1f} ms",
+            )
+    finally:
+        server.shutdown()
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark: pytoil's API access patterns against a simulated GitHub.
+
+Runs the sync and async API clients against `tests.fake_github.FakeGitHub`
+with a fixed per-request latency standing in for the network round trip,
+so the effect of pagination, batching and concurrency on wall time can
+be compared without hitting the real API.
+
+Usage:
+    python -m benchmarks.api_fake_github [--repos N] [--latency SECONDS]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from pytoil.api import API, AsyncAPI
+from rich.console import Console
+from rich.table import Table
+
+from tests.fake_github import FakeGitHub
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def timed(github: FakeGitHub, func: Callable[[], Any]) -> tuple[int, float]:
+    before = len(github.requests)
+    start = time.perf_counter()
+    func()
+    return len(github.requests) - before, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+
+    github = FakeGitHub(latency=args.latency, rate_limit=1_000_000)
+    names = github.add_account("me", repos=args.repos)
+
+    sync_api = API(username="me", token="notatoken", transport=github.transport())
+
+    def check_one_by_one() -> None:
+        for name in names:
+            sync_api.check_repo_exists(owner="me", name=name)
+
+    def check_async() -> None:
+        async def run() -> None:
+            async with AsyncAPI(
+                username="me", token="notatoken", transport=github.async_transport()
+            ) as api:
+                await api.check_repos_exist(names)
+
+        asyncio.run(run())
+
+    scenarios: dict[str, Callable[[], Any]] = {
+        "list all repo names": sync_api.get_repo_names,
+        "list first 15 repos": lambda: list(sync_api.iter_repos(limit=15)),
+        "exists: one query per repo": check_one_by_one,
+        "exists: batched (sync)": lambda: sync_api.check_repos_exist(names),
+        "exists: batched (async)": check_async,
+    }
+
+    table = Table(
+        title=(
+            f"{args.repos} repos, {args.latency * 1000:.0f} ms simulated latency per"
+            " request"
+        )
+    )
+    table.add_column("Scenario")
+    table.add_column("Requests", justify="right")
+    table.add_column("Time", justify="right")
+
+    with sync_api:
+        for scenario, func in scenarios.items():
+            requests, elapsed = timed(github, func)
+            table.add_row(scenario, str(requests), f"{elapsed * 1000:.1f} ms")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
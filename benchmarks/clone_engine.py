@@ -0,0 +1,134 @@
+"""
+Benchmark: cloning many repos the way `pytoil pull` used to (every
+`Git.clone` submitted to a default `ThreadPoolExecutor`) vs through
+`pytoil.git.CloneEngine` at a few concurrency levels.
+
+The clone sources are local bare repos served over `file://` (so git
+goes through the same pack protocol it uses over the network), a couple
+of which don't exist to show which approaches notice failed clones.
+
+Usage:
+    python -m benchmarks.clone_engine [--repos N] [--files N] [--missing N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import humanize
+from pytoil.git import CloneEngine, CloneJob, Git
+from pytoil.git.git import GIT
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def make_source(root: Path, name: str, files: int) -> str:
+    work = root.joinpath("work", name)
+    work.mkdir(parents=True)
+    for i in range(files):
+        # Incompressible so the packs have some weight to them
+        work.joinpath(f"file-{i:04}.bin").write_bytes(os.urandom(4096))
+
+    def git(*args: str, cwd: Path = work) -> None:
+        subprocess.run([str(GIT), *args], cwd=cwd, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("add", "-A")
+    git(
+        "-c",
+        "user.name=bench",
+        "-c",
+        "user.email=bench@example.com",
+        "commit",
+        "-qm",
+        "x",
+    )
+    bare = root.joinpath("sources", f"{name}.git")
+    git("clone", "-q", "--bare", str(work), str(bare), cwd=root)
+    shutil.rmtree(work)
+    return bare.as_uri()
+
+
+def executor_pull(urls: list[str], dest: Path) -> tuple[int, int]:
+    # No way of knowing what failed, other than checking afterwards
+    git = Git()
+    with ThreadPoolExecutor() as executor:
+        for url in urls:
+            executor.submit(git.clone, url=url, cwd=dest)
+    return len(list(dest.iterdir())), 0
+
+
+def engine_pull(urls: list[str], dest: Path, concurrency: int) -> tuple[int, int]:
+    engine = CloneEngine(concurrency=concurrency)
+    results = engine.run(
+        CloneJob(name=url, url=url, dest=dest.joinpath(Path(url).stem)) for url in urls
+    )
+    return sum(r.ok for r in results), sum(not r.ok for r in results)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=32)
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--missing", type=int, default=2)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        urls = [
+            make_source(root, f"repo-{i:03}", args.files) for i in range(args.repos)
+        ]
+        urls += [
+            root.joinpath("sources", f"missing-{i}.git").as_uri()
+            for i in range(args.missing)
+        ]
+        size = sum(
+            f.stat().st_size for f in root.joinpath("sources").rglob("*") if f.is_file()
+        )
+
+        scenarios: dict[str, Callable[[Path], tuple[int, int]]] = {
+            "ThreadPoolExecutor + Git.clone": lambda d: executor_pull(urls, d),
+            "CloneEngine (1 at a time)": lambda d: engine_pull(urls, d, 1),
+            "CloneEngine (4 at a time)": lambda d: engine_pull(urls, d, 4),
+            "CloneEngine (8 at a time)": lambda d: engine_pull(urls, d, 8),
+        }
+
+        table = Table(
+            title=(
+                f"{args.repos} repos ({humanize.naturalsize(size, binary=True)} of"
+                f" sources) + {args.missing} missing"
+            )
+        )
+        table.add_column("Scenario")
+        table.add_column("Cloned", justify="right")
+        table.add_column("Failures reported", justify="right")
+        table.add_column("Time", justify="right")
+
+        for i, (scenario, func) in enumerate(scenarios.items()):
+            dest = root.joinpath(f"dest-{i}")
+            dest.mkdir()
+            start = time.perf_counter()
+            cloned, failed = func(dest)
+            elapsed = time.perf_counter() - start
+            table.add_row(scenario, str(cloned), str(failed), f"{elapsed:.2f} s")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Benchmark: fuzzy matching a query against lots of project names with
+thefuzz (what `find` and `checkout` used to do) vs `pytoil.search.Matcher`.
+
+Names are generated from a small vocabulary so plenty of them look
+alike, the way a big account with lots of forks does. thefuzz isn't a
+dependency any more, its row is skipped if it isn't installed.
+
+Usage:
+    python -m benchmarks.fuzzy_match [--names N] [--rounds N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pytoil.search import MatchCache, Matcher
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+WORDS = (
+    "py api cli django flask rust go web lib tool data ml app server client"
+    " core utils test docs toil"
+).split()
+
+QUERY = "pytoil"
+
+
+def make_names(count: int) -> set[str]:
+    rng = random.Random(0)
+    names: set[str] = set()
+    while len(names) < count:
+        words = rng.choices(WORDS, k=rng.randint(1, 3))
+        names.add("-".join(words) + str(rng.randint(0, 99_999)))
+    return names
+
+
+def timed(func: Callable[[], Any], rounds: int) -> float:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--names", type=int, default=50_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = MatchCache(Path(tmp, "matches.json"))
+
+        def cold_cache() -> list[tuple[str, float]]:
+            cache.clear()
+            return Matcher(names, cache=cache).extract(QUERY)
+
+        scenarios: dict[str, Callable[[], Any]] = {
+            "Matcher, no cache": lambda: Matcher(names).extract(QUERY),
+            "Matcher, cold cache": cold_cache,
+        }
+        # Warm the cache up once so every round is a hit
+        Matcher(names, cache=cache).extract(QUERY, limit=10)
+        scenarios["Matcher, warm cache"] = lambda: Matcher(names, cache=cache).extract(
+            QUERY, limit=10
+        )
+
+        try:
+            from thefuzz import process
+        except ImportError:
+            pass
+        else:
+            scenarios["thefuzz extractBests"] = lambda: process.extractBests(
+                QUERY, names, limit=5, score_cutoff=75
+            )
+
+        table = Table(title=f"{args.names} names, median of {args.rounds} rounds")
+        table.add_column("Scenario")
+        table.add_column("Time", justify="right")
+
+        for scenario, func in scenarios.items():
+            table.add_row(scenario, f"{timed(func, args.rounds) * 1000:.1f} ms")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: how long `pytoil --help` spends importing modules.
+
+Runs `python -X importtime -m pytoil --help` a few times, totals the
+import time attributable to pytoil (everything imported once the
+interpreter has finished starting up) and fails if the median is
+over budget, so that a stray top-level import of a heavy dependency
+shows up as a regression.
+
+Usage:
+    python -m benchmarks.import_time [--runs N] [--budget MS] [--top N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+from rich.console import Console
+from rich.table import Table
+
+# `pytoil --help` spent ~500 ms importing when every subcommand (and so
+# copier, httpx, questionary etc.) was imported up front and ~100 ms
+# once they're loaded lazily, leaving some headroom for slower machines
+DEFAULT_BUDGET_MS = 200.0
+
+
+def parse(stderr: str) -> list[tuple[str, int]]:
+    """
+    The top level imports triggered by pytoil and their cumulative
+    time in microseconds, from `-X importtime` output.
+    """
+    imports: list[tuple[str, int]] = []
+    started = False
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            # Nested import, already counted in its parent
+            continue
+        name = name.strip()
+        started = started or name.startswith("pytoil")
+        if started:
+            imports.append((name, int(cumulative)))
+    return imports
+
+
+def measure() -> list[tuple[str, int]]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pytoil", "--help"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse(result.stderr)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    runs = [measure() for _ in range(args.runs)]
+    totals = [sum(us for _, us in run) / 1000 for run in runs]
+    median = statistics.median(totals)
+
+    table = Table(title="Slowest top level imports for `pytoil --help` (last run)")
+    table.add_column("Module")
+    table.add_column("Cumulative", justify="right")
+    for name, us in sorted(runs[-1], key=lambda item: item[1], reverse=True)[
+        : args.top
+    ]:
+        table.add_row(name, f"{us / 1000:.1f} ms")
+
+    console = Console()
+    console.print(table)
+    console.print(
+        f"Median import time over {args.runs} runs: {median:.1f} ms"
+        f" (budget {args.budget:.0f} ms)"
+    )
+
+    if median > args.budget:
+        console.print("[bold red]Over budget![/]")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark: re-cloning repos straight from their source vs through
+`pytoil.git.MirrorCache`, cold (the mirrors have to be made first) and
+warm (the mirrors exist and only need an incremental fetch).
+
+The sources are local bare repos served over `file://`, so this measures
+the work git does rather than the network, which is where the mirror
+saves the most in practice.
+
+Usage:
+    python -m benchmarks.mirror_cache [--repos N] [--files N] [--commits N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+import humanize
+from pytoil.git import CloneEngine, CloneJob, MirrorCache
+from pytoil.git.git import GIT
+from rich.console import Console
+from rich.table import Table
+
+
+def make_source(root: Path, name: str, files: int, commits: int) -> str:
+    work = root.joinpath("work", name)
+    work.mkdir(parents=True)
+
+    def git(*args: str, cwd: Path = work) -> None:
+        subprocess.run([str(GIT), *args], cwd=cwd, check=True, capture_output=True)
+
+    git("init", "-q")
+    for commit in range(commits):
+        for i in range(files):
+            # Incompressible so the packs have some weight to them
+            work.joinpath(f"file-{i:04}.bin").write_bytes(os.urandom(1024))
+        git("add", "-A")
+        git(
+            "-c",
+            "user.name=bench",
+            "-c",
+            "user.email=bench@example.com",
+            "commit",
+            "-qm",
+            f"{commit}",
+        )
+    bare = root.joinpath("sources", f"{name}.git")
+    git("clone", "-q", "--bare", str(work), str(bare), cwd=root)
+    shutil.rmtree(work)
+    return bare.as_uri()
+
+
+def pull(urls: list[str], dest: Path, mirrors: MirrorCache | None) -> float:
+    engine = CloneEngine(mirrors=mirrors)
+    start = time.perf_counter()
+    results = engine.run(
+        CloneJob(name=url, url=url, dest=dest.joinpath(Path(url).stem)) for url in urls
+    )
+    elapsed = time.perf_counter() - start
+    if failed := [r.error for r in results if not r.ok]:
+        raise SystemExit(f"Clones failed: {failed}")
+    shutil.rmtree(dest)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=8)
+    parser.add_argument("--files", type=int, default=100)
+    parser.add_argument("--commits", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        urls = [
+            make_source(root, f"repo-{i:03}", args.files, args.commits)
+            for i in range(args.repos)
+        ]
+        size = sum(
+            f.stat().st_size for f in root.joinpath("sources").rglob("*") if f.is_file()
+        )
+        mirrors = MirrorCache(root=root.joinpath("mirrors"))
+        dest = root.joinpath("dest")
+
+        table = Table(
+            title=(
+                f"{args.repos} repos ({humanize.naturalsize(size, binary=True)} of"
+                " sources)"
+            )
+        )
+        table.add_column("Scenario")
+        table.add_column("Time", justify="right")
+
+        table.add_row("No mirror", f"{pull(urls, dest, None):.2f} s")
+        table.add_row("Mirror (cold)", f"{pull(urls, dest, mirrors):.2f} s")
+        table.add_row("Mirror (warm)", f"{pull(urls, dest, mirrors):.2f} s")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
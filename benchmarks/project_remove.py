@@ -0,0 +1,85 @@
+"""
+Benchmark: how long `pytoil remove` keeps you waiting, deleting projects
+with `shutil.rmtree` on a thread pool (the old way) vs moving them to
+`pytoil.projects.trash.Trash` (and purging later, which is timed too).
+
+Each project gets a `.venv`-like directory full of small files, which
+is what makes real projects slow to delete.
+
+Usage:
+    python -m benchmarks.project_remove [--projects N] [--files N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pytoil.projects.trash import Trash
+from rich.console import Console
+from rich.table import Table
+
+
+def make_projects(root: Path, projects: int, files: int) -> list[str]:
+    names: list[str] = []
+    for i in range(projects):
+        name = f"project-{i:03}"
+        for package in range(files // 100 or 1):
+            site = root.joinpath(name, ".venv", "lib", "site-packages", f"pkg{package}")
+            site.mkdir(parents=True)
+            for module in range(100):
+                site.joinpath(f"mod{module}.py").write_text("x = 1\n")
+        names.append(name)
+    return names
+
+
+def rmtree_pool(root: Path, names: list[str]) -> None:
+    with ThreadPoolExecutor() as executor:
+        for name in names:
+            executor.submit(shutil.rmtree, root.joinpath(name), ignore_errors=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--files", type=int, default=5000)
+    args = parser.parse_args()
+
+    table = Table(title=f"{args.projects} projects, {args.files} files each")
+    table.add_column("Scenario")
+    table.add_column("Time", justify="right")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp, "rmtree")
+        names = make_projects(root, args.projects, args.files)
+        start = time.perf_counter()
+        rmtree_pool(root, names)
+        table.add_row("rmtree on a thread pool", f"{time.perf_counter() - start:.3f} s")
+
+        root = Path(tmp, "trash")
+        names = make_projects(root, args.projects, args.files)
+        trash = Trash(root)
+        start = time.perf_counter()
+        trash.move(names)
+        table.add_row(
+            "Trash.move (what you wait for)", f"{time.perf_counter() - start:.3f} s"
+        )
+        start = time.perf_counter()
+        trash.purge()
+        table.add_row(
+            "Trash.purge (in the background)", f"{time.perf_counter() - start:.3f} s"
+        )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
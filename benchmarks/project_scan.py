@@ -0,0 +1,102 @@
+"""
+Benchmark: listing the projects directory with `Path.iterdir` vs
+`pytoil.projects.scan`.
+
+Creates a projects directory full of synthetic (empty) projects plus a
+sprinkling of hidden directories and plain files, then times how each
+approach lists the project names and gathers the stat data `show local`
+needs.
+
+Usage:
+    python -m benchmarks.project_scan [--projects N] [--rounds N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pytoil.config import Config
+from pytoil.projects import LocalProjects
+from pytoil.projects.scan import scan
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def populate(root: Path, projects: int) -> None:
+    for i in range(projects):
+        root.joinpath(f"project-{i:05}").mkdir()
+        if i % 100 == 0:
+            root.joinpath(f".hidden-{i:05}").mkdir()
+            root.joinpath(f"notes-{i:05}.txt").touch()
+
+
+def iterdir_names(root: Path) -> set[str]:
+    # What every local command did before the scanner existed
+    return {f.name for f in root.iterdir() if f.is_dir() and not f.name.startswith(".")}
+
+
+def iterdir_stats(root: Path) -> dict[Path, Any]:
+    # What `show local` did: list, then stat every project again
+    projects = {f for f in root.iterdir() if f.is_dir() and not f.name.startswith(".")}
+    return {project: project.stat() for project in projects}
+
+
+def timed(func: Callable[[], Any], rounds: int) -> float:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp).joinpath("projects")
+        root.mkdir()
+        populate(root, args.projects)
+
+        index = Path(tmp).joinpath("projects.sqlite3")
+        config = Config(projects_dir=root)
+        # Build the index up front, the benchmark measures a warm start
+        LocalProjects(config, index=index).names()
+
+        scenarios: dict[str, Callable[[], Any]] = {
+            "names: Path.iterdir": lambda: iterdir_names(root),
+            "names: scan": lambda: {entry.name for entry in scan(root)},
+            "names + stat: Path.iterdir": lambda: iterdir_stats(root),
+            "names + stat: scan": lambda: list(scan(root)),
+            "LocalProjects (warm index)": lambda: LocalProjects(
+                config, index=index
+            ).projects(),
+        }
+
+        table = Table(title=f"{args.projects} projects, median of {args.rounds} rounds")
+        table.add_column("Scenario")
+        table.add_column("Time", justify="right")
+
+        for scenario, func in scenarios.items():
+            table.add_row(scenario, f"{timed(func, args.rounds) * 1000:.1f} ms")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
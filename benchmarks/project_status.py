@@ -0,0 +1,116 @@
+"""
+Benchmark: getting the status of lots of local projects one at a time
+the obvious way (separate git calls for the branch, ahead/behind,
+changes and stashes) vs `pytoil.git.status.collect` (one porcelain v2
+status per project, on a pool of threads).
+
+Usage:
+    python -m benchmarks.project_status [--projects N] [--files N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytoil.git.git import GIT
+from pytoil.git.status import DEFAULT_CONCURRENCY, collect
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def git(*args: str, cwd: Path) -> str:
+    return subprocess.run(
+        [str(GIT), *args], cwd=cwd, capture_output=True, text=True
+    ).stdout
+
+
+def make_projects(root: Path, projects: int, files: int) -> list[tuple[str, Path]]:
+    # One real repo, copied, is much quicker to set up than hundreds of
+    # `git init`s and gives each copy exactly the same amount of work
+    template = root.joinpath("template")
+    template.mkdir()
+    for i in range(files):
+        template.joinpath(f"file-{i:04}.txt").write_text(f"{i}\n", encoding="utf-8")
+    git("init", "-q", cwd=template)
+    git("add", "-A", cwd=template)
+    git(
+        "-c",
+        "user.name=bench",
+        "-c",
+        "user.email=bench@example.com",
+        "commit",
+        "-qm",
+        "x",
+        cwd=template,
+    )
+
+    dest = root.joinpath("projects")
+    dest.mkdir()
+    made: list[tuple[str, Path]] = []
+    for i in range(projects):
+        path = dest.joinpath(f"project-{i:04}")
+        shutil.copytree(template, path, symlinks=True)
+        if i % 3 == 0:
+            path.joinpath("file-0000.txt").write_text("changed\n", encoding="utf-8")
+        made.append((path.name, path))
+    return made
+
+
+def one_at_a_time(projects: list[tuple[str, Path]]) -> int:
+    for _, path in projects:
+        git("rev-parse", "--abbrev-ref", "HEAD", cwd=path)
+        git("rev-list", "--left-right", "--count", "HEAD...@{upstream}", cwd=path)
+        git("status", "--porcelain", cwd=path)
+        git("stash", "list", cwd=path)
+        git("log", "-1", "--format=%ct", cwd=path)
+    return len(projects)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--projects", type=int, default=500)
+    parser.add_argument("--files", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        projects = make_projects(Path(tmp), args.projects, args.files)
+
+        scenarios: dict[str, Callable[[], int]] = {
+            "5 git calls each, one at a time": lambda: one_at_a_time(projects),
+            f"collect ({DEFAULT_CONCURRENCY} at a time)": lambda: len(
+                list(collect(projects))
+            ),
+            f"collect ({DEFAULT_CONCURRENCY} at a time, fsmonitor)": lambda: len(
+                list(collect(projects, fsmonitor=True))
+            ),
+        }
+
+        table = Table(title=f"{args.projects} projects, {args.files} files each")
+        table.add_column("Scenario")
+        table.add_column("Projects", justify="right")
+        table.add_column("Time", justify="right")
+
+        for scenario, func in scenarios.items():
+            start = time.perf_counter()
+            count = func()
+            elapsed = time.perf_counter() - start
+            table.add_row(scenario, str(count), f"{elapsed:.2f} s")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
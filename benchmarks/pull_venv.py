@@ -0,0 +1,132 @@
+"""
+Benchmark: cloning a batch of projects and creating their environments
+one after the other (clone everything, then install each in turn, i.e.
+`pytoil pull` followed by `pytoil checkout --venv` by hand) vs
+`pytoil pull --venv`, which creates environments on their own pool while
+the clones are still going.
+
+Each project is a local bare repo (served over `file://`) with a
+requirements.txt, so the installs need the network but the clones don't.
+pip's cache is left alone and the first round warms it.
+
+Usage:
+    python -m benchmarks.pull_venv [--repos N] [--packages PKG ...]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytoil.environments import Requirements
+from pytoil.environments.provision import Provisioner
+from pytoil.git import CloneEngine, CloneJob
+from pytoil.git.git import GIT
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+PACKAGES = ["requests", "rich", "attrs", "click"]
+
+
+def make_source(root: Path, name: str, packages: list[str]) -> str:
+    work = root.joinpath("work", name)
+    work.mkdir(parents=True)
+    work.joinpath("requirements.txt").write_text("\n".join(packages) + "\n")
+
+    def git(*args: str, cwd: Path = work) -> None:
+        subprocess.run([str(GIT), *args], cwd=cwd, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("add", "-A")
+    git(
+        "-c",
+        "user.name=bench",
+        "-c",
+        "user.email=bench@example.com",
+        "commit",
+        "-qm",
+        "x",
+    )
+    bare = root.joinpath("sources", f"{name}.git")
+    git("clone", "-q", "--bare", str(work), str(bare), cwd=root)
+    shutil.rmtree(work)
+    return bare.as_uri()
+
+
+def jobs(urls: list[str], dest: Path) -> list[CloneJob]:
+    return [
+        CloneJob(name=Path(url).stem, url=url, dest=dest.joinpath(Path(url).stem))
+        for url in urls
+    ]
+
+
+def one_after_the_other(urls: list[str], dest: Path) -> tuple[float, float]:
+    start = time.perf_counter()
+    results = CloneEngine().run(jobs(urls, dest))
+    cloned = time.perf_counter() - start
+    for result in results:
+        Requirements(root=result.job.dest).install_self(silent=True)
+    return cloned, time.perf_counter() - start
+
+
+def pipelined(urls: list[str], dest: Path, venv_jobs: int) -> tuple[float, float]:
+    start = time.perf_counter()
+    with Provisioner(concurrency=venv_jobs) as provisioner:
+        engine = CloneEngine(
+            on_done=lambda result: provisioner.submit(
+                result.job.name, Requirements(root=result.job.dest)
+            )
+        )
+        engine.run(jobs(urls, dest))
+        cloned = time.perf_counter() - start
+    return cloned, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repos", type=int, default=6)
+    parser.add_argument("--packages", nargs="+", default=PACKAGES)
+    args = parser.parse_args()
+
+    table = Table(title=f"{args.repos} projects, each installing {len(args.packages)}")
+    table.add_column("Approach")
+    table.add_column("Clones done", justify="right")
+    table.add_column("Everything done", justify="right")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        urls = [
+            make_source(root, f"repo-{i:02}", args.packages) for i in range(args.repos)
+        ]
+
+        # Warm pip's cache so every row downloads the same (nothing)
+        one_after_the_other(urls[:1], root.joinpath("warm"))
+
+        scenarios: dict[str, Callable[[Path], tuple[float, float]]] = {
+            "One after the other": lambda dest: one_after_the_other(urls, dest),
+            "pull --venv, 1 install at once": lambda dest: pipelined(urls, dest, 1),
+            "pull --venv, 2 installs at once": lambda dest: pipelined(urls, dest, 2),
+        }
+        for name, scenario in scenarios.items():
+            dest = root.joinpath(name.replace(" ", "-"))
+            dest.mkdir()
+            cloned, total = scenario(dest)
+            table.add_row(name, f"{cloned:.2f} s", f"{total:.2f} s")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
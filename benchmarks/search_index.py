@@ -0,0 +1,87 @@
+"""
+Benchmark: what each keystroke costs in `pytoil find --interactive`,
+querying `pytoil.search.NameIndex` vs rescoring every name with
+`pytoil.search.Matcher` (or thefuzz, if it's installed).
+
+Every prefix of the query is searched in turn, as if it were being typed.
+
+Usage:
+    python -m benchmarks.search_index [--names N] [--query TEXT] [--rounds N]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import TYPE_CHECKING, Any
+
+from pytoil.search import Matcher, NameIndex
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.fuzzy_match import make_names
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def per_keystroke(search: Callable[[str], Any], query: str, rounds: int) -> float:
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for end in range(1, len(query) + 1):
+            search(query[:end])
+    return (time.perf_counter() - start) / (rounds * len(query))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--names", type=int, default=50_000)
+    parser.add_argument("--query", default="pytoil")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    names = make_names(args.names)
+
+    start = time.perf_counter()
+    index = NameIndex(names)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    index.warm()
+    warm = time.perf_counter() - start
+    matcher = Matcher(names)
+
+    scenarios: dict[str, Callable[[str], Any]] = {
+        "NameIndex.search": lambda text: index.search(text, limit=15),
+        "Matcher.extract": lambda text: matcher.extract(text, limit=15),
+    }
+    try:
+        from thefuzz import process
+    except ImportError:
+        pass
+    else:
+        scenarios["thefuzz extractBests"] = lambda text: process.extractBests(
+            text, names, limit=15
+        )
+
+    table = Table(title=f"{args.names} names, typing {args.query!r}")
+    table.add_column("Scenario")
+    table.add_column("Per keystroke", justify="right")
+
+    table.add_row("NameIndex build (once)", f"{build * 1000:.1f} ms")
+    table.add_row("NameIndex.warm (once, in the background)", f"{warm * 1000:.1f} ms")
+    for scenario, search in scenarios.items():
+        # thefuzz is far too slow to repeat as often as the others
+        rounds = 1 if scenario.startswith("thefuzz") else args.rounds
+        table.add_row(
+            scenario, f"{per_keystroke(search, args.query, rounds) * 1000:.3f} ms"
+        )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
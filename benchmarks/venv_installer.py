@@ -0,0 +1,204 @@
+"""
+Benchmark: creating the python environments pytoil makes, with pip
+(and virtualenv) vs uv as the installer.
+
+* python starter: `pytoil new --starter python --venv venv`, a Venv with
+  the usual toolchain as common_packages.
+* PEP 621 project: `pytoil checkout --venv` of a setuptools project,
+  Venv.install_self i.e. `install -e .[dev]`.
+* flit project: `pytoil checkout --venv` of a flit project, flit itself
+  does the installing so only creating the environment changes.
+* requirements heavy: `pytoil checkout --venv` of a project with a long
+  requirements.txt.
+
+No wheelhouse, so it's the installers alone. Each is run `--repeat` times
+and the best kept, the first run fills pip's and uv's caches so the best
+is what you'd see day to day. Needs the network, and uv and flit on $PATH
+(or passed with --uv / --flit), rows needing one that isn't found are skipped.
+Every environment is checked for pytest afterwards, which all of them
+install, so a failed install can't pass for a fast one.
+
+Usage:
+    python -m benchmarks.venv_installer [--repeat N] [--uv PATH] [--flit PATH]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import shutil
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pytoil.environments import Environment, Flit, Requirements, Venv
+from pytoil.environments.installer import Pip, Uv
+from pytoil.starters import PythonStarter
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pytoil.environments.installer import Installer
+
+TOOLCHAIN = ["black", "mypy", "pytest", "ruff", "isort"]
+
+HEAVY_REQUIREMENTS = [
+    "django",
+    "djangorestframework",
+    "flask",
+    "sqlalchemy",
+    "alembic",
+    "pydantic",
+    "httpx",
+    "requests",
+    "boto3",
+    "celery",
+    "redis",
+    "rich",
+    "typer",
+    "sphinx",
+    "pytest",
+    "pytest-cov",
+    "hypothesis",
+    "mypy",
+    "black",
+    "ruff",
+]
+
+PEP621_PYPROJECT = """\
+[build-system]
+requires = ["setuptools>=61"]
+build-backend = "setuptools.build_meta"
+
+[project]
+name = "demo"
+version = "0.1.0"
+dependencies = ["httpx", "rich"]
+
+[project.optional-dependencies]
+dev = ["pytest", "mypy"]
+"""
+
+FLIT_PYPROJECT = """\
+[build-system]
+requires = ["flit_core>=3.4"]
+build-backend = "flit_core.buildapi"
+
+[project]
+name = "demo"
+version = "0.1.0"
+description = "Demo"
+dependencies = ["httpx", "rich"]
+
+[project.optional-dependencies]
+dev = ["pytest", "mypy"]
+"""
+
+
+def python_starter(root: Path, installer: Installer, _: str | None) -> Environment:
+    PythonStarter(path=root, name="starter").generate()
+    env = Venv(root=root / "starter", installer=installer)
+    env.create(packages=TOOLCHAIN, silent=True)
+    return env
+
+
+def pep621(root: Path, installer: Installer, _: str | None) -> Environment:
+    project = root / "demo"
+    project.joinpath("demo").mkdir(parents=True)
+    project.joinpath("demo", "__init__.py").write_text('"""Demo."""\n')
+    project.joinpath("pyproject.toml").write_text(PEP621_PYPROJECT)
+    env = Venv(root=project, installer=installer)
+    env.install_self(silent=True)
+    return env
+
+
+def flit_project(root: Path, installer: Installer, flit: str | None) -> Environment:
+    project = root / "demo"
+    project.mkdir()
+    project.joinpath("demo.py").write_text('"""Demo."""\n\n__version__ = "0.1.0"\n')
+    project.joinpath("pyproject.toml").write_text(FLIT_PYPROJECT)
+    env = Flit(root=project, flit=flit, installer=installer)
+    env.install_self(silent=True)
+    return env
+
+
+def requirements_heavy(root: Path, installer: Installer, _: str | None) -> Environment:
+    project = root / "heavy"
+    project.mkdir()
+    project.joinpath("requirements.txt").write_text("\n".join(HEAVY_REQUIREMENTS))
+    env = Requirements(root=project, installer=installer)
+    env.install_self(silent=True)
+    return env
+
+
+SCENARIOS: dict[str, Callable[[Path, Installer, str | None], Environment]] = {
+    "python starter": python_starter,
+    "PEP 621 project": pep621,
+    "flit project": flit_project,
+    f"requirements heavy ({len(HEAVY_REQUIREMENTS)})": requirements_heavy,
+}
+
+
+def best_of(
+    scenario: Callable[[Path, Installer, str | None], Environment],
+    installer: Installer,
+    flit: str | None,
+    repeat: int,
+) -> float:
+    times: list[float] = []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            env = scenario(Path(tmp), installer, flit)
+            times.append(time.perf_counter() - start)
+            check = subprocess.run(
+                [f"{env.executable}", "-m", "pip", "show", "--quiet", "pytest"],
+                capture_output=True,
+            )
+            if check.returncode != 0:
+                raise SystemExit(f"{installer.name} didn't install {env.project_path}")
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--uv", default=shutil.which("uv"))
+    parser.add_argument("--flit", default=shutil.which("flit"))
+    args = parser.parse_args()
+
+    installers: list[Installer] = [Pip()]
+    if args.uv:
+        installers.append(Uv(uv=args.uv))
+
+    table = Table(title=f"Creating environments, best of {args.repeat}")
+    table.add_column("Project")
+    for installer in installers:
+        table.add_column(installer.name, justify="right")
+    if len(installers) > 1:
+        table.add_column("Speedup", justify="right")
+
+    for name, scenario in SCENARIOS.items():
+        if scenario is flit_project and not args.flit:
+            continue
+        times = [
+            best_of(scenario, installer, args.flit, args.repeat)
+            for installer in installers
+        ]
+        row = [name, *(f"{t:.2f} s" for t in times)]
+        if len(times) > 1:
+            row.append(f"{times[0] / times[1]:.1f}x")
+        table.add_row(*row)
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Benchmark: the virtual environment `pytoil new --venv venv` makes,
+created from scratch vs cloned from a template with the common packages
+already installed.
+
+The first clone has to build the template too, every one after that is
+just the clone. No wheelhouse, and pip's cache is left alone. Needs the
+network for the from scratch and first clone rows.
+
+Usage:
+    python -m benchmarks.venv_templates [--packages PKG ...]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pytoil.environments import Venv, VenvTemplates
+from rich.console import Console
+from rich.table import Table
+
+TOOLCHAIN = ["black", "mypy", "pytest", "ruff", "isort"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--packages", nargs="+", default=TOOLCHAIN)
+    args = parser.parse_args()
+
+    table = Table(title=f"A new venv with {', '.join(args.packages)}")
+    table.add_column("Scenario")
+    table.add_column("Time", justify="right")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+
+        project = root.joinpath("scratch")
+        project.mkdir()
+        start = time.perf_counter()
+        Venv(root=project).create(packages=args.packages, silent=True)
+        table.add_row("From scratch", f"{time.perf_counter() - start:.2f} s")
+
+        templates = VenvTemplates(root.joinpath("templates"))
+        for scenario in ("First clone (builds the template)", "Clone"):
+            project = root.joinpath(scenario)
+            project.mkdir()
+            start = time.perf_counter()
+            method = templates.clone(
+                args.packages, project.joinpath(".venv"), silent=True
+            )
+            elapsed = time.perf_counter() - start
+            if not method:
+                raise SystemExit("Could not build the template")
+            table.add_row(f"{scenario}, {method}", f"{elapsed:.2f} s")
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
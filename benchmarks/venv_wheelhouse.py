@@ -0,0 +1,69 @@
+"""
+Benchmark: creating a virtual environment with a set of packages the
+way `pytoil new --venv venv` does, without a wheelhouse vs with a warm one.
+
+Needs the network for everything except the warm run. pip's own HTTP
+cache is left alone, so the "no wheelhouse" row is what you'd see day to
+day rather than on a brand new machine.
+
+Usage:
+    python -m benchmarks.venv_wheelhouse [--packages PKG ...]
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from pytoil.environments import Venv, Wheelhouse
+from rich.console import Console
+from rich.table import Table
+
+TOOLCHAIN = ["black", "mypy", "pytest", "ruff", "isort"]
+
+
+def create(root: Path, packages: list[str], wheelhouse: Wheelhouse | None) -> float:
+    root.mkdir()
+    start = time.perf_counter()
+    Venv(root=root, wheelhouse=wheelhouse).create(packages=packages, silent=True)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--packages", nargs="+", default=TOOLCHAIN)
+    args = parser.parse_args()
+
+    table = Table(title=f"Venv.create with {', '.join(args.packages)}")
+    table.add_column("Scenario")
+    table.add_column("Time", justify="right")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        table.add_row(
+            "No wheelhouse",
+            f"{create(Path(tmp, 'plain'), args.packages, None):.2f} s",
+        )
+
+        house = Wheelhouse(Path(tmp, "wheels"))
+        start = time.perf_counter()
+        error = house.build(args.packages)
+        if error:
+            raise SystemExit(error)
+        table.add_row("Wheelhouse.build (once)", f"{time.perf_counter() - start:.2f} s")
+
+        table.add_row(
+            "Warm wheelhouse",
+            f"{create(Path(tmp, 'warm'), args.packages, house):.2f} s",
+        )
+
+    Console().print(table)
+
+
+if __name__ == "__main__":
+    main()
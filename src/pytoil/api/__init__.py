@@ -1,5 +1,17 @@
 from __future__ import annotations
 
 from pytoil.api.api import API
+from pytoil.api.async_api import AsyncAPI, bounded_gather
+from pytoil.api.cache import ResponseCache
+from pytoil.api.pagination import AsyncPaginator, Paginator
+from pytoil.api.ratelimit import RateLimiter
 
-__all__ = ("API",)
+__all__ = (
+    "API",
+    "AsyncAPI",
+    "AsyncPaginator",
+    "Paginator",
+    "RateLimiter",
+    "ResponseCache",
+    "bounded_gather",
+)
@@ -9,35 +9,81 @@ Created: 21/12/2021
 
 from __future__ import annotations
 
+import functools
+import time
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 import humanize
 
 from pytoil import __version__
 from pytoil.api import queries
+from pytoil.api.pagination import Paginator
+from pytoil.api.ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from types import TracebackType
+
+    from pytoil.api.cache import ResponseCache
+
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
 
 URL = "https://api.github.com/graphql"
+REST_URL = "https://api.github.com"
 GITHUB_TIME_FORMAT = r"%Y-%m-%dT%H:%M:%SZ"
-DEFAULT_REPO_LIMIT = 50
-
 
-class API:
-    def __init__(self, username: str, token: str, url: str = URL) -> None:
+# Repos per aliased existence query, keeps each request comfortably
+# inside GitHub's node and query complexity limits
+EXISTS_BATCH_SIZE = 50
+
+# Commands make a handful of requests to the same host in quick succession
+# so a small pool of kept-alive connections is all we need
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=10, max_keepalive_connections=5, keepalive_expiry=30
+)
+
+
+class BaseAPI:
+    def __init__(
+        self,
+        username: str,
+        token: str,
+        url: str = URL,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        limiter: RateLimiter | None = None,
+    ) -> None:
         """
-        Container for methods and data for hitting the GitHub v4
-        GraphQL API.
+        Configuration and response handling shared by the sync
+        and async API clients.
 
         Args:
             username (str): User's GitHub username.
             token (str): User's personal access token.
             url (str, optional): GraphQL URL
                 defaults to https://api.github.com/graphql
+            limits (httpx.Limits, optional): Connection pool limits.
+                Defaults to DEFAULT_LIMITS.
+            http2 (bool, optional): Whether to negotiate HTTP/2, requires
+                the `h2` package to be installed. Defaults to False.
+            cache (ResponseCache | None, optional): Where to cache repo listings,
+                None disables caching. Defaults to None.
+            limiter (RateLimiter | None, optional): Paces requests and retries
+                throttled ones. Defaults to None (a default `RateLimiter`).
         """
         self.username = username
         self.token = token
         self.url = url
+        self.limits = limits
+        self.http2 = http2
+        self.cache = cache
+        self.limiter = limiter or RateLimiter()
 
     def __repr__(self) -> str:
         return (
@@ -45,7 +91,15 @@ class API:
             + f"(username={self.username}, token={self.token}, url={self.url})"
         )
 
-    __slots__ = ("username", "token", "url")
+    __slots__ = ("username", "token", "url", "limits", "http2", "cache", "limiter")
+
+    @property
+    def remaining(self) -> int | None:
+        """
+        The rate limit budget GitHub last reported, None before
+        the first response.
+        """
+        return self.limiter.remaining
 
     @property
     def headers(self) -> dict[str, str]:
@@ -55,94 +109,369 @@ class API:
             "Accept": "application/vnd.github.v4+json",
         }
 
-    def get_repos(self, limit: int = DEFAULT_REPO_LIMIT) -> list[dict[str, Any]] | None:
+    @property
+    def rest_headers(self) -> dict[str, str]:
         """
-        Gets some summary info for all the users repos.
+        Headers for the v3 REST API, used for the few things
+        GraphQL can't do (e.g. forking).
+        """
+        return {**self.headers, "Accept": "application/vnd.github.v3+json"}
 
-        Args:
-            limit (int, optional): Maximum number of repos to return.
-                Defaults to DEFAULT_REPO_LIMIT.
+    def _cache_key(self, query: str, variables: dict[str, Any]) -> str | None:
+        """
+        The key to cache a query's response under, or None if
+        caching is disabled.
+        """
+        if self.cache is None:
+            return None
+        return self.cache.key(self.url, self.token, query, variables)
 
-        Returns:
-            list[dict[str, Any]]: The repos info.
+    @staticmethod
+    def fork_url(owner: str, repo: str) -> str:
+        return f"{REST_URL}/repos/{owner}/{repo}/forks"
+
+    @staticmethod
+    def _connection(raw: dict[str, Any]) -> dict[str, Any]:
         """
-        r = httpx.post(
-            self.url,
-            json={
-                "query": queries.GET_REPOS,
-                "variables": {"username": self.username, "limit": limit},
-            },
-            headers=self.headers,
-        )
+        Pull the user's `repositories` connection out of a GraphQL response.
 
-        r.raise_for_status()
-        raw: dict[str, Any] = r.json()
+        Raises:
+            ValueError: If the GraphQL query is malformed.
+        """
+        if data := raw.get("data"):
+            connection: dict[str, Any] = data["user"]["repositories"]
+            return connection
+
+        raise ValueError(f"Bad GraphQL: {raw}")  # pragma: no cover
 
+    @staticmethod
+    def _exists(raw: dict[str, Any]) -> bool:
+        """
+        Whether a `repository` lookup found anything.
+
+        Raises:
+            ValueError: If the GraphQL query is malformed.
+        """
         if data := raw.get("data"):
-            return list(data["user"]["repositories"]["nodes"])
+            if data["repository"] is None:
+                return False
+
+            return True
+
+        raise ValueError(f"Bad GraphQL: {raw}")  # pragma: no cover
+
+    def _split_name(self, name: str) -> tuple[str, str]:
+        """
+        Split `owner/repo` into its parts, a bare `repo` is taken
+        to belong to the current user.
+        """
+        owner, _, repo = name.rpartition("/")
+        return owner or self.username, repo
+
+    def _batch_variables(self, names: Sequence[str]) -> dict[str, str]:
+        """
+        Variables for a `queries.check_repos_exist` query over `names`.
+        """
+        variables: dict[str, str] = {}
+        for i, name in enumerate(names):
+            variables[f"owner{i}"], variables[f"name{i}"] = self._split_name(name)
+        return variables
+
+    @staticmethod
+    def _batch_exists(names: Sequence[str], raw: dict[str, Any]) -> dict[str, bool]:
+        """
+        Map each of `names` to whether its aliased lookup found anything.
+
+        Raises:
+            ValueError: If the GraphQL query is malformed.
+        """
+        if (data := raw.get("data")) is None:
+            raise ValueError(f"Bad GraphQL: {raw}")  # pragma: no cover
+
+        return {name: data.get(f"r{i}") is not None for i, name in enumerate(names)}
+
+    @staticmethod
+    def _humanize_datetime(dt: str) -> str:
+        """
+        Takes a string datetime of GITHUB_TIME_FORMAT
+        and converts it to our STR_TIME_FORMAT.
+        """
+        s: str = humanize.naturaltime(
+            datetime.strptime(dt, GITHUB_TIME_FORMAT), when=datetime.utcnow()
+        )
+        return s
 
+    def _repo_info(self, raw: dict[str, Any]) -> dict[str, Any] | None:
+        """
+        Format the response to a `GET_REPO_INFO` query, or None if
+        the repo wasn't found.
+        """
+        if data := raw.get("data"):
+            if repo := data.get("repository"):
+                return {
+                    "Name": repo["name"],
+                    "Description": repo["description"],
+                    "Created": self._humanize_datetime(repo["createdAt"]),
+                    "Updated": self._humanize_datetime(repo["pushedAt"]),
+                    "Size": humanize.naturalsize(
+                        int(repo["diskUsage"]) * 1024
+                    ),  # diskUsage is in kB
+                    "License": (
+                        repo["licenseInfo"]["name"] if repo.get("licenseInfo") else None
+                    ),
+                    "Language": repo["primaryLanguage"]["name"],
+                    "Remote": True,
+                }
+            return None
         return None  # pragma: no cover
 
-    def get_repo_names(self, limit: int = DEFAULT_REPO_LIMIT) -> set[str]:
+
+class API(BaseAPI):
+    def __init__(
+        self,
+        username: str,
+        token: str,
+        url: str = URL,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        limiter: RateLimiter | None = None,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
         """
-        Gets the names of all repos owned by the authenticated user.
+        Container for methods and data for hitting the GitHub v4
+        GraphQL API.
+
+        All requests go through a single pooled `httpx.Client` so
+        consecutive calls reuse the same TCP/TLS connection. The client
+        is created on first use and should be closed when done, either
+        with `.close()` or by using the API as a context manager.
 
         Args:
-            limit (int, optional): Maximum number of repos to return.
-                Defaults to DEFAULT_REPO_LIMIT.
+            username (str): User's GitHub username.
+            token (str): User's personal access token.
+            url (str, optional): GraphQL URL
+                defaults to https://api.github.com/graphql
+            limits (httpx.Limits, optional): Connection pool limits.
+                Defaults to DEFAULT_LIMITS.
+            http2 (bool, optional): Whether to negotiate HTTP/2, requires
+                the `h2` package to be installed. Defaults to False.
+            cache (ResponseCache | None, optional): Where to cache repo listings,
+                None disables caching. Defaults to None.
+            limiter (RateLimiter | None, optional): Paces requests and retries
+                throttled ones. Defaults to None (a default `RateLimiter`).
+            transport (httpx.BaseTransport | None, optional): Send requests through
+                this instead of the network, e.g. a fake GitHub for testing.
+                Defaults to None.
+        """
+        super().__init__(
+            username=username,
+            token=token,
+            url=url,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            limiter=limiter,
+        )
+        self._transport = transport
+        self._client: httpx.Client | None = None
+
+    __slots__ = ("_transport", "_client")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def client(self) -> httpx.Client:
+        """
+        The pooled HTTP client, created lazily on first access.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(
+                headers=self.headers,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and any pooled connections.
+
+        Safe to call more than once, or if no requests have been made.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        idempotent: bool = True,
+    ) -> httpx.Response:
+        """
+        Send a request, pacing it to the rate limit and retrying it
+        if GitHub throttles it or (for idempotent requests) fails.
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub still responds with an error
+                status once the retries are used up.
+            httpx.TransportError: If the request can't be sent at all.
+        """
+        attempt = 0
+        while True:
+            if delay := self.limiter.delay():
+                time.sleep(delay)
+
+            try:
+                r = self.client.request(method, url, json=json, headers=headers)
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.limiter.retries:
+                    raise
+                time.sleep(self.limiter.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            self.limiter.update(r)
+            if not self.limiter.should_retry(r, attempt, idempotent=idempotent):
+                r.raise_for_status()
+                return r
+
+            time.sleep(self.limiter.backoff_delay(attempt, r))
+            attempt += 1
+
+    def _query(
+        self, query: str, variables: dict[str, Any], cached: bool = False
+    ) -> dict[str, Any]:
+        """
+        Send a GraphQL query over the pooled client and return
+        the decoded JSON body.
+
+        If `cached` is True and the API has a cache, a cached response
+        is returned instead where available and fresh ones are stored.
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub responds with an error status.
+            ResponseNotCachedError: If the cache is offline and has no entry.
+        """
+        key = self._cache_key(query, variables) if cached else None
+        if (
+            key is not None
+            and self.cache is not None
+            and (body := self.cache.load(key)) is not None
+        ):
+            return body
+
+        r = self._send("POST", self.url, json={"query": query, "variables": variables})
+        raw: dict[str, Any] = r.json()
+        self.limiter.update_graphql(raw)
+
+        if key is not None and self.cache is not None and raw.get("data"):
+            self.cache.store(key, raw)
+
+        return raw
+
+    def _repositories(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """
+        Fetch a single page of the user's `repositories` connection.
 
         Raises:
             ValueError: If the GraphQL query is malformed.
+        """
+        raw = self._query(query, {"username": self.username, **variables}, cached=True)
+        return self._connection(raw)
+
+    def _paginate(self, query: str, limit: int | None) -> Paginator:
+        return Paginator(
+            fetch=functools.partial(self._repositories, query), limit=limit
+        )
+
+    def iter_repos(self, limit: int | None = None) -> Paginator:
+        """
+        Lazily iterate over summary info for the user's repos, a page
+        at a time.
+
+        Only as many pages are requested as iteration needs, and once
+        the first page has been fetched `.total` holds the number
+        of repos the user has in total.
+
+        Args:
+            limit (int | None, optional): Maximum number of repos to return,
+                None means all of them. Defaults to None.
 
         Returns:
-            Set[str]: The names of the user's repos.
+            Paginator: Iterator over the repos info.
         """
-        r = httpx.post(
-            self.url,
-            json={
-                "query": queries.GET_REPO_NAMES,
-                "variables": {"username": self.username, "limit": limit},
-            },
-            headers=self.headers,
-        )
+        return self._paginate(queries.GET_REPOS, limit=limit)
 
-        r.raise_for_status()
-        raw: dict[str, Any] = r.json()
+    def iter_forks(self, limit: int | None = None) -> Paginator:
+        """
+        Lazily iterate over info for the user's forks, a page at a time.
 
-        # TODO: I don't like the indexing here, must be a more type safe way of doing this
-        # What happens when there are no nodes? e.g. user has no forks
-        if data := raw.get("data"):
-            return {node["name"] for node in data["user"]["repositories"]["nodes"]}
+        Args:
+            limit (int | None, optional): Maximum number of forks to return,
+                None means all of them. Defaults to None.
 
-        raise ValueError(f"Bad GraphQL: {raw}")  # pragma: no cover
+        Returns:
+            Paginator: Iterator over the forks info.
+        """
+        return self._paginate(queries.GET_FORKS, limit=limit)
 
-    def get_forks(self, limit: int = DEFAULT_REPO_LIMIT) -> list[dict[str, Any]] | None:
+    def get_repos(self, limit: int | None = None) -> list[dict[str, Any]]:
         """
-        Gets info for all users forks.
+        Gets some summary info for all the users repos.
 
         Args:
-            limit: (int, optional): Maximum number of repos to return.
-                Defaults to DEFAULT_REPO_LIMIT.
+            limit (int | None, optional): Maximum number of repos to return,
+                None means all of them. Defaults to None.
 
         Returns:
-            list[dict[str, Any]]: The JSON info for all forks.
+            list[dict[str, Any]]: The repos info.
         """
-        r = httpx.post(
-            self.url,
-            json={
-                "query": queries.GET_FORKS,
-                "variables": {"username": self.username, "limit": limit},
-            },
-            headers=self.headers,
-        )
+        return list(self.iter_repos(limit=limit))
 
-        r.raise_for_status()
-        raw: dict[str, Any] = r.json()
+    def get_repo_names(self, limit: int | None = None) -> set[str]:
+        """
+        Gets the names of all repos owned by the authenticated user.
 
-        if data := raw.get("data"):
-            return list(data["user"]["repositories"]["nodes"])
+        Args:
+            limit (int | None, optional): Maximum number of repos to return,
+                None means all of them. Defaults to None.
 
-        return None  # pragma: no cover
+        Raises:
+            ValueError: If the GraphQL query is malformed.
+
+        Returns:
+            Set[str]: The names of the user's repos.
+        """
+        return {
+            node["name"] for node in self._paginate(queries.GET_REPO_NAMES, limit=limit)
+        }
+
+    def get_forks(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Gets info for all users forks.
+
+        Args:
+            limit: (int | None, optional): Maximum number of forks to return,
+                None means all of them. Defaults to None.
+
+        Returns:
+            list[dict[str, Any]]: The JSON info for all forks.
+        """
+        return list(self.iter_forks(limit=limit))
 
     def check_repo_exists(self, owner: str, name: str) -> bool:
         """
@@ -155,25 +484,33 @@ class API:
         Returns:
             bool: True if repo exists on GitHub, else False.
         """
-        r = httpx.post(
-            self.url,
-            json={
-                "query": queries.CHECK_REPO_EXISTS,
-                "variables": {"username": owner, "name": name},
-            },
-            headers=self.headers,
-        )
+        raw = self._query(queries.CHECK_REPO_EXISTS, {"username": owner, "name": name})
+        return self._exists(raw)
 
-        r.raise_for_status()
-        raw: dict[str, Any] = r.json()
+    def check_repos_exist(self, names: Iterable[str]) -> dict[str, bool]:
+        """
+        Checks whether each of `names` exists on GitHub, batching them
+        into as few requests as possible.
 
-        if data := raw.get("data"):
-            if data["repository"] is None:
-                return False
+        Each name can be either `owner/repo` or just `repo`, in which
+        case it is looked up under the current user.
 
-            return True
+        Args:
+            names (Iterable[str]): The repos to check for.
 
-        raise ValueError(f"Bad GraphQL: {raw}")  # pragma: no cover
+        Returns:
+            dict[str, bool]: Each name mapped to whether it exists.
+        """
+        names = list(dict.fromkeys(names))
+        results: dict[str, bool] = {}
+        for start in range(0, len(names), EXISTS_BATCH_SIZE):
+            chunk = names[start : start + EXISTS_BATCH_SIZE]
+            raw = self._query(
+                queries.check_repos_exist(len(chunk)), self._batch_variables(chunk)
+            )
+            results.update(self._batch_exists(chunk, raw))
+
+        return results
 
     def create_fork(self, owner: str, repo: str) -> None:
         """
@@ -184,62 +521,34 @@ class API:
             owner (str): Owner of the original repo.
             repo (str): Name of the original repo.
         """
-        rest_headers = self.headers.copy()
-        rest_headers["Accept"] = "application/vnd.github.v3+json"
-        fork_url = f"https://api.github.com/repos/{owner}/{repo}/forks"
-
-        r = httpx.post(fork_url, headers=self.headers)
-        r.raise_for_status()
-
-    @staticmethod
-    def _humanize_datetime(dt: str) -> str:
-        """
-        Takes a string datetime of GITHUB_TIME_FORMAT
-        and converts it to our STR_TIME_FORMAT.
-        """
-        s: str = humanize.naturaltime(
-            datetime.strptime(dt, GITHUB_TIME_FORMAT), when=datetime.utcnow()
+        self._send(
+            "POST",
+            self.fork_url(owner, repo),
+            idempotent=False,
+            headers=self.rest_headers,
         )
-        return s
 
-    def get_repo_info(self, name: str) -> dict[str, Any] | None:
+    def get_repo_info(
+        self, name: str, owner: str | None = None
+    ) -> dict[str, Any] | None:
         """
         Gets some descriptive info for the repo given by
-        `name` under the current user.
+        `name` under `owner` (the current user by default).
+
+        This doubles as an existence check, if the repo does not exist
+        on GitHub the result is None so callers wanting both only need
+        the one request.
 
         Args:
             name (str): Name of the repo to fetch info for.
+            owner (str | None, optional): Owner of the repo.
+                Defaults to the current user.
 
         Returns:
-            Dict[str, Any]: Repository info.
-        """
-        r = httpx.post(
-            self.url,
-            json={
-                "query": queries.GET_REPO_INFO,
-                "variables": {"username": self.username, "name": name},
-            },
-            headers=self.headers,
+            Dict[str, Any] | None: Repository info, or None if it doesn't exist.
+        """
+        raw = self._query(
+            queries.GET_REPO_INFO, {"username": owner or self.username, "name": name}
         )
 
-        r.raise_for_status()
-        raw: dict[str, Any] = r.json()
-
-        if data := raw.get("data"):
-            if repo := data.get("repository"):
-                return {
-                    "Name": repo["name"],
-                    "Description": repo["description"],
-                    "Created": self._humanize_datetime(repo["createdAt"]),
-                    "Updated": self._humanize_datetime(repo["pushedAt"]),
-                    "Size": humanize.naturalsize(
-                        int(repo["diskUsage"]) * 1024
-                    ),  # diskUsage is in kB
-                    "License": (
-                        repo["licenseInfo"]["name"] if repo.get("licenseInfo") else None
-                    ),
-                    "Language": repo["primaryLanguage"]["name"],
-                    "Remote": True,
-                }
-            return None  # pragma: no cover
-        return None  # pragma: no cover
+        return self._repo_info(raw)
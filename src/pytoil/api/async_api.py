@@ -0,0 +1,336 @@
+"""
+Asyncio counterpart to `pytoil.api.API` so that independent
+GraphQL queries can be in flight at the same time.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import httpx
+
+from pytoil.api import queries
+from pytoil.api.api import DEFAULT_LIMITS, EXISTS_BATCH_SIZE, URL, BaseAPI
+from pytoil.api.pagination import AsyncPaginator
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Iterable
+    from types import TracebackType
+
+    from pytoil.api.cache import ResponseCache
+    from pytoil.api.ratelimit import RateLimiter
+
+    try:
+        from typing import Self
+    except ImportError:
+        from typing_extensions import Self
+
+T = TypeVar("T")
+
+# GitHub's secondary rate limits punish bursts of concurrent requests
+# so fan out gently by default
+DEFAULT_CONCURRENCY = 5
+
+
+async def bounded_gather(
+    aws: Iterable[Awaitable[T]], limit: int = DEFAULT_CONCURRENCY
+) -> list[T]:
+    """
+    Like `asyncio.gather` but with at most `limit` of the awaitables
+    running at any one time.
+
+    Results are returned in the same order as `aws`.
+
+    Args:
+        aws (Iterable[Awaitable[T]]): The awaitables to run.
+        limit (int, optional): Maximum concurrency.
+            Defaults to DEFAULT_CONCURRENCY.
+
+    Returns:
+        list[T]: The results, in order.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return list(await asyncio.gather(*(run(aw) for aw in aws)))
+
+
+class AsyncAPI(BaseAPI):
+    def __init__(
+        self,
+        username: str,
+        token: str,
+        url: str = URL,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        http2: bool = False,
+        cache: ResponseCache | None = None,
+        limiter: RateLimiter | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        """
+        Async container for methods and data for hitting the GitHub v4
+        GraphQL API.
+
+        Has the same methods as `API` but they are coroutines, and all
+        requests share a single pooled `httpx.AsyncClient`. Use as an
+        async context manager or call `.aclose()` when done.
+
+        Args:
+            username (str): User's GitHub username.
+            token (str): User's personal access token.
+            url (str, optional): GraphQL URL
+                defaults to https://api.github.com/graphql
+            limits (httpx.Limits, optional): Connection pool limits.
+                Defaults to DEFAULT_LIMITS.
+            http2 (bool, optional): Whether to negotiate HTTP/2, requires
+                the `h2` package to be installed. Defaults to False.
+            cache (ResponseCache | None, optional): Where to cache repo listings,
+                None disables caching. Defaults to None.
+            limiter (RateLimiter | None, optional): Paces requests and retries
+                throttled ones. Defaults to None (a default `RateLimiter`).
+            transport (httpx.AsyncBaseTransport | None, optional): Send requests through
+                this instead of the network, e.g. a fake GitHub for testing.
+                Defaults to None.
+        """
+        super().__init__(
+            username=username,
+            token=token,
+            url=url,
+            limits=limits,
+            http2=http2,
+            cache=cache,
+            limiter=limiter,
+        )
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+    __slots__ = ("_transport", "_client")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        The pooled async HTTP client, created lazily on first access.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying HTTP client and any pooled connections.
+
+        Safe to call more than once, or if no requests have been made.
+        """
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        idempotent: bool = True,
+    ) -> httpx.Response:
+        """
+        Send a request, pacing it to the rate limit and retrying it
+        if GitHub throttles it or (for idempotent requests) fails.
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub still responds with an error
+                status once the retries are used up.
+            httpx.TransportError: If the request can't be sent at all.
+        """
+        attempt = 0
+        while True:
+            if delay := self.limiter.delay():
+                await asyncio.sleep(delay)
+
+            try:
+                r = await self.client.request(method, url, json=json, headers=headers)
+            except httpx.TransportError:
+                if not idempotent or attempt >= self.limiter.retries:
+                    raise
+                await asyncio.sleep(self.limiter.backoff_delay(attempt))
+                attempt += 1
+                continue
+
+            self.limiter.update(r)
+            if not self.limiter.should_retry(r, attempt, idempotent=idempotent):
+                r.raise_for_status()
+                return r
+
+            await asyncio.sleep(self.limiter.backoff_delay(attempt, r))
+            attempt += 1
+
+    async def _query(
+        self, query: str, variables: dict[str, Any], cached: bool = False
+    ) -> dict[str, Any]:
+        """
+        Send a GraphQL query over the pooled client and return
+        the decoded JSON body, going via the cache if `cached` is True.
+
+        Raises:
+            httpx.HTTPStatusError: If GitHub responds with an error status.
+            ResponseNotCachedError: If the cache is offline and has no entry.
+        """
+        key = self._cache_key(query, variables) if cached else None
+        if (
+            key is not None
+            and self.cache is not None
+            and (body := self.cache.load(key)) is not None
+        ):
+            return body
+
+        r = await self._send(
+            "POST", self.url, json={"query": query, "variables": variables}
+        )
+        raw: dict[str, Any] = r.json()
+        self.limiter.update_graphql(raw)
+
+        if key is not None and self.cache is not None and raw.get("data"):
+            self.cache.store(key, raw)
+
+        return raw
+
+    async def _repositories(
+        self, query: str, variables: dict[str, Any]
+    ) -> dict[str, Any]:
+        raw = await self._query(
+            query, {"username": self.username, **variables}, cached=True
+        )
+        return self._connection(raw)
+
+    def _paginate(self, query: str, limit: int | None) -> AsyncPaginator:
+        return AsyncPaginator(
+            fetch=functools.partial(self._repositories, query), limit=limit
+        )
+
+    def iter_repos(self, limit: int | None = None) -> AsyncPaginator:
+        """
+        Lazily iterate over summary info for the user's repos,
+        use with `async for`.
+
+        Args:
+            limit (int | None, optional): Maximum number of repos to return,
+                None means all of them. Defaults to None.
+
+        Returns:
+            AsyncPaginator: Async iterator over the repos info.
+        """
+        return self._paginate(queries.GET_REPOS, limit=limit)
+
+    def iter_forks(self, limit: int | None = None) -> AsyncPaginator:
+        """
+        Lazily iterate over info for the user's forks, use with `async for`.
+
+        Args:
+            limit (int | None, optional): Maximum number of forks to return,
+                None means all of them. Defaults to None.
+
+        Returns:
+            AsyncPaginator: Async iterator over the forks info.
+        """
+        return self._paginate(queries.GET_FORKS, limit=limit)
+
+    async def get_repos(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Gets some summary info for all the users repos.
+        """
+        return [repo async for repo in self.iter_repos(limit=limit)]
+
+    async def get_repo_names(self, limit: int | None = None) -> set[str]:
+        """
+        Gets the names of all repos owned by the authenticated user.
+        """
+        return {
+            node["name"]
+            async for node in self._paginate(queries.GET_REPO_NAMES, limit=limit)
+        }
+
+    async def get_forks(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """
+        Gets info for all users forks.
+        """
+        return [fork async for fork in self.iter_forks(limit=limit)]
+
+    async def check_repo_exists(self, owner: str, name: str) -> bool:
+        """
+        Checks whether or not the repo `owner/name` exists on GitHub.
+        """
+        raw = await self._query(
+            queries.CHECK_REPO_EXISTS, {"username": owner, "name": name}
+        )
+        return self._exists(raw)
+
+    async def check_repos_exist(self, names: Iterable[str]) -> dict[str, bool]:
+        """
+        Checks whether each of `names` (`owner/repo` or `repo`) exists on
+        GitHub, batching them into as few requests as possible.
+        """
+        names = list(dict.fromkeys(names))
+        chunks = [
+            names[start : start + EXISTS_BATCH_SIZE]
+            for start in range(0, len(names), EXISTS_BATCH_SIZE)
+        ]
+        raws = await bounded_gather(
+            self._query(
+                queries.check_repos_exist(len(chunk)), self._batch_variables(chunk)
+            )
+            for chunk in chunks
+        )
+
+        results: dict[str, bool] = {}
+        for chunk, raw in zip(chunks, raws):
+            results.update(self._batch_exists(chunk, raw))
+        return results
+
+    async def create_fork(self, owner: str, repo: str) -> None:
+        """
+        Use the v3 REST API to create a fork of the specified repository
+        under the authenticated user.
+        """
+        await self._send(
+            "POST",
+            self.fork_url(owner, repo),
+            idempotent=False,
+            headers=self.rest_headers,
+        )
+
+    async def get_repo_info(
+        self, name: str, owner: str | None = None
+    ) -> dict[str, Any] | None:
+        """
+        Gets some descriptive info for the repo given by `name` under
+        `owner` (the current user by default), or None if it doesn't exist.
+        """
+        raw = await self._query(
+            queries.GET_REPO_INFO, {"username": owner or self.username, "name": name}
+        )
+        return self._repo_info(raw)
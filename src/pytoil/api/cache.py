@@ -0,0 +1,151 @@
+"""
+On-disk cache for GitHub API responses.
+
+Listing all of a user's repos means paging through the whole
+`repositories` connection, which is slow for big accounts and
+rarely changes between runs, so those responses are kept in the
+user cache directory for a configurable time.
+
+Each entry is a single JSON file named after a hash of the request,
+written to a temporary file and atomically renamed into place so
+any number of pytoil processes can share the cache safely.
+
+Entries expire on their age alone, there's no conditional revalidation.
+GitHub only sends ETags on the REST API and everything cached here comes
+from GraphQL, the one REST fork endpoint pytoil uses creates a fork (a
+POST) rather than listing them, and the REST fork listings don't say
+what each fork's parent is, which `show forks` needs.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from pytoil.config import defaults
+from pytoil.exceptions import ResponseNotCachedError
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        path: Path = defaults.API_CACHE_DIR,
+        ttl: float = defaults.CACHE_TTL,
+        refresh: bool = False,
+        offline: bool = False,
+    ) -> None:
+        """
+        Cache of decoded API responses, keyed by the request.
+
+        Args:
+            path (Path, optional): Directory to keep the cache in.
+                Defaults to defaults.API_CACHE_DIR.
+            ttl (float, optional): Seconds a cached response is considered
+                fresh for. Defaults to defaults.CACHE_TTL.
+            refresh (bool, optional): Ignore any cached responses and
+                fetch (and cache) fresh ones. Defaults to False.
+            offline (bool, optional): Serve cached responses no matter how old
+                and never go to the network. Defaults to False.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.refresh = refresh
+        self.offline = offline
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(path={self.path!r}, ttl={self.ttl!r}, refresh={self.refresh!r},"
+            f" offline={self.offline!r})"
+        )
+
+    __slots__ = ("path", "ttl", "refresh", "offline")
+
+    @staticmethod
+    def key(url: str, token: str, query: str, variables: dict[str, Any]) -> str:
+        """
+        The cache key for a request.
+
+        The token is part of the key (hashed, never stored) as different
+        tokens can see different repos.
+        """
+        request = json.dumps(
+            {"url": url, "token": token, "query": query, "variables": variables},
+            sort_keys=True,
+        )
+        return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path.joinpath(f"{key}.json")
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """
+        Look up the response cached under `key`, respecting the ttl,
+        `refresh` and `offline` settings.
+
+        Raises:
+            ResponseNotCachedError: If offline and nothing is cached for `key`.
+
+        Returns:
+            dict[str, Any] | None: The cached response, or None if the caller
+                should go to the network.
+        """
+        if self.refresh:
+            return None
+
+        try:
+            entry: dict[str, Any] = json.loads(
+                self._file(key).read_text(encoding="utf-8")
+            )
+        except (FileNotFoundError, json.JSONDecodeError):
+            entry = {}
+
+        if "body" not in entry:
+            if self.offline:
+                raise ResponseNotCachedError(
+                    "No cached response available while offline."
+                )
+            return None
+
+        if self.offline or time.time() - entry["stored_at"] < self.ttl:
+            body: dict[str, Any] = entry["body"]
+            return body
+
+        return None
+
+    def store(self, key: str, body: dict[str, Any]) -> None:
+        """
+        Cache `body` under `key`.
+
+        The entry is written to a temporary file first and renamed over
+        the old one so concurrent readers never see a partial write.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"stored_at": time.time(), "body": body}, f)
+            tmp.replace(self._file(key))
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """
+        Remove every cached response.
+        """
+        if not self.path.exists():
+            return
+
+        for file in self.path.glob("*.json"):
+            file.unlink(missing_ok=True)
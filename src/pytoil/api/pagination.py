@@ -0,0 +1,136 @@
+"""
+Cursor based pagination over GitHub GraphQL connections.
+
+GitHub caps every connection at 100 nodes per request, anything
+beyond that has to be walked page by page using the `endCursor`
+of the previous page.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+
+# The maximum value GitHub allows for `first` on a connection
+PAGE_SIZE = 100
+
+
+class _Pages:
+    def __init__(self, limit: int | None = None, page_size: int = PAGE_SIZE) -> None:
+        """
+        Cursor state shared by the sync and async paginators.
+
+        Args:
+            limit (int | None, optional): Maximum number of nodes to yield
+                in total, None means all of them. Defaults to None.
+            page_size (int, optional): Nodes to request per page.
+                Defaults to PAGE_SIZE.
+        """
+        self.limit = limit
+        self.page_size = page_size
+        self.after: str | None = None
+        self.seen = 0
+        self.total: int | None = None
+        self.done = limit is not None and limit <= 0
+
+    __slots__ = ("limit", "page_size", "after", "seen", "total", "done")
+
+    def variables(self) -> dict[str, Any]:
+        """
+        The `limit` and `after` variables for the next page request.
+
+        Only asks for as many nodes as are still needed so a caller
+        wanting the first 10 doesn't pay for a full page.
+        """
+        first = self.page_size
+        if self.limit is not None:
+            first = min(first, self.limit - self.seen)
+        return {"limit": first, "after": self.after}
+
+    def advance(self, connection: dict[str, Any]) -> list[dict[str, Any]]:
+        """
+        Consume a page of a connection, returning its nodes and moving
+        the cursor on to the next page.
+        """
+        nodes: list[dict[str, Any]] = connection["nodes"]
+        if self.limit is not None:
+            nodes = nodes[: self.limit - self.seen]
+
+        self.seen += len(nodes)
+        if (total := connection.get("totalCount")) is not None:
+            self.total = total
+
+        page_info: dict[str, Any] = connection.get("pageInfo") or {}
+        self.after = page_info.get("endCursor")
+        self.done = (
+            not page_info.get("hasNextPage")
+            or self.after is None
+            or (self.limit is not None and self.seen >= self.limit)
+        )
+        return nodes
+
+
+class Paginator(_Pages):
+    def __init__(
+        self,
+        fetch: Callable[[dict[str, Any]], dict[str, Any]],
+        limit: int | None = None,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        """
+        Lazily iterate over every node in a paginated connection.
+
+        Pages are only requested as iteration reaches them so breaking
+        out of the loop early stops any further requests.
+
+        Args:
+            fetch (Callable): Takes the pagination variables and returns
+                the connection object (the thing with `nodes` and `pageInfo`).
+            limit (int | None, optional): Maximum number of nodes to yield,
+                None means all of them. Defaults to None.
+            page_size (int, optional): Nodes to request per page.
+                Defaults to PAGE_SIZE.
+        """
+        self.fetch = fetch
+        super().__init__(limit=limit, page_size=page_size)
+
+    __slots__ = ("fetch",)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        while not self.done:
+            yield from self.advance(self.fetch(self.variables()))
+
+
+class AsyncPaginator(_Pages):
+    def __init__(
+        self,
+        fetch: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]],
+        limit: int | None = None,
+        page_size: int = PAGE_SIZE,
+    ) -> None:
+        """
+        Async counterpart to `Paginator`, use with `async for`.
+
+        Args:
+            fetch (Callable): Coroutine function taking the pagination variables
+                and returning the connection object.
+            limit (int | None, optional): Maximum number of nodes to yield,
+                None means all of them. Defaults to None.
+            page_size (int, optional): Nodes to request per page.
+                Defaults to PAGE_SIZE.
+        """
+        self.fetch = fetch
+        super().__init__(limit=limit, page_size=page_size)
+
+    __slots__ = ("fetch",)
+
+    async def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        while not self.done:
+            for node in self.advance(await self.fetch(self.variables())):
+                yield node
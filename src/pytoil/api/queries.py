@@ -9,14 +9,24 @@ Created: 21/12/2021
 from __future__ import annotations
 
 GET_REPO_NAMES = """
-query ($username: String!, $limit: Int!) {
+query ($username: String!, $limit: Int!, $after: String) {
   user(login: $username) {
-    repositories(first: $limit, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+    repositories(first: $limit, after: $after, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+      totalCount
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
       nodes {
         name
       }
     }
   }
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
 }
 """
 
@@ -48,9 +58,14 @@ query ($username: String!, $name: String!) {
 """
 
 GET_REPOS = """
-query ($username: String!, $limit: Int!) {
+query ($username: String!, $limit: Int!, $after: String) {
   user(login: $username) {
-    repositories(first: $limit, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+    repositories(first: $limit, after: $after, ownerAffiliations: OWNER, orderBy: {field: NAME, direction: ASC}) {
+      totalCount
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
       nodes {
         name,
         description,
@@ -60,13 +75,29 @@ query ($username: String!, $limit: Int!) {
       }
     }
   }
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
 }
 """
 
 GET_FORKS = """
-query ($username: String!, $limit: Int!) {
+query ($username: String!, $limit: Int!, $after: String) {
   user(login: $username) {
-    repositories(first: $limit, ownerAffiliations: OWNER, isFork: true, orderBy: {field: NAME, direction: ASC}) {
+    repositories(
+      first: $limit
+      after: $after
+      ownerAffiliations: OWNER
+      isFork: true
+      orderBy: {field: NAME, direction: ASC}
+    ) {
+      totalCount
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
       nodes {
         name
         diskUsage
@@ -78,5 +109,32 @@ query ($username: String!, $limit: Int!) {
       }
     }
   }
+  rateLimit {
+    cost
+    remaining
+    resetAt
+  }
 }
 """
+
+
+def check_repos_exist(count: int) -> str:
+    """
+    Build a query checking whether `count` repos exist in a single
+    request, using a field alias (`r0`, `r1`, ...) per repo.
+
+    The owner and name of repo `i` are passed as the `$owner{i}`
+    and `$name{i}` variables.
+
+    Args:
+        count (int): Number of repos to check.
+
+    Returns:
+        str: The GraphQL query.
+    """
+    params = ", ".join(f"$owner{i}: String!, $name{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  r{i}: repository(owner: $owner{i}, name: $name{i}) {{\n    name\n  }}"
+        for i in range(count)
+    )
+    return f"query ({params}) {{\n{fields}\n}}\n"
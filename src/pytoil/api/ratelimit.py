@@ -0,0 +1,228 @@
+"""
+Keeps pytoil's GitHub requests inside the API rate limits.
+
+GitHub reports the remaining budget on every response, either in the
+`X-RateLimit-*` headers or (for GraphQL queries that ask for it) in the
+`rateLimit` object. The `RateLimiter` tracks that budget so requests
+can be spread out as it runs low, and decides when and how long to
+back off before retrying a throttled or failed request.
+
+It does no sleeping or I/O itself so the same limiter works for both
+the sync and async API clients.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx
+
+# Statuses worth retrying for an idempotent request, GitHub sends 429
+# (and sometimes 403) when throttling and 502s under load
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+DEFAULT_RETRIES = 3
+BACKOFF_BASE = 1.0  # Seconds
+MAX_DELAY = 60.0  # Seconds, never wait longer than this in one go
+
+# Once the remaining budget drops below this, requests are spread
+# evenly over the time left until the limit resets
+LOW_BUDGET = 50
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = BACKOFF_BASE,
+        max_delay: float = MAX_DELAY,
+        low_budget: int = LOW_BUDGET,
+        clock: Callable[[], float] = time.time,
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        Tracks the GitHub rate limit budget and schedules retries.
+
+        Args:
+            retries (int, optional): Maximum number of times to retry
+                a request. Defaults to DEFAULT_RETRIES.
+            backoff (float, optional): Base delay in seconds for the
+                exponential backoff. Defaults to BACKOFF_BASE.
+            max_delay (float, optional): Cap in seconds on any single wait.
+                Defaults to MAX_DELAY.
+            low_budget (int, optional): Remaining budget below which requests
+                are paced out until the reset. Defaults to LOW_BUDGET.
+            clock (Callable[[], float], optional): Returns the current epoch
+                time. Defaults to time.time.
+            rng (random.Random | None, optional): Source of backoff jitter.
+                Defaults to None (a fresh `random.Random`).
+        """
+        self.retries = retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.low_budget = low_budget
+        self.clock = clock
+        self.rng = rng or random.Random()
+
+        self.limit: int | None = None
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self.cost: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(retries={self.retries!r}, backoff={self.backoff!r},"
+            f" max_delay={self.max_delay!r}, low_budget={self.low_budget!r})"
+        )
+
+    __slots__ = (
+        "retries",
+        "backoff",
+        "max_delay",
+        "low_budget",
+        "clock",
+        "rng",
+        "limit",
+        "remaining",
+        "reset_at",
+        "cost",
+    )
+
+    def update(self, response: httpx.Response) -> None:
+        """
+        Record the budget from a response's `X-RateLimit-*` headers.
+        """
+        headers = response.headers
+        if (limit := headers.get("X-RateLimit-Limit")) is not None:
+            self.limit = int(limit)
+        if (remaining := headers.get("X-RateLimit-Remaining")) is not None:
+            self.remaining = int(remaining)
+        if (reset := headers.get("X-RateLimit-Reset")) is not None:
+            self.reset_at = float(reset)
+
+    def update_graphql(self, raw: dict[str, Any]) -> None:
+        """
+        Record the budget from the `rateLimit` object of a GraphQL
+        response, if the query asked for it.
+        """
+        data = raw.get("data") or {}
+        if not (rate_limit := data.get("rateLimit")):
+            return
+
+        self.cost = rate_limit.get("cost", self.cost)
+        self.remaining = rate_limit.get("remaining", self.remaining)
+        if reset_at := rate_limit.get("resetAt"):
+            self.reset_at = datetime.fromisoformat(
+                reset_at.replace("Z", "+00:00")
+            ).timestamp()
+
+    def _until_reset(self) -> float:
+        if self.reset_at is None:
+            return 0.0
+        return max(0.0, self.reset_at - self.clock())
+
+    def delay(self) -> float:
+        """
+        How long to wait before sending the next request so the
+        remaining budget lasts until the reset.
+
+        Returns:
+            float: Seconds to wait, 0 if there's plenty of budget left or
+                none left until a reset too far off to wait for.
+        """
+        if self.remaining is None or self.remaining >= self.low_budget:
+            return 0.0
+
+        if self.remaining <= 0:
+            # Waiting max_delay wouldn't get to the reset and should_retry
+            # won't wait either, so fail straight away instead
+            until_reset = self._until_reset()
+            return 0.0 if until_reset > self.max_delay else until_reset
+
+        return min(self._until_reset() / self.remaining, self.max_delay)
+
+    def is_throttled(self, response: httpx.Response) -> bool:
+        """
+        Whether `response` means GitHub is rate limiting us, as opposed
+        to a plain 403 for something we're not allowed to do.
+        """
+        if response.status_code == 429:
+            return True
+
+        if response.status_code != 403:
+            return False
+
+        return (
+            "Retry-After" in response.headers
+            or response.headers.get("X-RateLimit-Remaining") == "0"
+        )
+
+    def should_retry(
+        self, response: httpx.Response, attempt: int, idempotent: bool = True
+    ) -> bool:
+        """
+        Whether to retry the request that got `response`.
+
+        Only idempotent requests are retried on server errors, anything
+        else is only retried when it was rejected by the rate limiter
+        and so never processed.
+
+        Args:
+            response (httpx.Response): The response to the last attempt.
+            attempt (int): How many times the request has been retried so far.
+            idempotent (bool, optional): Whether the request is safe to repeat.
+                Defaults to True.
+
+        Returns:
+            bool: True if the request should be sent again.
+        """
+        if attempt >= self.retries:
+            return False
+
+        if self.is_throttled(response):
+            # No point sitting around for an hour waiting for the reset
+            return (
+                "Retry-After" in response.headers
+                or self._until_reset() <= self.max_delay
+            )
+
+        return idempotent and response.status_code in RETRY_STATUSES
+
+    def backoff_delay(
+        self, attempt: int, response: httpx.Response | None = None
+    ) -> float:
+        """
+        How long to wait before retry number `attempt`.
+
+        Honours `Retry-After` and the rate limit reset time when GitHub
+        gives them, otherwise uses exponential backoff with full jitter
+        so concurrent clients don't all retry at once.
+
+        Args:
+            attempt (int): How many times the request has been retried so far.
+            response (httpx.Response | None, optional): The failed response,
+                None if the request didn't get one. Defaults to None.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        if response is not None:
+            if (retry_after := response.headers.get("Retry-After")) is not None:
+                return min(float(retry_after), self.max_delay)
+
+            if self.is_throttled(response) and self.reset_at is not None:
+                return min(self._until_reset(), self.max_delay)
+
+        ceiling = min(self.backoff * 2**attempt, self.max_delay)
+        return self.rng.uniform(0, ceiling)
@@ -9,16 +9,13 @@ Created: 21/12/2021
 from __future__ import annotations
 
 import re
+import subprocess
 import time
 from typing import TYPE_CHECKING
 
 import click
-import httpx
-import questionary
-from thefuzz import process
 
 from pytoil import editor
-from pytoil.api import API
 from pytoil.cli import utils
 from pytoil.cli.printer import printer
 from pytoil.exceptions import (
@@ -26,9 +23,14 @@ from pytoil.exceptions import (
     ExternalToolNotInstalledError,
 )
 from pytoil.git import Git
+from pytoil.git.modes import CLONE_MODES
+from pytoil.projects import LocalProjects
 from pytoil.repo import Repo
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytoil.api import API
     from pytoil.config import Config
     from pytoil.environments import Environment
 
@@ -39,8 +41,6 @@ USER_REPO_REGEX = re.compile(r"^([A-Za-z0-9_.-])+/([A-Za-z0-9_.-])+$")
 # The bare 'project' pattern
 PROJECT_REGEX = re.compile(r"^([A-Za-z0-9_.-])+$")
 
-FUZZY_SCORE_CUTOFF = 75
-
 
 @click.command()
 @click.argument("project", nargs=1)
@@ -50,8 +50,22 @@ FUZZY_SCORE_CUTOFF = 75
     is_flag=True,
     help="Attempt to auto-create a virtual environment.",
 )
+@click.option(
+    "-m",
+    "--mode",
+    type=click.Choice(CLONE_MODES),
+    help="How to clone, defaults to 'clone_mode' from the config.",
+)
+@click.option(
+    "-d",
+    "--depth",
+    type=click.IntRange(min=1),
+    help="Commits to keep in a shallow clone, implies '--mode shallow'.",
+)
 @click.pass_obj
-def checkout(config: Config, project: str, venv: bool) -> None:
+def checkout(
+    config: Config, project: str, venv: bool, mode: str | None, depth: int | None
+) -> None:
     """
     Checkout an existing development project.
 
@@ -90,6 +104,10 @@ def checkout(config: Config, project: str, venv: bool) -> None:
     is a python package, in which case it will install it's requirements into the
     created environment.
 
+    Big projects can be cloned more quickly with one of the cheaper clone modes
+    ("--mode/-m") e.g. "shallow" or "blobless", "pytoil unshallow" turns them into
+    a full clone later if needed. The default comes from the "clone_mode" config key.
+
     More info about this can be found in the documentation. Use `pytoil docs` to go there.
 
     Examples:
@@ -98,65 +116,74 @@ def checkout(config: Config, project: str, venv: bool) -> None:
     $ pytoil checkout my_project --venv
 
     $ pytoil checkout someoneelse/project
+
+    $ pytoil checkout someoneelse/huge_project --mode blobless
     """
-    api = API(username=config.username, token=config.token)
+    import httpx
+
+    from pytoil.api import API
+    from pytoil.search import MatchCache, Matcher
+
     repo = Repo(
         owner=config.username,
         name=project,
         local_path=config.projects_dir.joinpath(project),
     )
     git = Git()
+    options = utils.resolve_clone_options(config, mode=mode, depth=depth)
+    if venv:
+        # Bad config is better found out before cloning than after
+        utils.resolve_installer(config)
+
+    with API(username=config.username, token=config.token) as api:
+        if bool(USER_REPO_REGEX.match(project)):
+            # We've matched the "user/repo" pattern, meaning the user wants
+            # to create a fork
+            owner, name = project.split("/")
+            if owner == config.username:
+                printer.warn(
+                    "You don't need the '/' when checking out a repo you own", exits=1
+                )
 
-    if bool(USER_REPO_REGEX.match(project)):
-        # We've matched the "user/repo" pattern, meaning the user wants
-        # to create a fork
-        owner, name = project.split("/")
-        if owner == config.username:
-            printer.warn(
-                "You don't need the '/' when checking out a repo you own", exits=1
+            checkout_fork(
+                owner=owner,
+                name=name,
+                api=api,
+                config=config,
+                git=git,
+                venv=venv,
+                options=options,
             )
 
-        checkout_fork(
-            owner=owner,
-            name=name,
-            api=api,
-            config=config,
-            git=git,
-            venv=venv,
-        )
-
-        printer.good("Done!")
+            printer.good("Done!")
 
-    elif bool(PROJECT_REGEX.match(project)):
-        if repo.exists_local():
-            checkout_local(repo=repo, config=config, venv=venv)
-        elif repo.exists_remote(api):
-            checkout_remote(repo=repo, config=config, venv=venv, git=git)
-        else:
-            printer.error(f"{project!r} not found locally or on GitHub.")
-            local_projects: set[str] = {
-                f.name
-                for f in config.projects_dir.iterdir()
-                if f.is_dir() and not f.name.startswith(".")
-            }
-            try:
-                remote_projects = api.get_repo_names()
-            except httpx.HTTPStatusError as err:
-                utils.handle_http_status_error(err)
-            else:
-                all_projects = local_projects.union(remote_projects)
-
-                best_match: tuple[str, int] = process.extractOne(
-                    query=project, choices=all_projects, score_cutoff=FUZZY_SCORE_CUTOFF
+        elif bool(PROJECT_REGEX.match(project)):
+            if repo.exists_local():
+                checkout_local(repo=repo, config=config, venv=venv)
+            elif repo.exists_remote(api):
+                checkout_remote(
+                    repo=repo, config=config, venv=venv, git=git, options=options
                 )
-                if best_match:
-                    best_match_name, _ = best_match
-                    printer.note(f"Did you mean {best_match_name}?", exits=1)
+            else:
+                printer.error(f"{project!r} not found locally or on GitHub.")
+                local_projects = LocalProjects(config).names()
+                try:
+                    remote_projects = api.get_repo_names()
+                except httpx.HTTPStatusError as err:
+                    utils.handle_http_status_error(err)
+                else:
+                    matcher = Matcher(
+                        local_projects.union(remote_projects), cache=MatchCache()
+                    )
+                    best_match = matcher.best(project)
+                    if best_match:
+                        best_match_name, _ = best_match
+                        printer.note(f"Did you mean {best_match_name}?", exits=1)
 
-    else:
-        # Unrecognised regex
-        printer.error(f"{project!r} did not match valid pattern.")
-        printer.note('Valid patterns are "user/repo" or "repo".', exits=1)
+        else:
+            # Unrecognised regex
+            printer.error(f"{project!r} did not match valid pattern.")
+            printer.note('Valid patterns are "user/repo" or "repo".', exits=1)
 
 
 def checkout_fork(
@@ -166,11 +193,15 @@ def checkout_fork(
     config: Config,
     git: Git,
     venv: bool,
+    options: Sequence[str] = (),
 ) -> None:
     """
     Forks the passed repo, clones it, sets the upstream and informs
     the user along the way.
     """
+    import httpx
+    import questionary
+
     # Check if we've already forked it, in which case the repo will already
     # exist under the user's namespace
     fork = Repo(
@@ -182,7 +213,13 @@ def checkout_fork(
         owner=owner, name=name, local_path=config.projects_dir.joinpath(name)
     )
 
-    if not original.exists_remote(api=api):
+    # Check for the original and an existing fork in a single request
+    original_name = f"{owner}/{name}"
+    fork_name = f"{config.username}/{name}"
+    found = api.check_repos_exist([original_name, fork_name])
+    original_exists, fork_exists = found[original_name], found[fork_name]
+
+    if not original_exists:
         printer.error(f"{owner}/{name} not found on GitHub. Was it a typo?", exits=1)
 
     printer.info(f"{owner}/{name} belongs to {owner}")
@@ -190,7 +227,7 @@ def checkout_fork(
         "Fork project or clone the original?", choices=("fork", "clone")
     ).ask()
 
-    if fork.exists_remote(api):
+    if fork_exists:
         printer.warn(f"Looks like you've already forked {owner}/{name}")
         printer.note(f"Use pytoil checkout {name} to pull down your fork.", exits=1)
 
@@ -219,22 +256,25 @@ def checkout_fork(
 
         printer.info(f"Cloning your fork: {config.username}/{name}.", spaced=True)
         # Only cloning 1 repo so makes sense to show the clone output
-        git.clone(url=fork.clone_url, cwd=config.projects_dir, silent=False)
+        if git.clone(
+            url=fork.clone_url, cwd=config.projects_dir, silent=False, options=options
+        ):
+            printer.error(f"Could not clone {fork.name!r}.", exits=1)
 
         printer.info("Setting 'upstream' to original repo.")
         git.set_upstream(owner=owner, repo=name, cwd=fork.local_path)
 
-        # Automatic environment detection
-        env = fork.dispatch_env(config=config)
-
         if venv:
-            handle_venv_creation(env=env)
+            # Automatic environment detection
+            handle_venv_creation(env=fork.dispatch_env(config=config))
 
         if config.specifies_editor():
             printer.sub_info(f"Opening {fork.name} with {config.editor}")
             editor.launch(path=config.projects_dir.joinpath(name), binary=config.editor)
     elif choice == "clone":
-        checkout_remote(repo=original, config=config, venv=venv, git=git)
+        checkout_remote(
+            repo=original, config=config, venv=venv, git=git, options=options
+        )
     else:
         # We'll only get here if the user hits ctrl + c or something so just abort
         printer.error("Aborting", exits=1)
@@ -259,10 +299,15 @@ def handle_venv_creation(env: Environment | None) -> None:
             with printer.progress() as p:
                 p.add_task("[bold white]Working")
                 env.install_self(silent=True)
-        except ExternalToolNotInstalledError:
-            printer.error(f"{env.name} not installed", exits=1)
+        except ExternalToolNotInstalledError as err:
+            printer.error(err.message, exits=1)
         except EnvironmentAlreadyExistsError:
             printer.warn("Environment already exists. Skipping.")
+        except subprocess.CalledProcessError as err:
+            # e.g. uv failing to create the environment
+            printer.error(
+                f"Could not create the {env.name} environment: {err}", exits=1
+            )
 
 
 def checkout_local(repo: Repo, config: Config, venv: bool) -> None:
@@ -281,18 +326,41 @@ def checkout_local(repo: Repo, config: Config, venv: bool) -> None:
         editor.launch(path=repo.local_path, binary=config.editor)
 
 
-def checkout_remote(repo: Repo, config: Config, venv: bool, git: Git) -> None:
+def checkout_remote(
+    repo: Repo, config: Config, venv: bool, git: Git, options: Sequence[str] = ()
+) -> None:
     """
     Helper to checkout a remote repo.
     """
     printer.info(f"{repo.owner}/{repo.name} found on GitHub. Cloning...", spaced=True)
-    # Only cloning 1 repo so makes sense to show output
-    git.clone(url=repo.clone_url, cwd=config.projects_dir, silent=False)
 
-    env = repo.dispatch_env(config=config)
+    # The cheaper clone modes don't mix with --reference, they're already
+    # most of the way to what the mirror would save
+    reference: list[str] = []
+    mirrors = utils.mirror_cache(config) if not options else None
+    if mirrors is not None:
+        with printer.progress() as p:
+            p.add_task("[bold white]Updating local mirror")
+            reference = mirrors.reference(repo.clone_url)
+
+    try:
+        # Only cloning 1 repo so makes sense to show output
+        returncode = git.clone(
+            url=repo.clone_url,
+            cwd=config.projects_dir,
+            silent=False,
+            options=[*options, *reference],
+        )
+    finally:
+        if mirrors is not None:
+            mirrors.release(repo.clone_url)
+            mirrors.evict()
+
+    if returncode:
+        printer.error(f"Could not clone {repo.name!r}.", exits=1)
 
     if venv:
-        handle_venv_creation(env=env)
+        handle_venv_creation(env=repo.dispatch_env(config=config))
 
     if config.specifies_editor():
         printer.info(f"Opening {repo.name} with {config.editor}", spaced=True)
@@ -8,14 +8,18 @@ Created: 21/12/2021
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import click
 from rich import box
 from rich.console import Console
-from rich.markdown import Markdown
 from rich.table import Table
 
 from pytoil.cli.printer import printer
-from pytoil.config import Config, defaults
+from pytoil.config import defaults
+
+if TYPE_CHECKING:
+    from pytoil.config import Config
 
 
 @click.group()
@@ -90,6 +94,8 @@ def explain() -> None:
     Examples:
     $ pytoil config explain
     """
+    from rich.markdown import Markdown
+
     console = Console()
     markdown = Markdown(defaults.CONFIG_SCHEMA, justify="center")
     console.print(markdown)
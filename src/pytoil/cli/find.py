@@ -15,19 +15,17 @@ from rich import box
 from rich.console import Console
 from rich.table import Table
 from rich.text import Text
-from thefuzz import process
 
-from pytoil.api import API
 from pytoil.cli.printer import printer
+from pytoil.exceptions import ResponseNotCachedError
+from pytoil.projects import LocalProjects
 
 if TYPE_CHECKING:
     from pytoil.config import Config
 
-FUZZY_SCORE_CUTOFF = 75
-
 
 @click.command()
-@click.argument("project", nargs=1)
+@click.argument("project", nargs=1, required=False)
 @click.option(
     "-l",
     "--limit",
@@ -36,8 +34,32 @@ FUZZY_SCORE_CUTOFF = 75
     help="Limit results to maximum number.",
     show_default=True,
 )
-@click.pass_obj
-def find(config: Config, project: str, limit: int) -> None:
+@click.option(
+    "-r",
+    "--refresh",
+    is_flag=True,
+    help="Ignore cached results and fetch fresh ones from GitHub.",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Only use cached results, never hit GitHub.",
+)
+@click.option(
+    "-i",
+    "--interactive",
+    is_flag=True,
+    help="Pick a project as you type, then check it out.",
+)
+@click.pass_context
+def find(
+    ctx: click.Context,
+    project: str | None,
+    limit: int,
+    refresh: bool,
+    offline: bool,
+    interactive: bool,
+) -> None:
     """
     Quickly locate a project.
 
@@ -55,25 +77,52 @@ def find(config: Config, project: str, limit: int) -> None:
     are returned anyway so the results flag only limits the maximum number
     of results shown.
 
+    Remote project names are cached for a few minutes, use "-r/--refresh"
+    to force a fresh fetch or "--offline" to only use what's cached.
+
+    With "-i/--interactive" you get a picker instead, which narrows down your
+    projects as you type (starting from PROJECT if given). Whichever you pick
+    is handed straight to "pytoil checkout".
+
     Examples:
     $ pytoil find my
 
     $ pytoil find proj --limit 3
-    """
-    api = API(username=config.username, token=config.token)
 
-    local_projects: set[str] = {
-        f.name
-        for f in config.projects_dir.iterdir()
-        if f.is_dir() and not f.name.startswith(".")
-    }
-    remote_projects = api.get_repo_names()
+    $ pytoil find proj --offline
 
-    all_projects = local_projects.union(remote_projects)
+    $ pytoil find --interactive
+    """
+    from pytoil.api import API, ResponseCache
+    from pytoil.search import MatchCache, Matcher
+
+    config: Config = ctx.obj
+    if project is None and not interactive:
+        raise click.UsageError("Missing argument 'PROJECT'.", ctx=ctx)
+
+    local_projects = LocalProjects(config).names()
+    try:
+        with API(
+            username=config.username,
+            token=config.token,
+            cache=ResponseCache(ttl=config.cache_ttl, refresh=refresh, offline=offline),
+        ) as api:
+            remote_projects = api.get_repo_names()
+    except ResponseNotCachedError as err:
+        printer.error(f"{err} Run without '--offline' to fetch from GitHub.", exits=1)
+        return
+
+    if interactive:
+        pick_and_checkout(
+            ctx, local=local_projects, remote=remote_projects, query=project
+        )
+        return
+
+    if project is None:  # pragma: no cover (checked above, keeps mypy happy)
+        return
 
-    matches: list[tuple[str, int]] = process.extractBests(
-        project, all_projects, limit=limit, score_cutoff=FUZZY_SCORE_CUTOFF
-    )
+    matcher = Matcher(local_projects.union(remote_projects), cache=MatchCache())
+    matches = matcher.extract(project, limit=limit)
 
     table = Table(box=box.SIMPLE)
     table.add_column("Project", style="bold white")
@@ -87,7 +136,7 @@ def find(config: Config, project: str, limit: int) -> None:
         is_local = match[0] in local_projects
         table.add_row(
             match[0],
-            str(match[1]),
+            str(round(match[1])),
             (
                 Text("Local", style="green")
                 if is_local
@@ -97,3 +146,25 @@ def find(config: Config, project: str, limit: int) -> None:
 
     console = Console()
     console.print(table)
+
+
+def pick_and_checkout(
+    ctx: click.Context, local: set[str], remote: set[str], query: str | None
+) -> None:
+    """
+    Let the user pick a project as they type, then check it out.
+    """
+    from pytoil.cli.checkout import checkout
+    from pytoil.cli.picker import pick
+    from pytoil.search import NameIndex
+
+    index = NameIndex(local.union(remote))
+    if not index:
+        printer.error("You don't have any projects yet!", exits=1)
+
+    choice = pick(index, local=local, default=query or "")
+    if not choice:
+        printer.warn("Aborted", exits=1)
+        return
+
+    ctx.invoke(checkout, project=choice)
@@ -11,9 +11,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import click
-import httpx
 
-from pytoil.api import API
 from pytoil.cli import utils
 from pytoil.cli.printer import printer
 from pytoil.repo import Repo
@@ -44,7 +42,10 @@ def gh(config: Config, project: str, issues: bool, prs: bool) -> None:
 
     $ pytoil gh my_project --prs
     """
-    api = API(username=config.username, token=config.token)
+    import httpx
+
+    from pytoil.api import API
+
     repo = Repo(
         owner=config.username,
         name=project,
@@ -52,7 +53,8 @@ def gh(config: Config, project: str, issues: bool, prs: bool) -> None:
     )
 
     try:
-        exists = repo.exists_remote(api)
+        with API(username=config.username, token=config.token) as api:
+            exists = repo.exists_remote(api)
     except httpx.HTTPStatusError as err:
         utils.handle_http_status_error(err)
     else:
@@ -15,7 +15,6 @@ from rich import box
 from rich.console import Console
 from rich.table import Table
 
-from pytoil.api import API
 from pytoil.cli.printer import printer
 from pytoil.exceptions import RepoNotFoundError
 from pytoil.repo import Repo
@@ -43,7 +42,8 @@ def info(config: Config, project: str) -> None:
     Examples:
     $ pytoil info my_project
     """
-    api = API(username=config.username, token=config.token)
+    from pytoil.api import API
+
     repo = Repo(
         owner=config.username,
         name=project,
@@ -51,7 +51,8 @@ def info(config: Config, project: str) -> None:
     )
 
     try:
-        info = repo.info(api)
+        with API(username=config.username, token=config.token) as api:
+            info = repo.info(api)
     except RepoNotFoundError:
         printer.error(
             f"{project!r} not found locally or on GitHub. Was it a typo?", exits=1
@@ -8,14 +8,13 @@ Created: 06/02/2022
 
 from __future__ import annotations
 
-import shutil
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import click
-import questionary
 
+from pytoil.cli import utils
 from pytoil.cli.printer import printer
+from pytoil.projects import LocalProjects
 
 if TYPE_CHECKING:
     from pytoil.config import Config
@@ -34,9 +33,10 @@ def keep(config: Config, projects: tuple[str, ...], force: bool) -> None:
 
     It is effectively the inverse of `pytoil remove`.
 
-    As with most programmatic deleting, the directories are deleted instantly and
-    not sent to trash. As such, pytoil will prompt you for confirmation before
-    doing anything.
+    Projects are moved to pytoil's trash, which is instant however big they are,
+    and deleted for good in the background once the undo window ("undo_window"
+    in the config) is up. Until then "pytoil trash undo" brings them back.
+    pytoil will still prompt you for confirmation before doing anything.
 
     The "--force/-f" flag can be used to force deletion without the confirmation
     prompt. Use with caution!
@@ -46,11 +46,9 @@ def keep(config: Config, projects: tuple[str, ...], force: bool) -> None:
 
     $ pytoil keep project1 project2 project3 --force
     """
-    local_projects: set[str] = {
-        f.name
-        for f in config.projects_dir.iterdir()
-        if f.is_dir() and not f.name.startswith(".")
-    }
+    import questionary
+
+    local_projects = LocalProjects(config).names()
 
     if not local_projects:
         printer.error("You don't have any local projects to remove", exits=1)
@@ -94,12 +92,4 @@ def keep(config: Config, projects: tuple[str, ...], force: bool) -> None:
             printer.warn("Aborted", exits=1)
 
     # If we get here, user has used --force or said yes when prompted
-    # do the deleting in a threadpool so it's concurrent
-    with ThreadPoolExecutor() as executor:
-        for project in to_delete:
-            executor.submit(remove_and_report, config=config, project=project)
-
-
-def remove_and_report(config: Config, project: str) -> None:
-    shutil.rmtree(path=config.projects_dir.joinpath(project), ignore_errors=True)
-    printer.good(f"Deleted {project}")
+    utils.trash_projects(config=config, projects=to_delete)
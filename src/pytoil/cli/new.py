@@ -8,26 +8,28 @@ Created: 21/12/2021
 
 from __future__ import annotations
 
+import subprocess
 from typing import TYPE_CHECKING
 
 import click
-import copier
-from cookiecutter.main import cookiecutter
 
 from pytoil import editor
-from pytoil.api import API
+from pytoil.cli import utils
 from pytoil.cli.printer import printer
-from pytoil.environments import Conda, Venv
+from pytoil.environments import Conda, Venv, VenvTemplates, Wheelhouse
 from pytoil.exceptions import (
     CargoNotInstalledError,
     EnvironmentAlreadyExistsError,
     GoNotInstalledError,
+    UvNotInstalledError,
 )
 from pytoil.git import Git
 from pytoil.repo import Repo
 from pytoil.starters import GoStarter, PythonStarter, RustStarter
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from pytoil.config import Config
 
 
@@ -125,7 +127,8 @@ def new(  # noqa: C901
 
     $ pytoil new my_project --starter python
     """
-    api = API(username=config.username, token=config.token)
+    import asyncio
+
     repo = Repo(
         owner=config.username,
         name=project,
@@ -152,14 +155,15 @@ def new(  # noqa: C901
     ):
         printer.error(f"Can't create a venv for a {starter} project", exits=1)
 
+    installer = utils.resolve_installer(config) if venv == "venv" else None
+
     # Resolve config vs flag for no-git
     # flag takes priority over config
     use_git: bool = config.git and not no_git
 
     # Does this project already exist?
     # Mightaswell check concurrently
-    local = repo.exists_local()
-    remote = repo.exists_remote(api)
+    local, remote = asyncio.run(check_exists(repo=repo, config=config))
 
     if local:
         printer.error(f"{repo.name} already exists locally.")
@@ -175,10 +179,14 @@ def new(  # noqa: C901
 
     # If we get here, we're good to create a new project
     if cookie:
+        from cookiecutter.main import cookiecutter
+
         printer.info(f"Creating {repo.name} from cookiecutter: {cookie}.")
         cookiecutter(template=cookie, output_dir=str(config.projects_dir))
 
     elif _copier:
+        import copier
+
         printer.info(f"Creating {repo.name} from copier: {_copier}.")
         copier.run_copy(src_path=_copier, dst_path=repo.local_path)
 
@@ -232,10 +240,20 @@ def new(  # noqa: C901
         if to_install:
             printer.note(f"Including {', '.join(to_install)}")
 
-        env = Venv(root=repo.local_path)
-        with printer.progress() as p:
-            p.add_task("[bold white]Working")
-            env.create(packages=to_install, silent=True)
+        env = Venv(
+            root=repo.local_path,
+            wheelhouse=Wheelhouse() if config.wheelhouse else None,
+            installer=installer,
+        )
+        try:
+            with printer.progress() as p:
+                p.add_task("[bold white]Working")
+                create_venv(env=env, packages=packages, config=config)
+        except UvNotInstalledError as err:
+            printer.error(err.message, exits=1)
+        except subprocess.CalledProcessError as err:
+            # e.g. uv failing to create the environment
+            printer.error(f"Could not create the environment: {err}", exits=1)
 
     elif venv == "conda":
         # Note, conda installs take longer so by default we don't hide the output
@@ -262,3 +280,39 @@ def new(  # noqa: C901
     if config.specifies_editor():
         printer.sub_info(f"Opening {repo.name} with {config.editor}")
         editor.launch(path=repo.local_path, binary=config.editor)
+
+
+def create_venv(env: Venv, packages: Sequence[str], config: Config) -> None:
+    """
+    Create `env` with `packages` and the common packages installed, cloning
+    it from a template that already has the common packages if the config
+    allows.
+    """
+    if config.venv_templates:
+        templates = VenvTemplates(installer=env.installer, wheelhouse=env.wheelhouse)
+        if templates.clone(
+            config.common_packages, env.project_path.joinpath(".venv"), silent=True
+        ):
+            if packages:
+                env.install(packages=packages, silent=True)
+            return
+
+    env.create(packages=[*packages, *config.common_packages], silent=True)
+
+
+async def check_exists(repo: Repo, config: Config) -> tuple[bool, bool]:
+    """
+    Check whether `repo` exists locally and on GitHub at the same time.
+
+    Returns:
+        tuple[bool, bool]: (exists locally, exists on GitHub)
+    """
+    import asyncio
+
+    from pytoil.api import AsyncAPI
+
+    async with AsyncAPI(username=config.username, token=config.token) as api:
+        return await asyncio.gather(
+            asyncio.to_thread(repo.exists_local),
+            api.check_repo_exists(owner=repo.owner, name=repo.name),
+        )
@@ -0,0 +1,81 @@
+"""
+Interactive, search-as-you-type project picker.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import questionary
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from prompt_toolkit.document import Document
+
+    from pytoil.search import NameIndex
+
+# Suggestions shown at once, more than fit on most screens isn't useful
+PICKER_LIMIT = 15
+
+
+class IndexCompleter(Completer):
+    def __init__(
+        self, index: NameIndex, local: set[str], limit: int = PICKER_LIMIT
+    ) -> None:
+        """
+        Completes project names from `index` as the user types.
+
+        Args:
+            index (NameIndex): The names to pick from.
+            local (set[str]): Which of them are available locally.
+            limit (int, optional): Maximum number of suggestions.
+                Defaults to PICKER_LIMIT.
+        """
+        self.index = index
+        self.local = local
+        self.limit = limit
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(index={self.index!r}, local=<{len(self.local)} names>,"
+            f" limit={self.limit!r})"
+        )
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent  # noqa: ARG002
+    ) -> Iterator[Completion]:
+        text = document.text_before_cursor
+        for name in self.index.search(text, limit=self.limit):
+            yield Completion(
+                name,
+                start_position=-len(text),
+                display_meta="Local" if name in self.local else "Remote",
+            )
+
+
+def pick(index: NameIndex, local: set[str], default: str = "") -> str | None:
+    """
+    Ask the user to pick a project from `index`, filtering as they type.
+
+    Returns:
+        str | None: The chosen project, or None if they gave up.
+    """
+    # Ready by the time anyone's typed enough to need it
+    threading.Thread(target=index.warm, daemon=True).start()
+
+    choice: str | None = questionary.autocomplete(
+        "Project:",
+        choices=index.names,
+        default=default,
+        completer=IndexCompleter(index, local=local),
+        validate=lambda text: text in index or "Pick one of your projects",
+    ).ask()
+    return choice
@@ -9,12 +9,24 @@ Created: 05/02/2022
 from __future__ import annotations
 
 import sys
+from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.live import Live
+from rich.progress import (
+    BarColumn,
+    Progress,
+    SpinnerColumn,
+    TaskProgressColumn,
+    TextColumn,
+    TimeElapsedColumn,
+)
 from rich.style import Style
 from rich.theme import Theme
 
+if TYPE_CHECKING:
+    from rich.console import RenderableType
+
 __all__ = ("Printer", "printer")
 
 
@@ -137,6 +149,32 @@ class Printer:
         spinner_column = SpinnerColumn("simpleDotsScrolling", style="bold white")
         return Progress(text_column, spinner_column, transient=True)
 
+    def progress_bar(self) -> Progress:
+        """
+        Return a pre-configured rich progress bar, messages printed
+        while it's running appear above it.
+        """
+        return Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            console=self._pytoil_console,
+            transient=True,
+        )
+
+    def live(self, renderable: RenderableType) -> Live:
+        """
+        Return a pre-configured rich live display of `renderable`, which
+        is only redrawn when `refresh` is called and disappears once done.
+        """
+        return Live(
+            renderable,
+            console=self._pytoil_console,
+            auto_refresh=False,
+            transient=True,
+        )
+
     def subtle(self, msg: str) -> None:
         """
         Print subtle greyed out text.
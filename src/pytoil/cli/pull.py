@@ -8,29 +8,83 @@ Created: 21/12/2021
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
+import time
 from typing import TYPE_CHECKING
 
 import click
-import httpx
-import questionary
+import humanize
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
 
-from pytoil.api import API
 from pytoil.cli import utils
 from pytoil.cli.printer import printer
-from pytoil.git import Git
+from pytoil.environments.provision import (
+    DEFAULT_CONCURRENCY as DEFAULT_VENV_CONCURRENCY,
+)
+from pytoil.environments.provision import Provisioner
+from pytoil.git.clone import DEFAULT_CONCURRENCY
+from pytoil.git.modes import CLONE_MODES
+from pytoil.projects import LocalProjects
 from pytoil.repo import Repo
 
 if TYPE_CHECKING:
     from pytoil.config import Config
+    from pytoil.environments import Environment
+    from pytoil.environments.provision import ProvisionResult
+    from pytoil.git import CloneResult
 
 
 @click.command()
 @click.argument("projects", nargs=-1)
 @click.option("-f", "--force", is_flag=True, help="Force pull without confirmation.")
 @click.option("-a", "--all", "all_", is_flag=True, help="Pull down all your projects.")
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Maximum number of projects to clone at once.",
+    show_default=True,
+)
+@click.option(
+    "-m",
+    "--mode",
+    type=click.Choice(CLONE_MODES),
+    help="How to clone, defaults to 'clone_mode' from the config.",
+)
+@click.option(
+    "-d",
+    "--depth",
+    type=click.IntRange(min=1),
+    help="Commits to keep in a shallow clone, implies '--mode shallow'.",
+)
+@click.option(
+    "-v",
+    "--venv",
+    is_flag=True,
+    help="Create an environment for each project once it's cloned.",
+)
+@click.option(
+    "--venv-jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_VENV_CONCURRENCY,
+    help="Maximum number of environments to create at once.",
+    show_default=True,
+)
 @click.pass_obj
-def pull(config: Config, projects: tuple[str, ...], force: bool, all_: bool) -> None:
+def pull(  # noqa: C901
+    config: Config,
+    projects: tuple[str, ...],
+    force: bool,
+    all_: bool,
+    jobs: int,
+    mode: str | None,
+    depth: int | None,
+    venv: bool,
+    venv_jobs: int,
+) -> None:
     """
     Pull down your remote projects.
 
@@ -44,7 +98,21 @@ def pull(config: Config, projects: tuple[str, ...], force: bool, all_: bool) ->
     if you're into that sorta thing.
 
     If more than 1 repo is passed (or if "--all/-a" is used) pytoil will pull
-    the repos concurrently, speeding up the process.
+    the repos concurrently, speeding up the process. The "--jobs/-j" flag
+    sets how many are cloned at once.
+
+    Any clones that fail are listed at the end.
+
+    Pulling lots of repos is much quicker with one of the cheaper clone modes
+    ("--mode/-m") e.g. "shallow" (just the latest commit, see "--depth/-d") or
+    "blobless" (all the history but file contents are only fetched when
+    needed). Use "pytoil unshallow" to turn any of them into a full clone later.
+    The default comes from the "clone_mode" config key.
+
+    The "--venv/-v" flag creates an environment for each project, the same
+    way "pytoil checkout --venv" does, as soon as it's cloned while the rest
+    are still cloning. Environments are created on their own, smaller pool
+    ("--venv-jobs") so installing doesn't slow down cloning.
 
     Any remote project that already exists locally will be skipped and none of
     your local projects are changed in any way. pytoil will only pull down
@@ -64,30 +132,48 @@ def pull(config: Config, projects: tuple[str, ...], force: bool, all_: bool) ->
     $ pytoil pull --all
 
     $ pytoil pull --all --force
+
+    $ pytoil pull --all --jobs 16
+
+    $ pytoil pull --all --mode blobless
+
+    $ pytoil pull --all --venv
     """
+    import httpx
+    import questionary
+
+    from pytoil.api import API
+    from pytoil.git import CloneEngine, CloneJob
+
+    options = utils.resolve_clone_options(config, mode=mode, depth=depth)
+    if venv:
+        utils.resolve_installer(config)
+
     if not projects and not all_:
         printer.error(
             "If not using the '--all' flag, you must specify projects to pull.", exits=1
         )
 
-    api = API(username=config.username, token=config.token)
+    # pull only clones the user's own repos, "owner/repo" would otherwise
+    # pass the lookup below and be cloned as a project named "owner/repo"
+    for project in projects:
+        if "/" in project:
+            printer.error(f"{project!r} not found on GitHub. Was it a typo?", exits=1)
 
-    local_projects: set[str] = {
-        f.name
-        for f in config.projects_dir.iterdir()
-        if f.is_dir() and not f.name.startswith(".")
-    }
+    local_projects = LocalProjects(config).names()
 
     try:
-        remote_projects = api.get_repo_names()
+        with API(username=config.username, token=config.token) as api:
+            if all_:
+                remote_projects = api.get_repo_names()
+            else:
+                # Only the named projects matter so check them all in one
+                # request rather than listing every repo
+                found = api.check_repos_exist(projects)
+                remote_projects = {name for name, exists in found.items() if exists}
     except httpx.HTTPStatusError as err:
         utils.handle_http_status_error(err)
     else:
-        if not remote_projects:
-            printer.error("You don't have any remote projects to pull.", exits=1)
-
-        specified_remotes = remote_projects if all_ else set(projects)
-
         # Check for typos
         for project in projects:
             if project not in remote_projects:
@@ -95,6 +181,11 @@ def pull(config: Config, projects: tuple[str, ...], force: bool, all_: bool) ->
                     f"{project!r} not found on GitHub. Was it a typo?", exits=1
                 )
 
+        if not remote_projects:
+            printer.error("You don't have any remote projects to pull.", exits=1)
+
+        specified_remotes = remote_projects if all_ else set(projects)
+
         diff = specified_remotes.difference(local_projects)
         if not diff:
             printer.good("Your local and remote projects are in sync!", exits=0)
@@ -120,14 +211,180 @@ def pull(config: Config, projects: tuple[str, ...], force: bool, all_: bool) ->
                 name=project,
                 local_path=config.projects_dir.joinpath(project),
             )
-            for project in diff
+            for project in sorted(diff)
         ]
-        git = Git()
-        with ThreadPoolExecutor() as executor:
-            for repo in to_clone:
-                executor.submit(clone_and_report, repo=repo, git=git, config=config)
 
+        repos = {repo.name: repo for repo in to_clone}
 
-def clone_and_report(repo: Repo, git: Git, config: Config) -> None:
-    git.clone(url=repo.clone_url, cwd=config.projects_dir)
-    printer.good(f"Cloned {repo.name!r}")
+        with printer.progress_bar() as progress:
+            task = progress.add_task("Cloning", total=len(to_clone))
+            env_task = progress.add_task(
+                "Environments", total=len(to_clone), visible=venv
+            )
+
+            def report(result: CloneResult) -> None:
+                if result.ok:
+                    printer.good(f"Cloned {result.job.name!r}")
+                    if venv:
+                        provisioner.submit(
+                            result.job.name, detect_env(repos[result.job.name], config)
+                        )
+                elif venv:
+                    # Nothing to create an environment in
+                    progress.advance(env_task)
+                progress.update(task, completed=engine.completed)
+
+            def env_started(name: str, env: Environment) -> None:
+                printer.sub_info(f"Creating {env.name} environment for {name!r}")
+
+            def env_done(result: ProvisionResult) -> None:
+                if result.status == "created":
+                    printer.good(
+                        f"Created {result.env} environment for {result.name!r} in"
+                        f" {result.duration:.1f}s"
+                    )
+                elif result.status == "skipped":
+                    printer.warn(
+                        f"No environment for {result.name!r}: {escape(result.detail)}"
+                    )
+                else:
+                    printer.error(
+                        f"Could not create an environment for {result.name!r}:"
+                        f" {escape(result.detail)}"
+                    )
+                progress.advance(env_task)
+
+            engine = CloneEngine(
+                concurrency=jobs,
+                mirrors=utils.mirror_cache(config),
+                on_progress=lambda *_: progress.update(
+                    task, completed=engine.completed
+                ),
+                on_done=report,
+            )
+            provisioner = Provisioner(
+                concurrency=venv_jobs, on_start=env_started, on_done=env_done
+            )
+            start = time.perf_counter()
+            # Leaving the provisioner waits for the environments still going
+            with provisioner:
+                results = engine.run(
+                    CloneJob(
+                        name=repo.name,
+                        url=repo.clone_url,
+                        dest=repo.local_path,
+                        options=options,
+                    )
+                    for repo in to_clone
+                )
+                cloned = time.perf_counter() - start
+                # CloneEngine handles Ctrl-C itself, so the environments
+                # still queued have to be told too
+                if engine.cancelled:
+                    provisioner.cancel()
+
+        summarise(
+            results,
+            elapsed=cloned,
+            cancelled=engine.cancelled,
+            environments=provisioner.results() if venv else None,
+            env_elapsed=provisioner.elapsed,
+            total=time.perf_counter() - start,
+        )
+
+
+def detect_env(repo: Repo, config: Config) -> Environment | None:
+    """
+    The environment for a freshly cloned `repo`, None if it can't be
+    detected (including a project file too broken to read).
+    """
+    try:
+        return repo.dispatch_env(config)
+    except (OSError, ValueError):
+        return None
+
+
+def summarise_envs(results: list[ProvisionResult], elapsed: float, total: float) -> int:
+    """
+    Print a summary of the environments created by "pull --venv", with
+    a table of any that failed, and how long each stage took.
+
+    Returns:
+        int: How many failed.
+    """
+    created = [result for result in results if result.status == "created"]
+    skipped = [result for result in results if result.status == "skipped"]
+    failed = [result for result in results if not result.ok]
+
+    printer.info(
+        f"Created {len(created)} of {len(results)} environments in {elapsed:.1f}s"
+        + (f", skipped {len(skipped)}" if skipped else ""),
+        spaced=True,
+    )
+    if created:
+        slowest = max(created, key=lambda result: result.duration)
+        printer.note(
+            f"Installing took {sum(r.duration for r in created):.1f}s in all, the"
+            f" slowest was {slowest.name!r} ({slowest.duration:.1f}s). Cloning and"
+            f" environments together took {total:.1f}s."
+        )
+
+    if failed:
+        table = Table(box=box.SIMPLE)
+        table.add_column("Project", style="bold white")
+        table.add_column("Environment")
+        table.add_column("Error")
+        for result in failed:
+            table.add_row(result.name, result.env or "", escape(result.detail))
+        Console().print(table)
+
+    return len(failed)
+
+
+def summarise(
+    results: list[CloneResult],
+    elapsed: float,
+    cancelled: bool = False,
+    environments: list[ProvisionResult] | None = None,
+    env_elapsed: float = 0.0,
+    total: float = 0.0,
+) -> None:
+    """
+    Print a summary of the clones, and of the environments if "--venv"
+    was used, with a table of any that failed, and exit non-zero if any
+    of them did.
+    """
+    cloned = [result for result in results if result.ok]
+    failed = [result for result in results if not result.ok]
+    received = humanize.naturalsize(
+        sum(result.received for result in cloned), binary=True
+    )
+
+    printer.info(
+        (
+            f"Cloned {len(cloned)} of {len(results)} projects ({received}) in"
+            f" {elapsed:.1f}s"
+        ),
+        spaced=True,
+    )
+
+    if failed:
+        table = Table(box=box.SIMPLE)
+        table.add_column("Project", style="bold white")
+        table.add_column("Error")
+        for result in failed:
+            table.add_row(result.job.name, escape(result.error))
+        Console().print(table)
+
+    env_failed = 0
+    if environments is not None:
+        env_failed = summarise_envs(environments, elapsed=env_elapsed, total=total)
+
+    if cancelled:
+        printer.warn("Cancelled", exits=130)
+
+    if failed:
+        printer.error(f"{len(failed)} project(s) could not be cloned.", exits=1)
+
+    if env_failed:
+        printer.error(f"{env_failed} environment(s) could not be created.", exits=1)
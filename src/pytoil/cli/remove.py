@@ -8,14 +8,13 @@ Created: 21/12/2021
 
 from __future__ import annotations
 
-import shutil
-from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 import click
-import questionary
 
+from pytoil.cli import utils
 from pytoil.cli.printer import printer
+from pytoil.projects import LocalProjects
 
 if TYPE_CHECKING:
     from pytoil.config import Config
@@ -42,9 +41,10 @@ def remove(config: Config, projects: tuple[str, ...], force: bool, all_: bool) -
     You can selectively remove any number of projects by passing them as
     arguments or nuke the whole lot with "--all/-a" if you want.
 
-    As with most programmatic deleting, the directories are deleted instantly and
-    not sent to trash. As such, pytoil will prompt you for confirmation before
-    doing anything.
+    Projects are moved to pytoil's trash, which is instant however big they are,
+    and deleted for good in the background once the undo window ("undo_window"
+    in the config) is up. Until then "pytoil trash undo" brings them back.
+    pytoil will still prompt you for confirmation before doing anything.
 
     The "--force/-f" flag can be used to force deletion without the confirmation
     prompt. Use with caution!
@@ -58,11 +58,9 @@ def remove(config: Config, projects: tuple[str, ...], force: bool, all_: bool) -
 
     $ pytoil remove --all --force
     """
-    local_projects: set[str] = {
-        f.name
-        for f in config.projects_dir.iterdir()
-        if f.is_dir() and not f.name.startswith(".")
-    }
+    import questionary
+
+    local_projects = LocalProjects(config).names()
 
     if not local_projects:
         printer.error("You don't have any local projects to remove", exits=1)
@@ -117,12 +115,4 @@ def remove(config: Config, projects: tuple[str, ...], force: bool, all_: bool) -
             printer.warn("Aborted", exits=1)
 
     # If we get here, user has used --force or said yes when prompted
-    # do the deleting in a threadpool so it's concurrent
-    with ThreadPoolExecutor() as executor:
-        for project in to_delete:
-            executor.submit(remove_and_report, config=config, project=project)
-
-
-def remove_and_report(config: Config, project: str) -> None:
-    shutil.rmtree(config.projects_dir.joinpath(project), ignore_errors=True)
-    printer.good(f"Deleted {project}")
+    utils.trash_projects(config=config, projects=to_delete)
@@ -8,48 +8,78 @@ Created: 21/12/2021
 
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
-import questionary
-import rich.traceback
 
 from pytoil import __version__
-from pytoil.cli.bug import bug
-from pytoil.cli.checkout import checkout
-from pytoil.cli.config import config
-from pytoil.cli.docs import docs
-from pytoil.cli.find import find
-from pytoil.cli.gh import gh
-from pytoil.cli.info import info
-from pytoil.cli.keep import keep
-from pytoil.cli.new import new
 from pytoil.cli.printer import printer
-from pytoil.cli.pull import pull
-from pytoil.cli.remove import remove
-from pytoil.cli.show import show
-from pytoil.config import Config, defaults
-
-# So that if we do ever get a traceback, it uses rich to show it nicely
-rich.traceback.install()
-
-
-@click.group(
-    commands={
-        "checkout": checkout,
-        "config": config,
-        "docs": docs,
-        "find": find,
-        "gh": gh,
-        "info": info,
-        "new": new,
-        "pull": pull,
-        "remove": remove,
-        "show": show,
-        "keep": keep,
-        "bug": bug,
-    }
-)
+from pytoil.config import defaults
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# Subcommand name -> "module:attribute" of the click command implementing it
+SUBCOMMANDS: dict[str, str] = {
+    "checkout": "pytoil.cli.checkout:checkout",
+    "config": "pytoil.cli.config:config",
+    "docs": "pytoil.cli.docs:docs",
+    "find": "pytoil.cli.find:find",
+    "gh": "pytoil.cli.gh:gh",
+    "info": "pytoil.cli.info:info",
+    "new": "pytoil.cli.new:new",
+    "pull": "pytoil.cli.pull:pull",
+    "remove": "pytoil.cli.remove:remove",
+    "show": "pytoil.cli.show:show",
+    "status": "pytoil.cli.status:status",
+    "sync": "pytoil.cli.sync:sync",
+    "trash": "pytoil.cli.trash:trash",
+    "unshallow": "pytoil.cli.unshallow:unshallow",
+    "wheelhouse": "pytoil.cli.wheelhouse:wheelhouse",
+    "keep": "pytoil.cli.keep:keep",
+    "bug": "pytoil.cli.bug:bug",
+}
+
+
+class LazyGroup(click.Group):
+    """
+    A click Group that only imports a subcommand's module when that
+    subcommand is actually needed.
+
+    Startup time is dominated by imports, so `pytoil config get editor`
+    shouldn't have to import everything `pytoil new` needs.
+    """
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        lazy_subcommands: Mapping[str, str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        module_name, _, attribute = self.lazy_subcommands[cmd_name].partition(":")
+        command = getattr(importlib.import_module(module_name), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(  # pragma: no cover
+                f"Lazy subcommand {cmd_name!r} is not a click Command: {command!r}"
+            )
+        return command
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=SUBCOMMANDS)
 @click.version_option(version=__version__, prog_name="pytoil")
 @click.pass_context
 def main(ctx: click.Context) -> None:
@@ -64,6 +94,13 @@ def main(ctx: click.Context) -> None:
 
     - Minimal configuration required.
     """
+    import rich.traceback
+
+    from pytoil.config import Config
+
+    # So that if we do ever get a traceback, it uses rich to show it nicely
+    rich.traceback.install()
+
     # Load the config once on launch of the app and pass it down to the child commands
     # through click's context
     try:
@@ -89,6 +126,10 @@ def interactive_config() -> None:
     Prompt the user with a series of questions
     to configure pytoil interactively.
     """
+    import questionary
+
+    from pytoil.config import Config
+
     printer.warn("No pytoil config file detected!")
     interactive: bool = questionary.confirm(
         "Interactively configure pytoil?", default=False, auto_enter=False
@@ -12,19 +12,17 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import click
-import httpx
 import humanize
 from rich import box
 from rich.console import Console
 from rich.table import Table
 
-from pytoil.api import API
 from pytoil.cli import utils
 from pytoil.cli.printer import printer
+from pytoil.exceptions import ResponseNotCachedError
+from pytoil.projects import LocalProjects
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
     from pytoil.config import Config
 
 
@@ -60,28 +58,34 @@ def show() -> None:
     help="Maximum number of projects to list.",
     show_default=True,
 )
+@click.option(
+    "-r",
+    "--refresh",
+    is_flag=True,
+    help="Rescan the projects directory rather than using the index.",
+)
 @click.pass_obj
-def local(config: Config, limit: int) -> None:
+def local(config: Config, limit: int, refresh: bool) -> None:
     """
     Show your local projects.
 
     Show the projects you have locally in your configured
-    projects directory.
+    projects directory, and the kind of environment each one uses.
 
     You can limit the number of projects shown with the
     "--limit/-l" flag.
 
+    Projects are read from an index that's updated whenever projects are
+    added or removed, use "-r/--refresh" to rescan every project.
+
     Examples:
     $ pytoil show local
 
     $ pytoil show local --limit 5
     """
     console = Console()
-    local_projects: set[Path] = {
-        f
-        for f in config.projects_dir.iterdir()
-        if f.is_dir() and not f.name.startswith(".")
-    }
+    index = LocalProjects(config, refresh=refresh)
+    local_projects = index.projects()
 
     if not local_projects:
         printer.error("You don't have any local projects yet!", exits=1)
@@ -90,27 +94,27 @@ def local(config: Config, limit: int) -> None:
     table.add_column("Name", style="bold white")
     table.add_column("Created")
     table.add_column("Modified")
+    table.add_column("Environment")
 
-    stats = (project.stat() for project in local_projects)
-
-    results = dict(zip(local_projects, stats))
+    # Only detected for the projects actually shown
+    shown = local_projects[:limit]
+    environments = index.environments(project.name for project in shown)
 
     printer.title("Local Projects", spaced=False)
     console.print(
-        f"[bright_black italic]\nShowing {min(limit, len(results))} out of"
+        f"[bright_black italic]\nShowing {min(limit, len(local_projects))} out of"
         f" {len(local_projects)} local projects [/]"
     )
-    for path, result in sorted(results.items(), key=lambda x: str.casefold(str(x[0])))[
-        :limit
-    ]:
+    for project in shown:
         table.add_row(
-            path.name,
+            project.name,
             humanize.naturaltime(
-                datetime.utcfromtimestamp(result.st_birthtime), when=datetime.utcnow()  # type: ignore[attr-defined]
+                datetime.utcfromtimestamp(project.created), when=datetime.utcnow()
             ),
             humanize.naturaltime(
-                datetime.utcfromtimestamp(result.st_mtime), when=datetime.utcnow()
+                datetime.utcfromtimestamp(project.modified), when=datetime.utcnow()
             ),
+            environments[project.name] or "-",
         )
 
     console.print(table)
@@ -125,8 +129,19 @@ def local(config: Config, limit: int) -> None:
     help="Maximum number of projects to list.",
     show_default=True,
 )
+@click.option(
+    "-r",
+    "--refresh",
+    is_flag=True,
+    help="Ignore cached results and fetch fresh ones from GitHub.",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Only use cached results, never hit GitHub.",
+)
 @click.pass_obj
-def remote(config: Config, limit: int) -> None:
+def remote(config: Config, limit: int, refresh: bool, offline: bool) -> None:
     """
     Show your remote projects.
 
@@ -138,18 +153,36 @@ def remote(config: Config, limit: int) -> None:
     The "-l/--limit" flag can be used to limit the number of repos
     returned.
 
+    Results are cached for a few minutes, use "-r/--refresh" to force
+    a fresh fetch or "--offline" to only use what's cached.
+
     Examples:
     $ pytoil show remote
 
     $ pytoil show remote --limit 10
+
+    $ pytoil show remote --refresh
     """
+    import httpx
+
+    from pytoil.api import API, ResponseCache
+
     console = Console()
-    api = API(username=config.username, token=config.token)
 
     try:
-        repos = api.get_repos()
+        with API(
+            username=config.username,
+            token=config.token,
+            cache=ResponseCache(ttl=config.cache_ttl, refresh=refresh, offline=offline),
+        ) as api:
+            # Only fetch the pages we're going to show, the total
+            # comes back with the first one
+            pages = api.iter_repos(limit=limit)
+            repos = list(pages)
     except httpx.HTTPStatusError as err:
         utils.handle_http_status_error(err)
+    except ResponseNotCachedError as err:
+        printer.error(f"{err} Run without '--offline' to fetch from GitHub.", exits=1)
     else:
         if not repos:
             printer.error("You don't have any projects on GitHub yet.", exits=1)
@@ -164,11 +197,11 @@ def remote(config: Config, limit: int) -> None:
 
         printer.title("Remote Projects", spaced=False)
         console.print(
-            f"[bright_black italic]\nShowing {min(limit, len(repos))} out of"
-            f" {len(repos)} remote projects [/]"
+            f"[bright_black italic]\nShowing {len(repos)} out of"
+            f" {pages.total or len(repos)} remote projects [/]"
         )
 
-        for repo in repos[:limit]:
+        for repo in repos:
             table.add_row(
                 repo["name"],
                 humanize.naturalsize(int(repo["diskUsage"]) * 1024),
@@ -194,8 +227,19 @@ def remote(config: Config, limit: int) -> None:
     help="Maximum number of projects to list.",
     show_default=True,
 )
+@click.option(
+    "-r",
+    "--refresh",
+    is_flag=True,
+    help="Ignore cached results and fetch fresh ones from GitHub.",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Only use cached results, never hit GitHub.",
+)
 @click.pass_obj
-def forks(config: Config, limit: int) -> None:
+def forks(config: Config, limit: int, refresh: bool, offline: bool) -> None:
     """
     Show your forked projects.
 
@@ -209,14 +253,29 @@ def forks(config: Config, limit: int) -> None:
     $ pytoil show forks
 
     $ pytoil show forks --limit 10
+
+    $ pytoil show forks --offline
     """
+    import httpx
+
+    from pytoil.api import API, ResponseCache
+
     console = Console()
-    api = API(username=config.username, token=config.token)
 
     try:
-        forks = api.get_forks()
+        with API(
+            username=config.username,
+            token=config.token,
+            cache=ResponseCache(ttl=config.cache_ttl, refresh=refresh, offline=offline),
+        ) as api:
+            # Only fetch the pages we're going to show, the total
+            # comes back with the first one
+            pages = api.iter_forks(limit=limit)
+            forks = list(pages)
     except httpx.HTTPStatusError as err:
         utils.handle_http_status_error(err)
+    except ResponseNotCachedError as err:
+        printer.error(f"{err} Run without '--offline' to fetch from GitHub.", exits=1)
     else:
         if not forks:
             printer.error("You don't have any forks yet.", exits=1)
@@ -231,11 +290,11 @@ def forks(config: Config, limit: int) -> None:
 
         printer.title("Forked Projects", spaced=False)
         console.print(
-            f"[bright_black italic]\nShowing {min(limit, len(forks))} out of"
-            f" {len(forks)} forked projects [/]"
+            f"[bright_black italic]\nShowing {len(forks)} out of"
+            f" {pages.total or len(forks)} forked projects [/]"
         )
 
-        for repo in forks[:limit]:
+        for repo in forks:
             table.add_row(
                 repo["name"],
                 humanize.naturalsize(int(repo["diskUsage"]) * 1024),
@@ -263,8 +322,19 @@ def forks(config: Config, limit: int) -> None:
     help="Maximum number of projects to list.",
     show_default=True,
 )
+@click.option(
+    "-r",
+    "--refresh",
+    is_flag=True,
+    help="Ignore cached results and fetch fresh ones from GitHub.",
+)
+@click.option(
+    "--offline",
+    is_flag=True,
+    help="Only use cached results, never hit GitHub.",
+)
 @click.pass_obj
-def diff(config: Config, limit: int) -> None:
+def diff(config: Config, limit: int, refresh: bool, offline: bool) -> None:
     """
     Show the difference in local/remote projects.
 
@@ -279,19 +349,25 @@ def diff(config: Config, limit: int) -> None:
 
     $ pytoil show diff --limit 10
     """
+    import httpx
+
+    from pytoil.api import API, ResponseCache
+
     console = Console()
-    api = API(username=config.username, token=config.token)
 
-    local_projects: set[str] = {
-        f.name
-        for f in config.projects_dir.iterdir()
-        if f.is_dir() and not f.name.startswith(".")
-    }
+    local_projects = LocalProjects(config, refresh=refresh).names()
 
     try:
-        remote_projects = api.get_repos()
+        with API(
+            username=config.username,
+            token=config.token,
+            cache=ResponseCache(ttl=config.cache_ttl, refresh=refresh, offline=offline),
+        ) as api:
+            remote_projects = api.get_repos()
     except httpx.HTTPStatusError as err:
         utils.handle_http_status_error(err)
+    except ResponseNotCachedError as err:
+        printer.error(f"{err} Run without '--offline' to fetch from GitHub.", exits=1)
     else:
         if not remote_projects:
             printer.error("You don't have any projects on GitHub yet!", exits=1)
@@ -0,0 +1,178 @@
+"""
+The pytoil status command.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+import click
+import humanize
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from pytoil.cli.printer import printer
+from pytoil.git.status import DEFAULT_CONCURRENCY
+from pytoil.projects import LocalProjects
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pytoil.config import Config
+    from pytoil.git import RepoStatus
+
+# Seconds between redraws of the table while statuses are coming in
+REFRESH_INTERVAL = 0.1
+
+
+@click.command()
+@click.argument("projects", nargs=-1)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Maximum number of projects to check at once.",
+    show_default="CPUs + 4",
+)
+@click.option(
+    "--fsmonitor",
+    is_flag=True,
+    help="Use git's filesystem monitor and untracked cache, for big projects.",
+)
+@click.pass_obj
+def status(
+    config: Config, projects: tuple[str, ...], jobs: int, fsmonitor: bool
+) -> None:
+    """
+    See the state of all your local projects.
+
+    The status command shows, for every local project (or just the ones you
+    pass as arguments), the current branch, how far ahead and behind the
+    branch it tracks it is, how many files are staged, modified, conflicted
+    and untracked, how many stashes there are and when the last commit was.
+
+    Projects are checked in parallel, "--jobs/-j" sets how many at once, and
+    show up as soon as they're done.
+
+    For projects with huge working trees, "--fsmonitor" turns on git's
+    filesystem monitor and untracked cache which make every status after the
+    first one much quicker (where git supports them).
+
+    Examples:
+    $ pytoil status
+
+    $ pytoil status project1 project2
+
+    $ pytoil status --fsmonitor
+    """
+    from pytoil.git.status import collect
+
+    local_projects = LocalProjects(config).names()
+
+    if not local_projects:
+        printer.error("You don't have any local projects", exits=1)
+
+    # If user gives a project that doesn't exist (e.g. typo), abort
+    for project in projects:
+        if project not in local_projects:
+            printer.error(
+                f"{project!r} not found under {config.projects_dir}. Was it a typo?",
+                exits=1,
+            )
+
+    to_check = sorted(projects or local_projects)
+    results: list[RepoStatus] = []
+    start = time.perf_counter()
+
+    # Rows go in as they arrive, the finished table is printed sorted
+    # once they're all in
+    live_table = make_table()
+    refreshed = 0.0
+    with printer.live(live_table) as live:
+        for result in collect(
+            ((project, config.projects_dir.joinpath(project)) for project in to_check),
+            concurrency=jobs,
+            fsmonitor=fsmonitor,
+        ):
+            results.append(result)
+            add_row(live_table, result)
+            # Redrawing the whole table for every row would cost more than
+            # getting the statuses, a few times a second is plenty
+            if (now := time.perf_counter()) - refreshed > REFRESH_INTERVAL:
+                live_table.caption = f"{len(results)}/{len(to_check)}"
+                live.refresh()
+                refreshed = now
+
+    elapsed = time.perf_counter() - start
+    Console().print(make_table(sorted(results, key=lambda result: result.name)))
+    dirty = sum(not result.clean for result in results)
+    printer.info(
+        f"Checked {len(results)} projects in {elapsed:.1f}s, {dirty} need attention",
+        spaced=True,
+    )
+
+
+def make_table(results: Iterable[RepoStatus] = ()) -> Table:
+    """
+    The status table, with a row for each of `results`.
+    """
+    table = Table(box=box.SIMPLE)
+    table.add_column("Project", style="bold white")
+    table.add_column("Branch")
+    table.add_column("Ahead/Behind", justify="center")
+    table.add_column("Changes")
+    table.add_column("Stashes", justify="right")
+    table.add_column("Last Commit", justify="right")
+    for result in results:
+        add_row(table, result)
+    return table
+
+
+def add_row(table: Table, result: RepoStatus) -> None:
+    """
+    Add a row for a project's status to `table`.
+    """
+    if result.error:
+        table.add_row(result.name, f"[red]{escape(result.error)}", "", "", "", "")
+        return
+
+    if result.upstream is None:
+        ahead_behind = "[dim]-"
+    elif result.ahead or result.behind:
+        ahead_behind = f"[yellow]↑{result.ahead} ↓{result.behind}"
+    else:
+        ahead_behind = "[green]✔"
+
+    counts = (
+        ("staged", result.staged, "green"),
+        ("modified", result.modified, "yellow"),
+        ("conflicted", result.conflicted, "bold red"),
+        ("untracked", result.untracked, "cyan"),
+    )
+    changes = ", ".join(
+        f"[{style}]{count} {label}[/]" for label, count, style in counts if count
+    )
+
+    last_commit = ""
+    if result.last_commit is not None:
+        last_commit = humanize.naturaltime(
+            datetime.now(tz=timezone.utc) - result.last_commit
+        )
+
+    table.add_row(
+        result.name,
+        escape(result.branch) if result.branch else "[yellow](detached)",
+        ahead_behind,
+        changes or "[green]clean",
+        str(result.stashes or ""),
+        last_commit,
+    )
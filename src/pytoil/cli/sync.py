@@ -0,0 +1,143 @@
+"""
+The pytoil sync command.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import click
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from pytoil.cli.printer import printer
+from pytoil.git import sync as outcomes
+from pytoil.git.sync import DEFAULT_CONCURRENCY
+from pytoil.projects import LocalProjects
+
+if TYPE_CHECKING:
+    from pytoil.config import Config
+    from pytoil.git import SyncResult
+
+# How to show each outcome in the summary table
+STYLES: dict[str, str] = {
+    outcomes.UPDATED: "bold green",
+    outcomes.UP_TO_DATE: "green",
+    outcomes.AHEAD: "cyan",
+    outcomes.DIVERGED: "yellow",
+    outcomes.DIRTY: "yellow",
+    outcomes.NO_UPSTREAM: "yellow",
+    outcomes.NOT_A_REPO: "dim",
+    outcomes.FAILED: "bold red",
+    outcomes.CANCELLED: "dim",
+}
+
+
+@click.command()
+@click.argument("projects", nargs=-1)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=DEFAULT_CONCURRENCY,
+    help="Maximum number of projects to sync at once.",
+    show_default=True,
+)
+@click.pass_obj
+def sync(config: Config, projects: tuple[str, ...], jobs: int) -> None:
+    """
+    Bring your local projects up to date.
+
+    The sync command fetches every local project (or just the ones you pass
+    as arguments) from its remote, pruning any branches that have been deleted
+    there, and fast-forwards the current branch to what it tracks.
+
+    Nothing is ever merged or overwritten: projects with uncommitted changes,
+    branches that have diverged from their upstream and branches that don't
+    track one are fetched but otherwise left alone.
+
+    Projects are synced in parallel, "--jobs/-j" sets how many at once. Once
+    they're done you get a table of what happened to each one and how long it
+    took.
+
+    Examples:
+    $ pytoil sync
+
+    $ pytoil sync project1 project2
+
+    $ pytoil sync --jobs 16
+    """
+    from pytoil.git import SyncEngine
+
+    local_projects = LocalProjects(config).names()
+
+    if not local_projects:
+        printer.error("You don't have any local projects to sync", exits=1)
+
+    # If user gives a project that doesn't exist (e.g. typo), abort
+    for project in projects:
+        if project not in local_projects:
+            printer.error(
+                f"{project!r} not found under {config.projects_dir}. Was it a typo?",
+                exits=1,
+            )
+
+    to_sync = sorted(projects or local_projects)
+
+    with printer.progress_bar() as progress:
+        task = progress.add_task("Syncing", total=len(to_sync))
+        engine = SyncEngine(concurrency=jobs, on_done=lambda _: progress.advance(task))
+        start = time.perf_counter()
+        results = engine.run(
+            (project, config.projects_dir.joinpath(project)) for project in to_sync
+        )
+
+    summarise(results, elapsed=time.perf_counter() - start, cancelled=engine.cancelled)
+
+
+def summarise(
+    results: list[SyncResult], elapsed: float, cancelled: bool = False
+) -> None:
+    """
+    Print what happened to each project and exit non-zero if any
+    of them failed.
+    """
+    table = Table(box=box.SIMPLE)
+    table.add_column("Project", style="bold white")
+    table.add_column("Outcome")
+    table.add_column("Detail")
+    table.add_column("Time", justify="right")
+    for result in results:
+        table.add_row(
+            result.name,
+            f"[{STYLES[result.outcome]}]{result.outcome}",
+            escape(result.detail),
+            f"{result.duration:.1f}s" if result.outcome != outcomes.CANCELLED else "",
+        )
+    Console().print(table)
+
+    counts = Counter(result.outcome for result in results)
+    printer.info(
+        (
+            f"Synced {len(results)} projects in {elapsed:.1f}s:"
+            f" {counts[outcomes.UPDATED]} updated,"
+            f" {counts[outcomes.UP_TO_DATE] + counts[outcomes.AHEAD]} up to date,"
+            f" {sum(result.skipped for result in results)} skipped,"
+            f" {counts[outcomes.FAILED]} failed"
+        ),
+        spaced=True,
+    )
+
+    if cancelled:
+        printer.warn("Cancelled", exits=130)
+
+    if failed := counts[outcomes.FAILED]:
+        printer.error(f"{failed} project(s) could not be synced.", exits=1)
@@ -0,0 +1,180 @@
+"""
+The pytoil trash command group.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import click
+import humanize
+from rich import box
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+
+from pytoil.cli.printer import printer
+from pytoil.projects.trash import Trash
+
+if TYPE_CHECKING:
+    from pytoil.config import Config
+    from pytoil.projects.trash import TrashEntry, TrashFailure
+
+
+@click.group()
+def trash() -> None:
+    """
+    Manage projects you've removed.
+
+    "pytoil remove" and "pytoil keep" move projects to pytoil's trash so they
+    return straight away, and the space is reclaimed in the background once the
+    undo window ("undo_window" in the config) is up.
+
+    The trash command group lets you see what's in the trash, bring projects
+    back and empty it.
+    """
+
+
+@trash.command(name="list")
+@click.pass_obj
+def list_(config: Config) -> None:
+    """
+    Show what's in the trash.
+
+    Anything that couldn't be deleted is shown along with why.
+
+    Examples:
+    $ pytoil trash list
+    """
+    entries = Trash(config.projects_dir).entries()
+    if not entries:
+        printer.good("The trash is empty")
+        return
+
+    now = time.time()
+    table = Table(box=box.SIMPLE)
+    table.add_column("Project", style="bold white")
+    table.add_column("Removed")
+    table.add_column("Status")
+    for entry in entries:
+        table.add_row(
+            entry.name,
+            humanize.naturaltime(now - entry.trashed),
+            f"[red]{escape(entry.error)}" if entry.error else "[dim]Waiting to purge",
+        )
+    Console().print(table)
+
+
+@trash.command()
+@click.argument("projects", nargs=-1)
+@click.pass_obj
+def undo(config: Config, projects: tuple[str, ...]) -> None:
+    """
+    Bring removed projects back.
+
+    With no arguments, everything removed by the last "pytoil remove" or
+    "pytoil keep" is put back. Otherwise the named projects are, the most
+    recently removed copy of each.
+
+    Examples:
+    $ pytoil trash undo
+
+    $ pytoil trash undo project1 project2
+    """
+    projects_trash = Trash(config.projects_dir)
+
+    to_restore: list[TrashEntry]
+    if projects:
+        latest: dict[str, TrashEntry] = {}
+        # Newest first, so the first of each name is the latest
+        for entry in projects_trash.entries():
+            latest.setdefault(entry.name, entry)
+
+        for project in projects:
+            if project not in latest:
+                printer.error(f"{project!r} is not in the trash.", exits=1)
+
+        to_restore = [latest[project] for project in projects]
+    else:
+        batches = projects_trash.batches()
+        if not batches:
+            printer.error("There's nothing in the trash to bring back.", exits=1)
+        to_restore = projects_trash.entries(batches[0])
+
+    restored, failed = projects_trash.restore(to_restore)
+    for path in restored:
+        printer.good(f"Restored {path.name}")
+
+    report(failed, action="restored")
+
+
+@trash.command()
+@click.option("-f", "--force", is_flag=True, help="Empty without confirmation.")
+@click.pass_obj
+def empty(config: Config, force: bool) -> None:
+    """
+    Delete everything in the trash for good.
+
+    Removed projects are normally deleted in the background once the undo
+    window is up, this deletes them all now (and retries any that couldn't be
+    deleted before) and waits until it's done.
+
+    Examples:
+    $ pytoil trash empty
+
+    $ pytoil trash empty --force
+    """
+    import questionary
+
+    projects_trash = Trash(config.projects_dir)
+    entries = projects_trash.entries()
+    if not entries:
+        printer.good("The trash is already empty")
+        return
+
+    if not force:
+        confirmed: bool = questionary.confirm(
+            (
+                f"This will permanently delete {len(entries)} project(s) from the"
+                " trash. Are you sure?"
+            ),
+            default=False,
+            auto_enter=False,
+        ).ask()
+
+        if not confirmed:
+            printer.warn("Aborted", exits=1)
+
+    with printer.progress() as p:
+        p.add_task("[bold white]Emptying the trash")
+        failed = projects_trash.purge()
+
+    deleted = len(entries) - len({failure.name for failure in failed})
+    printer.good(f"Deleted {deleted} project(s) for good")
+
+    report(failed, action="deleted")
+
+
+def report(failed: list[TrashFailure], action: str) -> None:
+    """
+    Print why anything couldn't be restored or deleted and exit
+    non-zero if there's anything.
+    """
+    if not failed:
+        return
+
+    table = Table(box=box.SIMPLE)
+    table.add_column("Project", style="bold white")
+    table.add_column("Path")
+    table.add_column("Error")
+    for failure in failed:
+        table.add_row(failure.name, str(failure.path), escape(failure.error))
+    Console().print(table)
+
+    projects = len({failure.name for failure in failed})
+    printer.error(f"{projects} project(s) could not be {action}.", exits=1)
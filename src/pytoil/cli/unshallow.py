@@ -0,0 +1,76 @@
+"""
+The pytoil unshallow command.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+
+from pytoil.cli.printer import printer
+from pytoil.git import Git
+from pytoil.projects import LocalProjects
+
+if TYPE_CHECKING:
+    from pytoil.config import Config
+
+
+@click.command()
+@click.argument("projects", nargs=-1, required=True)
+@click.pass_obj
+def unshallow(config: Config, projects: tuple[str, ...]) -> None:
+    """
+    Turn quick clones into full ones.
+
+    The unshallow command fetches everything that was left out of local
+    projects cloned with one of the cheaper clone modes ("--mode" on checkout
+    and pull, or "clone_mode" in the config): the full history and every
+    branch of a shallow clone, all the file contents of a blobless or treeless
+    clone, and checks out every file of a sparse one.
+
+    Projects that are already full clones are left alone.
+
+    Examples:
+    $ pytoil unshallow my_project
+
+    $ pytoil unshallow project1 project2
+    """
+    local_projects = LocalProjects(config).names()
+
+    for project in projects:
+        if project not in local_projects:
+            printer.error(
+                f"{project!r} not found under {config.projects_dir}. Was it a typo?",
+                exits=1,
+            )
+
+    git = Git()
+    failed = False
+    for project in projects:
+        path = config.projects_dir.joinpath(project)
+        if not path.joinpath(".git").exists():
+            printer.warn(f"{project!r} is not a git repo. Skipping.")
+            continue
+
+        if not (state := git.clone_state(path)):
+            printer.good(f"{project!r} is already a full clone")
+            continue
+
+        printer.info(f"Fetching the rest of {project!r} ({', '.join(sorted(state))})")
+        with printer.progress() as p:
+            p.add_task("[bold white]Working")
+            returncode = git.unshallow(path)
+
+        if returncode:
+            printer.error(f"Could not unshallow {project!r} (git exited {returncode})")
+            failed = True
+        else:
+            printer.good(f"{project!r} is now a full clone")
+
+    if failed:
+        printer.note("Run the git commands by hand to see what went wrong.", exits=1)
@@ -7,13 +7,25 @@ Created: 30/12/2021
 """
 from __future__ import annotations
 
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+import humanize
+
 from pytoil.cli.printer import printer
+from pytoil.environments.installer import get_installer
+from pytoil.git.mirror import MIB, MirrorCache
+from pytoil.git.modes import clone_options
+from pytoil.projects.trash import Trash
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from httpx import HTTPStatusError
 
+    from pytoil.config import Config
+    from pytoil.environments.installer import Installer
+
 
 def handle_http_status_error(error: HTTPStatusError) -> None:
     """
@@ -33,6 +45,110 @@ def handle_http_status_error(error: HTTPStatusError) -> None:
     elif code == 404:
         printer.error("HTTP 404 - Not Found")
         printer.note("This is a bug we've not handled, please raise an issue!", exits=1)
+    elif code in {403, 429}:
+        printer.error(f"HTTP {code} - Rate Limited")
+        if reset := error.response.headers.get("X-RateLimit-Reset"):
+            resets = datetime.fromtimestamp(int(reset)).strftime("%H:%M:%S")
+            printer.note(f"GitHub's API rate limit resets at {resets}", exits=1)
+        else:
+            printer.note("GitHub is throttling requests, try again shortly!", exits=1)
     elif code == 500:
         printer.error("HTTP 500 - Server Error")
         printer.note("This is very rare but it means GitHub is not happy!", exits=1)
+    elif code in {502, 503, 504}:
+        printer.error(f"HTTP {code} - GitHub Unavailable")
+        printer.note("GitHub is struggling right now, try again shortly!", exits=1)
+
+
+def resolve_clone_options(
+    config: Config, mode: str | None = None, depth: int | None = None
+) -> list[str]:
+    """
+    The `git clone` arguments for the clone mode and depth given on
+    the command line, falling back to the config for anything not given.
+
+    Passing just a depth means a shallow clone. Exits with an error
+    message if the config has an invalid mode or depth.
+
+    Args:
+        config (Config): The pytoil config.
+        mode (str | None, optional): The "--mode" option. Defaults to None.
+        depth (int | None, optional): The "--depth" option. Defaults to None.
+
+    Returns:
+        list[str]: The extra arguments for `git clone`.
+    """
+    if mode is None:
+        mode = "shallow" if depth is not None else config.clone_mode
+
+    try:
+        return clone_options(mode, depth or config.clone_depth)
+    except ValueError as err:
+        printer.error(str(err))
+        printer.note("Check 'clone_mode' and 'clone_depth' in your config.", exits=1)
+        raise  # pragma: no cover
+
+
+def resolve_installer(config: Config) -> Installer:
+    """
+    The installer virtual environments should use, from the "installer"
+    config key. Exits with an error message if it isn't a valid one.
+
+    Args:
+        config (Config): The pytoil config.
+
+    Returns:
+        Installer: The installer.
+    """
+    try:
+        return get_installer(config.installer)
+    except ValueError as err:
+        printer.error(str(err))
+        printer.note("Check 'installer' in your config.", exits=1)
+        raise  # pragma: no cover
+
+
+def mirror_cache(config: Config) -> MirrorCache | None:
+    """
+    The local mirror cache to clone through, or None if the user has
+    turned it off by setting "mirror_cache_size" to 0.
+
+    Args:
+        config (Config): The pytoil config.
+
+    Returns:
+        MirrorCache | None: The mirror cache.
+    """
+    if config.mirror_cache_size <= 0:
+        return None
+    return MirrorCache(max_size=config.mirror_cache_size * MIB)
+
+
+def trash_projects(config: Config, projects: Iterable[str]) -> None:
+    """
+    Move local projects to the trash, reporting each one, and start
+    the purge worker to delete them for good once the undo window is up.
+
+    Exits non-zero if any of them couldn't be moved.
+
+    Args:
+        config (Config): The pytoil config.
+        projects (Iterable[str]): Names of the projects to remove.
+    """
+    trash = Trash(config.projects_dir)
+    moved, failed = trash.move(sorted(projects))
+
+    for entry in moved:
+        printer.good(f"Deleted {entry.name}")
+
+    if moved:
+        trash.spawn_purge(delay=max(0, config.undo_window))
+        if config.undo_window > 0:
+            window = humanize.naturaldelta(config.undo_window)
+            printer.note(f"Changed your mind? 'pytoil trash undo' within {window}.")
+
+    for failure in failed:
+        printer.error(f"Could not delete {failure.name!r}: {failure.error}")
+
+    if failed:
+        printer.note(f"{len(failed)} project(s) were not deleted.", exits=1)
@@ -0,0 +1,91 @@
+"""
+The pytoil wheelhouse command group.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import click
+import humanize
+
+from pytoil.cli.printer import printer
+from pytoil.environments import Wheelhouse
+
+if TYPE_CHECKING:
+    from pytoil.config import Config
+
+
+@click.group()
+def wheelhouse() -> None:
+    """
+    Manage the shared wheelhouse.
+
+    Virtual environments pytoil creates install packages from a shared
+    directory of wheels in pytoil's cache directory, so packages you use in
+    every project aren't downloaded and built again for each one. Whatever
+    gets installed is added to it in the background afterwards.
+
+    The wheelhouse command group lets you fill it up front and empty it.
+    Turn it off altogether with "wheelhouse = false" in the config.
+    """
+
+
+@wheelhouse.command()
+@click.argument("packages", nargs=-1)
+@click.pass_obj
+def build(config: Config, packages: tuple[str, ...]) -> None:
+    """
+    Build wheels for packages and their dependencies.
+
+    With no arguments, builds wheels for the "common_packages" from the
+    config, so the next "pytoil new --venv venv" doesn't need the network
+    for them at all.
+
+    Examples:
+    $ pytoil wheelhouse build
+
+    $ pytoil wheelhouse build "black>=23" mypy
+    """
+    to_build = list(packages) or config.common_packages
+    if not to_build:
+        printer.error(
+            (
+                "Nothing to build, pass some packages or set 'common_packages' in the"
+                " config."
+            ),
+            exits=1,
+        )
+        return
+
+    house = Wheelhouse()
+    with printer.progress() as p:
+        p.add_task(f"[bold white]Building wheels for {', '.join(to_build)}")
+        error = house.build(to_build)
+
+    if error:
+        printer.error(f"Could not build every wheel: {error}", exits=1)
+
+    wheels = sum(len(versions) for versions in house.wheels().values())
+    printer.good(
+        f"The wheelhouse has {wheels} wheel(s)"
+        f" ({humanize.naturalsize(house.size())}) at {house.path}"
+    )
+
+
+@wheelhouse.command()
+def clear() -> None:
+    """
+    Delete every wheel in the wheelhouse.
+
+    Examples:
+    $ pytoil wheelhouse clear
+    """
+    house = Wheelhouse()
+    size = house.size()
+    house.clear()
+    printer.good(f"Cleared the wheelhouse, freeing {humanize.naturalsize(size)}")
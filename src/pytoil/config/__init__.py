@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from pytoil.config import defaults
-from pytoil.config.config import Config
+
+if TYPE_CHECKING:
+    from pytoil.config.config import Config  # noqa: TCH004
 
 __all__ = (
     "Config",
     "defaults",
 )
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # Config pulls in pydantic, so only import it once it's asked for,
+    # plenty of commands only need the defaults
+    if name == "Config":
+        from pytoil.config.config import Config
+
+        return Config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
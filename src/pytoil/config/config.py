@@ -25,6 +25,15 @@ class Config(BaseModel):
     conda_bin: str = defaults.CONDA_BIN
     common_packages: list[str] = defaults.COMMON_PACKAGES
     git: bool = defaults.GIT
+    cache_ttl: int = defaults.CACHE_TTL
+    follow_symlinks: bool = defaults.FOLLOW_SYMLINKS
+    clone_mode: str = defaults.CLONE_MODE
+    clone_depth: int = defaults.CLONE_DEPTH
+    mirror_cache_size: int = defaults.MIRROR_CACHE_SIZE
+    undo_window: int = defaults.UNDO_WINDOW
+    wheelhouse: bool = defaults.WHEELHOUSE
+    installer: str = defaults.INSTALLER
+    venv_templates: bool = defaults.VENV_TEMPLATES
 
     @staticmethod
     def load(path: Path = defaults.CONFIG_FILE) -> Config:
@@ -87,6 +96,15 @@ class Config(BaseModel):
             "conda_bin": self.conda_bin,
             "common_packages": self.common_packages,
             "git": self.git,
+            "cache_ttl": self.cache_ttl,
+            "follow_symlinks": self.follow_symlinks,
+            "clone_mode": self.clone_mode,
+            "clone_depth": self.clone_depth,
+            "mirror_cache_size": self.mirror_cache_size,
+            "undo_window": self.undo_window,
+            "wheelhouse": self.wheelhouse,
+            "installer": self.installer,
+            "venv_templates": self.venv_templates,
         }
 
     def write(self, path: Path = defaults.CONFIG_FILE) -> None:
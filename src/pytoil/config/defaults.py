@@ -22,8 +22,31 @@ CONFIG_KEYS: set[str] = {
     "conda_bin",
     "common_packages",
     "git",
+    "cache_ttl",
+    "follow_symlinks",
+    "clone_mode",
+    "clone_depth",
+    "mirror_cache_size",
+    "undo_window",
+    "wheelhouse",
+    "installer",
+    "venv_templates",
 }
 
+# Where pytoil keeps anything it can rebuild, e.g. cached API responses
+CACHE_DIR: Path = (
+    Path(os.getenv("XDG_CACHE_HOME", Path.home().joinpath(".cache")))
+    .joinpath("pytoil")
+    .resolve()
+)
+API_CACHE_DIR: Path = CACHE_DIR.joinpath("api")
+PROJECTS_INDEX: Path = CACHE_DIR.joinpath("projects.sqlite3")
+MIRROR_CACHE_DIR: Path = CACHE_DIR.joinpath("mirrors")
+MATCH_CACHE: Path = CACHE_DIR.joinpath("matches.json")
+WHEELHOUSE_DIR: Path = CACHE_DIR.joinpath("wheels")
+VENV_TEMPLATES_DIR: Path = CACHE_DIR.joinpath("venvs")
+CONDA_INFO_CACHE: Path = CACHE_DIR.joinpath("conda.json")
+
 # Pytoil meta stuff
 PYTOIL_DOCS_URL: str = "https://followtheprocess.github.io/pytoil/"
 PYTOIL_ISSUES_URL: str = "https://github.com/FollowTheProcess/pytoil/issues"
@@ -36,6 +59,15 @@ EDITOR: str = os.getenv("EDITOR", "")
 CONDA_BIN: str = "conda"
 COMMON_PACKAGES: list[str] = []
 GIT: bool = True
+CACHE_TTL: int = 300
+FOLLOW_SYMLINKS: bool = True
+CLONE_MODE: str = "full"
+CLONE_DEPTH: int = 1
+MIRROR_CACHE_SIZE: int = 2048  # MiB
+UNDO_WINDOW: int = 900
+WHEELHOUSE: bool = True
+INSTALLER: str = "auto"
+VENV_TEMPLATES: bool = True
 
 # Config Schema
 CONFIG_SCHEMA = """
@@ -97,4 +129,66 @@ are passed straight through to installation tools like pip and conda.
 
 Whether or not you want pytoil to create an empty git repo when you make a new project with
 'pytoil new'. This can also be disabled on a per use basis using the '--no-git' flag.
+
+## cache_ttl *(int)*
+
+How long (in seconds) pytoil keeps your list of GitHub repos cached before fetching it again.
+Commands like 'show' and 'find' accept '--refresh' to ignore the cache and '--offline' to use
+it no matter how old it is. Defaults to 300 (5 minutes), set to 0 to disable caching.
+
+## follow_symlinks *(bool)*
+
+Whether symlinks in your projects directory that point to other directories count as projects.
+Defaults to true, set to false if you keep symlinks there that aren't projects.
+
+## clone_mode *(str)*
+
+How 'pytoil checkout' and 'pytoil pull' clone repos by default, one of:
+
+* "full": The whole repo, every version of every file (default).
+* "shallow": Just the latest commits of the default branch (see clone_depth).
+* "blobless": All the history, but old versions of files are only downloaded when needed.
+* "treeless": Like blobless but directory listings are downloaded when needed too.
+* "sparse": Blobless, and only the top level files are checked out.
+
+Anything other than "full" is much quicker to clone and takes less space, and can be turned
+into a full clone at any time with 'pytoil unshallow'. Can be overridden with '--mode'.
+
+## clone_depth *(int)*
+
+How many commits a "shallow" clone keeps. Defaults to 1.
+
+## mirror_cache_size *(int)*
+
+pytoil keeps a mirror of every repo it clones in its cache directory, so checking out a project
+you've removed before only has to download what's changed since. This is how big (in MiB) that
+cache can get before the least recently used mirrors are removed. Defaults to 2048, set to 0 to
+turn the mirror cache off.
+
+## undo_window *(int)*
+
+'pytoil remove' and 'pytoil keep' move projects to a trash directory inside your projects directory,
+which is instant, and delete them for good in the background this many seconds later. Until then
+'pytoil trash undo' puts them back. Defaults to 900 (15 minutes), set to 0 to delete them straight away
+(still in the background).
+
+## wheelhouse *(bool)*
+
+Whether virtual environments pytoil creates install from (and after installing, add to) a shared
+directory of wheels in pytoil's cache directory, so packages you use in every project aren't downloaded
+and built all over again each time. 'pytoil wheelhouse build' fills it with your common_packages up front.
+Defaults to true.
+
+## installer *(str)*
+
+What creates virtual environments and installs packages into them: "pip" (with virtualenv), "uv", which
+does the same thing many times faster, or "auto" to use uv if it's on $PATH and pip if it isn't.
+Defaults to "auto".
+
+## venv_templates *(bool)*
+
+Whether 'pytoil new --venv venv' clones new virtual environments from a template in pytoil's cache directory
+that already has your common_packages installed (reflinking or hard linking files where it can), rather than
+creating each one from scratch. The template is rebuilt whenever common_packages or your python changes.
+Defaults to true.
 """
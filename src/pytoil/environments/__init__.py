@@ -5,7 +5,9 @@ from pytoil.environments.conda import Conda
 from pytoil.environments.flit import Flit
 from pytoil.environments.poetry import Poetry
 from pytoil.environments.reqs import Requirements
+from pytoil.environments.templates import VenvTemplates
 from pytoil.environments.virtualenv import Venv
+from pytoil.environments.wheelhouse import Wheelhouse
 
 __all__ = (
     "Poetry",
@@ -14,4 +16,6 @@ __all__ = (
     "Requirements",
     "Flit",
     "Conda",
+    "Wheelhouse",
+    "VenvTemplates",
 )
@@ -1,6 +1,17 @@
 """
 Module responsible for handling conda environments.
 
+Where conda keeps environments depends on the installation (a home
+directory miniconda, a system wide install, custom `envs_dirs` in a
+.condarc etc.) so pytoil asks it, with `conda info --json` (or mamba's).
+That's slow, the best part of a second, so the answer is cached both in
+memory and on disk, keyed on the conda binary and its config files and
+asked again only when one of those changes. Checking whether any number
+of environments exist is then just looking in the environment directories.
+
+If conda can't be asked (e.g. it's not on $PATH) pytoil falls back to
+looking for the usual home directory installations.
+
 
 Author: Tom Fleet
 Created: 26/12/2021
@@ -8,13 +19,16 @@ Created: 26/12/2021
 
 from __future__ import annotations
 
+import contextlib
+import json
+import os
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
-
-import yaml
+from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
     try:
@@ -22,9 +36,10 @@ if TYPE_CHECKING:
     except ImportError:
         from typing_extensions import TypeAlias
 
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
 
 
+from pytoil.config import defaults
 from pytoil.exceptions import (
     BadEnvironmentFileError,
     CondaNotInstalledError,
@@ -38,6 +53,250 @@ EnvironmentYml: TypeAlias = dict[str, Union[list[str], str]]
 
 CONDA = shutil.which("conda")
 
+# Installations looked for in $HOME when conda can't be asked, in order
+KNOWN_INSTALLATIONS: tuple[str, ...] = (
+    "anaconda3",
+    "miniconda3",
+    "miniforge3",
+    "mambaforge",
+)
+
+# Environment variables that change where conda keeps environments
+CONDA_ENV_VARS: tuple[str, ...] = ("CONDARC", "CONDA_ENVS_DIRS", "CONDA_ENVS_PATH")
+
+# User config files conda reads, watched even if they don't exist yet
+USER_CONDARCS: tuple[str, ...] = (
+    ".condarc",
+    ".conda/condarc",
+    ".config/conda/condarc",
+)
+
+# Discovered installations by conda binary, shared by every Conda
+_discovered: dict[str, tuple[dict[str, Any], CondaInfo]] = {}
+_discovered_lock = threading.Lock()
+
+
+class CondaInfo:
+    def __init__(
+        self, envs_dirs: Sequence[Path], root_prefix: Path | None = None
+    ) -> None:
+        """
+        Where a conda installation keeps its environments.
+
+        Args:
+            envs_dirs (Sequence[Path]): The environment directories, in the
+                order conda searches them. New environments go in the first.
+            root_prefix (Path | None, optional): The installation itself,
+                i.e. the "base" environment. Defaults to None.
+        """
+        self.envs_dirs = list(envs_dirs)
+        self.root_prefix = root_prefix
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(envs_dirs={self.envs_dirs!r}, root_prefix={self.root_prefix!r})"
+        )
+
+    __slots__ = ("envs_dirs", "root_prefix")
+
+    def prefix(self, name: str) -> Path:
+        """
+        The directory of the environment `name`, where it would be created
+        if it doesn't exist.
+        """
+        if name == "base" and self.root_prefix is not None:
+            return self.root_prefix
+        for envs_dir in self.envs_dirs:
+            if envs_dir.joinpath(name).is_dir():
+                return envs_dir.joinpath(name)
+        return self.envs_dirs[0].joinpath(name)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "envs_dirs": [str(envs_dir) for envs_dir in self.envs_dirs],
+            "root_prefix": str(self.root_prefix) if self.root_prefix else None,
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, Any]) -> CondaInfo:
+        """
+        Raises:
+            ValueError: If `data` isn't from `to_dict` or has no
+                environment directories.
+        """
+        envs_dirs = data.get("envs_dirs")
+        root_prefix = data.get("root_prefix")
+        if not envs_dirs or not isinstance(envs_dirs, list):
+            raise ValueError("No envs_dirs")
+        return CondaInfo(
+            envs_dirs=[Path(envs_dir) for envs_dir in envs_dirs],
+            root_prefix=Path(root_prefix) if root_prefix else None,
+        )
+
+
+def _mtime(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def fingerprint(binary: str, config_files: Iterable[str] = ()) -> dict[str, Any]:
+    """
+    What an installation's `conda info` depends on, if any of it changes
+    (an upgrade, an edited .condarc) it has to be asked again.
+
+    Args:
+        binary (str): The resolved conda (or mamba) binary.
+        config_files (Iterable[str], optional): The config files conda said
+            it read, on top of the user ones. Defaults to ().
+    """
+    files = {
+        *config_files,
+        *(str(Path.home().joinpath(condarc)) for condarc in USER_CONDARCS),
+    }
+    return {
+        "conda": binary,
+        "mtime_ns": _mtime(Path(binary)),
+        "env": {var: os.environ.get(var) for var in CONDA_ENV_VARS},
+        "config_files": {file: _mtime(Path(file)) for file in sorted(files)},
+    }
+
+
+def _still_valid(key: dict[str, Any]) -> bool:
+    return key == fingerprint(key["conda"], key.get("config_files", {}))
+
+
+def ask(binary: str) -> tuple[CondaInfo, list[str]]:
+    """
+    Run `binary info --json`.
+
+    Returns:
+        tuple[CondaInfo, list[str]]: What it said, and the config files it read.
+
+    Raises:
+        OSError: If it can't be run.
+        subprocess.SubprocessError: If it fails.
+        ValueError: If what it says isn't what conda says.
+    """
+    result = subprocess.run(
+        [binary, "info", "--json"],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        encoding="utf-8",
+        check=True,
+    )
+    data = json.loads(result.stdout)
+    if not isinstance(data, dict):
+        raise ValueError("Unexpected conda info output")
+    config_files = data.get("config_files") or []
+    return CondaInfo.from_dict(data), [str(file) for file in config_files]
+
+
+def probe_home() -> CondaInfo:
+    """
+    Look for one of the KNOWN_INSTALLATIONS in $HOME.
+
+    Raises:
+        UnsupportedCondaInstallationError: If there isn't one.
+    """
+    for name in KNOWN_INSTALLATIONS:
+        directory = Path.home().joinpath(name)
+        if directory.is_dir():
+            return CondaInfo(
+                envs_dirs=[directory.joinpath("envs")], root_prefix=directory
+            )
+
+    raise UnsupportedCondaInstallationError(
+        "Could not find a conda installation. Is conda on $PATH? Checked for:"
+        f" {', '.join(KNOWN_INSTALLATIONS)} in $HOME"
+    )
+
+
+def _read_cache(cache: Path, binary: str) -> CondaInfo | None:
+    try:
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        entry = data[binary]
+        if not _still_valid(entry["key"]):
+            return None
+        info = CondaInfo.from_dict(entry["info"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    with _discovered_lock:
+        _discovered[binary] = (entry["key"], info)
+    return info
+
+
+def _write_cache(
+    cache: Path, binary: str, key: dict[str, Any], info: CondaInfo
+) -> None:
+    try:
+        data = json.loads(cache.read_text(encoding="utf-8"))
+        if not isinstance(data, dict):
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    data[binary] = {"key": key, "info": info.to_dict()}
+
+    cache.parent.mkdir(parents=True, exist_ok=True)
+    fd, name = tempfile.mkstemp(dir=cache.parent, suffix=".tmp")
+    tmp = Path(name)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        tmp.replace(cache)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def discover(
+    conda: str | None = CONDA, cache: Path = defaults.CONDA_INFO_CACHE
+) -> CondaInfo:
+    """
+    Where the conda installation behind `conda` keeps its environments.
+
+    `conda info` is only run the first time and whenever the binary or
+    its config changes, otherwise the answer comes from memory or `cache`.
+
+    Args:
+        conda (str | None, optional): The conda (or mamba) binary, a name
+            on $PATH or a path. Defaults to CONDA.
+        cache (Path, optional): The on-disk cache.
+            Defaults to defaults.CONDA_INFO_CACHE.
+
+    Raises:
+        UnsupportedCondaInstallationError: If conda can't be asked and isn't
+            one of the KNOWN_INSTALLATIONS.
+    """
+    binary = shutil.which(conda) if conda else None
+    if binary is None:
+        return probe_home()
+    binary = os.path.realpath(binary)
+
+    with _discovered_lock:
+        known = _discovered.get(binary)
+    if known is not None and _still_valid(known[0]):
+        return known[1]
+
+    info = _read_cache(cache, binary)
+    if info is not None:
+        return info
+
+    try:
+        info, config_files = ask(binary)
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return probe_home()
+
+    key = fingerprint(binary, config_files)
+    with _discovered_lock:
+        _discovered[binary] = (key, info)
+    # Only worth having, not worth failing over
+    with contextlib.suppress(OSError):
+        _write_cache(cache, binary, key, info)
+    return info
+
 
 class Conda:
     def __init__(
@@ -79,44 +338,20 @@ class Conda:
 
     @property
     def executable(self) -> Path:
-        envs_dir = self.get_envs_dir()
-        return envs_dir.joinpath(f"{self.environment_name}/bin/python")
+        return self.info().prefix(self.environment_name).joinpath("bin/python")
 
     @property
     def name(self) -> str:
         return "conda"
 
-    @staticmethod
-    def get_envs_dir() -> Path:
+    def info(self) -> CondaInfo:
         """
-        Tries to detect which anaconda/miniconda installation
-        the user has by naively checking if the environment
-        storage directories exist.
+        Where the conda installation behind `conda` keeps its environments.
 
         Raises:
-            UnsupportedCondaInstallationError: If no matches are found
-                for known conda installations.
-
-        Returns:
-            Path: The path to the users conda
-                environment storage directory.
+            UnsupportedCondaInstallationError: If it can't be worked out.
         """
-        # Map of all supported conda installations to their root directories
-        supported: dict[str, Path] = {
-            "anaconda": Path.home().joinpath("anaconda3"),
-            "miniconda": Path.home().joinpath("miniconda3"),
-            "miniforge": Path.home().joinpath("miniforge3"),
-            "mambaforge": Path.home().joinpath("mambaforge"),
-        }
-
-        names = supported.keys()
-
-        for _, directory in supported.items():
-            if directory.exists() and directory.is_dir():
-                return directory.joinpath("envs")
-
-        raise UnsupportedCondaInstallationError(f"""Could not detect the type of conda
-        installation present. Checked for: {names}""")
+        return discover(self.conda)
 
     def exists(self) -> bool:
         """
@@ -195,6 +430,8 @@ class Conda:
         project_path = project_path.resolve()
         yml_file = project_path.joinpath("environment.yml")
 
+        import yaml
+
         contents = yml_file.read_text(encoding="utf-8")
         env_dict: EnvironmentYml = yaml.safe_load(contents)
 
@@ -205,7 +442,7 @@ class Conda:
                 " for key: `name`."
             )
 
-        env = Conda(root=project_path, environment_name=env_name)
+        env = Conda(root=project_path, environment_name=env_name, conda=conda)
 
         if env.exists():
             raise EnvironmentAlreadyExistsError(
@@ -11,7 +11,7 @@ from __future__ import annotations
 import shutil
 import subprocess
 import sys
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pytoil.environments.virtualenv import Venv
 from pytoil.exceptions import FlitNotInstalledError
@@ -19,17 +19,30 @@ from pytoil.exceptions import FlitNotInstalledError
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytoil.environments.installer import Installer
+    from pytoil.environments.wheelhouse import Wheelhouse
+
 FLIT = shutil.which("flit")
 
 
 class Flit(Venv):
-    def __init__(self, root: Path, flit: str | None = FLIT) -> None:
+    def __init__(
+        self,
+        root: Path,
+        flit: str | None = FLIT,
+        wheelhouse: Wheelhouse | None = None,
+        installer: Installer | None = None,
+    ) -> None:
         self.root = root
         self.flit = flit
-        super().__init__(root)
+        super().__init__(root, wheelhouse=wheelhouse, installer=installer)
 
     def __repr__(self) -> str:
-        return self.__class__.__qualname__ + f"(root={self.root!r}, flit={self.flit!r})"
+        return (
+            self.__class__.__qualname__
+            + f"(root={self.root!r}, flit={self.flit!r},"
+            f" wheelhouse={self.wheelhouse!r}, installer={self.installer!r})"
+        )
 
     __slots__ = ("root", "flit")
 
@@ -49,11 +62,17 @@ class Flit(Venv):
             raise FlitNotInstalledError
 
         # Unlike poetry, conda etc. flit does not make it's own virtual environment
-        # we must make one here before installing the project
+        # we must make one here before installing the project, with the installer
+        # like any other, but flit always installs through the pip inside it
         if not self.exists():
-            self.create()
+            self.create(silent=silent)
+
+        # flit runs pip itself, so the wheelhouse goes in through the environment
+        kwargs: dict[str, Any] = {}
+        if self.wheelhouse is not None:
+            kwargs["env"] = self.wheelhouse.environ()
 
-        subprocess.run(
+        result = subprocess.run(
             [
                 self.flit,
                 "install",
@@ -66,4 +85,7 @@ class Flit(Venv):
             cwd=self.project_path,
             stdout=subprocess.DEVNULL if silent else sys.stdout,
             stderr=subprocess.DEVNULL if silent else sys.stderr,
+            **kwargs,
         )
+        if self.wheelhouse is not None and result.returncode == 0:
+            self.wheelhouse.spawn_fill(self.executable)
@@ -0,0 +1,138 @@
+"""
+The tools that create virtual environments and install packages into them
+for `Venv` and everything built on it (`Requirements`, `Flit`).
+
+pip (with virtualenv to create the environment) works everywhere and is
+the fallback. uv does the same job as `uv venv` and `uv pip install`, but
+resolves and installs many times faster, so it's used whenever it's on
+$PATH unless the "installer" config key says otherwise.
+
+Environments made by uv are seeded with pip all the same: flit installs
+through it, the wheelhouse fills itself with `pip freeze` and `pip wheel`,
+and users expect `.venv/bin/pip` to be there.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+import sys
+from typing import TYPE_CHECKING, Protocol
+
+from pytoil.exceptions import UvNotInstalledError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+UV = shutil.which("uv")
+
+# Valid values for the "installer" config key
+INSTALLERS: tuple[str, ...] = ("auto", "pip", "uv")
+
+
+class Installer(Protocol):
+    @property
+    def name(self) -> str:
+        """
+        The installer's name, as used in the config e.g. 'pip'.
+        """
+        ...
+
+    def create(self, path: Path, silent: bool = False) -> None:
+        """
+        Create an empty virtual environment (with pip in it) at `path`.
+        """
+        ...
+
+    def install_command(self, python: Path) -> list[str]:
+        """
+        The command to install packages into the environment of `python`,
+        anything after it is passed straight through e.g. "-r", "requirements.txt".
+        """
+        ...
+
+
+class Pip:
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + "()"
+
+    __slots__ = ()
+
+    @property
+    def name(self) -> str:
+        return "pip"
+
+    def create(self, path: Path, silent: bool = False) -> None:  # noqa: ARG002
+        import virtualenv
+
+        virtualenv.cli_run(args=[str(path), "--quiet"])
+
+    def install_command(self, python: Path) -> list[str]:
+        return [f"{python}", "-m", "pip", "install"]
+
+
+class Uv:
+    def __init__(self, uv: str | None = UV) -> None:
+        self.uv = uv
+
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + f"(uv={self.uv!r})"
+
+    __slots__ = ("uv",)
+
+    @property
+    def name(self) -> str:
+        return "uv"
+
+    def create(self, path: Path, silent: bool = False) -> None:
+        if not self.uv:
+            raise UvNotInstalledError
+
+        subprocess.run(
+            [
+                self.uv,
+                "venv",
+                "--seed",
+                "--quiet",
+                # The interpreter pytoil runs on, same as virtualenv would use
+                "--python",
+                sys.executable,
+                f"{path}",
+            ],
+            check=True,
+            stdout=subprocess.DEVNULL if silent else sys.stdout,
+            stderr=subprocess.DEVNULL if silent else sys.stderr,
+        )
+
+    def install_command(self, python: Path) -> list[str]:
+        if not self.uv:
+            raise UvNotInstalledError
+
+        return [self.uv, "pip", "install", "--python", f"{python}"]
+
+
+def get_installer(name: str = "auto") -> Installer:
+    """
+    The installer for a value of the "installer" config key.
+
+    Args:
+        name (str, optional): One of INSTALLERS, "auto" picks uv if
+            it's installed and pip if not. Defaults to "auto".
+
+    Raises:
+        ValueError: If `name` isn't one of INSTALLERS.
+
+    Returns:
+        Installer: The installer.
+    """
+    if name == "pip" or (name == "auto" and not UV):
+        return Pip()
+    if name in {"uv", "auto"}:
+        return Uv(uv=UV)
+    raise ValueError(
+        f"Unknown installer {name!r}, must be one of {', '.join(INSTALLERS)}"
+    )
@@ -0,0 +1,298 @@
+"""
+Creates environments for lots of projects at once, alongside whatever
+is producing the projects (e.g. `CloneEngine` in `pytoil pull --venv`).
+
+Installing is CPU and disk heavy where cloning is mostly waiting on the
+network, so `Provisioner` has its own, smaller pool of threads: projects
+are handed to it as they arrive and environments get built while the rest
+are still cloning, without a pile of builds starving the clones.
+
+Every project handed over gets a `ProvisionResult`, whether its
+environment was created, skipped (nothing to detect, or already there)
+or failed.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from pytoil.exceptions import (
+    EnvironmentAlreadyExistsError,
+    ExternalToolNotInstalledError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+    from types import TracebackType
+
+    from pytoil.environments.base import Environment
+
+# Environment builds are mostly pip and compilers, so a couple at once
+# is plenty without leaving nothing for anything else
+DEFAULT_CONCURRENCY = max(1, min(4, (os.cpu_count() or 1) // 2))
+
+
+class ProvisionResult:
+    def __init__(
+        self,
+        name: str,
+        env: str | None,
+        status: str,
+        duration: float = 0.0,
+        detail: str = "",
+    ) -> None:
+        """
+        The outcome of creating one project's environment.
+
+        Args:
+            name (str): The project.
+            env (str | None): The kind of environment e.g. "venv", None if
+                it couldn't be detected.
+            status (str): "created", "skipped" or "failed".
+            duration (float, optional): How long it took in seconds.
+                Defaults to 0.0.
+            detail (str, optional): Why it was skipped or failed.
+                Defaults to "".
+        """
+        self.name = name
+        self.env = env
+        self.status = status
+        self.duration = duration
+        self.detail = detail
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, env={self.env!r}, status={self.status!r},"
+            f" duration={self.duration!r}, detail={self.detail!r})"
+        )
+
+    __slots__ = ("name", "env", "status", "duration", "detail")
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether nothing went wrong, skipping isn't going wrong.
+        """
+        return self.status != "failed"
+
+
+class Provisioner:
+    def __init__(
+        self,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        on_start: Callable[[str, Environment], None] | None = None,
+        on_done: Callable[[ProvisionResult], None] | None = None,
+    ) -> None:
+        """
+        Creates environments in parallel, at most `concurrency` at a time.
+
+        Use it as a context manager, projects can be submitted from any
+        thread while it's open and leaving it waits for them all.
+
+        The callbacks are called from the worker threads so they should be
+        quick and thread safe.
+
+        Args:
+            concurrency (int, optional): Maximum simultaneous installs.
+                Defaults to DEFAULT_CONCURRENCY.
+            on_start (Callable[[str, Environment], None] | None, optional):
+                Called as each install starts. Defaults to None.
+            on_done (Callable[[ProvisionResult], None] | None, optional): Called
+                as each install finishes or is skipped. Defaults to None.
+        """
+        self.concurrency = max(1, concurrency)
+        self.on_start = on_start
+        self.on_done = on_done
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # (name, environment kind, its result or the work producing it)
+        self._results: list[
+            tuple[str, str | None, ProvisionResult | Future[ProvisionResult]]
+        ] = []
+        self._started: float | None = None
+        self._finished: float | None = None
+        self._cancelled = False
+
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + f"(concurrency={self.concurrency!r})"
+
+    __slots__ = (
+        "concurrency",
+        "on_start",
+        "on_done",
+        "_executor",
+        "_lock",
+        "_results",
+        "_started",
+        "_finished",
+        "_cancelled",
+    )
+
+    def __enter__(self) -> Provisioner:
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="pytoil-provision"
+        )
+        with self._lock:
+            self._results.clear()
+            self._started = self._finished = None
+            self._cancelled = False
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._executor is not None:
+            # Anything not started yet isn't worth waiting for on an error
+            self._executor.shutdown(wait=True, cancel_futures=exc_type is not None)
+            self._executor = None
+
+    def submit(self, name: str, env: Environment | None) -> None:
+        """
+        Create `env` for the project `name` when there's a free worker.
+
+        Args:
+            name (str): The project.
+            env (Environment | None): Its environment, None if it couldn't
+                be detected in which case it's recorded as skipped.
+
+        Raises:
+            RuntimeError: If the provisioner isn't open.
+        """
+        if self._executor is None:
+            raise RuntimeError("Provisioner must be used as a context manager")
+
+        if env is None:
+            result = ProvisionResult(
+                name=name, env=None, status="skipped", detail="Not detected"
+            )
+        else:
+            with self._lock:
+                # Under the lock so nothing is queued after `cancel`
+                if not self._cancelled:
+                    future = self._executor.submit(self._provision, name, env)
+                    self._results.append((name, env.name, future))
+                    return
+            result = ProvisionResult(
+                name=name, env=env.name, status="failed", detail="Cancelled"
+            )
+
+        with self._lock:
+            self._results.append((name, result.env, result))
+        self._done(result)
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether `cancel` has been called since it was opened.
+        """
+        with self._lock:
+            return self._cancelled
+
+    def cancel(self) -> None:
+        """
+        Skip every environment that hasn't started yet, and any submitted
+        from now on, so leaving only waits for the ones already going.
+
+        They're reported as failed with "Cancelled".
+        """
+        with self._lock:
+            self._cancelled = True
+            pending = [item for _, _, item in self._results]
+        for item in pending:
+            if not isinstance(item, ProvisionResult):
+                item.cancel()
+
+    def results(self) -> list[ProvisionResult]:
+        """
+        A result for every project submitted, in the order they were,
+        waiting for any that haven't finished.
+        """
+        with self._lock:
+            pending = list(self._results)
+
+        results: list[ProvisionResult] = []
+        for name, env, item in pending:
+            if isinstance(item, ProvisionResult):
+                results.append(item)
+            elif item.cancelled():
+                results.append(
+                    ProvisionResult(
+                        name=name, env=env, status="failed", detail="Cancelled"
+                    )
+                )
+            else:
+                results.append(item.result())
+        return results
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Seconds from the first install starting to the last one finishing
+        (or now, if they haven't), 0 if none have started.
+        """
+        with self._lock:
+            if self._started is None:
+                return 0.0
+            return (self._finished or time.perf_counter()) - self._started
+
+    def _provision(self, name: str, env: Environment) -> ProvisionResult:
+        start = time.perf_counter()
+        with self._lock:
+            if self._started is None:
+                self._started = start
+        if self.on_start is not None:
+            self.on_start(name, env)
+
+        status, detail = "created", ""
+        try:
+            env.install_self(silent=True)
+        except EnvironmentAlreadyExistsError as err:
+            status, detail = "skipped", err.message
+        except ExternalToolNotInstalledError as err:
+            status, detail = "failed", err.message
+        except (OSError, subprocess.SubprocessError) as err:
+            status, detail = "failed", str(err)
+        except Exception as err:  # noqa: BLE001
+            # e.g. a malformed environment.yml, one broken project mustn't
+            # take the whole summary down with it
+            status, detail = "failed", str(err) or type(err).__name__
+        else:
+            # The environments don't say when an install fails, so as with
+            # "checkout --venv" an environment being there counts as created
+            if not env.exists():
+                status, detail = (
+                    "failed",
+                    f"Could not create the {env.name} environment",
+                )
+
+        result = ProvisionResult(
+            name=name,
+            env=env.name,
+            status=status,
+            duration=time.perf_counter() - start,
+            detail=detail,
+        )
+        self._done(result)
+        return result
+
+    def _done(self, result: ProvisionResult) -> None:
+        if result.env is not None:
+            with self._lock:
+                self._finished = time.perf_counter()
+        if self.on_done is not None:
+            self.on_done(result)
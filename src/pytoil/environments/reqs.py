@@ -9,8 +9,6 @@ Created: 26/12/2021
 
 from __future__ import annotations
 
-import subprocess
-import sys
 from typing import TYPE_CHECKING
 
 from pytoil.environments.virtualenv import Venv
@@ -18,14 +16,26 @@ from pytoil.environments.virtualenv import Venv
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pytoil.environments.installer import Installer
+    from pytoil.environments.wheelhouse import Wheelhouse
+
 
 class Requirements(Venv):
-    def __init__(self, root: Path) -> None:
+    def __init__(
+        self,
+        root: Path,
+        wheelhouse: Wheelhouse | None = None,
+        installer: Installer | None = None,
+    ) -> None:
         self.root = root
-        super().__init__(root)
+        super().__init__(root, wheelhouse=wheelhouse, installer=installer)
 
     def __repr__(self) -> str:
-        return self.__class__.__qualname__ + f"(root={self.root!r})"
+        return (
+            self.__class__.__qualname__
+            + f"(root={self.root!r}, wheelhouse={self.wheelhouse!r},"
+            f" installer={self.installer!r})"
+        )
 
     __slots__ = ("root",)
 
@@ -46,9 +56,4 @@ class Requirements(Venv):
         if self.project_path.joinpath("requirements-dev.txt").exists():
             requirements_file = "requirements-dev.txt"
 
-        subprocess.run(
-            [f"{self.executable}", "-m", "pip", "install", "-r", requirements_file],
-            cwd=self.project_path,
-            stdout=subprocess.DEVNULL if silent else sys.stdout,
-            stderr=subprocess.DEVNULL if silent else sys.stderr,
-        )
+        self._install(["-r", requirements_file], silent=silent)
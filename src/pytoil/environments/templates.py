@@ -0,0 +1,347 @@
+"""
+Pre-built virtual environments that new ones are cloned from.
+
+Creating a virtual environment and installing `common_packages` into it
+is the slowest part of `pytoil new --venv venv`, and it's the same work
+every time. So pytoil keeps one template environment per interpreter
+with the common packages already installed, in the user cache directory,
+and new environments are a clone of it:
+
+* Files are reflinked (copy on write, e.g. btrfs, XFS, APFS) where the
+  filesystem can, hard linked if not, and only copied as a last resort.
+* Scripts in `bin/`, and anything else at the top of the environment,
+  have the template's path in them (shebangs, activate scripts) so they're
+  copied with it swapped for the new environment's path instead.
+
+Hard linked files are shared with the template. That's safe for what
+pip does to an environment, it removes files and writes new ones rather
+than changing them in place, but editing an installed package's source
+in place would change the template (and every other clone) too.
+
+A template is rebuilt when `common_packages` or the interpreter (its
+path, version or the file itself, e.g. after an upgrade) changes.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pytoil.config import defaults
+from pytoil.environments.virtualenv import Venv
+from pytoil.environments.wheelhouse import canonical_name, requirement_name
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pytoil.environments.installer import Installer
+    from pytoil.environments.wheelhouse import Wheelhouse
+
+# Linux's FICLONE ioctl, a copy on write clone of a whole file
+FICLONE = 0x40049409
+
+# Ways of cloning a file, best first
+CLONE_METHODS: tuple[str, ...] = ("reflink", "hardlink", "copy")
+
+# A build lock older than this was left by a pytoil that didn't finish
+STALE_LOCK = 15 * 60
+
+
+def interpreter(python: str = sys.executable) -> dict[str, Any]:
+    """
+    What identifies the interpreter virtual environments are created with,
+    if any of it changes the templates for it are out of date.
+    """
+    path = os.path.realpath(python)
+    return {
+        "python": path,
+        "version": sys.version,
+        "mtime_ns": Path(path).stat().st_mtime_ns,
+    }
+
+
+def reflink(src: Path, dst: Path) -> None:
+    """
+    Clone `src` to `dst` sharing its data until either is changed.
+
+    Raises:
+        OSError: If the platform or filesystem can't.
+    """
+    if sys.platform == "darwin":  # pragma: no cover
+        import ctypes
+
+        libc = ctypes.CDLL(None, use_errno=True)
+        if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(dst))
+        return
+
+    if not sys.platform.startswith("linux"):  # pragma: no cover
+        raise OSError(f"Can't reflink on {sys.platform}")
+
+    import fcntl
+
+    with src.open("rb") as source, dst.open("wb") as target:
+        try:
+            fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        except OSError:
+            target.close()
+            dst.unlink()
+            raise
+    shutil.copymode(src, dst)
+
+
+def clone_file(src: Path, dst: Path, method: str) -> None:
+    """
+    Clone `src` to `dst` with one of CLONE_METHODS.
+    """
+    if method == "reflink":
+        reflink(src, dst)
+    elif method == "hardlink":
+        os.link(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+
+def clone_tree(src: Path, dst: Path) -> str:
+    """
+    Clone the virtual environment at `src` to `dst` (which mustn't exist),
+    rewriting its path in scripts and symlinks.
+
+    Args:
+        src (Path): The template environment.
+        dst (Path): Where to put the new one.
+
+    Returns:
+        str: The best of CLONE_METHODS that worked for every file.
+    """
+    old, new = os.fsencode(src), os.fsencode(dst)
+    methods = list(CLONE_METHODS)
+
+    def vanished(err: OSError) -> None:
+        # os.walk skips directories it can't list, which would quietly
+        # leave a truncated clone if the template changed under us
+        raise err
+
+    for dirpath, dirnames, filenames in os.walk(src, onerror=vanished):
+        here = Path(dirpath)
+        target = dst.joinpath(here.relative_to(src))
+        target.mkdir(exist_ok=here != src)
+        # Scripts and config, small and likely to have the path in them
+        relocate = here in {src, src.joinpath("bin")}
+
+        # os.walk lists symlinks to directories (e.g. lib64 -> lib) but
+        # doesn't go into them
+        links = [name for name in dirnames if here.joinpath(name).is_symlink()]
+        dirnames[:] = [name for name in dirnames if name not in links]
+
+        for name in [*links, *filenames]:
+            source = here.joinpath(name)
+            if source.is_symlink():
+                link = os.fsencode(source.readlink())
+                target.joinpath(name).symlink_to(os.fsdecode(link.replace(old, new)))
+                continue
+
+            if relocate:
+                content = source.read_bytes()
+                if old in content:
+                    target.joinpath(name).write_bytes(content.replace(old, new))
+                    shutil.copymode(source, target.joinpath(name))
+                    continue
+
+            while True:
+                try:
+                    clone_file(source, target.joinpath(name), methods[0])
+                    break
+                except OSError:
+                    if len(methods) == 1:
+                        raise
+                    methods.pop(0)
+
+    return methods[0]
+
+
+class VenvTemplates:
+    def __init__(
+        self,
+        path: Path = defaults.VENV_TEMPLATES_DIR,
+        installer: Installer | None = None,
+        wheelhouse: Wheelhouse | None = None,
+    ) -> None:
+        """
+        Template virtual environments, one per interpreter.
+
+        Args:
+            path (Path, optional): Where the templates live.
+                Defaults to defaults.VENV_TEMPLATES_DIR.
+            installer (Installer | None, optional): What builds templates.
+                Defaults to None, i.e. pip.
+            wheelhouse (Wheelhouse | None, optional): The wheelhouse to build
+                templates through. Defaults to None.
+        """
+        self.path = path
+        self.installer = installer
+        self.wheelhouse = wheelhouse
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(path={self.path!r}, installer={self.installer!r},"
+            f" wheelhouse={self.wheelhouse!r})"
+        )
+
+    __slots__ = ("path", "installer", "wheelhouse")
+
+    def slot(self, python: str = sys.executable) -> Path:
+        """
+        The directory holding the template for `python`.
+        """
+        key = hashlib.sha256(os.fsencode(os.path.realpath(python))).hexdigest()
+        return self.path.joinpath(key[:16])
+
+    def template(self, packages: Sequence[str]) -> Path | None:
+        """
+        The template environment with `packages` for the current
+        interpreter, or None if there isn't an up to date one.
+        """
+        slot = self.slot()
+        try:
+            meta = json.loads(slot.joinpath("template.json").read_text("utf-8"))
+        except (OSError, ValueError):
+            return None
+        if meta != {**interpreter(), "packages": sorted(packages)}:
+            return None
+        return slot.joinpath(".venv")
+
+    def build(self, packages: Sequence[str], silent: bool = False) -> Path | None:
+        """
+        (Re)build the template for the current interpreter with `packages`.
+
+        Args:
+            packages (Sequence[str]): What to install in it.
+            silent (bool, optional): Whether to discard or display output.
+                Defaults to False.
+
+        Returns:
+            Path | None: The template environment, or None if another pytoil
+                is building it or installing `packages` didn't work.
+        """
+        slot = self.slot()
+        lock = self.path.joinpath(f"{slot.name}.lock")
+        self.path.mkdir(parents=True, exist_ok=True)
+        with contextlib.suppress(OSError):
+            if time.time() - lock.stat().st_mtime > STALE_LOCK:
+                lock.unlink()
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return None
+
+        try:
+            # Out of date as soon as anything is touched
+            slot.joinpath("template.json").unlink(missing_ok=True)
+            shutil.rmtree(slot, ignore_errors=True)
+            slot.mkdir()
+
+            env = Venv(root=slot, wheelhouse=self.wheelhouse, installer=self.installer)
+            env.create(packages=packages, silent=silent)
+            if not self._has(env.executable, packages):
+                shutil.rmtree(slot, ignore_errors=True)
+                return None
+
+            fd, tmp = tempfile.mkstemp(dir=slot, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({**interpreter(), "packages": sorted(packages)}, f)
+            Path(tmp).replace(slot.joinpath("template.json"))
+        finally:
+            lock.unlink(missing_ok=True)
+
+        return slot.joinpath(".venv")
+
+    def clone(self, packages: Sequence[str], dest: Path, silent: bool = False) -> str:
+        """
+        Make a virtual environment at `dest` with `packages` installed by
+        cloning the template, building it first if it's missing or out of
+        date.
+
+        Args:
+            packages (Sequence[str]): What the environment needs, usually
+                `common_packages`.
+            dest (Path): The new environment e.g. project/.venv.
+            silent (bool, optional): Whether to discard or display output
+                while building the template. Defaults to False.
+
+        Returns:
+            str: How it was cloned (one of CLONE_METHODS), or "" if it couldn't
+                be and the environment should be created the usual way.
+        """
+        template = self.template(packages) or self.build(packages, silent=silent)
+        if template is None:
+            return ""
+        built = self._built()
+        try:
+            method = clone_tree(template, dest)
+        except OSError:
+            # e.g. the template being rebuilt underneath us
+            shutil.rmtree(dest, ignore_errors=True)
+            return ""
+
+        # A rebuild that started and finished while we were cloning doesn't
+        # necessarily make anything fail, but the clone may be a mix of both
+        if self._built() != built or self.template(packages) is None:
+            shutil.rmtree(dest, ignore_errors=True)
+            return ""
+        return method
+
+    def clear(self) -> None:
+        """
+        Remove every template.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _built(self) -> int | None:
+        """
+        When the current template was finished, None if there isn't one.
+        """
+        try:
+            return self.slot().joinpath("template.json").stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _has(python: Path, packages: Sequence[str]) -> bool:
+        """
+        Whether every one of `packages` is installed in the environment
+        of `python`, installers don't all say when something failed.
+        """
+        result = subprocess.run(
+            [
+                f"{python}",
+                "-m",
+                "pip",
+                "list",
+                "--format=json",
+                "--disable-pip-version-check",
+            ],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            return False
+        installed = {canonical_name(dist["name"]) for dist in json.loads(result.stdout)}
+        wanted = {requirement_name(package) for package in packages}
+        return None not in wanted and wanted <= installed
@@ -1,6 +1,6 @@
 """
-Module responsible for handling python virtual environments
-through the std lib `venv` module.
+Module responsible for handling python virtual environments,
+created and installed into by an `Installer` (pip or uv).
 
 
 Author: Tom Fleet
@@ -13,23 +13,37 @@ import subprocess
 import sys
 from typing import TYPE_CHECKING
 
-import virtualenv
+from pytoil.environments.installer import Pip
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
     from pathlib import Path
 
+    from pytoil.environments.installer import Installer
+    from pytoil.environments.wheelhouse import Wheelhouse
+
 
 class Venv:
     root: Path
 
-    def __init__(self, root: Path) -> None:
+    def __init__(
+        self,
+        root: Path,
+        wheelhouse: Wheelhouse | None = None,
+        installer: Installer | None = None,
+    ) -> None:
         self.root = root
+        self.wheelhouse = wheelhouse
+        self.installer = installer or Pip()
 
     def __repr__(self) -> str:
-        return self.__class__.__qualname__ + f"(root={self.root!r})"
+        return (
+            self.__class__.__qualname__
+            + f"(root={self.root!r}, wheelhouse={self.wheelhouse!r},"
+            f" installer={self.installer!r})"
+        )
 
-    __slots__ = ("root",)
+    __slots__ = ("root", "wheelhouse", "installer")
 
     @property
     def project_path(self) -> Path:
@@ -68,7 +82,7 @@ class Venv:
             silent (bool, optional): Whether to discard or display output.
                 Defaults to False.
         """
-        virtualenv.cli_run(args=[str(self.project_path.joinpath(".venv")), "--quiet"])
+        self.installer.create(self.project_path.joinpath(".venv"), silent=silent)
 
         # Install any specified packages
         if packages:  # pragma: no cover
@@ -76,23 +90,57 @@ class Venv:
 
     def install(self, packages: Sequence[str], silent: bool = False) -> None:
         """
-        Generic `pip install` method.
+        Generic `pip install` method (or `uv pip install`, whichever the
+        installer is).
 
         Takes a list of packages to install. All packages are passed through to pip
         so any versioning syntax will work as expected.
 
+        If there's a wheelhouse with a wheel for every package, installing
+        from it alone is tried first so no network is needed at all.
+
         Args:
             packages (List[str]): List of packages to install, if only 1 package
                 still must be a list e.g. `["black"]`.
             silent (bool, optional): Whether to discard or display output.
                 Defaults to False.
         """
-        subprocess.run(
-            [f"{self.executable}", "-m", "pip", "install", *packages],
+        if self.wheelhouse is not None and self.wheelhouse.covers(packages):
+            offline = subprocess.run(
+                [
+                    *self.installer.install_command(self.executable),
+                    *self.wheelhouse.pip_args(offline=True),
+                    *packages,
+                ],
+                cwd=self.project_path,
+                stdout=subprocess.DEVNULL if silent else sys.stdout,
+                # Something missing is expected now and then, the retry
+                # below will say if it's a real problem
+                stderr=subprocess.DEVNULL,
+            )
+            if offline.returncode == 0:
+                return
+
+        self._install(packages, silent=silent)
+
+    def _install(self, args: Sequence[str], silent: bool = False) -> None:
+        """
+        Run the installer with `args`, through the wheelhouse if there is one
+        and adding anything new to it afterwards.
+        """
+        wheelhouse_args = self.wheelhouse.pip_args() if self.wheelhouse else []
+        result = subprocess.run(
+            [
+                *self.installer.install_command(self.executable),
+                *wheelhouse_args,
+                *args,
+            ],
             cwd=self.project_path,
             stdout=subprocess.DEVNULL if silent else sys.stdout,
             stderr=subprocess.DEVNULL if silent else sys.stderr,
         )
+        if self.wheelhouse is not None and result.returncode == 0:
+            self.wheelhouse.spawn_fill(self.executable)
 
     def install_self(self, silent: bool = False) -> None:
         """
@@ -116,9 +164,4 @@ class Venv:
 
         # We try .[dev] first as most packages I've seen have this
         # and pip will automatically fall back to '.' if not
-        subprocess.run(
-            [f"{self.executable}", "-m", "pip", "install", "-e", ".[dev]"],
-            cwd=self.project_path,
-            stdout=subprocess.DEVNULL if silent else sys.stdout,
-            stderr=subprocess.DEVNULL if silent else sys.stderr,
-        )
+        self._install(["-e", ".[dev]"], silent=silent)
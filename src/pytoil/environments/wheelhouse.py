@@ -0,0 +1,333 @@
+"""
+A shared wheelhouse for the virtual environments pytoil creates.
+
+Every new virtual environment starts empty, so `common_packages` (and
+every project's dependencies) get downloaded and, for anything without a
+wheel on PyPI, built all over again each time. The wheelhouse is a
+directory of wheels in the user cache directory that pip is pointed at
+with `--find-links`, so anything already in it is installed straight from
+disk.
+
+It's filled by `Wheelhouse.build` (e.g. `pytoil wheelhouse build` for
+`common_packages`) and, after every successful install, by a detached
+worker that builds wheels for whatever the environment has that the
+wheelhouse doesn't, so the next project needing them gets them for free.
+
+Only one worker fills the wheelhouse at a time (it holds a lock file
+while it does) and none are started while one is running, so pulling lots
+of projects doesn't set off a `pip wheel` for each of them. Wheels are
+built into a temporary directory and moved into place one at a time, so
+pip never sees a half written wheel.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pytoil.config import defaults
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+# The start of a requirement specifier, i.e. the distribution name
+REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+# Held by the fill worker, one older than this was left by one that didn't finish
+FILL_LOCK = ".fill.lock"
+STALE_LOCK = 30 * 60
+
+
+def canonical_name(name: str) -> str:
+    """
+    The normalised form of a distribution name (PEP 503), so that
+    "Foo_Bar", "foo-bar" and "foo.bar" are all the same thing.
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def requirement_name(requirement: str) -> str | None:
+    """
+    The canonical distribution name from a requirement specifier
+    e.g. "black[d]>=23" -> "black", or None if it isn't one (a path, a URL).
+    """
+    if requirement.startswith((".", "/", "-")) or "://" in requirement:
+        return None
+    match = REQUIREMENT_NAME.match(requirement)
+    return canonical_name(match.group(1)) if match else None
+
+
+class Wheelhouse:
+    def __init__(self, path: Path = defaults.WHEELHOUSE_DIR) -> None:
+        """
+        A directory of wheels shared between virtual environments.
+
+        Args:
+            path (Path, optional): The wheelhouse directory.
+                Defaults to defaults.WHEELHOUSE_DIR.
+        """
+        self.path = path
+
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + f"(path={self.path!r})"
+
+    __slots__ = ("path",)
+
+    def wheels(self) -> dict[str, set[str]]:
+        """
+        The versions of each distribution in the wheelhouse, by canonical name.
+        """
+        wheels: dict[str, set[str]] = {}
+        if not self.path.exists():
+            return wheels
+        for wheel in self.path.glob("*.whl"):
+            # {name}-{version}(-{build})?-{python}-{abi}-{platform}.whl
+            name, _, rest = wheel.name.partition("-")
+            version = rest.partition("-")[0]
+            wheels.setdefault(canonical_name(name), set()).add(version)
+        return wheels
+
+    def covers(self, packages: Iterable[str]) -> bool:
+        """
+        Whether there's a wheel for every one of `packages`, so it's
+        worth trying to install them without going to the package index.
+
+        Only the names are checked, not versions or dependencies, pip is
+        the judge of whether it actually works.
+        """
+        wheels = self.wheels()
+        names = [requirement_name(package) for package in packages]
+        return bool(names) and all(name in wheels for name in names)
+
+    def pip_args(self, offline: bool = False) -> list[str]:
+        """
+        Arguments for `pip install` to use the wheelhouse.
+
+        Args:
+            offline (bool, optional): Only install from the wheelhouse, never
+                the package index. Defaults to False.
+        """
+        args = ["--find-links", str(self.path)]
+        return ["--no-index", *args] if offline else args
+
+    def environ(self) -> dict[str, str]:
+        """
+        An environment for tools that run pip themselves (e.g. flit) to
+        use the wheelhouse.
+        """
+        return {**os.environ, "PIP_FIND_LINKS": str(self.path)}
+
+    def build(
+        self, packages: Sequence[str], python: str | Path = sys.executable
+    ) -> str:
+        """
+        Build wheels for `packages` and all their dependencies.
+
+        Args:
+            packages (Sequence[str]): Requirement specifiers.
+            python (str | Path, optional): The interpreter to build for, which
+                needs pip. Defaults to sys.executable, the one pytoil creates
+                virtual environments with.
+
+        Returns:
+            str: Why it failed, or "" if it didn't.
+        """
+        return self._wheel(python, packages)
+
+    def fill(self, python: str | Path) -> str:
+        """
+        Build wheels for everything installed in the environment of
+        `python` that the wheelhouse doesn't have yet.
+
+        Args:
+            python (str | Path): The environment's interpreter.
+
+        Returns:
+            str: Why it failed, or "" if it didn't.
+        """
+        freeze = subprocess.run(
+            [str(python), "-m", "pip", "freeze", "--exclude-editable"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+        )
+        if freeze.returncode != 0:
+            return error_line(freeze.stderr)
+
+        wheels = self.wheels()
+        missing: list[str] = []
+        for line in freeze.stdout.splitlines():
+            name, sep, version = line.partition("==")
+            # Only pinned releases, not "name @ file://..." and the like
+            if not sep or " " in line:
+                continue
+            if version not in wheels.get(canonical_name(name), set()):
+                missing.append(line)
+
+        if not missing:
+            return ""
+        # Dependencies are in the freeze too
+        return self._wheel(python, ["--no-deps", *missing])
+
+    def filling(self) -> bool:
+        """
+        Whether a fill worker is running.
+        """
+        try:
+            age = time.time() - self.path.joinpath(FILL_LOCK).stat().st_mtime
+        except OSError:
+            return False
+        return age < STALE_LOCK
+
+    def lock(self) -> bool:
+        """
+        Take the fill lock, clearing it first if it's stale.
+
+        Returns:
+            bool: Whether it was taken, False if another worker has it.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        lock = self.path.joinpath(FILL_LOCK)
+        if not self.filling():
+            lock.unlink(missing_ok=True)
+        try:
+            os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return False
+        return True
+
+    def unlock(self) -> None:
+        """
+        Release the fill lock.
+        """
+        self.path.joinpath(FILL_LOCK).unlink(missing_ok=True)
+
+    def spawn_fill(self, python: str | Path) -> subprocess.Popen[bytes] | None:
+        """
+        Start a worker that carries on after pytoil exits and fills the
+        wheelhouse from the environment of `python`, unless one is
+        already running.
+
+        Args:
+            python (str | Path): The environment's interpreter.
+
+        Returns:
+            subprocess.Popen[bytes] | None: The worker process, or None if
+                one was already running.
+        """
+        if self.filling():
+            return None
+
+        kwargs: dict[str, Any] = {}
+        if sys.platform == "win32":  # pragma: no cover
+            kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            # Its own session, so closing the terminal or Ctrl-C in it
+            # doesn't take the worker with it
+            kwargs["start_new_session"] = True
+
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "pytoil.environments.wheelhouse",
+                str(self.path),
+                "--python",
+                str(python),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+
+    def size(self) -> int:
+        """
+        Total size of the wheels in bytes.
+        """
+        if not self.path.exists():
+            return 0
+        return sum(wheel.stat().st_size for wheel in self.path.glob("*.whl"))
+
+    def clear(self) -> None:
+        """
+        Remove every wheel.
+        """
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def _wheel(self, python: str | Path, args: Sequence[str]) -> str:
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Hidden, and find-links doesn't look in subdirectories anyway
+        build_dir = Path(tempfile.mkdtemp(prefix=".build-", dir=self.path))
+        try:
+            result = subprocess.run(
+                [
+                    str(python),
+                    "-m",
+                    "pip",
+                    "wheel",
+                    "--wheel-dir",
+                    str(build_dir),
+                    *self.pip_args(),
+                    *args,
+                ],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+            )
+            # Whatever did get built is still worth keeping
+            for wheel in build_dir.glob("*.whl"):
+                wheel.replace(self.path.joinpath(wheel.name))
+        finally:
+            shutil.rmtree(build_dir, ignore_errors=True)
+
+        return error_line(result.stderr) if result.returncode != 0 else ""
+
+
+def error_line(stderr: str) -> str:
+    """
+    The most useful line of pip's error output.
+    """
+    lines = [line.strip() for line in stderr.splitlines() if line.strip()]
+    for line in reversed(lines):
+        if line.startswith("ERROR:"):
+            return line
+    return lines[-1] if lines else "pip failed"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    The fill worker started by `Wheelhouse.spawn_fill`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pytoil.environments.wheelhouse")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--python", required=True)
+    args = parser.parse_args(argv)
+
+    wheelhouse = Wheelhouse(args.path)
+    if not wheelhouse.lock():
+        # Another worker got there first
+        return 0
+    try:
+        return 1 if wheelhouse.fill(args.python) else 0
+    finally:
+        wheelhouse.unlock()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
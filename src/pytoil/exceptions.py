@@ -104,6 +104,17 @@ class RepoNotFoundError(PytoilError):
         super().__init__(self.message)
 
 
+class ResponseNotCachedError(PytoilError):
+    """
+    Asked for a cached API response while offline
+    but nothing has been cached yet.
+    """
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+        super().__init__(self.message)
+
+
 class GoNotInstalledError(ExternalToolNotInstalledError):
     """
     The user does not have `go` installed.
@@ -134,6 +145,16 @@ class FlitNotInstalledError(ExternalToolNotInstalledError):
         super().__init__(self.message)
 
 
+class UvNotInstalledError(ExternalToolNotInstalledError):
+    """
+    The config asks for the `uv` installer but it isn't installed.
+    """
+
+    def __init__(self) -> None:
+        self.message = "uv not found on $PATH. Is it installed?"
+        super().__init__(self.message)
+
+
 class PoetryNotInstalledError(ExternalToolNotInstalledError):
     """
     The user does not have `poetry` installed.
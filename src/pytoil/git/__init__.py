@@ -1,5 +1,19 @@
 from __future__ import annotations
 
+from pytoil.git.clone import CloneEngine, CloneJob, CloneProgress, CloneResult
 from pytoil.git.git import Git
+from pytoil.git.mirror import MirrorCache
+from pytoil.git.status import RepoStatus
+from pytoil.git.sync import SyncEngine, SyncResult
 
-__all__ = ("Git",)
+__all__ = (
+    "CloneEngine",
+    "CloneJob",
+    "CloneProgress",
+    "CloneResult",
+    "Git",
+    "MirrorCache",
+    "RepoStatus",
+    "SyncEngine",
+    "SyncResult",
+)
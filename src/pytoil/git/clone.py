@@ -0,0 +1,465 @@
+"""
+Clones lots of repos at once without losing track of any of them.
+
+`CloneEngine` runs `git clone --progress` for each job on a bounded
+pool of threads (cloning is almost all waiting on the network and the
+git subprocess so threads are plenty), parses the progress git writes
+to stderr so callers can show how far along everything is, and records
+a `CloneResult` for every job, including the ones that failed or were
+cancelled, so nothing goes missing silently.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import IO, TYPE_CHECKING
+
+from pytoil.exceptions import GitNotInstalledError
+from pytoil.git.git import GIT, error_line
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Sequence
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from pytoil.git.mirror import MirrorCache
+
+# Enough to keep a fast connection busy without getting every clone
+# throttled by GitHub or thrashing a slow disk
+DEFAULT_CONCURRENCY = 8
+
+# How much of a clone each phase accounts for, roughly, when turning
+# git's per-phase percentages into a single fraction
+PHASES: dict[str, tuple[float, float]] = {
+    "Counting objects": (0.0, 0.0),
+    "Compressing objects": (0.0, 0.0),
+    "Receiving objects": (0.0, 0.7),
+    "Resolving deltas": (0.7, 0.2),
+    "Updating files": (0.9, 0.1),
+}
+
+# e.g. "Receiving objects:  45% (450/1000), 1.20 MiB | 2.00 MiB/s"
+PROGRESS = re.compile(
+    r"(?P<phase>[A-Z][a-z]+ [a-z]+):\s+(?P<percent>\d+)%"
+    r"(?:\s+\(\d+/\d+\))?"
+    r"(?:,\s+(?P<size>[\d.]+)\s+(?P<unit>bytes|[KMGT]iB))?"
+)
+
+UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024**2, "GiB": 1024**3, "TiB": 1024**4}
+
+# Only keep the end of stderr, it's where git puts the actual error
+STDERR_TAIL = 2048
+
+
+class CloneJob:
+    def __init__(
+        self, name: str, url: str, dest: Path, options: Sequence[str] = ()
+    ) -> None:
+        """
+        A single repo to clone.
+
+        Args:
+            name (str): Name to report the clone under, e.g. the repo name.
+            url (str): The url to clone from.
+            dest (Path): Where to clone it to, must not exist yet.
+            options (Sequence[str], optional): Extra arguments to `git clone`
+                e.g. from `pytoil.git.modes.clone_options`. Defaults to ().
+        """
+        self.name = name
+        self.url = url
+        self.dest = dest
+        self.options = tuple(options)
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, url={self.url!r}, dest={self.dest!r},"
+            f" options={self.options!r})"
+        )
+
+    __slots__ = ("name", "url", "dest", "options")
+
+
+class CloneProgress:
+    def __init__(self, phase: str, percent: int, received: int | None = None) -> None:
+        """
+        One progress update parsed from `git clone --progress`.
+
+        Args:
+            phase (str): The phase git is in e.g. "Receiving objects".
+            percent (int): How far through that phase it is.
+            received (int | None, optional): Bytes received so far, if git said.
+                Defaults to None.
+        """
+        self.phase = phase
+        self.percent = percent
+        self.received = received
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(phase={self.phase!r}, percent={self.percent!r},"
+            f" received={self.received!r})"
+        )
+
+    __slots__ = ("phase", "percent", "received")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CloneProgress):
+            return NotImplemented
+        return (self.phase, self.percent, self.received) == (
+            other.phase,
+            other.percent,
+            other.received,
+        )
+
+    @property
+    def fraction(self) -> float:
+        """
+        Roughly how much of the whole clone is done, from 0 to 1.
+        """
+        start, weight = PHASES.get(self.phase, (0.0, 0.0))
+        return start + weight * self.percent / 100
+
+
+def parse_progress(line: str) -> CloneProgress | None:
+    """
+    Parse a line of `git clone --progress` output, returning None
+    for anything that isn't a progress update.
+    """
+    if (match := PROGRESS.search(line)) is None:
+        return None
+
+    received = None
+    if match["size"] is not None:
+        received = int(float(match["size"]) * UNITS[match["unit"]])
+
+    return CloneProgress(
+        phase=match["phase"], percent=int(match["percent"]), received=received
+    )
+
+
+class CloneResult:
+    def __init__(
+        self,
+        job: CloneJob,
+        returncode: int | None,
+        duration: float = 0.0,
+        received: int = 0,
+        stderr: str = "",
+    ) -> None:
+        """
+        The outcome of a single clone.
+
+        Args:
+            job (CloneJob): The job this is the result of.
+            returncode (int | None): git's exit status, None if the clone
+                was cancelled before it started (negative if it was
+                stopped part way through).
+            duration (float, optional): How long the clone took in seconds.
+                Defaults to 0.0.
+            received (int, optional): Bytes received, as reported by git.
+                Defaults to 0.
+            stderr (str, optional): The tail of git's stderr, without the
+                progress updates. Defaults to "".
+        """
+        self.job = job
+        self.returncode = returncode
+        self.duration = duration
+        self.received = received
+        self.stderr = stderr
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(job={self.job!r}, returncode={self.returncode!r},"
+            f" duration={self.duration!r}, received={self.received!r})"
+        )
+
+    __slots__ = ("job", "returncode", "duration", "received", "stderr")
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the clone succeeded.
+        """
+        return self.returncode == 0
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the clone was cancelled, either before it started or
+        part way through.
+        """
+        return self.returncode is None or self.returncode < 0
+
+    @property
+    def error(self) -> str:
+        """
+        A one line explanation of why the clone failed, empty if it didn't.
+        """
+        if self.ok:
+            return ""
+        if self.cancelled:
+            return "Cancelled"
+        return error_line(self.stderr, self.returncode)
+
+
+class CloneEngine:
+    def __init__(
+        self,
+        git: str | None = GIT,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        on_progress: Callable[[CloneJob, CloneProgress], None] | None = None,
+        on_done: Callable[[CloneResult], None] | None = None,
+        mirrors: MirrorCache | None = None,
+    ) -> None:
+        """
+        Clones repos in parallel, at most `concurrency` at a time.
+
+        If given a `MirrorCache`, full clones (jobs without any options)
+        are made from the cached mirror, which is updated first, and the
+        cache is trimmed back to size once all the clones have finished.
+
+        The callbacks are called from the worker threads so they
+        should be quick and thread safe, `rich.progress.Progress` is.
+
+        Args:
+            git (str | None, optional): The git executable.
+                Defaults to git on $PATH.
+            concurrency (int, optional): Maximum simultaneous clones.
+                Defaults to DEFAULT_CONCURRENCY.
+            on_progress (Callable[[CloneJob, CloneProgress], None] | None, optional):
+                Called with every progress update. Defaults to None.
+            on_done (Callable[[CloneResult], None] | None, optional): Called as
+                each clone finishes. Defaults to None.
+            mirrors (MirrorCache | None, optional): Mirrors to clone from.
+                Defaults to None.
+
+        Raises:
+            GitNotInstalledError: If git can't be found.
+        """
+        if git is None:
+            raise GitNotInstalledError
+        self.git = git
+        self.concurrency = max(1, concurrency)
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.mirrors = mirrors
+
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        self._running: set[subprocess.Popen[bytes]] = set()
+        self._fractions: dict[CloneJob, float] = {}
+        self._received: dict[CloneJob, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(git={self.git!r}, concurrency={self.concurrency!r})"
+        )
+
+    __slots__ = (
+        "git",
+        "concurrency",
+        "on_progress",
+        "on_done",
+        "mirrors",
+        "_cancelled",
+        "_lock",
+        "_running",
+        "_fractions",
+        "_received",
+    )
+
+    def run(self, jobs: Iterable[CloneJob]) -> list[CloneResult]:
+        """
+        Clone everything in `jobs`, returning a result for each of them
+        in the same order.
+
+        On Ctrl-C the clones in flight are stopped and the ones that
+        haven't started are skipped, their results are marked as cancelled
+        and `cancelled` is True afterwards.
+
+        Args:
+            jobs (Iterable[CloneJob]): What to clone.
+
+        Returns:
+            list[CloneResult]: The outcome of each clone.
+        """
+        jobs = list(jobs)
+        self._cancelled.clear()
+        with self._lock:
+            self._fractions.clear()
+            self._received.clear()
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="pytoil-clone"
+        ) as executor:
+            futures = [executor.submit(self._clone, job) for job in jobs]
+            try:
+                # Waiting with a timeout rather than blocking on the futures
+                # means Ctrl-C is delivered to this thread promptly
+                pending: set[Future[CloneResult]] = set(futures)
+                while pending:
+                    _, pending = wait(pending, timeout=0.1)
+            except KeyboardInterrupt:
+                self.cancel()
+
+        if self.mirrors is not None:
+            self.mirrors.evict()
+
+        return [future.result() for future in futures]
+
+    @property
+    def completed(self) -> float:
+        """
+        How many clones' worth of work the current run has done so far,
+        counting clones in flight by how far along they are.
+        """
+        with self._lock:
+            return sum(self._fractions.values())
+
+    @property
+    def received(self) -> int:
+        """
+        Total bytes received by the current run so far.
+        """
+        with self._lock:
+            return sum(self._received.values())
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the last run was cancelled.
+        """
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        """
+        Stop the clones in flight and skip any that haven't started.
+
+        git removes the partial clone itself when it's interrupted.
+        """
+        self._cancelled.set()
+        with self._lock:
+            for process in self._running:
+                process.terminate()
+
+    def _clone(self, job: CloneJob) -> CloneResult:
+        start = time.perf_counter()
+        try:
+            result = self._attempt(job, start)
+        except Exception as err:  # noqa: BLE001
+            # e.g. git going missing or the mirror cache's disk being full,
+            # one broken clone mustn't take the rest of the run down with it
+            result = CloneResult(
+                job=job,
+                returncode=1,
+                duration=time.perf_counter() - start,
+                stderr=f"error: {str(err) or type(err).__name__}",
+            )
+        self._done(result)
+        return result
+
+    def _attempt(self, job: CloneJob, start: float) -> CloneResult:
+        use_mirror = self.mirrors is not None and not job.options
+        try:
+            reference: list[str] = []
+            if use_mirror and self.mirrors is not None and not self.cancelled:
+                reference = self.mirrors.reference(job.url)
+
+            with self._lock:
+                # Checked under the lock so a clone can't start after `cancel`
+                # has already stopped everything that was running
+                cancelled = self._cancelled.is_set()
+                if not cancelled:
+                    process = subprocess.Popen(
+                        [
+                            self.git,
+                            "clone",
+                            "--progress",
+                            *job.options,
+                            *reference,
+                            job.url,
+                            str(job.dest),
+                        ],
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.PIPE,
+                    )
+                    self._running.add(process)
+
+            if cancelled:
+                return CloneResult(job=job, returncode=None)
+
+            try:
+                with process:
+                    received, stderr = self._watch(job, process.stderr)
+                    returncode = process.wait()
+            finally:
+                with self._lock:
+                    self._running.discard(process)
+        finally:
+            if use_mirror and self.mirrors is not None:
+                self.mirrors.release(job.url)
+
+        return CloneResult(
+            job=job,
+            returncode=returncode,
+            duration=time.perf_counter() - start,
+            received=received,
+            stderr=stderr,
+        )
+
+    def _watch(self, job: CloneJob, stream: IO[bytes] | None) -> tuple[int, str]:
+        """
+        Read git's stderr until it closes, reporting progress as it goes.
+
+        Returns:
+            tuple[int, str]: Bytes received and the non-progress output.
+        """
+        received = 0
+        messages: list[str] = []
+        if stream is None:  # pragma: no cover
+            return received, ""
+
+        buffer = b""
+        while chunk := stream.read1(4096):  # type: ignore[attr-defined]
+            buffer += chunk
+            # git redraws progress lines with \r and finishes them with \n
+            *lines, buffer = re.split(rb"[\r\n]", buffer)
+            for raw in lines:
+                line = raw.decode("utf-8", errors="replace")
+                if (progress := parse_progress(line)) is None:
+                    if line.strip():
+                        messages.append(line)
+                    continue
+                with self._lock:
+                    self._fractions[job] = max(
+                        self._fractions.get(job, 0.0), progress.fraction
+                    )
+                    if progress.received is not None:
+                        received = max(received, progress.received)
+                        self._received[job] = received
+                if self.on_progress is not None:
+                    self.on_progress(job, progress)
+
+        if buffer.strip():
+            messages.append(buffer.decode("utf-8", errors="replace"))
+
+        return received, "\n".join(messages)[-STDERR_TAIL:]
+
+    def _done(self, result: CloneResult) -> None:
+        with self._lock:
+            self._fractions[result.job] = 1.0
+        if self.on_done is not None:
+            self.on_done(result)
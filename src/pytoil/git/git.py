@@ -8,20 +8,35 @@ Created: 22/12/2021
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import sys
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
 from pytoil.exceptions import GitNotInstalledError
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
     from pathlib import Path
 
 
 GIT = shutil.which("git")
 
 
+def error_line(stderr: str, returncode: int | None) -> str:
+    """
+    The line of git's stderr that best explains why it failed.
+    """
+    lines = [line.strip() for line in stderr.splitlines() if line.strip()]
+    # git follows the actual error with hints e.g. "Please make sure..."
+    errors = [line for line in lines if line.startswith(("fatal:", "error:"))]
+    if errors or lines:
+        return (errors or lines)[-1]
+    return f"git exited with {returncode}"
+
+
 class Git:
     def __init__(self, git: str | None = GIT) -> None:
         if git is None:
@@ -33,7 +48,9 @@ class Git:
 
     __slots__ = ("git",)
 
-    def clone(self, url: str, cwd: Path, silent: bool = True) -> None:
+    def clone(
+        self, url: str, cwd: Path, silent: bool = True, options: Sequence[str] = ()
+    ) -> int:
         """
         Clone a repo.
 
@@ -43,13 +60,18 @@ class Git:
             silent (bool, optional): Whether to hook the output
                 up to stdout and stderr (False) or to discard and keep silent (True).
                 Defaults to True.
+            options (Sequence[str], optional): Extra arguments to `git clone`
+                e.g. from `pytoil.git.modes.clone_options`. Defaults to ().
+
+        Returns:
+            int: git's exit status, 0 if the clone succeeded.
         """
-        subprocess.run(
-            [self.git, "clone", url],
+        return subprocess.run(
+            [self.git, "clone", *options, url],
             cwd=cwd,
             stdout=subprocess.DEVNULL if silent else sys.stdout,
             stderr=subprocess.DEVNULL if silent else sys.stderr,
-        )
+        ).returncode
 
     def init(self, cwd: Path, silent: bool = True) -> None:
         """
@@ -135,3 +157,208 @@ class Git:
             stdout=subprocess.DEVNULL if silent else sys.stdout,
             stderr=subprocess.DEVNULL if silent else sys.stderr,
         )
+
+    def _run(
+        self, *args: str, cwd: Path, env: Mapping[str, str] | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Run git with `args` in `cwd`, capturing its output.
+        """
+        return subprocess.run(
+            [self.git, *args],
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            env=None if env is None else {**os.environ, **env},
+        )
+
+    def _config(self, cwd: Path, key: str) -> str | None:
+        """
+        The value of git config `key` for the repo at `cwd`, if it's set.
+        """
+        return self._run("config", "--get", key, cwd=cwd).stdout.strip() or None
+
+    def fetch(self, cwd: Path, prune: bool = True) -> subprocess.CompletedProcess[str]:
+        """
+        Fetch from origin.
+
+        Never prompts for credentials, a repo that needs them just fails,
+        so this is safe to run on lots of repos at once.
+
+        Args:
+            cwd (Path): Root of the project where the local git repo is.
+            prune (bool, optional): Whether to remove remote-tracking branches
+                that no longer exist on origin. Defaults to True.
+
+        Returns:
+            subprocess.CompletedProcess[str]: The finished git process with its
+                output captured.
+        """
+        args = ["fetch", "--prune"] if prune else ["fetch"]
+        return self._run(*args, "origin", cwd=cwd, env={"GIT_TERMINAL_PROMPT": "0"})
+
+    def is_dirty(self, cwd: Path) -> bool:
+        """
+        Whether the repo at `cwd` has uncommitted changes to tracked files.
+
+        Untracked files don't count, git won't let a merge overwrite them.
+        """
+        result = self._run("status", "--porcelain", "--untracked-files=no", cwd=cwd)
+        return bool(result.stdout.strip())
+
+    def upstream(self, cwd: Path) -> str | None:
+        """
+        The branch the current branch tracks e.g. "origin/main", or None
+        if it doesn't track one (or HEAD is detached).
+        """
+        result = self._run(
+            "rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{upstream}", cwd=cwd
+        )
+        if result.returncode != 0:
+            return None
+        return result.stdout.strip() or None
+
+    def ahead_behind(self, cwd: Path) -> tuple[int, int] | None:
+        """
+        How many commits the current branch is ahead of and behind its
+        upstream, or None if it doesn't have one.
+        """
+        result = self._run(
+            "rev-list", "--left-right", "--count", "HEAD...@{upstream}", cwd=cwd
+        )
+        if result.returncode != 0:
+            return None
+        ahead, behind = result.stdout.split()
+        return int(ahead), int(behind)
+
+    def status(
+        self, cwd: Path, fsmonitor: bool = False
+    ) -> subprocess.CompletedProcess[str]:
+        """
+        Everything `git status` knows about the repo at `cwd` in one go,
+        in the machine readable porcelain v2 format including the branch
+        headers and the number of stashes (needs git 2.35 or later).
+
+        Args:
+            cwd (Path): Root of the project where the local git repo is.
+            fsmonitor (bool, optional): Whether to use git's filesystem
+                monitor daemon and untracked cache, which make status much
+                quicker on big working trees after the first run.
+                Defaults to False.
+
+        Returns:
+            subprocess.CompletedProcess[str]: The finished git process with its
+                output captured, see `pytoil.git.status.parse_status`.
+        """
+        config = (
+            ["-c", "core.fsmonitor=true", "-c", "core.untrackedCache=true"]
+            if fsmonitor
+            else []
+        )
+        return self._run(
+            *config,
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "--show-stash",
+            cwd=cwd,
+        )
+
+    def last_commit(self, cwd: Path) -> datetime | None:
+        """
+        When the commit HEAD points to was made, or None if there
+        aren't any commits yet.
+        """
+        result = self._run("log", "-1", "--format=%ct", cwd=cwd)
+        if result.returncode != 0 or not result.stdout.strip():
+            return None
+        return datetime.fromtimestamp(int(result.stdout.strip()), tz=timezone.utc)
+
+    def fast_forward(self, cwd: Path) -> subprocess.CompletedProcess[str]:
+        """
+        Fast-forward the current branch to its upstream, refusing to
+        do anything if that would need a merge commit.
+
+        Returns:
+            subprocess.CompletedProcess[str]: The finished git process with its
+                output captured.
+        """
+        return self._run("merge", "--ff-only", "--quiet", "@{upstream}", cwd=cwd)
+
+    def clone_state(self, cwd: Path) -> set[str]:
+        """
+        The ways the repo at `cwd` is less than a full clone.
+
+        Args:
+            cwd (Path): Root of the project where the local git repo is.
+
+        Returns:
+            set[str]: Any of "shallow" (truncated history), "partial" (file
+                contents or trees fetched on demand) and "sparse" (only
+                some files checked out), empty for a full clone.
+        """
+        state: set[str] = set()
+        if cwd.joinpath(".git", "shallow").exists():
+            state.add("shallow")
+        if self._config(cwd, "remote.origin.promisor") == "true":
+            state.add("partial")
+        if self._config(cwd, "core.sparseCheckout") == "true":
+            state.add("sparse")
+        return state
+
+    def unshallow(self, cwd: Path, silent: bool = True) -> int:
+        """
+        Turn a shallow, partial or sparse clone into a full one by
+        fetching all the history, every branch and all file contents,
+        and checking out every file.
+
+        Does nothing to a repo that's already a full clone.
+
+        Args:
+            cwd (Path): Root of the project where the local git repo is.
+            silent (bool, optional): Whether to hook the output
+                up to stdout and stderr (False) or to discard and keep silent (True).
+                Defaults to True.
+
+        Returns:
+            int: The exit status of the first git command to fail, or 0.
+        """
+        state = self.clone_state(cwd)
+        commands: list[list[str]] = []
+
+        if "shallow" in state:
+            # Shallow clones are single branch too, widen it back out
+            # so the fetch brings down every branch
+            commands += [
+                [
+                    "config",
+                    "remote.origin.fetch",
+                    "+refs/heads/*:refs/remotes/origin/*",
+                ],
+                ["fetch", "--unshallow", "origin"],
+            ]
+
+        if "partial" in state:
+            # Drop the filter, fetch everything again, then tell git it
+            # no longer needs to go back to origin for missing objects
+            commands += [
+                ["config", "--unset", "remote.origin.partialclonefilter"],
+                ["fetch", "--refetch", "origin"],
+                ["config", "--unset", "remote.origin.promisor"],
+            ]
+
+        if "sparse" in state:
+            commands.append(["sparse-checkout", "disable"])
+
+        for command in commands:
+            returncode = subprocess.run(
+                [self.git, *command],
+                cwd=cwd,
+                stdout=subprocess.DEVNULL if silent else sys.stdout,
+                stderr=subprocess.DEVNULL if silent else sys.stderr,
+            ).returncode
+            if returncode != 0:
+                return returncode
+
+        return 0
@@ -0,0 +1,288 @@
+"""
+A local cache of bare mirrors to clone from.
+
+Projects get removed and checked out again all the time and, without
+this, every clone brings the whole history back over the network.
+`MirrorCache` keeps a `git clone --mirror` of every repo it's asked
+about in the user cache directory, brings it up to date with an
+incremental fetch before each clone and hands out
+`--reference <mirror> --dissociate` so git copies everything it already
+has from the mirror and only fetches what's new from GitHub. With
+`--dissociate` the clone doesn't depend on the mirror afterwards, so
+mirrors can be evicted at any time.
+
+The cache is bounded in size and evicts the least recently used
+mirrors first. A mirror being cloned from is never evicted, by this
+pytoil or any other: each process using a mirror leaves a marker file in
+it for as long as it does (ignored once it's old enough to have been left
+behind by a pytoil that didn't finish).
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+
+from pytoil.config import defaults
+from pytoil.exceptions import GitNotInstalledError
+from pytoil.git.git import GIT
+
+# Touched whenever a mirror is used, its mtime is the mirror's last use
+LAST_USED = "pytoil-last-used"
+
+# Directory of markers, one per process cloning from the mirror
+IN_USE = "pytoil-in-use"
+
+# A marker older than this was left by a pytoil that didn't finish
+STALE_IN_USE = 60 * 60
+
+MIB = 1024 * 1024
+
+
+class MirrorCache:
+    def __init__(
+        self,
+        root: Path = defaults.MIRROR_CACHE_DIR,
+        max_size: int = defaults.MIRROR_CACHE_SIZE * MIB,
+        git: str | None = GIT,
+    ) -> None:
+        """
+        The mirror cache under `root`.
+
+        Args:
+            root (Path, optional): Where to keep the mirrors.
+                Defaults to defaults.MIRROR_CACHE_DIR.
+            max_size (int, optional): Size in bytes the cache is trimmed back
+                to by `evict`. Defaults to defaults.MIRROR_CACHE_SIZE MiB.
+            git (str | None, optional): The git executable.
+                Defaults to git on $PATH.
+
+        Raises:
+            GitNotInstalledError: If git can't be found.
+        """
+        if git is None:
+            raise GitNotInstalledError
+        self.root = root
+        self.max_size = max_size
+        self.git = git
+        # Clones run in parallel, but evicting a mirror one of them is
+        # about to use would be bad. Counted as more than one job can
+        # use the same mirror at once
+        self._lock = threading.Lock()
+        self._in_use: dict[Path, int] = {}
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(root={self.root!r}, max_size={self.max_size!r}, git={self.git!r})"
+        )
+
+    __slots__ = ("root", "max_size", "git", "_lock", "_in_use")
+
+    def path(self, url: str) -> Path:
+        """
+        Where the mirror of `url` lives (whether it exists yet or not).
+        """
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        name = re.sub(r"[^A-Za-z0-9_.-]", "_", url.rstrip("/").rsplit("/", 1)[-1])
+        if not name.endswith(".git"):
+            name = f"{name}.git"
+        return self.root.joinpath(f"{digest}-{name}")
+
+    def update(self, url: str) -> Path | None:
+        """
+        Make sure there's an up to date mirror of `url`, creating it if
+        needed or fetching just what's changed if not.
+
+        Args:
+            url (str): The repo's clone url.
+
+        Returns:
+            Path | None: The mirror, or None if there isn't one because it
+                couldn't be created. A mirror that couldn't be brought up
+                to date is still returned as it's still useful to clone from.
+        """
+        mirror = self.path(url)
+        self._acquire(mirror)
+
+        if mirror.exists():
+            self._mark(mirror)
+            self._git("fetch", "--prune", "--quiet", "origin", cwd=mirror)
+        elif self._create(url, mirror):
+            self._mark(mirror)
+        else:
+            self._release(mirror)
+            return None
+
+        mirror.joinpath(LAST_USED).touch()
+        return mirror
+
+    def reference(self, url: str) -> list[str]:
+        """
+        The `git clone` arguments to clone `url` using its mirror,
+        updating (or creating) the mirror first.
+
+        Call `release` once the clone has finished.
+
+        Args:
+            url (str): The repo's clone url.
+
+        Returns:
+            list[str]: `--reference <mirror> --dissociate`, or nothing if
+                there's no mirror to use.
+        """
+        if (mirror := self.update(url)) is None:
+            return []
+        return ["--reference", str(mirror), "--dissociate"]
+
+    def release(self, url: str) -> None:
+        """
+        Mark the mirror of `url` as no longer being cloned from,
+        so `evict` may remove it.
+        """
+        self._release(self.path(url))
+
+    def mirrors(self) -> list[Path]:
+        """
+        All the mirrors in the cache, least recently used first.
+        """
+        if not self.root.exists():
+            return []
+        return sorted(
+            (path for path in self.root.iterdir() if path.suffix == ".git"),
+            key=_last_used,
+        )
+
+    def size(self) -> int:
+        """
+        Total size of the cache in bytes.
+        """
+        return sum(_disk_usage(mirror) for mirror in self.mirrors())
+
+    def evict(self) -> list[Path]:
+        """
+        Remove the least recently used mirrors until the cache fits in
+        `max_size`, skipping any that are being cloned from here or by
+        another pytoil.
+
+        Returns:
+            list[Path]: The mirrors removed.
+        """
+        with self._lock:
+            mirrors = [(mirror, _disk_usage(mirror)) for mirror in self.mirrors()]
+            total = sum(size for _, size in mirrors)
+
+            evicted: list[Path] = []
+            for mirror, size in mirrors:
+                if total <= self.max_size:
+                    break
+                if mirror in self._in_use or _used_elsewhere(mirror):
+                    continue
+                shutil.rmtree(mirror, ignore_errors=True)
+                evicted.append(mirror)
+                total -= size
+
+        return evicted
+
+    def clear(self) -> None:
+        """
+        Remove every mirror.
+        """
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _acquire(self, mirror: Path) -> None:
+        with self._lock:
+            self._in_use[mirror] = self._in_use.get(mirror, 0) + 1
+
+    def _mark(self, mirror: Path) -> None:
+        # Created under the lock so it can't race `_release` removing it
+        with self._lock:
+            markers = mirror.joinpath(IN_USE)
+            markers.mkdir(exist_ok=True)
+            markers.joinpath(str(os.getpid())).touch()
+
+    def _release(self, mirror: Path) -> None:
+        with self._lock:
+            count = self._in_use.get(mirror, 0) - 1
+            if count > 0:
+                self._in_use[mirror] = count
+                return
+            self._in_use.pop(mirror, None)
+            mirror.joinpath(IN_USE, str(os.getpid())).unlink(missing_ok=True)
+
+    def _create(self, url: str, mirror: Path) -> bool:
+        # Mirror into a temporary directory and move it into place so an
+        # interrupted clone never leaves a broken mirror behind
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root.joinpath(
+            f".{mirror.name}.{os.getpid()}.{threading.get_ident()}"
+        )
+        if self._git("clone", "--mirror", "--quiet", url, str(tmp), cwd=self.root):
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+
+        try:
+            tmp.rename(mirror)
+        except OSError:
+            # Someone else got there first, theirs is just as good
+            shutil.rmtree(tmp, ignore_errors=True)
+        return mirror.exists()
+
+    def _git(self, *args: str, cwd: Path) -> int:
+        return subprocess.run(
+            [self.git, *args],
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        ).returncode
+
+
+def _last_used(mirror: Path) -> float:
+    try:
+        return mirror.joinpath(LAST_USED).stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+def _used_elsewhere(mirror: Path) -> bool:
+    """
+    Whether another pytoil process is cloning from `mirror`.
+    """
+    own = str(os.getpid())
+    try:
+        markers = list(mirror.joinpath(IN_USE).iterdir())
+    except OSError:
+        return False
+
+    now = time.time()
+    for marker in markers:
+        if marker.name == own:
+            continue
+        try:
+            if now - marker.stat().st_mtime < STALE_IN_USE:
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def _disk_usage(path: Path) -> int:
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            try:
+                total += Path(dirpath, filename).stat().st_size
+            except OSError:
+                continue
+    return total
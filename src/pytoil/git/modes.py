@@ -0,0 +1,62 @@
+"""
+The different ways pytoil can clone a repo.
+
+A full clone downloads every version of every file, which for big
+repos (or for a `pytoil pull --all` on a fresh machine) is most of the
+time and disk space spent. The cheaper modes lean on git's shallow,
+partial and sparse clones and can all be turned back into a full clone
+later with `pytoil unshallow`:
+
+* full: Everything, the default.
+* shallow: Only the latest commit of the default branch.
+* blobless: All the history but file contents are only downloaded
+    when they're needed (e.g. on checkout).
+* treeless: Like blobless but directory listings are fetched on demand
+    too, the fastest to clone while keeping the history.
+* sparse: Blobless, and only the files at the top level of the repo
+    are checked out.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+CLONE_MODES: tuple[str, ...] = ("full", "shallow", "blobless", "treeless", "sparse")
+
+DEFAULT_DEPTH = 1
+
+
+def clone_options(mode: str, depth: int = DEFAULT_DEPTH) -> list[str]:
+    """
+    The extra `git clone` arguments for a clone `mode`.
+
+    Args:
+        mode (str): One of CLONE_MODES.
+        depth (int, optional): How many commits a shallow clone keeps.
+            Defaults to DEFAULT_DEPTH.
+
+    Raises:
+        ValueError: If `mode` isn't one of CLONE_MODES or `depth` < 1.
+
+    Returns:
+        list[str]: The arguments.
+    """
+    if mode == "full":
+        return []
+    if mode == "shallow":
+        if depth < 1:
+            raise ValueError(f"Clone depth must be at least 1, got {depth}")
+        # --depth implies --single-branch, but say so as it's half the saving
+        return ["--depth", str(depth), "--single-branch"]
+    if mode == "blobless":
+        return ["--filter=blob:none"]
+    if mode == "treeless":
+        return ["--filter=tree:0"]
+    if mode == "sparse":
+        return ["--filter=blob:none", "--sparse"]
+
+    raise ValueError(
+        f"Unknown clone mode {mode!r}, must be one of {', '.join(CLONE_MODES)}"
+    )
@@ -0,0 +1,248 @@
+"""
+The state of lots of local projects at a glance.
+
+Each project costs a single `git status --porcelain=v2 --branch
+--show-stash`, which has the branch, its upstream, how far ahead and
+behind it is, the stash count and every changed file all in one
+machine readable go, plus a `git log -1` for the date of the last commit.
+`collect` runs those on a pool of threads and yields a `RepoStatus` for
+each project as soon as it's ready, so callers can show results as
+they arrive rather than waiting for the slowest repo.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from pytoil.git.git import Git, error_line
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+    from datetime import datetime
+    from pathlib import Path
+
+# git status is a mix of disk and CPU so, like ThreadPoolExecutor's own
+# default, a few more than there are CPUs keeps everything busy
+DEFAULT_CONCURRENCY = min(32, (os.cpu_count() or 1) + 4)
+
+
+class RepoStatus:
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        branch: str | None = None,
+        upstream: str | None = None,
+        ahead: int = 0,
+        behind: int = 0,
+        staged: int = 0,
+        modified: int = 0,
+        untracked: int = 0,
+        conflicted: int = 0,
+        stashes: int = 0,
+        last_commit: datetime | None = None,
+        error: str = "",
+    ) -> None:
+        """
+        The state of a single local project.
+
+        Args:
+            name (str): The project's name.
+            path (Path): The project's root.
+            branch (str | None, optional): The current branch, None if HEAD
+                is detached. Defaults to None.
+            upstream (str | None, optional): The branch it tracks e.g.
+                "origin/main", if any. Defaults to None.
+            ahead (int, optional): Commits not on the upstream. Defaults to 0.
+            behind (int, optional): Commits only on the upstream. Defaults to 0.
+            staged (int, optional): Files with staged changes. Defaults to 0.
+            modified (int, optional): Files with unstaged changes. Defaults to 0.
+            untracked (int, optional): Untracked files. Defaults to 0.
+            conflicted (int, optional): Files with merge conflicts.
+                Defaults to 0.
+            stashes (int, optional): Number of stashes. Defaults to 0.
+            last_commit (datetime | None, optional): When the commit HEAD
+                points to was made, None if there aren't any.
+                Defaults to None.
+            error (str, optional): Why the status couldn't be read, empty
+                if it could. Defaults to "".
+        """
+        self.name = name
+        self.path = path
+        self.branch = branch
+        self.upstream = upstream
+        self.ahead = ahead
+        self.behind = behind
+        self.staged = staged
+        self.modified = modified
+        self.untracked = untracked
+        self.conflicted = conflicted
+        self.stashes = stashes
+        self.last_commit = last_commit
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, path={self.path!r}, branch={self.branch!r},"
+            f" upstream={self.upstream!r}, ahead={self.ahead!r},"
+            f" behind={self.behind!r}, staged={self.staged!r},"
+            f" modified={self.modified!r}, untracked={self.untracked!r},"
+            f" conflicted={self.conflicted!r}, stashes={self.stashes!r},"
+            f" last_commit={self.last_commit!r}, error={self.error!r})"
+        )
+
+    __slots__ = (
+        "name",
+        "path",
+        "branch",
+        "upstream",
+        "ahead",
+        "behind",
+        "staged",
+        "modified",
+        "untracked",
+        "conflicted",
+        "stashes",
+        "last_commit",
+        "error",
+    )
+
+    @property
+    def dirty(self) -> bool:
+        """
+        Whether there are any uncommitted changes to tracked files.
+        """
+        return bool(self.staged or self.modified or self.conflicted)
+
+    @property
+    def clean(self) -> bool:
+        """
+        Whether there's nothing at all to commit, push or pull.
+        """
+        return not (
+            self.error
+            or self.dirty
+            or self.untracked
+            or self.ahead
+            or self.behind
+            or self.stashes
+        )
+
+
+def parse_status(name: str, path: Path, output: str) -> RepoStatus:
+    """
+    Parse the output of `git status --porcelain=v2 --branch --show-stash`.
+
+    Args:
+        name (str): The project's name.
+        path (Path): The project's root.
+        output (str): What git printed.
+
+    Returns:
+        RepoStatus: The project's status, without the last commit date.
+    """
+    status = RepoStatus(name=name, path=path)
+
+    for line in output.splitlines():
+        kind, _, rest = line.partition(" ")
+        if kind == "#":
+            header, _, value = rest.partition(" ")
+            if header == "branch.head":
+                status.branch = None if value == "(detached)" else value
+            elif header == "branch.upstream":
+                status.upstream = value
+            elif header == "branch.ab":
+                ahead, behind = value.split()
+                status.ahead, status.behind = int(ahead), -int(behind)
+            elif header == "stash":
+                status.stashes = int(value)
+        elif kind in {"1", "2"}:
+            # "XY" is the staged (index) then unstaged (working tree) state
+            staged, unstaged = rest[0], rest[1]
+            status.staged += staged != "."
+            status.modified += unstaged != "."
+        elif kind == "u":
+            status.conflicted += 1
+        elif kind == "?":
+            status.untracked += 1
+
+    return status
+
+
+def repo_status(git: Git, name: str, path: Path, fsmonitor: bool = False) -> RepoStatus:
+    """
+    The status of a single project.
+
+    Args:
+        git (Git): The git to run.
+        name (str): The project's name.
+        path (Path): The project's root.
+        fsmonitor (bool, optional): Whether to use git's filesystem monitor
+            and untracked cache. Defaults to False.
+
+    Returns:
+        RepoStatus: The project's status.
+    """
+    if not path.joinpath(".git").exists():
+        return RepoStatus(name=name, path=path, error="Not a git repo")
+
+    result = git.status(path, fsmonitor=fsmonitor)
+    if result.returncode != 0:
+        return RepoStatus(
+            name=name, path=path, error=error_line(result.stderr, result.returncode)
+        )
+
+    status = parse_status(name, path, result.stdout)
+    status.last_commit = git.last_commit(path)
+    return status
+
+
+def collect(
+    projects: Iterable[tuple[str, Path]],
+    git: Git | None = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    fsmonitor: bool = False,
+) -> Iterator[RepoStatus]:
+    """
+    Get the status of every (name, path) in `projects` in parallel,
+    yielding each one as soon as it's ready.
+
+    Stopping early (e.g. on Ctrl-C) skips the projects that haven't
+    been started.
+
+    Args:
+        projects (Iterable[tuple[str, Path]]): The projects.
+        git (Git | None, optional): The git to run. Defaults to Git().
+        concurrency (int, optional): Maximum projects at once.
+            Defaults to DEFAULT_CONCURRENCY.
+        fsmonitor (bool, optional): Whether to use git's filesystem monitor
+            and untracked cache. Defaults to False.
+
+    Yields:
+        RepoStatus: The status of each project, in the order they finish.
+    """
+    git = git or Git()
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, concurrency), thread_name_prefix="pytoil-status"
+    )
+    try:
+        pending: set[Future[RepoStatus]] = {
+            executor.submit(repo_status, git, name, path, fsmonitor)
+            for name, path in projects
+        }
+        while pending:
+            # Waiting with a timeout rather than blocking on the futures
+            # means Ctrl-C is delivered to this thread promptly
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,265 @@
+"""
+Brings lots of local projects up to date with their remotes at once.
+
+For each project `SyncEngine` fetches from origin (pruning deleted
+branches) and, if it's safe to, fast-forwards the current branch to
+its upstream. It's never safe if the working tree has uncommitted
+changes or the branch has diverged from its upstream, those projects
+are fetched but left alone. Every project gets a `SyncResult` saying
+what happened and how long it took.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+from pytoil.git.git import Git, error_line
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from concurrent.futures import Future
+    from pathlib import Path
+
+# Fetching is mostly waiting on the network, but every one is also a
+# git process and some disk work so don't go overboard
+DEFAULT_CONCURRENCY = 8
+
+# What can happen to a project
+UPDATED = "updated"
+UP_TO_DATE = "up to date"
+AHEAD = "ahead"
+DIVERGED = "diverged"
+DIRTY = "dirty"
+NO_UPSTREAM = "no upstream"
+NOT_A_REPO = "not a repo"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# Fetched but deliberately not fast-forwarded
+SKIPPED = frozenset({DIVERGED, DIRTY, NO_UPSTREAM, NOT_A_REPO})
+
+
+class SyncResult:
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        outcome: str,
+        duration: float = 0.0,
+        commits: int = 0,
+        detail: str = "",
+    ) -> None:
+        """
+        What happened when syncing a single project.
+
+        Args:
+            name (str): The project's name.
+            path (Path): The project's root.
+            outcome (str): One of the outcomes above e.g. UPDATED.
+            duration (float, optional): How long the sync took in seconds.
+                Defaults to 0.0.
+            commits (int, optional): How many commits the branch was
+                fast-forwarded by. Defaults to 0.
+            detail (str, optional): A one line explanation, e.g. the
+                error from git. Defaults to "".
+        """
+        self.name = name
+        self.path = path
+        self.outcome = outcome
+        self.duration = duration
+        self.commits = commits
+        self.detail = detail
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, path={self.path!r}, outcome={self.outcome!r},"
+            f" duration={self.duration!r}, commits={self.commits!r},"
+            f" detail={self.detail!r})"
+        )
+
+    __slots__ = ("name", "path", "outcome", "duration", "commits", "detail")
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether the sync went fine, skipping a project on purpose counts.
+        """
+        return self.outcome not in {FAILED, CANCELLED}
+
+    @property
+    def skipped(self) -> bool:
+        """
+        Whether the project was deliberately left alone.
+        """
+        return self.outcome in SKIPPED
+
+
+def sync_project(git: Git, name: str, path: Path) -> SyncResult:
+    """
+    Fetch a single project and fast-forward it if that's safe.
+
+    Args:
+        git (Git): The git to run.
+        name (str): The project's name.
+        path (Path): The project's root.
+
+    Returns:
+        SyncResult: What happened.
+    """
+    start = time.perf_counter()
+
+    def result(outcome: str, detail: str = "", commits: int = 0) -> SyncResult:
+        return SyncResult(
+            name=name,
+            path=path,
+            outcome=outcome,
+            duration=time.perf_counter() - start,
+            commits=commits,
+            detail=detail,
+        )
+
+    if not path.joinpath(".git").exists():
+        return result(NOT_A_REPO)
+
+    fetch = git.fetch(path)
+    if fetch.returncode != 0:
+        return result(FAILED, error_line(fetch.stderr, fetch.returncode))
+
+    if (counts := git.ahead_behind(path)) is None:
+        return result(NO_UPSTREAM, "Fetched, the current branch doesn't track one")
+
+    ahead, behind = counts
+    if not behind:
+        if ahead:
+            return result(AHEAD, f"{ahead} commit(s) to push")
+        return result(UP_TO_DATE)
+
+    if ahead:
+        return result(DIVERGED, f"{ahead} ahead, {behind} behind, merge by hand")
+
+    if git.is_dirty(path):
+        return result(DIRTY, f"{behind} commit(s) behind, commit or stash first")
+
+    merge = git.fast_forward(path)
+    if merge.returncode != 0:
+        return result(FAILED, error_line(merge.stderr, merge.returncode))
+
+    return result(UPDATED, f"{behind} new commit(s)", commits=behind)
+
+
+class SyncEngine:
+    def __init__(
+        self,
+        git: Git | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        on_done: Callable[[SyncResult], None] | None = None,
+    ) -> None:
+        """
+        Syncs projects in parallel, at most `concurrency` at a time.
+
+        `on_done` is called from the worker threads so it should be
+        quick and thread safe, `rich.progress.Progress` is.
+
+        Args:
+            git (Git | None, optional): The git to run. Defaults to Git().
+            concurrency (int, optional): Maximum simultaneous syncs.
+                Defaults to DEFAULT_CONCURRENCY.
+            on_done (Callable[[SyncResult], None] | None, optional): Called as
+                each project finishes. Defaults to None.
+
+        Raises:
+            GitNotInstalledError: If git can't be found.
+        """
+        self.git = git or Git()
+        self.concurrency = max(1, concurrency)
+        self.on_done = on_done
+        self._cancelled = threading.Event()
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(git={self.git!r}, concurrency={self.concurrency!r})"
+        )
+
+    __slots__ = ("git", "concurrency", "on_done", "_cancelled")
+
+    def run(self, projects: Iterable[tuple[str, Path]]) -> list[SyncResult]:
+        """
+        Sync every (name, path) in `projects`, returning a result for
+        each of them in the same order.
+
+        On Ctrl-C the projects that haven't started are skipped and marked
+        as cancelled, and `cancelled` is True afterwards. The git commands
+        already running get the Ctrl-C too (they're in the same process
+        group) so those projects finish quickly, usually as failed.
+
+        Args:
+            projects (Iterable[tuple[str, Path]]): What to sync.
+
+        Returns:
+            list[SyncResult]: The outcome for each project.
+        """
+        projects = list(projects)
+        self._cancelled.clear()
+
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="pytoil-sync"
+        ) as executor:
+            futures = [
+                executor.submit(self._sync, name, path) for name, path in projects
+            ]
+            try:
+                # Waiting with a timeout rather than blocking on the futures
+                # means Ctrl-C is delivered to this thread promptly
+                pending: set[Future[SyncResult]] = set(futures)
+                while pending:
+                    _, pending = wait(pending, timeout=0.1)
+            except KeyboardInterrupt:
+                self._cancelled.set()
+                for future in futures:
+                    future.cancel()
+
+        return [
+            (
+                SyncResult(name=name, path=path, outcome=CANCELLED)
+                if future.cancelled()
+                else future.result()
+            )
+            for (name, path), future in zip(projects, futures)
+        ]
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the last run was cancelled.
+        """
+        return self._cancelled.is_set()
+
+    def _sync(self, name: str, path: Path) -> SyncResult:
+        if self._cancelled.is_set():
+            result = SyncResult(name=name, path=path, outcome=CANCELLED)
+        else:
+            start = time.perf_counter()
+            try:
+                result = sync_project(self.git, name, path)
+            except Exception as err:  # noqa: BLE001
+                # e.g. git going missing or output that won't decode, one
+                # broken project mustn't take the rest of the run down with it
+                result = SyncResult(
+                    name=name,
+                    path=path,
+                    outcome=FAILED,
+                    duration=time.perf_counter() - start,
+                    detail=f"error: {str(err) or type(err).__name__}",
+                )
+        if self.on_done is not None:
+            self.on_done(result)
+        return result
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+from pytoil.projects.index import LocalProjects, Project
+
+__all__ = (
+    "LocalProjects",
+    "Project",
+)
@@ -0,0 +1,381 @@
+"""
+Persistent index of the projects under the configured projects directory.
+
+Listing the projects directory and stat'ing every entry is the slowest
+part of most local commands when there are thousands of projects or the
+directory lives on a network drive. The index keeps the result of the
+last scan in a small SQLite database in the user cache directory,
+alongside each project's stat data and whether it's a git repo.
+
+Detecting a project's environment means reading and parsing its manifest,
+far more work than anything else the scan does and only needed by the
+commands that show it, so it's done lazily (`LocalProjects.environments`)
+and the result is saved to the index until the project changes.
+
+The index is validated against the modification time of the projects
+directory, which changes whenever a project is added, removed or renamed.
+When it has changed only the new or changed entries are re-inspected.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import sqlite3
+from typing import TYPE_CHECKING
+
+from pytoil.config import defaults
+from pytoil.projects.scan import scan
+from pytoil.repo import Repo
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from pytoil.config import Config
+
+# Bump whenever the tables change, old indexes are then rebuilt from scratch
+SCHEMA_VERSION = 4
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS roots (
+    root TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    follow_symlinks INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS projects (
+    root TEXT NOT NULL,
+    name TEXT NOT NULL,
+    created REAL NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    env TEXT,
+    env_detected INTEGER NOT NULL,
+    is_git INTEGER NOT NULL,
+    PRIMARY KEY (root, name)
+);
+"""
+
+
+class Project:
+    def __init__(
+        self,
+        name: str,
+        path: Path,
+        created: float,
+        mtime_ns: int,
+        env: str | None = None,
+        is_git: bool = False,
+        env_detected: bool = False,
+    ) -> None:
+        """
+        A single local project as recorded in the index.
+
+        Args:
+            name (str): The project's directory name.
+            path (Path): Full path to the project.
+            created (float): Creation time (epoch seconds), or the last metadata
+                change on platforms that don't record creation time.
+            mtime_ns (int): Modification time of the project directory in ns.
+            env (str | None, optional): Name of the detected environment type
+                e.g. "venv", "conda". Defaults to None.
+            is_git (bool, optional): Whether the project is a git repo.
+                Defaults to False.
+            env_detected (bool, optional): Whether `env` has been detected yet,
+                see `LocalProjects.environments`. Defaults to False.
+        """
+        self.name = name
+        self.path = path
+        self.created = created
+        self.mtime_ns = mtime_ns
+        self.env = env
+        self.is_git = is_git
+        self.env_detected = env_detected
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, path={self.path!r}, created={self.created!r},"
+            f" mtime_ns={self.mtime_ns!r}, env={self.env!r}, is_git={self.is_git!r},"
+            f" env_detected={self.env_detected!r})"
+        )
+
+    __slots__ = (
+        "name",
+        "path",
+        "created",
+        "mtime_ns",
+        "env",
+        "is_git",
+        "env_detected",
+    )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Project):
+            return NotImplemented
+        return all(
+            getattr(self, attr) == getattr(other, attr) for attr in self.__slots__
+        )
+
+    @property
+    def modified(self) -> float:
+        """
+        Modification time of the project directory (epoch seconds).
+        """
+        return self.mtime_ns / 1e9
+
+
+class LocalProjects:
+    def __init__(
+        self,
+        config: Config,
+        index: Path | None = defaults.PROJECTS_INDEX,
+        refresh: bool = False,
+    ) -> None:
+        """
+        The projects in the configured projects directory.
+
+        The directory is only scanned if it has changed since the index
+        was last updated (or if `refresh` is True), and the result is
+        memoised for the lifetime of the object.
+
+        Args:
+            config (Config): The pytoil config.
+            index (Path | None, optional): The SQLite index file, None to
+                always scan without persisting anything.
+                Defaults to defaults.PROJECTS_INDEX.
+            refresh (bool, optional): Ignore the index and rescan every project.
+                Defaults to False.
+        """
+        self.config = config
+        self.root = config.projects_dir
+        self.follow_symlinks = config.follow_symlinks
+        self.index = index
+        self.refresh = refresh
+        self._projects: dict[str, Project] | None = None
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(root={self.root!r}, index={self.index!r}, refresh={self.refresh!r})"
+        )
+
+    __slots__ = ("config", "root", "follow_symlinks", "index", "refresh", "_projects")
+
+    def __iter__(self) -> Iterator[Project]:
+        return iter(self.projects())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._load()
+
+    def get(self, name: str) -> Project | None:
+        """
+        The project called `name`, or None if there isn't one.
+        """
+        return self._load().get(name)
+
+    def names(self) -> set[str]:
+        """
+        The names of all the local projects.
+        """
+        return set(self._load())
+
+    def projects(self) -> list[Project]:
+        """
+        All the local projects, sorted case-insensitively by name.
+        """
+        return sorted(self._load().values(), key=lambda p: p.name.casefold())
+
+    def _load(self) -> dict[str, Project]:
+        if self._projects is None:
+            self._projects = self._from_index()
+        return self._projects
+
+    def _from_index(self) -> dict[str, Project]:
+        # Stat'd before scanning so that anything changing mid-scan
+        # invalidates the index again next time
+        mtime_ns = self.root.stat().st_mtime_ns
+
+        if self.index is None:
+            return self._scan({})
+
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    cached = self._read(conn)
+                    row = conn.execute(
+                        "SELECT mtime_ns, follow_symlinks FROM roots WHERE root = ?",
+                        (str(self.root),),
+                    ).fetchone()
+                    fresh = row == (mtime_ns, self.follow_symlinks)
+                    if not self.refresh and fresh:
+                        return cached
+
+                    # Switching follow_symlinks changes what counts as a project
+                    # so start from scratch rather than trusting the old entries
+                    same_rules = row is not None and row[1] == self.follow_symlinks
+                    reuse = not self.refresh and same_rules
+                    projects = self._scan(cached if reuse else {})
+                    self._write(conn, projects, mtime_ns)
+                    return projects
+            finally:
+                conn.close()
+        except sqlite3.OperationalError:
+            # Locked or read-only, just go without the index this time
+            return self._scan({})
+        except sqlite3.DatabaseError:
+            # Corrupt, throw it away so it's rebuilt next time
+            self.index.unlink(missing_ok=True)
+            return self._scan({})
+        except OSError:
+            # The cache directory can't be created or written to
+            return self._scan({})
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.index is None:
+            raise ValueError("LocalProjects has no index")  # pragma: no cover
+
+        self.index.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index, timeout=5)
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != SCHEMA_VERSION:
+            conn.executescript(
+                "DROP TABLE IF EXISTS roots; DROP TABLE IF EXISTS projects;"
+            )
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.executescript(SCHEMA)
+        return conn
+
+    def _read(self, conn: sqlite3.Connection) -> dict[str, Project]:
+        rows = conn.execute(
+            (
+                "SELECT name, created, mtime_ns, env, env_detected, is_git"
+                " FROM projects WHERE root = ?"
+            ),
+            (str(self.root),),
+        )
+        return {
+            name: Project(
+                name=name,
+                path=self.root.joinpath(name),
+                created=created,
+                mtime_ns=mtime_ns,
+                env=env,
+                is_git=bool(is_git),
+                env_detected=bool(env_detected),
+            )
+            for name, created, mtime_ns, env, env_detected, is_git in rows
+        }
+
+    def _write(
+        self, conn: sqlite3.Connection, projects: dict[str, Project], mtime_ns: int
+    ) -> None:
+        root = str(self.root)
+        conn.execute("DELETE FROM projects WHERE root = ?", (root,))
+        conn.executemany(
+            "INSERT INTO projects VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                (
+                    root,
+                    p.name,
+                    p.created,
+                    p.mtime_ns,
+                    p.env,
+                    p.env_detected,
+                    p.is_git,
+                )
+                for p in projects.values()
+            ),
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO roots VALUES (?, ?, ?)",
+            (root, mtime_ns, self.follow_symlinks),
+        )
+
+    def environments(self, names: Iterable[str] | None = None) -> dict[str, str | None]:
+        """
+        The detected environment of each project in `names` e.g. "venv",
+        None if there isn't one.
+
+        Only projects that haven't been detected since they last changed are
+        inspected, and what's found is saved to the index.
+
+        Args:
+            names (Iterable[str] | None, optional): The projects, unknown names
+                are ignored. Defaults to None, i.e. all of them.
+
+        Returns:
+            dict[str, str | None]: Each project's environment.
+        """
+        projects = self._load()
+        wanted = [
+            projects[name]
+            for name in (projects if names is None else names)
+            if name in projects
+        ]
+
+        detected = [project for project in wanted if not project.env_detected]
+        for project in detected:
+            project.env = self._detect_env(project.name, project.path)
+            project.env_detected = True
+
+        if detected and self.index is not None:
+            self._save_envs(detected)
+
+        return {project.name: project.env for project in wanted}
+
+    def _save_envs(self, projects: list[Project]) -> None:
+        # Only a cache, if it can't be saved it's detected again next time
+        with contextlib.suppress(sqlite3.DatabaseError, OSError):
+            conn = self._connect()
+            try:
+                with conn:
+                    # Guarded by mtime_ns so a project that's changed since
+                    # isn't given an environment it may no longer have
+                    conn.executemany(
+                        (
+                            "UPDATE projects SET env = ?, env_detected = 1"
+                            " WHERE root = ? AND name = ? AND mtime_ns = ?"
+                        ),
+                        ((p.env, str(self.root), p.name, p.mtime_ns) for p in projects),
+                    )
+            finally:
+                conn.close()
+
+    def _detect_env(self, name: str, path: Path) -> str | None:
+        repo = Repo(owner=self.config.username, name=name, local_path=path)
+        try:
+            env = repo.dispatch_env(self.config)
+        except (OSError, ValueError):
+            # e.g. an unreadable or malformed pyproject.toml
+            return None
+        return env.name if env else None
+
+    def _scan(self, previous: dict[str, Project]) -> dict[str, Project]:
+        """
+        List the projects directory, only inspecting projects that are
+        new or have changed since `previous`.
+        """
+        projects: dict[str, Project] = {}
+        for entry in scan(self.root, follow_symlinks=self.follow_symlinks):
+            old = previous.get(entry.name)
+            if old is not None and old.mtime_ns == entry.mtime_ns:
+                projects[entry.name] = old
+                continue
+
+            path = entry.to_path()
+            projects[entry.name] = Project(
+                name=entry.name,
+                path=path,
+                created=entry.created,
+                mtime_ns=entry.mtime_ns,
+                is_git=path.joinpath(".git").exists(),
+            )
+
+        return projects
@@ -0,0 +1,80 @@
+"""
+Fast listing of the projects directory.
+
+`os.scandir` gets the file type of every entry from the directory
+listing itself (on most platforms) so, unlike `Path.iterdir` followed
+by `is_dir` and `stat`, it doesn't need extra system calls to work out
+which entries are projects, and each `DirEntry` caches its stat result
+so it's only fetched once per project.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class ProjectEntry(NamedTuple):
+    """
+    The bare facts about a single project directory, as found by `scan`.
+
+    A tuple rather than a `Path` and a full `os.stat_result` so that
+    scanning thousands of projects stays cheap.
+    """
+
+    name: str
+    path: str
+    created: float
+    mtime_ns: int
+    is_symlink: bool
+
+    def to_path(self) -> Path:
+        """
+        The project's path as a `Path`.
+        """
+        return Path(self.path)
+
+
+def scan(root: Path, follow_symlinks: bool = True) -> Iterator[ProjectEntry]:
+    """
+    Yield an entry for every project directory directly under `root`,
+    in no particular order.
+
+    Hidden directories and anything that isn't a directory are skipped.
+
+    Args:
+        root (Path): The projects directory.
+        follow_symlinks (bool, optional): Whether symlinks to directories
+            count as projects. Defaults to True.
+
+    Yields:
+        ProjectEntry: The projects found.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+
+            try:
+                if not entry.is_dir(follow_symlinks=follow_symlinks):
+                    continue
+                stat = entry.stat(follow_symlinks=follow_symlinks)
+            except OSError:
+                # Deleted mid-scan or a dangling symlink
+                continue
+
+            yield ProjectEntry(
+                name=entry.name,
+                path=entry.path,
+                created=getattr(stat, "st_birthtime", stat.st_ctime),
+                mtime_ns=stat.st_mtime_ns,
+                is_symlink=entry.is_symlink(),
+            )
@@ -0,0 +1,493 @@
+"""
+Deleting projects without waiting for them to be deleted.
+
+Removing a project with a big `.venv`, `node_modules` or `target`
+directory means unlinking hundreds of thousands of files, which can
+take minutes. Instead `Trash.move` renames projects into a hidden trash
+directory inside the projects directory, which is instant (it's on the
+same filesystem so a rename is just a directory entry changing), and a
+detached purge worker reclaims the space in the background later on.
+
+Until the purge worker gets to them, trashed projects can be put back
+with `Trash.restore`. Each `move` puts its projects in their own batch
+so the last removal can be undone as a whole.
+
+Anything that can't be deleted is kept in the trash along with the
+reason, rather than being silently left behind.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import errno
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Hidden, so scanning the projects directory never sees it
+TRASH_DIR = ".pytoil-trash"
+
+# Batches being purged are renamed to this prefix first, so that two purges
+# (say the background worker and 'pytoil trash empty') never fight over one
+PURGING = ".purging-"
+
+# A claimed batch whose purge worker has been gone (or silent) this long is
+# put back in the trash to be purged again, in case the worker died
+# partway through without its pid having gone away
+STALE_PURGE = 6 * 60 * 60
+
+# Written into a batch that couldn't be purged completely
+PURGE_ERRORS = ".purge-errors"
+
+
+class TrashEntry:
+    def __init__(self, name: str, path: Path, batch: str, error: str = "") -> None:
+        """
+        A single project in the trash.
+
+        Args:
+            name (str): The project's name.
+            path (Path): Where it is in the trash.
+            batch (str): The batch it was trashed in.
+            error (str, optional): Why it couldn't be purged, if the purge
+                worker tried. Defaults to "".
+        """
+        self.name = name
+        self.path = path
+        self.batch = batch
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, path={self.path!r}, batch={self.batch!r},"
+            f" error={self.error!r})"
+        )
+
+    __slots__ = ("name", "path", "batch", "error")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TrashEntry):
+            return NotImplemented
+        return (self.name, self.path, self.batch, self.error) == (
+            other.name,
+            other.path,
+            other.batch,
+            other.error,
+        )
+
+    @property
+    def trashed(self) -> float:
+        """
+        When the project was trashed (epoch seconds).
+        """
+        return batch_time(self.batch)
+
+
+class TrashFailure:
+    def __init__(self, name: str, path: Path, error: str) -> None:
+        """
+        Something that couldn't be trashed, restored or purged.
+
+        Args:
+            name (str): The project's name.
+            path (Path): The path that couldn't be moved or deleted.
+            error (str): Why not.
+        """
+        self.name = name
+        self.path = path
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(name={self.name!r}, path={self.path!r}, error={self.error!r})"
+        )
+
+    __slots__ = ("name", "path", "error")
+
+
+def batch_time(batch: str) -> float:
+    """
+    When a batch was trashed (epoch seconds), from its name.
+    """
+    try:
+        return int(batch.partition("-")[0]) / 1e9
+    except ValueError:
+        return 0.0
+
+
+class Trash:
+    def __init__(self, projects_dir: Path) -> None:
+        """
+        The trash for the projects in `projects_dir`.
+
+        Args:
+            projects_dir (Path): The projects directory.
+        """
+        self.projects_dir = projects_dir
+        self.root = projects_dir.joinpath(TRASH_DIR)
+
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + f"(projects_dir={self.projects_dir!r})"
+
+    __slots__ = ("projects_dir", "root")
+
+    def move(
+        self, projects: Iterable[str]
+    ) -> tuple[list[TrashEntry], list[TrashFailure]]:
+        """
+        Move `projects` to the trash, as a single batch.
+
+        Args:
+            projects (Iterable[str]): Names of the projects to trash.
+
+        Returns:
+            tuple[list[TrashEntry], list[TrashFailure]]: What was trashed,
+                and what couldn't be.
+        """
+        batch = f"{time.time_ns()}-{os.getpid()}"
+        batch_dir = self.root.joinpath(batch)
+        batch_dir.mkdir(parents=True)
+
+        moved: list[TrashEntry] = []
+        failed: list[TrashFailure] = []
+        for project in projects:
+            source = self.projects_dir.joinpath(project)
+            dest = batch_dir.joinpath(project)
+            try:
+                source.rename(dest)
+            except OSError as err:
+                failed.append(TrashFailure(project, source, describe(err)))
+            else:
+                moved.append(TrashEntry(name=project, path=dest, batch=batch))
+
+        if not moved:
+            batch_dir.rmdir()
+        return moved, failed
+
+    def batches(self) -> list[str]:
+        """
+        The batches in the trash, newest first.
+
+        Batches left claimed by a purge worker that died partway through
+        are put back first, so they're listed and purged again.
+        """
+        if not self.root.exists():
+            return []
+        self._reclaim()
+        return sorted(
+            (path.name for path in self.root.iterdir() if _is_batch(path)),
+            key=batch_time,
+            reverse=True,
+        )
+
+    def entries(self, batch: str | None = None) -> list[TrashEntry]:
+        """
+        Everything in the trash (or just in `batch`), newest first.
+        """
+        entries: list[TrashEntry] = []
+        for name in self.batches() if batch is None else [batch]:
+            batch_dir = self.root.joinpath(name)
+            try:
+                children = sorted(batch_dir.iterdir())
+            except OSError:
+                continue
+            errors = _purge_errors(batch_dir)
+            entries.extend(
+                TrashEntry(
+                    name=child.name,
+                    path=child,
+                    batch=name,
+                    error=errors.get(child.name, ""),
+                )
+                for child in children
+                if not child.name.startswith(".")
+            )
+        return entries
+
+    def restore(
+        self, entries: Iterable[TrashEntry]
+    ) -> tuple[list[Path], list[TrashFailure]]:
+        """
+        Put trashed projects back in the projects directory.
+
+        Args:
+            entries (Iterable[TrashEntry]): What to restore.
+
+        Returns:
+            tuple[list[Path], list[TrashFailure]]: Where the projects were
+                restored to, and what couldn't be restored.
+        """
+        restored: list[Path] = []
+        failed: list[TrashFailure] = []
+        for entry in entries:
+            dest = self.projects_dir.joinpath(entry.name)
+            # rename would happily replace an empty directory
+            if dest.exists() or dest.is_symlink():
+                failed.append(
+                    TrashFailure(entry.name, entry.path, f"{dest} already exists")
+                )
+                continue
+            try:
+                entry.path.rename(dest)
+            except OSError as err:
+                failed.append(TrashFailure(entry.name, entry.path, describe(err)))
+            else:
+                restored.append(dest)
+                self._tidy(entry.batch)
+        return restored, failed
+
+    def purge(self, older_than: float | None = None) -> list[TrashFailure]:
+        """
+        Permanently delete what's in the trash.
+
+        Args:
+            older_than (float | None, optional): Only purge batches trashed at
+                least this many seconds ago, None for everything.
+                Defaults to None.
+
+        Returns:
+            list[TrashFailure]: Everything that couldn't be deleted, which
+                is left in the trash.
+        """
+        now = time.time()
+        failed: list[TrashFailure] = []
+        for batch in self.batches():
+            if older_than is not None and now - batch_time(batch) < older_than:
+                continue
+            failed.extend(self._purge(batch))
+        return failed
+
+    def size(self) -> int:
+        """
+        Total size of everything in the trash in bytes.
+        """
+        total = 0
+        for dirpath, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                try:
+                    total += Path(dirpath, filename).lstat().st_size
+                except OSError:
+                    continue
+        return total
+
+    def spawn_purge(self, delay: float = 0) -> subprocess.Popen[bytes]:
+        """
+        Start a purge worker that carries on after pytoil exits, waits
+        for `delay` seconds then purges every batch that's been in the
+        trash at least that long.
+
+        Args:
+            delay (float, optional): The undo window in seconds. Defaults to 0.
+
+        Returns:
+            subprocess.Popen[bytes]: The worker process.
+        """
+        kwargs: dict[str, Any] = {}
+        if sys.platform == "win32":  # pragma: no cover
+            kwargs["creationflags"] = (
+                subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+            )
+        else:
+            # Its own session, so closing the terminal or Ctrl-C in it
+            # doesn't take the worker with it
+            kwargs["start_new_session"] = True
+
+        return subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "pytoil.projects.trash",
+                str(self.projects_dir),
+                "--delay",
+                str(delay),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+
+    def _purge(self, batch: str) -> list[TrashFailure]:
+        batch_dir = self.root.joinpath(batch)
+        claimed = self.root.joinpath(f"{PURGING}{batch}-{os.getpid()}")
+        try:
+            batch_dir.rename(claimed)
+        except OSError:
+            # Restored or being purged by someone else in the meantime
+            return []
+        # A rename doesn't touch the mtime, which is how _reclaim tells
+        # how long the claim has been held
+        with contextlib.suppress(OSError):
+            os.utime(claimed)
+
+        failed: list[TrashFailure] = []
+
+        def onexc(func: Callable[..., Any], path: str, exc: BaseException) -> None:
+            # Read only files (e.g. git's objects on Windows) and directories
+            # are the usual culprits, make them writable and try once more
+            try:
+                Path(path).parent.chmod(stat.S_IRWXU)
+                if func is not os.rmdir:
+                    Path(path).chmod(stat.S_IWRITE | stat.S_IREAD)
+                func(path)
+            except OSError as err:
+                if err.errno in {errno.ENOTEMPTY, errno.EEXIST}:
+                    # Just a knock on effect of something inside it failing
+                    return
+                relative = Path(path).relative_to(claimed)
+                name = relative.parts[0] if relative.parts else batch
+                failed.append(TrashFailure(name, relative, describe(exc)))
+
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(claimed, onexc=onexc)
+        else:
+            shutil.rmtree(
+                claimed, onerror=lambda func, path, info: onexc(func, path, info[1])
+            )
+
+        if claimed.exists():
+            # Not everything that failed gets to onexc, e.g. before 3.12 a
+            # directory that could only be listed on the second try is
+            # skipped and then just isn't empty, so go by what's left
+            failed.extend(_leftovers(claimed, batch, reported=failed))
+
+        if failed:
+            # Keep what's left where 'pytoil trash list' can show it, with why
+            claimed.joinpath(PURGE_ERRORS).write_text(
+                "".join(f"{f.path}\t{f.error}\n" for f in failed), encoding="utf-8"
+            )
+            with contextlib.suppress(OSError):
+                claimed.rename(batch_dir)
+        return failed
+
+    def _reclaim(self) -> None:
+        now = time.time()
+        for path in self.root.iterdir():
+            if not path.name.startswith(PURGING):
+                continue
+            batch, _, pid = path.name[len(PURGING) :].rpartition("-")
+            try:
+                stale = now - path.stat().st_mtime >= STALE_PURGE
+            except OSError:
+                continue
+            if stale or not _running(int(pid) if pid.isdigit() else 0):
+                with contextlib.suppress(OSError):
+                    path.rename(self.root.joinpath(batch))
+
+    def _tidy(self, batch: str) -> None:
+        batch_dir = self.root.joinpath(batch)
+        try:
+            remaining = [p for p in batch_dir.iterdir() if p.name != PURGE_ERRORS]
+            if not remaining:
+                batch_dir.joinpath(PURGE_ERRORS).unlink(missing_ok=True)
+                batch_dir.rmdir()
+        except OSError:
+            pass
+
+
+def describe(error: BaseException) -> str:
+    """
+    A short description of an OSError (or anything else).
+    """
+    if isinstance(error, OSError) and error.strerror:
+        return error.strerror
+    return str(error) or error.__class__.__name__
+
+
+def _purge_errors(batch_dir: Path) -> dict[str, str]:
+    """
+    The first reason each project in a batch couldn't be purged.
+    """
+    errors: dict[str, str] = {}
+    try:
+        lines = batch_dir.joinpath(PURGE_ERRORS).read_text(encoding="utf-8")
+    except OSError:
+        return errors
+    for line in lines.splitlines():
+        path, _, error = line.partition("\t")
+        name = Path(path).parts[0] if Path(path).parts else ""
+        errors.setdefault(name, f"{path}: {error}")
+    return errors
+
+
+def _leftovers(
+    claimed: Path, batch: str, reported: list[TrashFailure]
+) -> list[TrashFailure]:
+    """
+    A failure for each project still in `claimed` after purging it that
+    isn't already in `reported`, or for the whole batch if none are.
+    """
+    names = {failure.name for failure in reported}
+    try:
+        left = sorted(
+            path.name for path in claimed.iterdir() if path.name != PURGE_ERRORS
+        )
+    except OSError as err:
+        return [] if reported else [TrashFailure(batch, Path(), describe(err))]
+    failed = [
+        TrashFailure(name, Path(name), "Could not be deleted completely")
+        for name in left
+        if name not in names
+    ]
+    if not failed and not reported:
+        failed.append(TrashFailure(batch, Path(), "Could not be deleted completely"))
+    return failed
+
+
+def _running(pid: int) -> bool:
+    """
+    Whether the process `pid` is still running, as far as can be told.
+    """
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":  # pragma: no cover
+        # os.kill would terminate it, leave it to STALE_PURGE
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Someone else's, but running
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _is_batch(path: Path) -> bool:
+    return not path.name.startswith(".") and path.is_dir()
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    The purge worker started by `Trash.spawn_purge`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m pytoil.projects.trash")
+    parser.add_argument("projects_dir", type=Path)
+    parser.add_argument("--delay", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    time.sleep(args.delay)
+    failed = Trash(args.projects_dir).purge(older_than=args.delay)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from pytoil.repo.manifest import ProjectManifest
 from pytoil.repo.repo import Repo
 
-__all__ = ("Repo",)
+__all__ = ("ProjectManifest", "Repo")
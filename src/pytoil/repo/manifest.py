@@ -0,0 +1,135 @@
+"""
+Everything environment detection needs to know about a project's
+files, gathered in one go.
+
+Working out which environment a project uses means checking for a
+handful of files and looking at the build backend in `pyproject.toml`.
+Doing that with separate `exists()` calls and reading and parsing
+`pyproject.toml` for every check adds up, so `ProjectManifest` lists
+the project directory once, parses `pyproject.toml` at most once and
+is memoised against the modification times of both so that looking at
+the same project again (or lots of projects in a row) stays cheap.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import TYPE_CHECKING, Any
+
+import rtoml
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Enough for every project in a big projects directory
+CACHE_SIZE = 1024
+
+PYPROJECT = "pyproject.toml"
+
+
+class ProjectManifest:
+    def __init__(self, root: Path, files: frozenset[str]) -> None:
+        """
+        The files at the top level of a project and (lazily) its parsed
+        `pyproject.toml`.
+
+        Use `ProjectManifest.load` rather than constructing one directly
+        so the memoised copy is used.
+
+        Args:
+            root (Path): The project's root directory.
+            files (frozenset[str]): Names of everything in `root`.
+        """
+        self.root = root
+        self.files = files
+        self._pyproject: dict[str, Any] | None = None
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(root={self.root!r}, files={sorted(self.files)!r})"
+        )
+
+    __slots__ = ("root", "files", "_pyproject")
+
+    @staticmethod
+    def load(root: Path) -> ProjectManifest:
+        """
+        The manifest for the project at `root`, reusing the last one
+        loaded if neither the directory nor its `pyproject.toml` have
+        changed since.
+
+        A project that doesn't exist has an empty manifest.
+
+        Args:
+            root (Path): The project's root directory.
+
+        Returns:
+            ProjectManifest: The project's manifest.
+        """
+        try:
+            root_mtime = root.stat().st_mtime_ns
+        except OSError:
+            return ProjectManifest(root=root, files=frozenset())
+
+        try:
+            stat = root.joinpath(PYPROJECT).stat()
+            pyproject = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            pyproject = None
+
+        return _load(root, root_mtime, pyproject)
+
+    def has(self, file: str) -> bool:
+        """
+        Whether the project contains `file` at the top level.
+        """
+        return file in self.files
+
+    @property
+    def pyproject(self) -> dict[str, Any]:
+        """
+        The parsed `pyproject.toml`, empty if there isn't one.
+
+        Raises:
+            rtoml.TomlParsingError: If `pyproject.toml` isn't valid toml.
+        """
+        if self._pyproject is None:
+            if not self.has(PYPROJECT):
+                self._pyproject = {}
+            else:
+                self._pyproject = rtoml.loads(
+                    self.root.joinpath(PYPROJECT).read_text(encoding="utf-8")
+                )
+        return self._pyproject
+
+    @property
+    def build_backend(self) -> str | None:
+        """
+        The normalised `build-system.build-backend` from `pyproject.toml`,
+        or None if it doesn't specify one.
+        """
+        build_system = self.pyproject.get("build-system")
+        if build_system and (backend := build_system.get("build-backend")):
+            return str(backend).strip().lower()
+        return None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def _load(
+    root: Path,
+    root_mtime: int,  # noqa: ARG001
+    pyproject: tuple[int, int] | None,  # noqa: ARG001
+) -> ProjectManifest:
+    # The modification times are only there to form part of the cache key
+    try:
+        with os.scandir(root) as entries:
+            files = frozenset(entry.name for entry in entries)
+    except OSError:
+        files = frozenset()
+    return ProjectManifest(root=root, files=files)
@@ -12,10 +12,19 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import humanize
-import rtoml
 
-from pytoil.environments import Conda, Environment, Flit, Poetry, Requirements, Venv
+from pytoil.environments import (
+    Conda,
+    Environment,
+    Flit,
+    Poetry,
+    Requirements,
+    Venv,
+    Wheelhouse,
+)
+from pytoil.environments.installer import get_installer
 from pytoil.exceptions import RepoNotFoundError
+from pytoil.repo.manifest import ProjectManifest
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -125,9 +134,10 @@ class Repo:
 
     def _remote_info(self, api: API) -> dict[str, Any] | None:
         """
-        Return remote API information for the repo.
+        Return remote API information for the repo, or None if
+        it doesn't exist on GitHub.
         """
-        return api.get_repo_info(self.name)
+        return api.get_repo_info(self.name, owner=self.owner)
 
     def info(self, api: API) -> dict[str, Any]:
         """
@@ -149,12 +159,13 @@ class Repo:
         """
         info: dict[str, Any] = {}
 
-        exists_remote = self.exists_remote(api=api)
+        # The info query comes back empty if the repo isn't on GitHub
+        # so there's no need for a separate existence check
+        remote_info = self._remote_info(api=api)
         exists_local = self.exists_local()
 
-        if exists_remote:
-            if remote_info := self._remote_info(api=api):
-                info.update(remote_info)
+        if remote_info:
+            info.update(remote_info)
             # Might also exist locally
             info.update({"Local": exists_local})
         elif exists_local:
@@ -169,6 +180,17 @@ class Repo:
 
         return info
 
+    @property
+    def manifest(self) -> ProjectManifest:
+        """
+        The files in the repo's root directory and its parsed
+        `pyproject.toml`, shared by all the environment checks below.
+
+        Cheap to access repeatedly, it's only reloaded if the directory
+        or `pyproject.toml` have changed.
+        """
+        return ProjectManifest.load(self.local_path)
+
     def _file_exists(self, file: str) -> bool:
         """
         Convenience method to determine whether or not
@@ -180,7 +202,7 @@ class Repo:
         Returns:
             bool: True if exists, else False.
         """
-        return self.local_path.joinpath(file).exists()
+        return self.manifest.has(file)
 
     def is_setuptools(self) -> bool:
         """
@@ -190,14 +212,12 @@ class Repo:
         Returns:
             bool: True if setuptools, else False.
         """
-        conditions = (
-            self._file_exists("setup.cfg"),
-            self._file_exists("setup.py"),
-            self._specifies_build_tool("setuptools.build_meta"),
+        return (
+            self._file_exists("setup.cfg")
+            or self._file_exists("setup.py")
+            or self._specifies_build_tool("setuptools.build_meta")
         )
 
-        return any(conditions)
-
     def is_requirements(self) -> bool:
         """
         Is the project a python app with a requirements file?.
@@ -205,13 +225,10 @@ class Repo:
         Returns:
             bool: True if yes, else False.
         """
-        conditions = (
-            self._file_exists("requirements.txt"),
-            self._file_exists("requirements-dev.txt"),
+        return self._file_exists("requirements.txt") or self._file_exists(
+            "requirements-dev.txt"
         )
 
-        return any(conditions)
-
     def has_pyproject_toml(self) -> bool:
         """
         Does the project have a `pyproject.toml` file.
@@ -246,33 +263,14 @@ class Repo:
         Returns:
             bool: True if `pyproject.toml` specifies that build tool, else False.
         """
-        # If it doesn't have a pyproject.toml, bail early
-        if not self.has_pyproject_toml():
-            return False
-
-        contents = self.local_path.joinpath("pyproject.toml").read_text(
-            encoding="utf-8"
-        )
-        toml = rtoml.loads(contents)
-
-        if (build_system := toml.get("build-system")) and (
-            build_backend := build_system.get("build-backend")
-        ):
-            return build_tool in build_backend.strip().lower()
-
-        return False
+        build_backend = self.manifest.build_backend
+        return build_backend is not None and build_tool in build_backend
 
     def is_pep621(self) -> bool:
         """
         Does the project comply with PEP 621.
         """
-        if not self.has_pyproject_toml():
-            return False
-
-        contents = self.local_path.joinpath("pyproject.toml").read_text(
-            encoding="utf-8"
-        )
-        toml = rtoml.loads(contents)
+        toml = self.manifest.pyproject
 
         if not toml.get("build-system"):
             return False
@@ -316,6 +314,11 @@ class Repo:
 
         Therefore all usage should first check for `None`.
 
+        Raises:
+            ValueError: If the "installer" config key isn't valid and the
+                project needs a virtual environment. Commands should check
+                it first with `cli.utils.resolve_installer`.
+
         Returns:
             Optional[Environment]: The correct environment object if it was
                 able to detect, or `None`.
@@ -326,22 +329,36 @@ class Repo:
         # Each of the environment objects below implements the `Environment` Protocol
         # and has an `install_self` method that does the correct thing for it's environment
 
+        wheelhouse = Wheelhouse() if config.wheelhouse else None
+
         if self.is_conda():
             return Conda(
                 root=self.local_path, environment_name=self.name, conda=config.conda_bin
             )
 
         if self.is_requirements():
-            return Requirements(root=self.local_path)
+            return Requirements(
+                root=self.local_path,
+                wheelhouse=wheelhouse,
+                installer=get_installer(config.installer),
+            )
 
         if self.is_setuptools() or self.is_pep621():
-            return Venv(root=self.local_path)
+            return Venv(
+                root=self.local_path,
+                wheelhouse=wheelhouse,
+                installer=get_installer(config.installer),
+            )
 
         if self.is_poetry():
             return Poetry(root=self.local_path)
 
         if self.is_flit():
-            return Flit(root=self.local_path)
+            return Flit(
+                root=self.local_path,
+                wheelhouse=wheelhouse,
+                installer=get_installer(config.installer),
+            )
 
         # Could not autodetect, this is handled by the CLI
         return None
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from pytoil.search.index import NameIndex
+from pytoil.search.matcher import MatchCache, Matcher
+
+__all__ = (
+    "MatchCache",
+    "Matcher",
+    "NameIndex",
+)
@@ -0,0 +1,185 @@
+"""
+An in-memory index of project names for search-as-you-type.
+
+`Matcher` scores every name against the query, which is fine once but
+not on every keystroke. `NameIndex` does the work up front instead:
+it keeps the normalised names sorted, separators and all dropped (so
+names, or any word in them, starting with the query are a binary search
+away) and maps every
+trigram to the names containing it (so names containing the query
+anywhere are an intersection of a few small sets).
+
+Results come back in tiers: names starting with the query, then names
+with a later word starting with it, then names containing it anywhere
+and, only if none of those turn anything up, names sharing most of the
+query's trigrams to catch typos. Each tier is alphabetical.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import bisect
+import heapq
+import threading
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING
+
+from pytoil.search.matcher import normalise
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# The fraction of the query's trigrams a name needs to count as a typo match
+TYPO_OVERLAP = 0.5
+
+
+def trigrams(text: str) -> set[str]:
+    """
+    Every run of three characters in `text`.
+    """
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    def __init__(self, names: Iterable[str]) -> None:
+        """
+        Index `names` for prefix and substring search.
+
+        Args:
+            names (Iterable[str]): The names to index, duplicates are ignored.
+        """
+        self.names = sorted(set(names))
+        words = [normalise(name).split() for name in self.names]
+        # Separators dropped too, so "pytoil" finds "py-toil"
+        compact = ["".join(parts) for parts in words]
+        self._compact = compact
+
+        # (compact text, index) for the whole name, and separately for
+        # the rest of the name from each later word onwards
+        self._starts = sorted((text, i) for i, text in enumerate(compact))
+        self._words = sorted(
+            ("".join(parts[pos:]), i)
+            for i, parts in enumerate(words)
+            for pos in range(1, len(parts))
+        )
+
+        # Most of the cost of building the index, and not needed until the
+        # query is at least 3 characters long, so only built when it is
+        # (or when `warm` is called, e.g. in the background)
+        self._trigrams: dict[str, set[int]] | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + f"(names=<{len(self.names)} names>)"
+
+    __slots__ = ("names", "_compact", "_starts", "_words", "_trigrams", "_lock")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        if not isinstance(name, str):
+            return False
+        i = bisect.bisect_left(self.names, name)
+        return i < len(self.names) and self.names[i] == name
+
+    def warm(self) -> dict[str, set[int]]:
+        """
+        Build the trigram index now, if it hasn't been already, rather than
+        on the first search that needs it. Safe to call from another thread.
+
+        Returns:
+            dict[str, set[int]]: The indexes of the names containing each trigram.
+        """
+        with self._lock:
+            if self._trigrams is None:
+                postings: defaultdict[str, set[int]] = defaultdict(set)
+                for i, text in enumerate(self._compact):
+                    for trigram in trigrams(text):
+                        postings[trigram].add(i)
+                self._trigrams = dict(postings)
+            return self._trigrams
+
+    def search(self, query: str, limit: int = 10) -> list[str]:
+        """
+        The names matching `query`, best first.
+
+        Args:
+            query (str): What's been typed so far.
+            limit (int, optional): Maximum number of names. Defaults to 10.
+
+        Returns:
+            list[str]: The matching names.
+        """
+        text = "".join(normalise(query).split())
+        if not text:
+            return self.names[:limit]
+
+        found: dict[int, None] = {}  # An ordered set
+
+        for tier in (
+            self._prefixed(self._starts, text),
+            self._prefixed(self._words, text),
+        ):
+            for i in tier:
+                if len(found) == limit:
+                    return [self.names[i] for i in found]
+                found.setdefault(i)
+
+        wanted = trigrams(text)
+        if not wanted:
+            # Too short for trigrams, prefixes are all there is
+            return [self.names[i] for i in found]
+
+        remaining = limit - len(found)
+        candidates = (i for i in self._containing(text, wanted) if i not in found)
+        for i in heapq.nsmallest(remaining, candidates):
+            found.setdefault(i)
+
+        if not found:
+            for i in self._similar(wanted)[:limit]:
+                found.setdefault(i)
+
+        return [self.names[i] for i in found]
+
+    @staticmethod
+    def _prefixed(entries: list[tuple[str, int]], text: str) -> Iterator[int]:
+        """
+        The indexes of the `entries` starting with `text`, in order.
+        """
+        for pos in range(bisect.bisect_left(entries, (text,)), len(entries)):
+            entry, i = entries[pos]
+            if not entry.startswith(text):
+                return
+            yield i
+
+    def _containing(self, text: str, wanted: set[str]) -> set[int]:
+        """
+        The indexes of the names containing `text` anywhere.
+        """
+        index = self.warm()
+        postings = sorted((index.get(trigram, set()) for trigram in wanted), key=len)
+        candidates = set.intersection(*postings)
+        if len(text) == 3:
+            return candidates
+        # Every trigram matching doesn't mean they're in the right order
+        return {i for i in candidates if text in self._compact[i]}
+
+    def _similar(self, wanted: set[str]) -> list[int]:
+        """
+        The indexes of the names sharing most of the trigrams in `wanted`,
+        most shared first.
+        """
+        index = self.warm()
+        counts: Counter[int] = Counter()
+        for trigram in wanted:
+            counts.update(index.get(trigram, ()))
+
+        needed = max(1, round(len(wanted) * TYPO_OVERLAP))
+        return sorted(
+            (i for i, count in counts.items() if count >= needed),
+            key=lambda i: (-counts[i], i),
+        )
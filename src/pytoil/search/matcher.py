@@ -0,0 +1,225 @@
+"""
+Fuzzy matching project names.
+
+`find` and the "Did you mean" suggestions in `checkout` score a query
+against every local and remote project name. With tens of thousands of
+names (forks and all) doing that one pair at a time in Python is far
+too slow to feel interactive, so the `Matcher` normalises every name
+once and hands the whole lot to rapidfuzz, which scores all of
+them in a single call in C++.
+
+The results are also kept in a small on-disk cache keyed by the query
+and a fingerprint of the names, so asking again (e.g. with a different
+'--limit') while nothing has changed doesn't score anything at all.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
+
+from pytoil.config import defaults
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# Matches scoring below this (out of 100) aren't worth suggesting
+SCORE_CUTOFF = 75
+
+# Distinct queries remembered for a given set of names
+MAX_CACHED_QUERIES = 256
+
+
+def normalise(name: str) -> str:
+    """
+    Lowercase `name`, replace anything that isn't a letter or number
+    with a space and strip the ends, so "My_Project" matches "my-project".
+    """
+    return default_process(name)
+
+
+class MatchCache:
+    def __init__(self, path: Path = defaults.MATCH_CACHE) -> None:
+        """
+        On-disk cache of match results.
+
+        Only results for the most recent set of names are kept, any
+        change to the names (a new project, a deleted repo) throws the
+        lot away.
+
+        Args:
+            path (Path, optional): The cache file.
+                Defaults to defaults.MATCH_CACHE.
+        """
+        self.path = path
+
+    def __repr__(self) -> str:
+        return self.__class__.__qualname__ + f"(path={self.path!r})"
+
+    __slots__ = ("path",)
+
+    def _read(self, fingerprint: str) -> dict[str, Any]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+            return {}
+
+        results: dict[str, Any] = data.get("results", {})
+        return results
+
+    def load(self, fingerprint: str, key: str) -> list[tuple[str, float]] | None:
+        """
+        The results cached under `key` for the names with `fingerprint`,
+        or None if there aren't any.
+        """
+        cached = self._read(fingerprint).get(key)
+        if cached is None:
+            return None
+        return [(name, score) for name, score in cached]
+
+    def store(
+        self, fingerprint: str, key: str, matches: list[tuple[str, float]]
+    ) -> None:
+        """
+        Cache `matches` under `key` for the names with `fingerprint`.
+
+        The file is written to a temporary file first and renamed over
+        the old one so concurrent readers never see a partial write.
+        """
+        results = self._read(fingerprint)
+        results.pop(key, None)
+        results[key] = matches
+        # Dicts keep insertion order, so the first ones are the oldest
+        for old in list(results)[:-MAX_CACHED_QUERIES]:
+            del results[old]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        tmp = Path(name)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "results": results}, f)
+            tmp.replace(self.path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        """
+        Remove every cached result.
+        """
+        self.path.unlink(missing_ok=True)
+
+
+class Matcher:
+    def __init__(self, choices: Iterable[str], cache: MatchCache | None = None) -> None:
+        """
+        Fuzzy matches queries against a fixed set of names.
+
+        Args:
+            choices (Iterable[str]): The names to match against, duplicates
+                are ignored.
+            cache (MatchCache | None, optional): Where to cache results between
+                runs, None to not cache them. Defaults to None.
+        """
+        # Sorted so ties always come out in the same order
+        self.choices = sorted(set(choices))
+        self.cache = cache
+        self._normalised: list[str] | None = None
+        self._fingerprint: str | None = None
+
+    def __repr__(self) -> str:
+        return (
+            self.__class__.__qualname__
+            + f"(choices=<{len(self.choices)} names>, cache={self.cache!r})"
+        )
+
+    __slots__ = ("choices", "cache", "_normalised", "_fingerprint")
+
+    @property
+    def normalised(self) -> list[str]:
+        """
+        The normalised names, in the same order as `choices`.
+
+        Only worked out the first time anything is scored, a cached
+        result never needs them.
+        """
+        if self._normalised is None:
+            self._normalised = [normalise(choice) for choice in self.choices]
+        return self._normalised
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        A hash of the names, changes whenever they do.
+        """
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            for choice in self.choices:
+                digest.update(choice.encode("utf-8"))
+                digest.update(b"\0")
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def extract(
+        self, query: str, limit: int = 5, score_cutoff: float = SCORE_CUTOFF
+    ) -> list[tuple[str, float]]:
+        """
+        The names best matching `query`, best first.
+
+        Args:
+            query (str): What to look for.
+            limit (int, optional): Maximum number of matches. Defaults to 5.
+            score_cutoff (float, optional): Minimum score (out of 100) for
+                a name to count as a match. Defaults to SCORE_CUTOFF.
+
+        Returns:
+            list[tuple[str, float]]: Matching names and their scores.
+        """
+        key = json.dumps([query, limit, score_cutoff])
+        if self.cache is not None:
+            cached = self.cache.load(self.fingerprint, key)
+            if cached is not None:
+                return cached
+
+        # Names are already normalised, so no processor for the choices
+        results = process.extract(
+            normalise(query),
+            self.normalised,
+            scorer=fuzz.WRatio,
+            processor=None,
+            limit=limit,
+            score_cutoff=score_cutoff,
+        )
+        matches = [(self.choices[index], score) for _, score, index in results]
+
+        if self.cache is not None:
+            # A read only cache dir shouldn't stop anyone finding things
+            with contextlib.suppress(OSError):
+                self.cache.store(self.fingerprint, key, matches)
+        return matches
+
+    def best(
+        self, query: str, score_cutoff: float = SCORE_CUTOFF
+    ) -> tuple[str, float] | None:
+        """
+        The name best matching `query`, or None if nothing scores at
+        least `score_cutoff`.
+        """
+        matches = self.extract(query, limit=1, score_cutoff=score_cutoff)
+        return matches[0] if matches else None
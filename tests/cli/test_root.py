@@ -1,7 +1,25 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
+import click
+import pytest
 from click.testing import CliRunner
-from pytoil.cli.root import main
+from pytoil.cli.root import SUBCOMMANDS, LazyGroup, main
+
+# Only the commands that need these should ever import them
+HEAVY_DEPENDENCIES = {
+    "copier",
+    "cookiecutter",
+    "httpx",
+    "pydantic",
+    "questionary",
+    "rapidfuzz",
+    "rich.traceback",
+    "virtualenv",
+    "yaml",
+}
 
 
 def test_cli_doesnt_blow_up() -> None:
@@ -10,3 +28,49 @@ def test_cli_doesnt_blow_up() -> None:
 
     assert result.exit_code == 0
     assert "Helpful CLI to automate the development workflow" in result.stdout
+
+
+def test_help_lists_every_subcommand() -> None:
+    runner = CliRunner()
+    result = runner.invoke(main, ["--help"])
+
+    for name in SUBCOMMANDS:
+        assert name in result.stdout
+
+
+def test_lazy_group_resolves_subcommands() -> None:
+    ctx = click.Context(main)
+
+    assert isinstance(main, LazyGroup)
+    assert main.list_commands(ctx) == sorted(SUBCOMMANDS)
+    for name in SUBCOMMANDS:
+        command = main.get_command(ctx, name)
+        assert isinstance(command, click.Command)
+        assert command.name == name
+
+    assert main.get_command(ctx, "notacommand") is None
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--help"],
+        ["--version"],
+    ],
+)
+def test_help_does_not_import_heavy_dependencies(args: list[str]) -> None:
+    script = (
+        "import sys\n"
+        "from pytoil.cli.root import main\n"
+        "try:\n"
+        f"    main({args!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(' '.join(sys.modules), file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    imported = set(result.stderr.split())
+
+    assert imported.isdisjoint(HEAVY_DEPENDENCIES)
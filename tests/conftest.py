@@ -373,7 +373,7 @@ def fake_home_folder_mambaforge(tmp_path_factory: MkTemp) -> Path:
 def fake_home_folder_no_conda(tmp_path_factory: MkTemp) -> Path:
     """
     Returns a faked $HOME but without any conda dirs.
-    To test whether get_envs_dir raises correctly.
+    To test whether probe_home raises correctly.
     """
     fake_home: Path = tmp_path_factory.mktemp("home")
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import os
 import shutil
 import subprocess
 import sys
@@ -7,8 +9,10 @@ from pathlib import Path
 from typing import NamedTuple, TextIO
 
 import pytest
+import pytoil.environments.conda
 from pytest_mock import MockerFixture
 from pytoil.environments import Conda
+from pytoil.environments.conda import CondaInfo, discover, probe_home
 from pytoil.exceptions import (
     BadEnvironmentFileError,
     CondaNotInstalledError,
@@ -21,12 +25,12 @@ from pytoil.exceptions import (
 def test_conda_default(mocker: MockerFixture) -> None:
     conda = Conda(root=Path("somewhere"), environment_name="test")
 
-    # Mock the return of get_envs_dir so it thinks it exists regardless
+    # Mock the conda installation so it thinks it exists regardless
     # of whether the tester has conda installed or not
     mocker.patch(
-        "pytoil.environments.conda.Conda.get_envs_dir",
+        "pytoil.environments.conda.Conda.info",
         autospec=True,
-        return_value=Path("anaconda3/envs"),
+        return_value=CondaInfo(envs_dirs=[Path("anaconda3/envs")]),
     )
 
     assert conda.project_path == Path("somewhere").resolve()
@@ -39,12 +43,12 @@ def test_conda_default(mocker: MockerFixture) -> None:
 def test_conda_passed(mocker: MockerFixture) -> None:
     conda = Conda(root=Path("somewhere"), environment_name="test", conda="notconda")
 
-    # Mock the return of get_envs_dir so it thinks it exists regardless
+    # Mock the conda installation so it thinks it exists regardless
     # of whether the tester has conda installed or not
     mocker.patch(
-        "pytoil.environments.conda.Conda.get_envs_dir",
+        "pytoil.environments.conda.Conda.info",
         autospec=True,
-        return_value=Path("anaconda3/envs"),
+        return_value=CondaInfo(envs_dirs=[Path("anaconda3/envs")]),
     )
 
     assert conda.project_path == Path("somewhere").resolve()
@@ -77,12 +81,12 @@ def test_exists(mocker: MockerFixture, exists_return: bool, want: bool) -> None:
         return_value=exists_return,
     )
 
-    # Mock the return of get_envs_dir so it thinks it exists regardless
+    # Mock the conda installation so it thinks it exists regardless
     # of whether the tester has conda installed or not
     mocker.patch(
-        "pytoil.environments.conda.Conda.get_envs_dir",
+        "pytoil.environments.conda.Conda.info",
         autospec=True,
-        return_value=Path("anaconda3/envs"),
+        return_value=CondaInfo(envs_dirs=[Path("anaconda3/envs")]),
     )
 
     conda = Conda(root=Path("somewhere"), environment_name="test", conda="notconda")
@@ -139,12 +143,12 @@ def test_create_correctly_adds_packages_if_specified(
         "pytoil.environments.conda.subprocess.run", autospec=True
     )
 
-    # Mock the return of get_envs_dir so it thinks it exists regardless
+    # Mock the conda installation so it thinks it exists regardless
     # of whether the tester has conda installed or not
     mocker.patch(
-        "pytoil.environments.conda.Conda.get_envs_dir",
+        "pytoil.environments.conda.Conda.info",
         autospec=True,
-        return_value=Path("anaconda3/envs"),
+        return_value=CondaInfo(envs_dirs=[Path("anaconda3/envs")]),
     )
 
     conda.create(packages=packages, silent=silent)
@@ -181,12 +185,12 @@ def test_create_doesnt_add_packages_if_not_specified(
         "pytoil.environments.conda.subprocess.run", autospec=True
     )
 
-    # Mock the return of get_envs_dir so it thinks it exists regardless
+    # Mock the conda installation so it thinks it exists regardless
     # of whether the tester has conda installed or not
     mocker.patch(
-        "pytoil.environments.conda.Conda.get_envs_dir",
+        "pytoil.environments.conda.Conda.info",
         autospec=True,
-        return_value=Path("anaconda3/envs"),
+        return_value=CondaInfo(envs_dirs=[Path("anaconda3/envs")]),
     )
 
     conda.create(silent=silent)
@@ -234,9 +238,9 @@ def test_create_from_yml_correctly_calls_subprocess(
 
     # Give it a fake envs dir
     mocker.patch(
-        "pytoil.environments.conda.Conda.get_envs_dir",
+        "pytoil.environments.conda.Conda.info",
         autospec=True,
-        return_value=Path("/Users/testyconda3/envs"),
+        return_value=CondaInfo(envs_dirs=[Path("/Users/testyconda3/envs")]),
     )
 
     # Ensure shutil.which doesn't fail
@@ -299,7 +303,7 @@ def test_create_from_yml_raises_if_environment_already_exists(
         )
 
 
-def test_get_envs_dir_returns_correctly_for_miniconda(
+def test_probe_home_finds_miniconda(
     mocker: MockerFixture, fake_home_folder_miniconda: Path
 ) -> None:
     mocker.patch(
@@ -308,14 +312,14 @@ def test_get_envs_dir_returns_correctly_for_miniconda(
         return_value=fake_home_folder_miniconda,
     )
 
-    env = Conda.get_envs_dir()
+    env = probe_home().envs_dirs[0]
 
     expected_env_dir = fake_home_folder_miniconda.joinpath("miniconda3/envs")
 
     assert env == expected_env_dir
 
 
-def test_get_envs_dir_returns_correctly_for_anaconda(
+def test_probe_home_finds_anaconda(
     mocker: MockerFixture, fake_home_folder_anaconda: Path
 ) -> None:
     mocker.patch(
@@ -324,14 +328,14 @@ def test_get_envs_dir_returns_correctly_for_anaconda(
         return_value=fake_home_folder_anaconda,
     )
 
-    env = Conda.get_envs_dir()
+    env = probe_home().envs_dirs[0]
 
     expected_env_dir = fake_home_folder_anaconda.joinpath("anaconda3/envs")
 
     assert env == expected_env_dir
 
 
-def test_get_envs_dir_returns_correctly_for_miniforge(
+def test_probe_home_finds_miniforge(
     mocker: MockerFixture, fake_home_folder_miniforge: Path
 ) -> None:
     mocker.patch(
@@ -340,14 +344,14 @@ def test_get_envs_dir_returns_correctly_for_miniforge(
         return_value=fake_home_folder_miniforge,
     )
 
-    env = Conda.get_envs_dir()
+    env = probe_home().envs_dirs[0]
 
     expected_env_dir = fake_home_folder_miniforge.joinpath("miniforge3/envs")
 
     assert env == expected_env_dir
 
 
-def test_get_envs_dir_returns_correctly_for_mambaforge(
+def test_probe_home_finds_mambaforge(
     mocker: MockerFixture, fake_home_folder_mambaforge: Path
 ) -> None:
     mocker.patch(
@@ -356,14 +360,14 @@ def test_get_envs_dir_returns_correctly_for_mambaforge(
         return_value=fake_home_folder_mambaforge,
     )
 
-    env = Conda.get_envs_dir()
+    env = probe_home().envs_dirs[0]
 
     expected_env_dir = fake_home_folder_mambaforge.joinpath("mambaforge/envs")
 
     assert env == expected_env_dir
 
 
-def test_get_envs_dir_raises_if_none_found(
+def test_probe_home_raises_if_none_found(
     mocker: MockerFixture, fake_home_folder_no_conda: Path
 ) -> None:
     mocker.patch(
@@ -373,7 +377,7 @@ def test_get_envs_dir_raises_if_none_found(
     )
 
     with pytest.raises(UnsupportedCondaInstallationError):
-        Conda.get_envs_dir()
+        probe_home()
 
 
 @pytest.mark.parametrize(
@@ -536,3 +540,125 @@ def test_export_yml(mocker: MockerFixture, temp_environment_yml: Path) -> None:
     )
 
     assert temp_environment_yml.read_text(encoding="utf-8") == Process().content
+
+
+def test_conda_info_prefix(tmp_path: Path) -> None:
+    first, second = tmp_path.joinpath("first"), tmp_path.joinpath("second")
+    second.joinpath("there").mkdir(parents=True)
+    info = CondaInfo(envs_dirs=[first, second], root_prefix=tmp_path)
+
+    assert info.prefix("there") == second.joinpath("there")
+    assert info.prefix("new") == first.joinpath("new")
+    assert info.prefix("base") == tmp_path
+
+
+def test_conda_info_round_trips() -> None:
+    info = CondaInfo(
+        envs_dirs=[Path("/opt/conda/envs")], root_prefix=Path("/opt/conda")
+    )
+
+    assert CondaInfo.from_dict(info.to_dict()).to_dict() == info.to_dict()
+    assert (
+        repr(info)
+        == f"CondaInfo(envs_dirs=[{Path('/opt/conda/envs')!r}],"
+        f" root_prefix={Path('/opt/conda')!r})"
+    )
+    with pytest.raises(ValueError, match="No envs_dirs"):
+        CondaInfo.from_dict({"envs_dirs": []})
+
+
+@pytest.fixture()
+def fake_conda(tmp_path: Path, mocker: MockerFixture) -> Path:
+    """
+    A `conda` that answers `info --json` about an installation under
+    tmp_path and counts how many times it's asked.
+    """
+    mocker.patch.dict("pytoil.environments.conda._discovered", clear=True)
+    mocker.patch(
+        "pytoil.environments.conda.Path.home",
+        autospec=True,
+        return_value=tmp_path.joinpath("home"),
+    )
+    condarc = tmp_path.joinpath("condarc")
+    condarc.write_text("envs_dirs: []\n")
+    info = {
+        "envs_dirs": [str(tmp_path / "custom/envs"), str(tmp_path / "conda/envs")],
+        "root_prefix": str(tmp_path / "conda"),
+        "config_files": [str(condarc)],
+    }
+    conda = tmp_path.joinpath("conda")
+    conda.write_text(
+        f"#!{sys.executable}\n"
+        "import pathlib\n"
+        f"calls = pathlib.Path({str(tmp_path / 'calls')!r})\n"
+        "calls.write_text(str(int(calls.read_text() if calls.exists() else 0) + 1))\n"
+        f"print({json.dumps(json.dumps(info))})\n"
+    )
+    conda.chmod(0o755)
+    return conda
+
+
+def calls(fake_conda: Path) -> int:
+    return int(fake_conda.parent.joinpath("calls").read_text())
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Needs a shebang")
+def test_discover_asks_conda_once(fake_conda: Path) -> None:
+    cache = fake_conda.parent.joinpath("cache.json")
+
+    info = discover(str(fake_conda), cache=cache)
+    again = discover(str(fake_conda), cache=cache)
+
+    assert info.envs_dirs[0] == fake_conda.parent.joinpath("custom/envs")
+    assert info.root_prefix == fake_conda.parent.joinpath("conda")
+    assert again is info
+    assert calls(fake_conda) == 1
+
+    # A new process only has the cache on disk
+    pytoil.environments.conda._discovered.clear()
+    assert discover(str(fake_conda), cache=cache).to_dict() == info.to_dict()
+    assert calls(fake_conda) == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Needs a shebang")
+@pytest.mark.parametrize("change", ["binary", "condarc", "user_condarc", "env"])
+def test_discover_asks_again_when_conda_changes(
+    fake_conda: Path, mocker: MockerFixture, change: str
+) -> None:
+    cache = fake_conda.parent.joinpath("cache.json")
+    discover(str(fake_conda), cache=cache)
+
+    if change == "binary":
+        os.utime(fake_conda, ns=(0, 0))
+    elif change == "condarc":
+        fake_conda.parent.joinpath("condarc").write_text("changed: true\n")
+        os.utime(fake_conda.parent.joinpath("condarc"), ns=(0, 0))
+    elif change == "user_condarc":
+        fake_conda.parent.joinpath("home").mkdir()
+        fake_conda.parent.joinpath("home/.condarc").touch()
+    else:
+        mocker.patch.dict(os.environ, {"CONDA_ENVS_PATH": "/somewhere/else"})
+
+    discover(str(fake_conda), cache=cache)
+    assert calls(fake_conda) == 2
+
+
+def test_discover_falls_back_to_home(
+    mocker: MockerFixture, fake_home_folder_miniforge: Path, tmp_path: Path
+) -> None:
+    mocker.patch(
+        "pytoil.environments.conda.Path.home",
+        autospec=True,
+        return_value=fake_home_folder_miniforge,
+    )
+    broken = tmp_path.joinpath("conda")
+    broken.write_text("#!/bin/sh\nexit 1\n")
+    broken.chmod(0o755)
+    cache = tmp_path.joinpath("cache.json")
+
+    want = fake_home_folder_miniforge.joinpath("miniforge3/envs")
+
+    assert discover(None, cache=cache).envs_dirs == [want]
+    assert discover("not-a-real-conda", cache=cache).envs_dirs == [want]
+    assert discover(str(broken), cache=cache).envs_dirs == [want]
+    assert not cache.exists()
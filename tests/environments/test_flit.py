@@ -22,7 +22,11 @@ def test_flit() -> None:
 
 def test_flit_repr() -> None:
     flit = Flit(root=Path("somewhere"), flit="notflit")
-    assert repr(flit) == f"Flit(root={Path('somewhere')!r}, flit='notflit')"
+    assert (
+        repr(flit)
+        == f"Flit(root={Path('somewhere')!r}, flit='notflit', wheelhouse=None,"
+        " installer=Pip())"
+    )
 
 
 def test_raises_if_flit_not_installed() -> None:
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from pytoil.config import Config
+from pytoil.environments import Flit, Requirements, Venv
+from pytoil.environments.installer import Pip, Uv, get_installer
+from pytoil.exceptions import UvNotInstalledError
+from pytoil.repo import Repo
+
+
+def test_pip() -> None:
+    pip = Pip()
+
+    assert pip.name == "pip"
+    assert repr(pip) == "Pip()"
+    assert pip.install_command(Path("somewhere/python")) == [
+        f"{Path('somewhere/python')}",
+        "-m",
+        "pip",
+        "install",
+    ]
+
+
+def test_pip_create(mocker: MockerFixture) -> None:
+    mock = mocker.patch("virtualenv.cli_run", autospec=True)
+
+    Pip().create(Path("somewhere/.venv"))
+
+    mock.assert_called_once_with(args=[str(Path("somewhere/.venv")), "--quiet"])
+
+
+def test_uv() -> None:
+    uv = Uv(uv="/bin/uv")
+
+    assert uv.name == "uv"
+    assert repr(uv) == "Uv(uv='/bin/uv')"
+    assert uv.install_command(Path("somewhere/python")) == [
+        "/bin/uv",
+        "pip",
+        "install",
+        "--python",
+        f"{Path('somewhere/python')}",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("silent", "stdout", "stderr"),
+    [
+        (True, subprocess.DEVNULL, subprocess.DEVNULL),
+        (False, sys.stdout, sys.stderr),
+    ],
+)
+def test_uv_create(
+    mocker: MockerFixture, silent: bool, stdout: object, stderr: object
+) -> None:
+    mock = mocker.patch("pytoil.environments.installer.subprocess.run", autospec=True)
+
+    Uv(uv="/bin/uv").create(Path("somewhere/.venv"), silent=silent)
+
+    mock.assert_called_once_with(
+        [
+            "/bin/uv",
+            "venv",
+            "--seed",
+            "--quiet",
+            "--python",
+            sys.executable,
+            f"{Path('somewhere/.venv')}",
+        ],
+        check=True,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+def test_uv_raises_if_not_installed() -> None:
+    uv = Uv(uv=None)
+
+    with pytest.raises(UvNotInstalledError):
+        uv.create(Path("somewhere/.venv"))
+
+    with pytest.raises(UvNotInstalledError):
+        uv.install_command(Path("somewhere/python"))
+
+
+@pytest.mark.parametrize(
+    ("name", "uv", "expected"),
+    [
+        ("pip", "/bin/uv", Pip),
+        ("pip", None, Pip),
+        ("uv", "/bin/uv", Uv),
+        ("uv", None, Uv),
+        ("auto", "/bin/uv", Uv),
+        ("auto", None, Pip),
+    ],
+)
+def test_get_installer(
+    mocker: MockerFixture, name: str, uv: str | None, expected: type
+) -> None:
+    mocker.patch("pytoil.environments.installer.UV", uv)
+
+    assert isinstance(get_installer(name), expected)
+
+
+def test_get_installer_raises_on_unknown_name() -> None:
+    with pytest.raises(ValueError, match="Unknown installer 'conda'"):
+        get_installer("conda")
+
+
+def test_venv_defaults_to_pip() -> None:
+    assert isinstance(Venv(root=Path("somewhere")).installer, Pip)
+
+
+def test_venv_create_uses_installer(mocker: MockerFixture) -> None:
+    mock = mocker.patch.object(Uv, "create", autospec=True)
+    uv = Uv(uv="/bin/uv")
+    venv = Venv(root=Path("somewhere"), installer=uv)
+
+    venv.create(silent=True)
+
+    mock.assert_called_once_with(
+        uv, Path("somewhere").resolve().joinpath(".venv"), silent=True
+    )
+
+
+@pytest.mark.parametrize("env_class", [Venv, Requirements])
+def test_install_self_uses_installer(
+    mocker: MockerFixture, env_class: type[Venv]
+) -> None:
+    mocker.patch.object(env_class, "exists", autospec=True, return_value=True)
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
+    env = env_class(root=Path("somewhere"), installer=Uv(uv="/bin/uv"))
+
+    env.install_self(silent=True)
+
+    assert mock.call_args.args[0][:5] == [
+        "/bin/uv",
+        "pip",
+        "install",
+        "--python",
+        f"{env.executable}",
+    ]
+
+
+def test_flit_creates_environment_with_installer(mocker: MockerFixture) -> None:
+    mocker.patch.object(Flit, "exists", autospec=True, return_value=False)
+    mocker.patch("pytoil.environments.flit.subprocess.run", autospec=True)
+    create = mocker.patch.object(Uv, "create", autospec=True)
+    uv = Uv(uv="/bin/uv")
+    env = Flit(root=Path("somewhere"), flit="notflit", installer=uv)
+
+    env.install_self(silent=True)
+
+    create.assert_called_once_with(uv, env.project_path.joinpath(".venv"), silent=True)
+
+
+def test_dispatch_env_uses_configured_installer(requirements_project: Path) -> None:
+    repo = Repo(name="test", owner="me", local_path=requirements_project)
+
+    env = repo.dispatch_env(config=Config(installer="pip"))
+
+    assert isinstance(env, Requirements)
+    assert isinstance(env.installer, Pip)
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from pytoil.environments.provision import Provisioner, ProvisionResult
+from pytoil.exceptions import (
+    EnvironmentAlreadyExistsError,
+    FlitNotInstalledError,
+)
+from pytoil.git import CloneEngine, CloneJob, CloneResult
+
+from tests.git_sources import make_source, requires_git
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+class FakeEnv:
+    """
+    Just enough of an `Environment` to provision.
+    """
+
+    def __init__(
+        self, root: Path, error: Exception | None = None, delay: float = 0.0
+    ) -> None:
+        self.root = root
+        self.error = error
+        self.delay = delay
+
+    @property
+    def project_path(self) -> Path:
+        return self.root
+
+    @property
+    def executable(self) -> Path:
+        return self.root.joinpath(".fake-env")
+
+    @property
+    def name(self) -> str:
+        return "fake"
+
+    def exists(self) -> bool:
+        return self.executable.exists()
+
+    def create(
+        self,
+        packages: Sequence[str] | None = None,  # noqa: ARG002
+        silent: bool = False,  # noqa: ARG002
+    ) -> None:
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        self.executable.touch()
+
+    def install(
+        self, packages: Sequence[str], silent: bool = False  # noqa: ARG002
+    ) -> None:
+        return
+
+    def install_self(self, silent: bool = False) -> None:
+        self.create(silent=silent)
+
+
+def test_provision_result() -> None:
+    result = ProvisionResult(name="demo", env="venv", status="created", duration=1.5)
+
+    assert result.ok
+    assert not ProvisionResult(name="demo", env="venv", status="failed").ok
+    assert ProvisionResult(name="demo", env=None, status="skipped").ok
+    assert (
+        repr(result)
+        == "ProvisionResult(name='demo', env='venv', status='created', duration=1.5,"
+        " detail='')"
+    )
+
+
+def test_provisioner_must_be_open(tmp_path: Path) -> None:
+    with pytest.raises(RuntimeError):
+        Provisioner().submit("demo", FakeEnv(tmp_path))
+
+
+def test_provisioner_records_every_outcome(tmp_path: Path) -> None:
+    for name in ("good", "exists", "broken", "silent", "malformed"):
+        tmp_path.joinpath(name).mkdir()
+    done: list[str] = []
+
+    class Silent(FakeEnv):
+        # Doesn't raise but doesn't leave an environment either
+        def install_self(self, silent: bool = False) -> None:  # noqa: ARG002
+            return
+
+    with Provisioner(
+        concurrency=2, on_done=lambda result: done.append(result.name)
+    ) as provisioner:
+        provisioner.submit("good", FakeEnv(tmp_path / "good"))
+        provisioner.submit("undetected", None)
+        provisioner.submit(
+            "exists",
+            FakeEnv(tmp_path / "exists", error=EnvironmentAlreadyExistsError("Exists")),
+        )
+        provisioner.submit(
+            "broken", FakeEnv(tmp_path / "broken", error=FlitNotInstalledError())
+        )
+        provisioner.submit("silent", Silent(tmp_path / "silent"))
+        provisioner.submit(
+            "malformed",
+            FakeEnv(tmp_path / "malformed", error=ValueError("Bad environment.yml")),
+        )
+
+    results = provisioner.results()
+
+    assert [(r.name, r.status) for r in results] == [
+        ("good", "created"),
+        ("undetected", "skipped"),
+        ("exists", "skipped"),
+        ("broken", "failed"),
+        ("silent", "failed"),
+        ("malformed", "failed"),
+    ]
+    assert results[1].detail == "Not detected"
+    assert results[2].detail == "Exists"
+    assert results[3].detail == "Flit not found on $PATH. Is it installed?"
+    assert results[4].detail == "Could not create the fake environment"
+    assert results[5].detail == "Bad environment.yml"
+    assert sorted(done) == sorted(r.name for r in results)
+    assert provisioner.elapsed > 0
+
+
+def test_provisioner_bounds_concurrency(tmp_path: Path) -> None:
+    running = 0
+    most = 0
+    lock = threading.Lock()
+
+    class Counting(FakeEnv):
+        def install_self(self, silent: bool = False) -> None:
+            nonlocal running, most
+            with lock:
+                running += 1
+                most = max(most, running)
+            try:
+                super().install_self(silent)
+            finally:
+                with lock:
+                    running -= 1
+
+    with Provisioner(concurrency=2) as provisioner:
+        for i in range(6):
+            root = tmp_path.joinpath(str(i))
+            root.mkdir()
+            provisioner.submit(str(i), Counting(root, delay=0.05))
+
+    assert most == 2
+    assert all(result.status == "created" for result in provisioner.results())
+
+
+def test_provisioner_cancels_pending_on_error(tmp_path: Path) -> None:
+    provisioner = Provisioner(concurrency=1)
+
+    def interrupted() -> None:
+        with provisioner:
+            for i in range(3):
+                root = tmp_path.joinpath(str(i))
+                root.mkdir()
+                provisioner.submit(str(i), FakeEnv(root, delay=0.1))
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        interrupted()
+
+    results = provisioner.results()
+
+    assert len(results) == 3
+    assert results[0].status == "created"
+    assert results[-1].detail == "Cancelled"
+
+
+@requires_git
+def test_provisioning_while_cloning(tmp_path: Path) -> None:
+    names = ["one", "two", "three"]
+    urls = {name: make_source(tmp_path, name) for name in names}
+    dest = tmp_path.joinpath("projects")
+
+    with Provisioner(concurrency=1) as provisioner:
+        engine = CloneEngine(
+            concurrency=2,
+            on_done=lambda result: provisioner.submit(
+                result.job.name, FakeEnv(result.job.dest)
+            ),
+        )
+        results = engine.run(
+            CloneJob(name=name, url=urls[name], dest=dest / name) for name in names
+        )
+
+    assert all(result.ok for result in results)
+    assert sorted(r.name for r in provisioner.results()) == sorted(names)
+    assert all(dest.joinpath(name, ".fake-env").exists() for name in names)
+
+
+@requires_git
+def test_cancelled_clones_cancel_queued_environments(tmp_path: Path) -> None:
+    names = ["one", "two", "three", "four"]
+    urls = {name: make_source(tmp_path, name) for name in names}
+    dest = tmp_path.joinpath("projects")
+
+    submitted: list[str] = []
+
+    def cancel_after_third(result: CloneResult) -> None:
+        provisioner.submit(result.job.name, FakeEnv(result.job.dest, delay=0.2))
+        submitted.append(result.job.name)
+        if len(submitted) == 3:
+            engine.cancel()
+
+    with Provisioner(concurrency=1) as provisioner:
+        engine = CloneEngine(concurrency=1, on_done=cancel_after_third)
+        engine.run(
+            CloneJob(name=name, url=urls[name], dest=dest / name) for name in names
+        )
+        # What pull does once the clones are done
+        assert engine.cancelled
+        provisioner.cancel()
+        # Submitted after cancelling, never started
+        provisioner.submit("late", FakeEnv(tmp_path))
+
+    results = {r.name: r for r in provisioner.results()}
+
+    assert results["one"].status == "created"
+    assert results["three"].detail == "Cancelled"
+    assert results["late"].detail == "Cancelled"
+    assert not dest.joinpath("three", ".fake-env").exists()
+    assert not tmp_path.joinpath(".fake-env").exists()
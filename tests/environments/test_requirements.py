@@ -21,7 +21,10 @@ def test_requirements() -> None:
 
 def test_requirements_repr() -> None:
     env = Requirements(root=Path("somewhere"))
-    assert repr(env) == f"Requirements(root={Path('somewhere')!r})"
+    assert (
+        repr(env)
+        == f"Requirements(root={Path('somewhere')!r}, wheelhouse=None, installer=Pip())"
+    )
 
 
 @pytest.mark.parametrize(
@@ -40,7 +43,7 @@ def test_install_self_venv_exists(
         return_value=True,
     )
 
-    mock = mocker.patch("pytoil.environments.reqs.subprocess.run", autospec=True)
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
 
     env = Requirements(root=Path("somewhere"))
 
@@ -70,7 +73,7 @@ def test_install_self_venv_doesnt_exist(
         return_value=False,
     )
 
-    mock = mocker.patch("pytoil.environments.reqs.subprocess.run", autospec=True)
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
 
     mock_create = mocker.patch(
         "pytoil.environments.reqs.Requirements.create", autospec=True
@@ -109,7 +112,9 @@ def test_install_self_requirements_dev(
             return_value=True,
         )
 
-        mock = mocker.patch("pytoil.environments.reqs.subprocess.run", autospec=True)
+        mock = mocker.patch(
+            "pytoil.environments.virtualenv.subprocess.run", autospec=True
+        )
 
         env = Requirements(root=Path(tmpdir))
 
@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from pytoil.cli.new import create_venv
+from pytoil.config import Config
+from pytoil.environments import Venv, VenvTemplates
+from pytoil.environments.templates import (
+    CLONE_METHODS,
+    clone_file,
+    clone_tree,
+    interpreter,
+)
+
+
+def make_venv(path: Path) -> Path:
+    """
+    Enough of a virtual environment's layout to clone.
+    """
+    path.joinpath("bin").mkdir(parents=True)
+    path.joinpath("lib", "site-packages", "demo").mkdir(parents=True)
+    path.joinpath("pyvenv.cfg").write_text("home = /usr/bin\n")
+    path.joinpath("bin", "python").symlink_to(sys.executable)
+    path.joinpath("bin", "python3").symlink_to("python")
+    path.joinpath("lib64").symlink_to("lib")
+    script = path.joinpath("bin", "demo")
+    script.write_text(f"#!{path}/bin/python\nimport demo\n")
+    script.chmod(0o755)
+    path.joinpath("bin", "activate").write_text(f"VIRTUAL_ENV='{path}'\n")
+    path.joinpath("lib", "site-packages", "demo", "__init__.py").write_text("X = 1\n")
+    return path
+
+
+def fake_create(self: Venv, packages: list[str], silent: bool = False) -> None:
+    make_venv(self.project_path.joinpath(".venv"))
+
+
+def test_interpreter() -> None:
+    info = interpreter()
+
+    assert info["python"] == os.path.realpath(sys.executable)
+    assert info["version"] == sys.version
+    assert info["mtime_ns"] == Path(sys.executable).resolve().stat().st_mtime_ns
+
+
+def test_clone_tree(tmp_path: Path) -> None:
+    src = make_venv(tmp_path.joinpath("template"))
+    dst = tmp_path.joinpath("project", ".venv")
+    dst.parent.mkdir()
+
+    method = clone_tree(src, dst)
+
+    assert method in CLONE_METHODS
+    # The template's path is swapped for the clone's in scripts
+    assert (
+        dst.joinpath("bin", "demo").read_text() == f"#!{dst}/bin/python\nimport demo\n"
+    )
+    assert os.access(dst.joinpath("bin", "demo"), os.X_OK)
+    assert dst.joinpath("bin", "activate").read_text() == f"VIRTUAL_ENV='{dst}'\n"
+    # Symlinks stay symlinks
+    assert dst.joinpath("bin", "python").readlink() == Path(sys.executable)
+    assert dst.joinpath("bin", "python3").readlink() == Path("python")
+    assert dst.joinpath("lib64").readlink() == Path("lib")
+    # Everything else is shared where the filesystem can
+    package = dst.joinpath("lib", "site-packages", "demo", "__init__.py")
+    assert package.read_text() == "X = 1\n"
+    if method == "hardlink":
+        assert package.samefile(
+            src.joinpath("lib", "site-packages", "demo", "__init__.py")
+        )
+
+
+def test_clone_tree_falls_back_to_copying(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mocker.patch("pytoil.environments.templates.reflink", side_effect=OSError)
+    mocker.patch("pytoil.environments.templates.os.link", side_effect=OSError)
+    src = make_venv(tmp_path.joinpath("template"))
+    dst = tmp_path.joinpath("clone")
+
+    assert clone_tree(src, dst) == "copy"
+
+    package = dst.joinpath("lib", "site-packages", "demo", "__init__.py")
+    assert package.read_text() == "X = 1\n"
+    assert not package.samefile(
+        src.joinpath("lib", "site-packages", "demo", "__init__.py")
+    )
+
+
+def test_clone_tree_fails_if_the_template_vanishes(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    src = make_venv(tmp_path.joinpath("template"))
+    real = clone_file
+
+    def rebuilt(source: Path, target: Path, method: str) -> None:
+        # The template being rebuilt by another pytoil before we get to lib/
+        real(source, target, method)
+        shutil.rmtree(src.joinpath("lib"), ignore_errors=True)
+
+    mocker.patch("pytoil.environments.templates.clone_file", side_effect=rebuilt)
+
+    with pytest.raises(FileNotFoundError):
+        clone_tree(src, tmp_path.joinpath("clone"))
+
+
+def test_template_missing(tmp_path: Path) -> None:
+    assert VenvTemplates(tmp_path).template(["black"]) is None
+
+
+def test_build_and_template(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch.object(Venv, "create", autospec=True, side_effect=fake_create)
+    has = mocker.patch.object(VenvTemplates, "_has", return_value=True)
+    templates = VenvTemplates(tmp_path)
+
+    venv = templates.build(["mypy", "black"], silent=True)
+
+    slot = templates.slot()
+    assert venv == slot.joinpath(".venv")
+    assert venv.joinpath("pyvenv.cfg").exists()
+    has.assert_called_once_with(venv.joinpath("bin", "python"), ["mypy", "black"])
+    assert json.loads(slot.joinpath("template.json").read_text()) == {
+        **interpreter(),
+        "packages": ["black", "mypy"],
+    }
+    assert not tmp_path.joinpath(f"{slot.name}.lock").exists()
+
+    # Order doesn't matter, anything else does
+    assert templates.template(["black", "mypy"]) == venv
+    assert templates.template(["black"]) is None
+    mocker.patch(
+        "pytoil.environments.templates.interpreter",
+        return_value={**interpreter(), "version": "3.99.0"},
+    )
+    assert templates.template(["black", "mypy"]) is None
+
+
+def test_build_throws_away_failed_installs(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mocker.patch.object(Venv, "create", autospec=True, side_effect=fake_create)
+    mocker.patch.object(VenvTemplates, "_has", return_value=False)
+    templates = VenvTemplates(tmp_path)
+
+    assert templates.build(["not-a-real-package"], silent=True) is None
+    assert not templates.slot().exists()
+
+
+def test_build_leaves_it_to_whoever_holds_the_lock(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    create = mocker.patch.object(Venv, "create", autospec=True)
+    templates = VenvTemplates(tmp_path)
+    tmp_path.joinpath(f"{templates.slot().name}.lock").touch()
+
+    assert templates.build(["black"], silent=True) is None
+    create.assert_not_called()
+
+
+def test_build_takes_over_a_stale_lock(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch.object(Venv, "create", autospec=True, side_effect=fake_create)
+    mocker.patch.object(VenvTemplates, "_has", return_value=True)
+    templates = VenvTemplates(tmp_path)
+    lock = tmp_path.joinpath(f"{templates.slot().name}.lock")
+    lock.touch()
+    an_hour_ago = time.time() - 3600
+    os.utime(lock, (an_hour_ago, an_hour_ago))
+
+    assert templates.build(["black"], silent=True) is not None
+
+
+def test_clone(mocker: MockerFixture, tmp_path: Path) -> None:
+    create = mocker.patch.object(Venv, "create", autospec=True, side_effect=fake_create)
+    mocker.patch.object(VenvTemplates, "_has", return_value=True)
+    templates = VenvTemplates(tmp_path.joinpath("templates"))
+
+    first = tmp_path.joinpath("first")
+    second = tmp_path.joinpath("second")
+    assert templates.clone(["black"], first, silent=True) in CLONE_METHODS
+    assert templates.clone(["black"], second, silent=True) in CLONE_METHODS
+
+    # Built once, cloned twice
+    create.assert_called_once()
+    assert second.joinpath("bin", "demo").read_text().startswith(f"#!{second}/bin")
+
+
+@pytest.mark.parametrize("rebuild", ["started", "finished"])
+def test_clone_throws_away_clones_of_a_changing_template(
+    mocker: MockerFixture, tmp_path: Path, rebuild: str
+) -> None:
+    mocker.patch.object(Venv, "create", autospec=True, side_effect=fake_create)
+    mocker.patch.object(VenvTemplates, "_has", return_value=True)
+    templates = VenvTemplates(tmp_path.joinpath("templates"))
+    templates.build(["black"], silent=True)
+    meta = templates.slot().joinpath("template.json")
+    real = clone_tree
+
+    def rebuilt(src: Path, dst: Path) -> str:
+        method = real(src, dst)
+        if rebuild == "started":
+            meta.unlink()
+        else:
+            os.utime(meta, ns=(0, 0))
+        return method
+
+    mocker.patch("pytoil.environments.templates.clone_tree", side_effect=rebuilt)
+    dest = tmp_path.joinpath("clone")
+
+    assert templates.clone(["black"], dest, silent=True) == ""
+    assert not dest.exists()
+
+
+def test_clone_without_a_template(mocker: MockerFixture, tmp_path: Path) -> None:
+    mocker.patch.object(VenvTemplates, "build", return_value=None)
+    templates = VenvTemplates(tmp_path)
+
+    assert templates.clone(["black"], tmp_path.joinpath("clone")) == ""
+    assert not tmp_path.joinpath("clone").exists()
+
+
+def test_clear(tmp_path: Path) -> None:
+    templates = VenvTemplates(tmp_path.joinpath("templates"))
+    make_venv(templates.slot().joinpath(".venv"))
+
+    templates.clear()
+
+    assert not templates.path.exists()
+
+
+@pytest.mark.parametrize("cloned", ["hardlink", ""])
+def test_create_venv_with_templates(
+    mocker: MockerFixture, tmp_path: Path, cloned: str
+) -> None:
+    clone = mocker.patch.object(VenvTemplates, "clone", return_value=cloned)
+    create = mocker.patch.object(Venv, "create", autospec=True)
+    install = mocker.patch.object(Venv, "install", autospec=True)
+    env = Venv(root=tmp_path)
+    config = Config(common_packages=["black", "mypy"])
+
+    create_venv(env=env, packages=("requests",), config=config)
+
+    clone.assert_called_once_with(
+        ["black", "mypy"], env.project_path.joinpath(".venv"), silent=True
+    )
+    if cloned:
+        # Only what wasn't in the template is left to install
+        install.assert_called_once_with(env, packages=("requests",), silent=True)
+        create.assert_not_called()
+    else:
+        create.assert_called_once_with(
+            env, packages=["requests", "black", "mypy"], silent=True
+        )
+
+
+def test_create_venv_without_templates(mocker: MockerFixture, tmp_path: Path) -> None:
+    clone = mocker.patch.object(VenvTemplates, "clone")
+    create = mocker.patch.object(Venv, "create", autospec=True)
+    env = Venv(root=tmp_path)
+    config = Config(common_packages=["black"], venv_templates=False)
+
+    create_venv(env=env, packages=(), config=config)
+
+    clone.assert_not_called()
+    create.assert_called_once_with(env, packages=["black"], silent=True)
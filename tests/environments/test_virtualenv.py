@@ -20,7 +20,10 @@ def test_virtualenv() -> None:
 
 def test_virtualenv_repr() -> None:
     venv = Venv(root=Path("somewhere"))
-    assert repr(venv) == f"Venv(root={Path('somewhere')!r})"
+    assert (
+        repr(venv)
+        == f"Venv(root={Path('somewhere')!r}, wheelhouse=None, installer=Pip())"
+    )
 
 
 @pytest.mark.parametrize(
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+from pytest_mock import MockerFixture
+from pytoil.environments import Flit, Requirements, Venv, Wheelhouse
+from pytoil.environments.wheelhouse import (
+    FILL_LOCK,
+    canonical_name,
+    error_line,
+    main,
+    requirement_name,
+)
+
+
+def make_wheel(directory: Path, name: str, version: str) -> Path:
+    """
+    A minimal pure python wheel, good enough for pip to install.
+    """
+    dist_info = f"{name}-{version}.dist-info"
+    files = {
+        f"{name}/__init__.py": f"VERSION = {version!r}\n",
+        f"{dist_info}/METADATA": (
+            f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+        ),
+        f"{dist_info}/WHEEL": (
+            "Wheel-Version: 1.0\nGenerator: test\nRoot-Is-Purelib: true\n"
+            "Tag: py3-none-any\n"
+        ),
+    }
+    files[f"{dist_info}/RECORD"] = (
+        "".join(f"{file},,\n" for file in files) + f"{dist_info}/RECORD,,\n"
+    )
+
+    directory.mkdir(parents=True, exist_ok=True)
+    wheel = directory.joinpath(f"{name}-{version}-py3-none-any.whl")
+    with zipfile.ZipFile(wheel, "w") as archive:
+        for file, content in files.items():
+            archive.writestr(file, content)
+    return wheel
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("black", "black"),
+        ("Foo_Bar", "foo-bar"),
+        ("zope.interface", "zope-interface"),
+    ],
+)
+def test_canonical_name(name: str, expected: str) -> None:
+    assert canonical_name(name) == expected
+
+
+@pytest.mark.parametrize(
+    ("requirement", "expected"),
+    [
+        ("black", "black"),
+        ("black[d]>=23", "black"),
+        ("Flake8 == 6.0", "flake8"),
+        ("typing_extensions; python_version < '3.10'", "typing-extensions"),
+        (".", None),
+        ("-e", None),
+        ("https://example.com/thing.whl", None),
+    ],
+)
+def test_requirement_name(requirement: str, expected: str | None) -> None:
+    assert requirement_name(requirement) == expected
+
+
+def test_wheels(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path.joinpath("wheels"))
+    assert house.wheels() == {}
+    assert house.size() == 0
+
+    make_wheel(house.path, "demo", "1.0")
+    make_wheel(house.path, "demo", "1.1")
+    make_wheel(house.path, "other_thing", "0.1")
+
+    assert house.wheels() == {"demo": {"1.0", "1.1"}, "other-thing": {"0.1"}}
+    assert house.size() > 0
+
+
+def test_covers(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path)
+    make_wheel(tmp_path, "demo", "1.0")
+    make_wheel(tmp_path, "other_thing", "0.1")
+
+    assert house.covers(["demo", "Other-Thing>=0.1"])
+    assert not house.covers(["demo", "missing"])
+    assert not house.covers(["-e", "."])
+    assert not house.covers([])
+
+
+def test_pip_args(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path)
+
+    assert house.pip_args() == ["--find-links", str(tmp_path)]
+    assert house.pip_args(offline=True) == ["--no-index", "--find-links", str(tmp_path)]
+    assert house.environ()["PIP_FIND_LINKS"] == str(tmp_path)
+
+
+def test_clear(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path.joinpath("wheels"))
+    make_wheel(house.path, "demo", "1.0")
+
+    house.clear()
+    house.clear()
+
+    assert house.wheels() == {}
+
+
+def test_only_one_fill_at_a_time(tmp_path: Path, mocker: MockerFixture) -> None:
+    house = Wheelhouse(tmp_path.joinpath("wheels"))
+    popen = mocker.patch("pytoil.environments.wheelhouse.subprocess.Popen")
+    fill = mocker.patch.object(Wheelhouse, "fill", autospec=True, return_value="")
+
+    assert not house.filling()
+    assert house.lock()
+    assert house.filling()
+    assert not house.lock()
+
+    # Neither started nor run while another worker has the lock
+    assert house.spawn_fill("python") is None
+    popen.assert_not_called()
+    assert main([str(house.path), "--python", "python"]) == 0
+    fill.assert_not_called()
+
+    house.unlock()
+    assert house.spawn_fill("python") is popen.return_value
+    assert main([str(house.path), "--python", "python"]) == 0
+    fill.assert_called_once_with(mocker.ANY, "python")
+    assert not house.filling()
+
+
+def test_stale_fill_lock_is_ignored(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path.joinpath("wheels"))
+    assert house.lock()
+    os.utime(house.path.joinpath(FILL_LOCK), (1000, 1000))
+
+    assert not house.filling()
+    assert house.lock()
+
+
+def test_error_line() -> None:
+    stderr = (
+        "Looking in links: /somewhere\n"
+        "ERROR: Could not find a version that satisfies the requirement nope\n"
+        "ERROR: No matching distribution found for nope\n"
+        "\n"
+    )
+    assert error_line(stderr) == "ERROR: No matching distribution found for nope"
+    assert error_line("something broke\n") == "something broke"
+    assert error_line("") == "pip failed"
+
+
+def test_install_tries_the_wheelhouse_alone_first(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
+    mock.return_value.returncode = 0
+    spawn = mocker.patch.object(Wheelhouse, "spawn_fill", autospec=True)
+    house = Wheelhouse(tmp_path)
+    make_wheel(tmp_path, "demo", "1.0")
+    venv = Venv(root=Path("somewhere"), wheelhouse=house)
+
+    venv.install(["demo"], silent=True)
+
+    mock.assert_called_once_with(
+        [
+            f"{venv.executable}",
+            "-m",
+            "pip",
+            "install",
+            "--no-index",
+            "--find-links",
+            str(tmp_path),
+            "demo",
+        ],
+        cwd=venv.project_path,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    # Nothing new, nothing to fill
+    spawn.assert_not_called()
+
+
+def test_install_falls_back_to_the_index(mocker: MockerFixture, tmp_path: Path) -> None:
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
+    mock.side_effect = [
+        subprocess.CompletedProcess([], returncode=1),
+        subprocess.CompletedProcess([], returncode=0),
+    ]
+    spawn = mocker.patch.object(Wheelhouse, "spawn_fill", autospec=True)
+    house = Wheelhouse(tmp_path)
+    make_wheel(tmp_path, "demo", "1.0")
+    venv = Venv(root=Path("somewhere"), wheelhouse=house)
+
+    venv.install(["demo"], silent=False)
+
+    assert mock.call_count == 2
+    assert mock.call_args.args[0] == [
+        f"{venv.executable}",
+        "-m",
+        "pip",
+        "install",
+        "--find-links",
+        str(tmp_path),
+        "demo",
+    ]
+    assert mock.call_args.kwargs["stderr"] is sys.stderr
+    spawn.assert_called_once_with(house, venv.executable)
+
+
+def test_install_skips_the_wheelhouse_alone_if_it_cant_work(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
+    mock.return_value.returncode = 1
+    spawn = mocker.patch.object(Wheelhouse, "spawn_fill", autospec=True)
+    venv = Venv(root=Path("somewhere"), wheelhouse=Wheelhouse(tmp_path))
+
+    venv.install(["not-in-the-wheelhouse"], silent=True)
+
+    mock.assert_called_once()
+    assert "--no-index" not in mock.call_args.args[0]
+    # A failed install has nothing worth keeping
+    spawn.assert_not_called()
+
+
+def test_requirements_install_self_uses_wheelhouse(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mocker.patch.object(Requirements, "exists", autospec=True, return_value=True)
+    mock = mocker.patch("pytoil.environments.virtualenv.subprocess.run", autospec=True)
+    mock.return_value.returncode = 0
+    spawn = mocker.patch.object(Wheelhouse, "spawn_fill", autospec=True)
+    house = Wheelhouse(tmp_path)
+    env = Requirements(root=Path("somewhere"), wheelhouse=house)
+
+    env.install_self(silent=True)
+
+    assert mock.call_args.args[0] == [
+        f"{env.executable}",
+        "-m",
+        "pip",
+        "install",
+        "--find-links",
+        str(tmp_path),
+        "-r",
+        "requirements.txt",
+    ]
+    spawn.assert_called_once_with(house, env.executable)
+
+
+def test_flit_install_self_uses_wheelhouse(
+    mocker: MockerFixture, tmp_path: Path
+) -> None:
+    mocker.patch.object(Flit, "exists", autospec=True, return_value=True)
+    mock = mocker.patch("pytoil.environments.flit.subprocess.run", autospec=True)
+    mock.return_value.returncode = 0
+    spawn = mocker.patch.object(Wheelhouse, "spawn_fill", autospec=True)
+    house = Wheelhouse(tmp_path)
+    env = Flit(root=Path("somewhere"), flit="notflit", wheelhouse=house)
+
+    env.install_self(silent=True)
+
+    assert mock.call_args.kwargs["env"]["PIP_FIND_LINKS"] == str(tmp_path)
+    spawn.assert_called_once_with(house, env.executable)
+
+
+def test_offline_install_and_fill(tmp_path: Path) -> None:
+    house = Wheelhouse(tmp_path.joinpath("wheels"))
+    make_wheel(house.path, "demo", "1.0")
+    project = tmp_path.joinpath("project")
+    project.mkdir()
+    venv = Venv(root=project, wheelhouse=house)
+    # In its own process rather than Venv.create, virtualenv leaves a pipe
+    # open which pytest turns into an error
+    subprocess.run(
+        [sys.executable, "-m", "virtualenv", "--quiet", str(project / ".venv")],
+        check=True,
+    )
+
+    venv.install(["demo"], silent=True)
+
+    result = subprocess.run(
+        [str(venv.executable), "-c", "import demo; print(demo.VERSION)"],
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout.strip() == "1.0"
+
+    # Everything in the environment is in the wheelhouse already
+    assert house.fill(venv.executable) == ""
+    assert main([str(house.path), "--python", str(venv.executable)]) == 0
+    assert house.wheels() == {"demo": {"1.0"}}
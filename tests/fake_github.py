@@ -0,0 +1,331 @@
+"""
+An in-process stand-in for the bits of GitHub pytoil talks to.
+
+`FakeGitHub` answers every query in `pytoil.api.queries` plus the REST
+fork endpoint from an in-memory set of synthetic accounts, and can be
+plugged into `API` or `AsyncAPI` via `httpx.MockTransport` so the whole
+client stack (pagination, batching, retries, pooling) runs for real
+without touching the network.
+
+It can also simulate per-request latency, the primary rate limit,
+secondary (concurrency) limits and forks that take a while to appear,
+which is what the integration tests and API benchmarks are built on.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import httpx
+from pytoil.api import queries
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+GITHUB_TIME_FORMAT = r"%Y-%m-%dT%H:%M:%SZ"
+FORK_PATH = re.compile(r"^/repos/(?P<owner>[^/]+)/(?P<repo>[^/]+)/forks$")
+ALIAS = re.compile(r"(r\d+): repository\(owner: \$(owner\d+), name: \$(name\d+)\)")
+
+
+def make_repo(name: str, parent: str | None = None) -> dict[str, Any]:
+    """
+    A synthetic repo with every field any of pytoil's queries ask for.
+    """
+    return {
+        "name": name,
+        "description": f"The {name} project.",
+        "createdAt": "2021-02-04T15:05:23Z",
+        "pushedAt": "2021-12-27T13:31:53Z",
+        "diskUsage": 1024,
+        "licenseInfo": {"name": "MIT License"},
+        "primaryLanguage": {"name": "Python"},
+        "parent": {"nameWithOwner": parent} if parent else None,
+    }
+
+
+class FakeGitHub:
+    def __init__(
+        self,
+        login: str = "me",
+        latency: float = 0.0,
+        rate_limit: int = 5000,
+        reset_in: float = 3600.0,
+        max_concurrency: int | None = None,
+        fork_delay: float = 0.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        A fake GitHub with no accounts in it yet, use `add_account`.
+
+        Args:
+            login (str, optional): The authenticated user. Defaults to "me".
+            latency (float, optional): Seconds every request takes to answer.
+                Defaults to 0.0.
+            rate_limit (int, optional): Requests allowed per rate limit window.
+                Defaults to 5000.
+            reset_in (float, optional): Length of the rate limit window in
+                seconds. Defaults to 3600.0.
+            max_concurrency (int | None, optional): Requests in flight at once
+                before GitHub's secondary limit kicks in with a 429,
+                None for no limit. Defaults to None.
+            fork_delay (float, optional): Seconds between a fork being
+                accepted and it showing up. Defaults to 0.0.
+            clock (Callable[[], float], optional): Returns the current epoch
+                time. Defaults to time.time.
+        """
+        self.login = login
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.reset_in = reset_in
+        self.max_concurrency = max_concurrency
+        self.fork_delay = fork_delay
+        self.clock = clock
+
+        self.accounts: dict[str, dict[str, dict[str, Any]]] = {}
+        self.pending_forks: list[tuple[float, str, str]] = []
+        self.remaining = rate_limit
+        self.reset_at = clock() + reset_in
+
+        self.requests: list[httpx.Request] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def add_account(
+        self, login: str, repos: int = 0, forks: int = 0, prefix: str = "repo"
+    ) -> list[str]:
+        """
+        Add (or extend) an account with synthetically named repos.
+
+        Args:
+            login (str): The account's login.
+            repos (int, optional): Number of source repos. Defaults to 0.
+            forks (int, optional): Number of forks of other people's repos.
+                Defaults to 0.
+            prefix (str, optional): Repo name prefix. Defaults to "repo".
+
+        Returns:
+            list[str]: The names of the repos added.
+        """
+        account = self.accounts.setdefault(login, {})
+        names = [f"{prefix}-{i:05}" for i in range(repos)]
+        for name in names:
+            account[name] = make_repo(name)
+
+        fork_names = [f"{prefix}-fork-{i:05}" for i in range(forks)]
+        for name in fork_names:
+            account[name] = make_repo(name, parent=f"upstream/{name}")
+
+        return names + fork_names
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        A transport for `API(transport=...)`.
+        """
+        return httpx.MockTransport(self.handle)
+
+    def async_transport(self) -> httpx.MockTransport:
+        """
+        A transport for `AsyncAPI(transport=...)`.
+        """
+        return httpx.MockTransport(self.ahandle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer a request, taking `latency` seconds (blocking).
+        """
+        self._enter(request)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            return self._respond(request)
+        finally:
+            self._exit()
+
+    async def ahandle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer a request, taking `latency` seconds (without blocking
+        the event loop).
+        """
+        self._enter(request)
+        try:
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return self._respond(request)
+        finally:
+            self._exit()
+
+    def _enter(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def _exit(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def _rate_limit_headers(self) -> dict[str, str]:
+        return {
+            "X-RateLimit-Limit": str(self.rate_limit),
+            "X-RateLimit-Remaining": str(max(self.remaining, 0)),
+            "X-RateLimit-Reset": str(int(self.reset_at)),
+        }
+
+    def _respond(self, request: httpx.Request) -> httpx.Response:
+        if "Authorization" not in request.headers:
+            return httpx.Response(401, json={"message": "Requires authentication"})
+
+        with self._lock:
+            if (
+                self.max_concurrency is not None
+                and self.in_flight > self.max_concurrency
+            ):
+                return httpx.Response(
+                    429,
+                    headers={"Retry-After": "1"},
+                    json={"message": "You have exceeded a secondary rate limit."},
+                )
+
+            if self.clock() >= self.reset_at:
+                self.remaining = self.rate_limit
+                self.reset_at = self.clock() + self.reset_in
+
+            if self.remaining <= 0:
+                return httpx.Response(
+                    403,
+                    headers=self._rate_limit_headers(),
+                    json={"message": "API rate limit exceeded"},
+                )
+            self.remaining -= 1
+            headers = self._rate_limit_headers()
+
+        if request.url.path == "/graphql" and request.method == "POST":
+            body = self._graphql(json.loads(request.content))
+            return httpx.Response(200, headers=headers, json=body)
+
+        if (match := FORK_PATH.match(request.url.path)) and request.method == "POST":
+            return self._fork(match["owner"], match["repo"], headers)
+
+        return httpx.Response(404, headers=headers, json={"message": "Not Found"})
+
+    def _repos(self, login: str) -> dict[str, dict[str, Any]] | None:
+        """
+        The repos `login` owns right now, including finished forks.
+        """
+        now = self.clock()
+        while self.pending_forks and self.pending_forks[0][0] <= now:
+            _, owner, name = self.pending_forks.pop(0)
+            self.accounts[self.login][name] = make_repo(name, parent=f"{owner}/{name}")
+
+        return self.accounts.get(login)
+
+    def _repository(self, owner: str, name: str) -> dict[str, Any] | None:
+        repos = self._repos(owner)
+        return None if repos is None else repos.get(name)
+
+    def _rate_limit(self) -> dict[str, Any]:
+        reset_at = datetime.fromtimestamp(self.reset_at, tz=timezone.utc)
+        return {
+            "cost": 1,
+            "remaining": max(self.remaining, 0),
+            "resetAt": reset_at.strftime(GITHUB_TIME_FORMAT),
+        }
+
+    def _graphql(self, payload: dict[str, Any]) -> dict[str, Any]:
+        query: str = payload["query"]
+        variables: dict[str, Any] = payload.get("variables") or {}
+
+        listings: dict[str, tuple[bool, tuple[str, ...]]] = {
+            queries.GET_REPO_NAMES: (False, ("name",)),
+            queries.GET_REPOS: (
+                False,
+                ("name", "description", "createdAt", "pushedAt", "diskUsage"),
+            ),
+            queries.GET_FORKS: (
+                True,
+                ("name", "diskUsage", "createdAt", "pushedAt", "parent"),
+            ),
+        }
+        if query in listings:
+            forks_only, fields = listings[query]
+            return self._listing(variables, forks_only, fields)
+
+        if query in {queries.CHECK_REPO_EXISTS, queries.GET_REPO_INFO}:
+            repo = self._repository(variables["username"], variables["name"])
+            return {"data": {"repository": repo}}
+
+        if aliases := ALIAS.findall(query):
+            return {
+                "data": {
+                    alias: (
+                        None
+                        if (repo := self._repository(variables[owner], variables[name]))
+                        is None
+                        else {"name": repo["name"]}
+                    )
+                    for alias, owner, name in aliases
+                }
+            }
+
+        return {"errors": [{"message": "FakeGitHub doesn't know this query"}]}
+
+    def _listing(
+        self, variables: dict[str, Any], forks_only: bool, fields: tuple[str, ...]
+    ) -> dict[str, Any]:
+        repos = self._repos(variables["username"])
+        if repos is None:
+            return {
+                "data": {"user": None, "rateLimit": self._rate_limit()},
+                "errors": [{"type": "NOT_FOUND", "message": "Could not resolve user"}],
+            }
+
+        matching = sorted(
+            (repo for repo in repos.values() if repo["parent"] or not forks_only),
+            key=lambda repo: str(repo["name"]).casefold(),
+        )
+
+        start = int(variables.get("after") or 0)
+        end = start + min(int(variables["limit"]), 100)
+        page = matching[start:end]
+
+        return {
+            "data": {
+                "user": {
+                    "repositories": {
+                        "totalCount": len(matching),
+                        "pageInfo": {
+                            "hasNextPage": end < len(matching),
+                            "endCursor": str(end) if page else None,
+                        },
+                        "nodes": [
+                            {field: repo[field] for field in fields} for repo in page
+                        ],
+                    }
+                },
+                "rateLimit": self._rate_limit(),
+            }
+        }
+
+    def _fork(self, owner: str, name: str, headers: dict[str, str]) -> httpx.Response:
+        if self._repository(owner, name) is None:
+            return httpx.Response(404, headers=headers, json={"message": "Not Found"})
+
+        self.accounts.setdefault(self.login, {})
+        self.pending_forks.append((self.clock() + self.fork_delay, owner, name))
+        self.pending_forks.sort()
+        return httpx.Response(
+            202,
+            headers=headers,
+            json={"name": name, "full_name": f"{self.login}/{name}"},
+        )
@@ -0,0 +1,80 @@
+"""
+Local bare repos for the git tests to clone from.
+
+`make_source` builds a small repo with a couple of commits and a second
+branch, and serves it from a bare repo over `file://` so that git goes
+through the same pack protocol it would use for GitHub.
+
+
+Author: Tom Fleet
+Created: 17/10/2026
+"""
+
+from __future__ import annotations
+
+import shutil
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+requires_git = pytest.mark.skipif(shutil.which("git") is None, reason="Needs git")
+
+
+def git(*args: str, cwd: Path) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    )
+    return result.stdout
+
+
+def commit(work: Path, message: str) -> None:
+    git("add", "-A", cwd=work)
+    git(
+        "-c",
+        "user.name=pytoil",
+        "-c",
+        "user.email=pytoil@example.com",
+        "commit",
+        "-q",
+        "-m",
+        message,
+        cwd=work,
+    )
+
+
+def make_source(root: Path, name: str) -> str:
+    """
+    Make a bare repo with a couple of commits and a "feature" branch
+    in it to clone from, returning its url.
+    """
+    work = root.joinpath("work", name)
+    work.mkdir(parents=True)
+    work.joinpath("README.md").write_text(f"# {name}\n", encoding="utf-8")
+    git("init", "-q", cwd=work)
+    commit(work, "Initial")
+
+    work.joinpath("docs").mkdir()
+    work.joinpath("docs", "index.md").write_text("# Docs\n", encoding="utf-8")
+    commit(work, "Docs")
+    git("branch", "feature", cwd=work)
+
+    bare = root.joinpath("sources", f"{name}.git")
+    git("clone", "-q", "--bare", str(work), str(bare), cwd=root)
+    # Partial clones need the server to allow them
+    git("config", "uploadpack.allowFilter", "true", cwd=bare)
+    git("remote", "add", "source", str(bare), cwd=work)
+    return bare.as_uri()
+
+
+def push_commit(root: Path, name: str, file: str) -> None:
+    """
+    Add a commit creating `file` to the source made by `make_source`.
+    """
+    work = root.joinpath("work", name)
+    work.joinpath(file).write_text(f"{file}\n", encoding="utf-8")
+    commit(work, f"Add {file}")
+    git("push", "-q", "source", "HEAD", cwd=work)
@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from typing import Any
+import json
+import time
+from typing import TYPE_CHECKING, Any
 
+import httpx
+import pytest
 from freezegun import freeze_time
 from pytest_httpx import HTTPXMock
 from pytoil import __version__
-from pytoil.api import API
+from pytoil.api import API, queries
+from pytoil.api.api import EXISTS_BATCH_SIZE
+from pytoil.api.cache import ResponseCache
+from pytoil.api.ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def test_headers() -> None:
@@ -18,6 +28,36 @@ def test_headers() -> None:
     }
 
 
+def test_client_is_reused_between_calls() -> None:
+    api = API(username="me", token="notatoken")
+
+    assert api.client is api.client
+    assert api.client.headers["Authorization"] == "token notatoken"
+
+    api.close()
+
+
+def test_close_is_safe_without_requests() -> None:
+    api = API(username="me", token="notatoken")
+
+    api.close()
+    api.close()
+
+
+def test_context_manager_closes_client(
+    httpx_mock: HTTPXMock, fake_repo_exists_true_response: dict[str, Any]
+) -> None:
+    httpx_mock.add_response(json=fake_repo_exists_true_response, status_code=200)
+
+    with API(username="me", token="notatoken") as api:
+        api.check_repo_exists(owner="me", name="pytoil")
+        api.check_repo_exists(owner="me", name="pytoil")
+        client = api.client
+
+    assert client.is_closed
+    assert len(httpx_mock.get_requests()) == 2
+
+
 def test_get_repo_names(
     httpx_mock: HTTPXMock, fake_get_repo_names_response: dict[str, Any]
 ) -> None:
@@ -123,6 +163,10 @@ def test_create_fork(httpx_mock: HTTPXMock) -> None:
 
     api.create_fork(owner="someoneelse", repo="project")
 
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers["Accept"] == "application/vnd.github.v3+json"
+
 
 def test_get_repos(
     httpx_mock: HTTPXMock, fake_get_repos_response: dict[str, Any]
@@ -218,3 +262,286 @@ def test_get_forks(
             "parent": {"nameWithOwner": "brettcannon/python-launcher"},
         },
     ]
+
+
+def _repo_names_page(
+    names: list[str], end_cursor: str | None, has_next_page: bool
+) -> dict[str, Any]:
+    return {
+        "data": {
+            "user": {
+                "repositories": {
+                    "totalCount": 3,
+                    "pageInfo": {
+                        "hasNextPage": has_next_page,
+                        "endCursor": end_cursor,
+                    },
+                    "nodes": [{"name": name} for name in names],
+                }
+            }
+        }
+    }
+
+
+def test_get_repo_names_follows_cursor(httpx_mock: HTTPXMock) -> None:
+    api = API(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(
+        url=api.url, json=_repo_names_page(["one", "two"], "cursor1", True)
+    )
+    httpx_mock.add_response(url=api.url, json=_repo_names_page(["three"], None, False))
+
+    names = api.get_repo_names()
+
+    assert names == {"one", "two", "three"}
+
+    first, second = httpx_mock.get_requests()
+    assert json.loads(first.content)["variables"] == {
+        "username": "me",
+        "limit": 100,
+        "after": None,
+    }
+    assert json.loads(second.content)["variables"]["after"] == "cursor1"
+
+
+def test_iter_repos_stops_early_when_limited(httpx_mock: HTTPXMock) -> None:
+    api = API(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(
+        url=api.url, json=_repo_names_page(["one", "two"], "cursor1", True)
+    )
+
+    pages = api.iter_repos(limit=2)
+    repos = list(pages)
+
+    assert [repo["name"] for repo in repos] == ["one", "two"]
+    assert pages.total == 3
+
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert json.loads(request.content)["variables"]["limit"] == 2
+
+
+def test_check_repos_exist_batches_into_one_request(httpx_mock: HTTPXMock) -> None:
+    api = API(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(
+        url=api.url,
+        json={
+            "data": {"r0": {"name": "pytoil"}, "r1": None, "r2": {"name": "nox"}},
+            "errors": [{"type": "NOT_FOUND", "path": ["r1"]}],
+        },
+    )
+
+    result = api.check_repos_exist(["pytoil", "dave", "wntrblm/nox"])
+
+    assert result == {"pytoil": True, "dave": False, "wntrblm/nox": True}
+
+    request = httpx_mock.get_request()
+    assert request is not None
+    body = json.loads(request.content)
+    assert body["query"] == queries.check_repos_exist(3)
+    assert body["variables"] == {
+        "owner0": "me",
+        "name0": "pytoil",
+        "owner1": "me",
+        "name1": "dave",
+        "owner2": "wntrblm",
+        "name2": "nox",
+    }
+
+
+def test_check_repos_exist_chunks_large_batches(httpx_mock: HTTPXMock) -> None:
+    api = API(username="me", token="definitelynotatoken")
+    names = [f"repo{i}" for i in range(EXISTS_BATCH_SIZE + 1)]
+
+    httpx_mock.add_response(
+        url=api.url,
+        json={"data": {f"r{i}": {"name": "x"} for i in range(EXISTS_BATCH_SIZE)}},
+    )
+    httpx_mock.add_response(url=api.url, json={"data": {"r0": None}})
+
+    result = api.check_repos_exist(names)
+
+    assert len(httpx_mock.get_requests()) == 2
+    assert sum(result.values()) == EXISTS_BATCH_SIZE
+    assert result[names[-1]] is False
+
+
+def test_check_repos_exist_query_shape() -> None:
+    query = queries.check_repos_exist(2)
+
+    assert (
+        "$owner0: String!, $name0: String!, $owner1: String!, $name1: String!" in query
+    )
+    assert "r0: repository(owner: $owner0, name: $name0)" in query
+    assert "r1: repository(owner: $owner1, name: $name1)" in query
+
+
+def test_repo_listing_is_served_from_cache(
+    httpx_mock: HTTPXMock, fake_get_repo_names_response: dict[str, Any], tmp_path: Path
+) -> None:
+    httpx_mock.add_response(json=fake_get_repo_names_response, status_code=200)
+    cache = ResponseCache(path=tmp_path)
+
+    with API(username="me", token="notatoken", cache=cache) as api:
+        first = api.get_repo_names()
+
+    with API(username="me", token="notatoken", cache=cache) as api:
+        second = api.get_repo_names()
+
+    assert first == second
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_refresh_bypasses_cache(
+    httpx_mock: HTTPXMock, fake_get_repo_names_response: dict[str, Any], tmp_path: Path
+) -> None:
+    httpx_mock.add_response(json=fake_get_repo_names_response, status_code=200)
+
+    with API(username="me", token="notatoken", cache=ResponseCache(tmp_path)) as api:
+        api.get_repo_names()
+
+    cache = ResponseCache(path=tmp_path, refresh=True)
+    with API(username="me", token="notatoken", cache=cache) as api:
+        api.get_repo_names()
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_existence_checks_are_not_cached(
+    httpx_mock: HTTPXMock,
+    fake_repo_exists_true_response: dict[str, Any],
+    tmp_path: Path,
+) -> None:
+    httpx_mock.add_response(json=fake_repo_exists_true_response, status_code=200)
+
+    with API(username="me", token="notatoken", cache=ResponseCache(tmp_path)) as api:
+        api.check_repo_exists(owner="me", name="pytoil")
+        api.check_repo_exists(owner="me", name="pytoil")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def no_wait() -> RateLimiter:
+    return RateLimiter(backoff=0, max_delay=0)
+
+
+def test_query_retries_throttled_then_succeeds(
+    httpx_mock: HTTPXMock, fake_repo_exists_true_response: dict[str, Any]
+) -> None:
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "1"})
+    httpx_mock.add_response(status_code=502)
+    httpx_mock.add_response(
+        json=fake_repo_exists_true_response,
+        status_code=200,
+        headers={"X-RateLimit-Remaining": "4998"},
+    )
+
+    with API(username="me", token="notatoken", limiter=no_wait()) as api:
+        assert api.check_repo_exists(owner="me", name="pytoil") is True
+        assert api.remaining == 4998
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_query_gives_up_after_retries(httpx_mock: HTTPXMock) -> None:
+    for _ in range(3):
+        httpx_mock.add_response(status_code=503)
+
+    limiter = RateLimiter(retries=2, backoff=0, max_delay=0)
+    api = API(username="me", token="notatoken", limiter=limiter)
+    with api, pytest.raises(httpx.HTTPStatusError):
+        api.check_repo_exists(owner="me", name="pytoil")
+
+    assert len(httpx_mock.get_requests()) == 3
+
+
+def test_query_retries_transport_errors(
+    httpx_mock: HTTPXMock, fake_repo_exists_true_response: dict[str, Any]
+) -> None:
+    httpx_mock.add_exception(httpx.ConnectError("connection reset"))
+    httpx_mock.add_response(json=fake_repo_exists_true_response, status_code=200)
+
+    with API(username="me", token="notatoken", limiter=no_wait()) as api:
+        assert api.check_repo_exists(owner="me", name="pytoil") is True
+
+
+def test_query_does_not_retry_auth_errors(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=401)
+
+    api = API(username="me", token="notatoken", limiter=no_wait())
+    with api, pytest.raises(httpx.HTTPStatusError):
+        api.check_repo_exists(owner="me", name="pytoil")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_fork_is_not_retried_on_server_error(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=502)
+
+    api = API(username="me", token="notatoken", limiter=no_wait())
+    with api, pytest.raises(httpx.HTTPStatusError):
+        api.create_fork(owner="someone", repo="project")
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_fork_is_retried_when_throttled(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=429)
+    httpx_mock.add_response(status_code=202)
+
+    with API(username="me", token="notatoken", limiter=no_wait()) as api:
+        api.create_fork(owner="someone", repo="project")
+
+    assert len(httpx_mock.get_requests()) == 2
+
+
+def test_exhausted_budget_fails_without_waiting(
+    httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    reset = str(int(time.time()) + 3600)
+    httpx_mock.add_response(
+        status_code=202,
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+    )
+    httpx_mock.add_response(
+        status_code=403,
+        headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset},
+    )
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+
+    with API(username="me", token="notatoken") as api:
+        api.create_fork(owner="someone", repo="project")
+        with pytest.raises(httpx.HTTPStatusError):
+            api.create_fork(owner="someone", repo="other")
+
+    assert sleeps == []
+
+
+def test_graphql_rate_limit_is_recorded(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json={
+            "data": {
+                "user": {
+                    "repositories": {
+                        "totalCount": 1,
+                        "pageInfo": {"hasNextPage": False, "endCursor": "a"},
+                        "nodes": [{"name": "pytoil"}],
+                    }
+                },
+                "rateLimit": {
+                    "cost": 1,
+                    "remaining": 4321,
+                    "resetAt": "2023-11-14T23:13:20Z",
+                },
+            }
+        },
+        status_code=200,
+    )
+
+    with API(username="me", token="notatoken") as api:
+        assert api.get_repo_names() == {"pytoil"}
+        assert api.remaining == 4321
+        assert api.limiter.cost == 1
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from freezegun import freeze_time
+from pytest_httpx import HTTPXMock
+from pytoil.api import AsyncAPI, RateLimiter, bounded_gather
+
+
+def test_async_get_repo_names(
+    httpx_mock: HTTPXMock, fake_get_repo_names_response: dict[str, Any]
+) -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(
+        url=api.url, json=fake_get_repo_names_response, status_code=200
+    )
+
+    async def run() -> set[str]:
+        async with api:
+            return await api.get_repo_names()
+
+    assert asyncio.run(run()) == {
+        "dingle",
+        "dangle",
+        "dongle",
+        "a_cool_project",
+        "another",
+        "yetanother",
+        "hello",
+    }
+
+
+def test_async_get_forks(
+    httpx_mock: HTTPXMock, fake_get_forks_response: dict[str, Any]
+) -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(url=api.url, json=fake_get_forks_response, status_code=200)
+
+    async def run() -> list[dict[str, Any]]:
+        async with api:
+            return await api.get_forks()
+
+    forks = asyncio.run(run())
+
+    assert [fork["name"] for fork in forks] == ["nox", "python-launcher"]
+
+
+def test_async_check_repo_exists(
+    httpx_mock: HTTPXMock,
+    fake_repo_exists_true_response: dict[str, Any],
+    fake_repo_exists_false_response: dict[str, Any],
+) -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(url=api.url, json=fake_repo_exists_true_response)
+    httpx_mock.add_response(url=api.url, json=fake_repo_exists_false_response)
+
+    async def run() -> list[bool]:
+        async with api:
+            return [
+                await api.check_repo_exists(owner="me", name="pytoil"),
+                await api.check_repo_exists(owner="me", name="dave"),
+            ]
+
+    assert asyncio.run(run()) == [True, False]
+
+
+@freeze_time("2022-01-16")
+def test_async_get_repo_info(
+    httpx_mock: HTTPXMock, fake_repo_info_response: dict[str, Any]
+) -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(url=api.url, json=fake_repo_info_response, status_code=200)
+
+    async def run() -> dict[str, Any] | None:
+        async with api:
+            return await api.get_repo_info(name="pytoil")
+
+    info = asyncio.run(run())
+
+    assert info is not None
+    assert info["Name"] == "pytoil"
+    assert info["License"] == "Apache License 2.0"
+    assert info["Updated"] == "19 days ago"
+
+
+def test_async_create_fork(httpx_mock: HTTPXMock) -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(
+        url="https://api.github.com/repos/someoneelse/project/forks", status_code=202
+    )
+
+    async def run() -> None:
+        async with api:
+            await api.create_fork(owner="someoneelse", repo="project")
+
+    asyncio.run(run())
+
+    request = httpx_mock.get_request()
+    assert request is not None
+    assert request.headers["Accept"] == "application/vnd.github.v3+json"
+
+
+def test_async_client_closed_on_exit() -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    async def run() -> bool:
+        async with api:
+            client = api.client
+        return client.is_closed
+
+    assert asyncio.run(run()) is True
+
+
+def test_bounded_gather_limits_concurrency_and_keeps_order() -> None:
+    running = 0
+    peak = 0
+
+    async def work(n: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return n * 2
+
+    results = asyncio.run(bounded_gather((work(n) for n in range(10)), limit=3))
+
+    assert results == [n * 2 for n in range(10)]
+    assert peak == 3
+
+
+def test_async_check_repos_exist(httpx_mock: HTTPXMock) -> None:
+    api = AsyncAPI(username="me", token="definitelynotatoken")
+
+    httpx_mock.add_response(
+        url=api.url, json={"data": {"r0": {"name": "pytoil"}, "r1": None}}
+    )
+
+    async def run() -> dict[str, bool]:
+        async with api:
+            return await api.check_repos_exist(["pytoil", "someoneelse/dave"])
+
+    assert asyncio.run(run()) == {"pytoil": True, "someoneelse/dave": False}
+
+
+def test_async_query_retries_throttled_then_succeeds(
+    httpx_mock: HTTPXMock, fake_repo_exists_true_response: dict[str, Any]
+) -> None:
+    httpx_mock.add_response(status_code=429)
+    httpx_mock.add_response(json=fake_repo_exists_true_response, status_code=200)
+
+    async def run() -> bool:
+        limiter = RateLimiter(backoff=0, max_delay=0)
+        async with AsyncAPI(username="me", token="notatoken", limiter=limiter) as api:
+            return await api.check_repo_exists(owner="me", name="pytoil")
+
+    assert asyncio.run(run()) is True
+    assert len(httpx_mock.get_requests()) == 2
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from pytoil.api.cache import ResponseCache
+from pytoil.exceptions import ResponseNotCachedError
+
+BODY = {"data": {"user": {"repositories": {"nodes": [{"name": "pytoil"}]}}}}
+
+
+def test_key_is_stable_and_depends_on_request() -> None:
+    key = ResponseCache.key("url", "token", "query", {"a": 1, "b": 2})
+
+    assert key == ResponseCache.key("url", "token", "query", {"b": 2, "a": 1})
+    assert key != ResponseCache.key("url", "other", "query", {"a": 1, "b": 2})
+    assert key != ResponseCache.key("url", "token", "query", {"a": 2, "b": 2})
+    assert "token" not in key
+
+
+def test_store_then_load(tmp_path: Path) -> None:
+    cache = ResponseCache(path=tmp_path.joinpath("api"))
+
+    cache.store("abc", BODY)
+
+    assert cache.load("abc") == BODY
+    assert not list(tmp_path.joinpath("api").glob("*.tmp"))
+
+
+def test_load_missing_returns_none(tmp_path: Path) -> None:
+    cache = ResponseCache(path=tmp_path)
+
+    assert cache.load("missing") is None
+
+
+def test_load_stale_returns_none(tmp_path: Path) -> None:
+    cache = ResponseCache(path=tmp_path, ttl=60)
+    cache.store("abc", BODY)
+
+    later = time.time() + 61
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(time, "time", lambda: later)
+        assert cache.load("abc") is None
+
+
+def test_refresh_ignores_cached(tmp_path: Path) -> None:
+    ResponseCache(path=tmp_path).store("abc", BODY)
+
+    assert ResponseCache(path=tmp_path, refresh=True).load("abc") is None
+
+
+def test_offline_serves_stale(tmp_path: Path) -> None:
+    ResponseCache(path=tmp_path, ttl=0).store("abc", BODY)
+
+    assert ResponseCache(path=tmp_path, ttl=0).load("abc") is None
+    assert ResponseCache(path=tmp_path, ttl=0, offline=True).load("abc") == BODY
+
+
+def test_offline_raises_on_miss(tmp_path: Path) -> None:
+    cache = ResponseCache(path=tmp_path, offline=True)
+
+    with pytest.raises(ResponseNotCachedError):
+        cache.load("missing")
+
+
+def test_corrupt_entry_is_a_miss(tmp_path: Path) -> None:
+    tmp_path.joinpath("abc.json").write_text("{not json", encoding="utf-8")
+    cache = ResponseCache(path=tmp_path)
+
+    assert cache.load("abc") is None
+
+
+def test_clear(tmp_path: Path) -> None:
+    cache = ResponseCache(path=tmp_path.joinpath("api"))
+    cache.store("abc", BODY)
+    cache.store("def", BODY)
+
+    cache.clear()
+
+    assert cache.load("abc") is None
+    assert os.listdir(tmp_path.joinpath("api")) == []
+
+
+def test_clear_missing_dir(tmp_path: Path) -> None:
+    ResponseCache(path=tmp_path.joinpath("nope")).clear()
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import subprocess
+from typing import TYPE_CHECKING
+
+import pytest
+from pytoil.exceptions import GitNotInstalledError
+from pytoil.git import CloneEngine, CloneJob, CloneProgress, CloneResult, Git
+from pytoil.git.clone import parse_progress
+from pytoil.git.modes import CLONE_MODES, clone_options
+
+from tests.git_sources import make_source, requires_git
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize(
+    ("mode", "depth", "want"),
+    [
+        ("full", 1, []),
+        ("shallow", 1, ["--depth", "1", "--single-branch"]),
+        ("shallow", 10, ["--depth", "10", "--single-branch"]),
+        ("blobless", 1, ["--filter=blob:none"]),
+        ("treeless", 1, ["--filter=tree:0"]),
+        ("sparse", 1, ["--filter=blob:none", "--sparse"]),
+    ],
+)
+def test_clone_options(mode: str, depth: int, want: list[str]) -> None:
+    assert clone_options(mode, depth) == want
+
+
+def test_clone_options_bad_mode() -> None:
+    with pytest.raises(ValueError, match="Unknown clone mode 'deep'"):
+        clone_options("deep")
+
+
+def test_clone_options_bad_depth() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        clone_options("shallow", depth=0)
+
+
+@pytest.mark.parametrize(
+    ("line", "want"),
+    [
+        (
+            "Receiving objects:  45% (450/1000), 1.50 MiB | 2.00 MiB/s",
+            CloneProgress("Receiving objects", 45, 1572864),
+        ),
+        (
+            "Receiving objects: 100% (3/3), done.",
+            CloneProgress("Receiving objects", 100, None),
+        ),
+        (
+            "Receiving objects: 100% (12/12), 512 bytes | 512.00 KiB/s, done.",
+            CloneProgress("Receiving objects", 100, 512),
+        ),
+        (
+            "remote: Counting objects:  10% (1/10)",
+            CloneProgress("Counting objects", 10, None),
+        ),
+        (
+            "Resolving deltas:  50% (2/4)",
+            CloneProgress("Resolving deltas", 50, None),
+        ),
+        ("Cloning into 'pytoil'...", None),
+        ("fatal: repository 'nope' does not exist", None),
+    ],
+)
+def test_parse_progress(line: str, want: CloneProgress | None) -> None:
+    assert parse_progress(line) == want
+
+
+@pytest.mark.parametrize(
+    ("progress", "fraction"),
+    [
+        (CloneProgress("Counting objects", 50), 0.0),
+        (CloneProgress("Receiving objects", 50), 0.35),
+        (CloneProgress("Resolving deltas", 100), 0.9),
+        (CloneProgress("Updating files", 100), 1.0),
+    ],
+)
+def test_progress_fraction(progress: CloneProgress, fraction: float) -> None:
+    assert progress.fraction == pytest.approx(fraction)
+
+
+@pytest.mark.parametrize(
+    ("returncode", "stderr", "ok", "cancelled", "error"),
+    [
+        (0, "", True, False, ""),
+        (None, "", False, True, "Cancelled"),
+        (-15, "", False, True, "Cancelled"),
+        (
+            128,
+            "Cloning into 'x'...\nfatal: not found\n",
+            False,
+            False,
+            "fatal: not found",
+        ),
+        (1, "", False, False, "git exited with 1"),
+    ],
+)
+def test_clone_result(
+    tmp_path: Path,
+    returncode: int | None,
+    stderr: str,
+    ok: bool,
+    cancelled: bool,
+    error: str,
+) -> None:
+    job = CloneJob(name="x", url="https://example.com/x.git", dest=tmp_path)
+    result = CloneResult(job=job, returncode=returncode, stderr=stderr)
+
+    assert result.ok is ok
+    assert result.cancelled is cancelled
+    assert result.error == error
+
+
+def test_clone_engine_needs_git() -> None:
+    with pytest.raises(GitNotInstalledError):
+        CloneEngine(git=None)
+
+
+@requires_git
+def test_clone_engine_clones_everything(tmp_path: Path) -> None:
+    jobs = [
+        CloneJob(
+            name=name,
+            url=make_source(tmp_path, name),
+            dest=tmp_path.joinpath("projects", name),
+        )
+        for name in ("one", "two", "three")
+    ]
+    done: list[str] = []
+
+    engine = CloneEngine(
+        concurrency=2, on_done=lambda result: done.append(result.job.name)
+    )
+    results = engine.run(jobs)
+
+    assert [result.job for result in results] == jobs
+    assert all(result.ok for result in results)
+    assert sorted(done) == ["one", "three", "two"]
+    assert engine.completed == pytest.approx(3)
+    assert engine.cancelled is False
+    for job in jobs:
+        assert (
+            job.dest.joinpath("README.md").read_text(encoding="utf-8")
+            == f"# {job.name}\n"
+        )
+
+
+@requires_git
+def test_clone_engine_reports_failures(tmp_path: Path) -> None:
+    good = CloneJob(
+        name="good",
+        url=make_source(tmp_path, "good"),
+        dest=tmp_path.joinpath("projects", "good"),
+    )
+    bad = CloneJob(
+        name="bad",
+        url=tmp_path.joinpath("sources", "missing.git").as_uri(),
+        dest=tmp_path.joinpath("projects", "bad"),
+    )
+
+    results = CloneEngine().run([good, bad])
+
+    assert results[0].ok
+    assert not results[1].ok
+    assert not results[1].cancelled
+    assert results[1].returncode == 128
+    assert "fatal" in results[1].error
+    assert not bad.dest.exists()
+
+
+def test_clone_engine_survives_errors(tmp_path: Path) -> None:
+    done: list[CloneResult] = []
+    engine = CloneEngine(
+        git=str(tmp_path.joinpath("not-git")), concurrency=2, on_done=done.append
+    )
+
+    results = engine.run(
+        CloneJob(name=name, url=f"https://example.com/{name}.git", dest=tmp_path / name)
+        for name in ("one", "two")
+    )
+
+    assert [result.ok for result in results] == [False, False]
+    assert not any(result.cancelled for result in results)
+    assert results[0].error.startswith("error: [Errno")
+    assert len(done) == 2
+
+
+@requires_git
+def test_clone_engine_cancel_skips_pending(tmp_path: Path) -> None:
+    jobs = [
+        CloneJob(
+            name=name,
+            url=make_source(tmp_path, name),
+            dest=tmp_path.joinpath("projects", name),
+        )
+        for name in ("one", "two", "three")
+    ]
+
+    def cancel_after_first(result: CloneResult) -> None:
+        if result.ok:
+            engine.cancel()
+
+    engine = CloneEngine(concurrency=1, on_done=cancel_after_first)
+    results = engine.run(jobs)
+
+    assert results[0].ok
+    assert [result.cancelled for result in results[1:]] == [True, True]
+    assert engine.cancelled is True
+    assert not jobs[1].dest.exists()
+
+
+@requires_git
+@pytest.mark.parametrize(
+    ("mode", "state"),
+    [
+        ("full", set()),
+        ("shallow", {"shallow"}),
+        ("blobless", {"partial"}),
+        ("treeless", {"partial"}),
+        ("sparse", {"partial", "sparse"}),
+    ],
+)
+def test_clone_modes_and_unshallow(tmp_path: Path, mode: str, state: set[str]) -> None:
+    assert mode in CLONE_MODES
+    url = make_source(tmp_path, "project")
+    dest = tmp_path.joinpath("projects", "project")
+    git = Git()
+
+    (result,) = CloneEngine().run(
+        [CloneJob(name="project", url=url, dest=dest, options=clone_options(mode))]
+    )
+
+    assert result.ok, result.stderr
+    assert git.clone_state(dest) == state
+    assert dest.joinpath("README.md").exists()
+    assert dest.joinpath("docs", "index.md").exists() is (mode != "sparse")
+
+    assert git.unshallow(dest) == 0
+
+    assert git.clone_state(dest) == set()
+    assert dest.joinpath("docs", "index.md").exists()
+    log = subprocess.run(
+        ["git", "log", "--oneline", "origin/feature"],
+        cwd=dest,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert len(log.stdout.splitlines()) == 2
@@ -23,6 +23,15 @@ def test_config_init_defaults() -> None:
     assert config.conda_bin == defaults.CONDA_BIN
     assert config.common_packages == defaults.COMMON_PACKAGES
     assert config.git == defaults.GIT
+    assert config.cache_ttl == defaults.CACHE_TTL
+    assert config.follow_symlinks == defaults.FOLLOW_SYMLINKS
+    assert config.clone_mode == defaults.CLONE_MODE
+    assert config.clone_depth == defaults.CLONE_DEPTH
+    assert config.mirror_cache_size == defaults.MIRROR_CACHE_SIZE
+    assert config.undo_window == defaults.UNDO_WINDOW
+    assert config.wheelhouse == defaults.WHEELHOUSE
+    assert config.installer == defaults.INSTALLER
+    assert config.venv_templates == defaults.VENV_TEMPLATES
 
 
 def test_config_init_passed() -> None:
@@ -34,6 +43,15 @@ def test_config_init_passed() -> None:
         conda_bin="mamba",
         common_packages=["black", "mypy", "flake8"],
         git=False,
+        cache_ttl=60,
+        follow_symlinks=False,
+        clone_mode="blobless",
+        clone_depth=5,
+        mirror_cache_size=0,
+        undo_window=60,
+        wheelhouse=False,
+        installer="pip",
+        venv_templates=False,
     )
 
     assert config.projects_dir == Path("some/dir")
@@ -43,6 +61,15 @@ def test_config_init_passed() -> None:
     assert config.conda_bin == "mamba"
     assert config.common_packages == ["black", "mypy", "flake8"]
     assert config.git is False
+    assert config.cache_ttl == 60
+    assert config.follow_symlinks is False
+    assert config.clone_mode == "blobless"
+    assert config.clone_depth == 5
+    assert config.mirror_cache_size == 0
+    assert config.undo_window == 60
+    assert config.wheelhouse is False
+    assert config.installer == "pip"
+    assert config.venv_templates is False
 
 
 def test_config_helper() -> None:
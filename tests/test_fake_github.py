@@ -0,0 +1,200 @@
+"""
+Integration tests running the API clients against `FakeGitHub`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from pytoil.api import API, AsyncAPI, RateLimiter
+
+from tests.fake_github import FakeGitHub
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_repo_names_walks_every_page() -> None:
+    github = FakeGitHub()
+    names = github.add_account("me", repos=2500)
+
+    with API(username="me", token="token", transport=github.transport()) as api:
+        assert api.get_repo_names() == set(names)
+
+    assert len(github.requests) == 25
+
+
+def test_iter_repos_reports_total_and_stops_early() -> None:
+    github = FakeGitHub()
+    github.add_account("me", repos=1000)
+
+    with API(username="me", token="token", transport=github.transport()) as api:
+        pages = api.iter_repos(limit=150)
+        repos = list(pages)
+
+    assert len(repos) == 150
+    assert pages.total == 1000
+    assert len(github.requests) == 2
+
+
+def test_get_forks_only_returns_forks() -> None:
+    github = FakeGitHub()
+    github.add_account("me", repos=10, forks=3)
+
+    with API(username="me", token="token", transport=github.transport()) as api:
+        forks = api.get_forks()
+
+    assert len(forks) == 3
+    assert all(
+        fork["parent"]["nameWithOwner"].startswith("upstream/") for fork in forks
+    )
+
+
+def test_check_repos_exist_batches() -> None:
+    github = FakeGitHub()
+    names = github.add_account("me", repos=120)
+    github.add_account("someone", repos=1, prefix="theirs")
+
+    wanted = [*names, "missing", "someone/theirs-00000", "someone/nope"]
+    with API(username="me", token="token", transport=github.transport()) as api:
+        exists = api.check_repos_exist(wanted)
+
+    assert exists == {
+        **{name: True for name in names},
+        "missing": False,
+        "someone/theirs-00000": True,
+        "someone/nope": False,
+    }
+    assert len(github.requests) == 3
+
+
+def test_get_repo_info() -> None:
+    github = FakeGitHub()
+    github.add_account("me", repos=1)
+
+    with API(username="me", token="token", transport=github.transport()) as api:
+        info = api.get_repo_info("repo-00000")
+        missing = api.get_repo_info("nope")
+
+    assert info is not None
+    assert info["Name"] == "repo-00000"
+    assert info["License"] == "MIT License"
+    assert missing is None
+
+
+def test_fork_completes_asynchronously() -> None:
+    clock = FakeClock()
+    github = FakeGitHub(fork_delay=5, clock=clock)
+    github.add_account("me")
+    github.add_account("someone", repos=1)
+
+    with API(username="me", token="token", transport=github.transport()) as api:
+        api.create_fork(owner="someone", repo="repo-00000")
+        assert not api.check_repo_exists(owner="me", name="repo-00000")
+
+        clock.now += 5
+        assert api.check_repo_exists(owner="me", name="repo-00000")
+        assert api.get_forks()[0]["parent"]["nameWithOwner"] == "someone/repo-00000"
+
+
+def test_fork_of_missing_repo_is_404() -> None:
+    github = FakeGitHub()
+    github.add_account("me")
+
+    api = API(username="me", token="token", transport=github.transport())
+    with api, pytest.raises(httpx.HTTPStatusError) as err:
+        api.create_fork(owner="someone", repo="nope")
+
+    assert err.value.response.status_code == 404
+
+
+def test_budget_is_reported() -> None:
+    github = FakeGitHub(rate_limit=100)
+    github.add_account("me", repos=250)
+
+    with API(username="me", token="token", transport=github.transport()) as api:
+        api.get_repo_names()
+        assert api.remaining == 97
+
+
+def test_rate_limit_exhaustion_fails_fast() -> None:
+    github = FakeGitHub(rate_limit=2, reset_in=3600)
+    github.add_account("me", repos=1)
+
+    limiter = RateLimiter(backoff=0, max_delay=0, low_budget=0)
+    with API(
+        username="me", token="token", limiter=limiter, transport=github.transport()
+    ) as api:
+        api.check_repo_exists(owner="me", name="repo-00000")
+        api.check_repo_exists(owner="me", name="repo-00000")
+        with pytest.raises(httpx.HTTPStatusError) as err:
+            api.check_repo_exists(owner="me", name="repo-00000")
+
+    assert err.value.response.status_code == 403
+    assert len(github.requests) == 3
+
+
+def test_rate_limit_waits_for_imminent_reset() -> None:
+    clock = FakeClock()
+    github = FakeGitHub(rate_limit=1, reset_in=1, clock=clock)
+    github.add_account("me", repos=1)
+
+    def tick() -> float:
+        # Every time the limiter looks at the clock a little time passes
+        clock.now += 0.5
+        return clock.now
+
+    limiter = RateLimiter(backoff=0, max_delay=2, low_budget=0, clock=tick)
+    with API(
+        username="me", token="token", limiter=limiter, transport=github.transport()
+    ) as api:
+        assert api.check_repo_exists(owner="me", name="repo-00000")
+        assert api.check_repo_exists(owner="me", name="repo-00000")
+
+
+def test_unauthenticated() -> None:
+    github = FakeGitHub()
+    transport = github.transport()
+
+    with httpx.Client(transport=transport) as client:
+        assert client.post("https://api.github.com/graphql").status_code == 401
+
+
+def test_async_check_repos_exist_runs_concurrently() -> None:
+    github = FakeGitHub(latency=0.05)
+    names = github.add_account("me", repos=500)
+
+    async def run() -> dict[str, bool]:
+        async with AsyncAPI(
+            username="me", token="token", transport=github.async_transport()
+        ) as api:
+            return await api.check_repos_exist(names)
+
+    assert all(asyncio.run(run()).values())
+    assert len(github.requests) == 10
+    assert github.max_in_flight == 5
+
+
+def test_async_secondary_limit_is_retried() -> None:
+    github = FakeGitHub(latency=0.01, max_concurrency=2)
+    names = github.add_account("me", repos=500)
+
+    async def run() -> dict[str, bool]:
+        limiter = RateLimiter(backoff=0, max_delay=0, retries=10)
+        async with AsyncAPI(
+            username="me",
+            token="token",
+            limiter=limiter,
+            transport=github.async_transport(),
+        ) as api:
+            return await api.check_repos_exist(names)
+
+    assert all(asyncio.run(run()).values())
+    assert len(github.requests) > 10
@@ -80,6 +80,27 @@ def test_git_clone(
     )
 
 
+def test_git_clone_with_options(mocker: MockerFixture) -> None:
+    mock = mocker.patch("pytoil.git.git.subprocess.run", autospec=True)
+    mock.return_value.returncode = 0
+
+    git = Git(git="notgit")
+
+    returncode = git.clone(
+        url="https://nothub.com/some/project.git",
+        cwd=Path("somewhere"),
+        options=["--depth", "1"],
+    )
+
+    assert returncode == 0
+    mock.assert_called_once_with(
+        ["notgit", "clone", "--depth", "1", "https://nothub.com/some/project.git"],
+        cwd=Path("somewhere"),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
 def test_instantiation_raises_if_git_not_insalled() -> None:
     with pytest.raises(GitNotInstalledError):
         Git(git=None)
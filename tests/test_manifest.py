@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+import rtoml
+from pytoil.config import Config
+from pytoil.environments import Poetry
+from pytoil.repo import ProjectManifest, Repo
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+POETRY = """\
+[build-system]
+requires = ["poetry-core>=1.0.0"]
+build-backend = "poetry.core.masonry.api"
+"""
+
+FLIT = """\
+[build-system]
+requires = ["flit_core >=3.2,<4"]
+build-backend = " Flit_Core.BuildAPI "
+"""
+
+
+def bump_mtime(path: Path) -> None:
+    # Filesystem timestamps can be coarse, make sure the change is visible
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    tmp_path.joinpath("pyproject.toml").write_text(POETRY, encoding="utf-8")
+    tmp_path.joinpath("README.md").touch()
+    return tmp_path
+
+
+def test_manifest_lists_files(project: Path) -> None:
+    manifest = ProjectManifest.load(project)
+
+    assert manifest.root == project
+    assert manifest.files == {"pyproject.toml", "README.md"}
+    assert manifest.has("README.md")
+    assert not manifest.has("setup.py")
+
+
+def test_manifest_build_backend(project: Path) -> None:
+    assert ProjectManifest.load(project).build_backend == "poetry.core.masonry.api"
+
+
+def test_manifest_build_backend_is_normalised(tmp_path: Path) -> None:
+    tmp_path.joinpath("pyproject.toml").write_text(FLIT, encoding="utf-8")
+
+    assert ProjectManifest.load(tmp_path).build_backend == "flit_core.buildapi"
+
+
+def test_manifest_missing_project() -> None:
+    manifest = ProjectManifest.load(Path("nowhere"))
+
+    assert manifest.files == frozenset()
+    assert manifest.pyproject == {}
+    assert manifest.build_backend is None
+
+
+def test_manifest_is_memoised(project: Path) -> None:
+    assert ProjectManifest.load(project) is ProjectManifest.load(project)
+
+
+def test_manifest_reloads_when_files_change(project: Path) -> None:
+    before = ProjectManifest.load(project)
+
+    project.joinpath("setup.py").touch()
+    bump_mtime(project)
+
+    after = ProjectManifest.load(project)
+    assert after is not before
+    assert after.has("setup.py")
+
+
+def test_manifest_reloads_when_pyproject_changes(project: Path) -> None:
+    assert ProjectManifest.load(project).build_backend == "poetry.core.masonry.api"
+
+    pyproject = project.joinpath("pyproject.toml")
+    pyproject.write_text(FLIT, encoding="utf-8")
+    bump_mtime(pyproject)
+
+    assert ProjectManifest.load(project).build_backend == "flit_core.buildapi"
+
+
+def test_manifest_malformed_pyproject(tmp_path: Path) -> None:
+    tmp_path.joinpath("pyproject.toml").write_text("[not valid", encoding="utf-8")
+
+    with pytest.raises(rtoml.TomlParsingError):
+        ProjectManifest.load(tmp_path).pyproject  # noqa: B018
+
+
+def test_dispatch_env_parses_pyproject_once(
+    project: Path, mocker: MockerFixture
+) -> None:
+    loads = mocker.spy(rtoml, "loads")
+    repo = Repo(owner="me", name="test", local_path=project)
+
+    env = repo.dispatch_env(Config())
+
+    assert isinstance(env, Poetry)
+    assert loads.call_count == 1
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from pytoil.exceptions import GitNotInstalledError
+from pytoil.git import CloneEngine, CloneJob, MirrorCache
+from pytoil.git.mirror import IN_USE, LAST_USED
+
+from tests.git_sources import git, make_source, push_commit, requires_git
+
+
+def test_mirror_cache_needs_git(tmp_path: Path) -> None:
+    with pytest.raises(GitNotInstalledError):
+        MirrorCache(root=tmp_path, git=None)
+
+
+def test_mirror_cache_repr(tmp_path: Path) -> None:
+    cache = MirrorCache(root=tmp_path, max_size=10, git="git")
+    assert repr(cache) == f"MirrorCache(root={tmp_path!r}, max_size=10, git='git')"
+
+
+def test_mirror_path_is_stable_and_distinct(tmp_path: Path) -> None:
+    cache = MirrorCache(root=tmp_path, git="git")
+    one = cache.path("https://github.com/me/project.git")
+    assert one == cache.path("https://github.com/me/project.git")
+    assert one.parent == tmp_path
+    assert one.name.endswith("-project.git")
+    assert one != cache.path("https://github.com/you/project.git")
+
+
+@requires_git
+def test_reference_creates_mirror(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+
+    reference = cache.reference(url)
+    mirror = cache.path(url)
+
+    assert reference == ["--reference", str(mirror), "--dissociate"]
+    assert mirror.joinpath(LAST_USED).exists()
+    assert git("rev-parse", "--is-bare-repository", cwd=mirror).strip() == "true"
+    assert "feature" in git("branch", cwd=mirror)
+    # No temporary clones left lying around
+    assert cache.mirrors() == [mirror]
+
+
+@requires_git
+def test_reference_bad_url(tmp_path: Path) -> None:
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+    url = tmp_path.joinpath("missing.git").as_uri()
+
+    assert cache.reference(url) == []
+    assert cache.mirrors() == []
+
+
+@requires_git
+def test_reference_clone_is_dissociated(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+    dest = tmp_path.joinpath("clone")
+
+    git("clone", "-q", *cache.reference(url), url, str(dest), cwd=tmp_path)
+    cache.release(url)
+    cache.clear()
+
+    assert not dest.joinpath(".git", "objects", "info", "alternates").exists()
+    git("fsck", "--no-progress", cwd=dest)
+    assert "Docs" in git("log", "--oneline", cwd=dest)
+
+
+@requires_git
+def test_update_fetches_new_commits(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+    mirror = cache.update(url)
+    assert mirror is not None
+
+    push_commit(tmp_path, "project", "new.txt")
+    assert cache.update(url) == mirror
+
+    assert "Add new.txt" in git("log", "--oneline", "--all", cwd=mirror)
+
+
+@requires_git
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    urls = [make_source(tmp_path, f"project-{i}") for i in range(3)]
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+    for i, url in enumerate(urls):
+        mirror = cache.update(url)
+        assert mirror is not None
+        cache.release(url)
+        os.utime(mirror.joinpath(LAST_USED), (1000 + i, 1000 + i))
+
+    # Room for 2 but not 3
+    cache.max_size = cache.size() * 3 // 4
+    evicted = cache.evict()
+
+    assert evicted == [cache.path(urls[0])]
+    assert cache.mirrors() == [cache.path(urls[1]), cache.path(urls[2])]
+
+
+@requires_git
+def test_evict_skips_mirrors_in_use(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"), max_size=0)
+    cache.update(url)
+
+    assert cache.evict() == []
+
+    cache.release(url)
+    assert cache.evict() == [cache.path(url)]
+    assert cache.size() == 0
+
+
+@requires_git
+def test_evict_counts_every_user_of_a_mirror(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"), max_size=0)
+    cache.update(url)
+    cache.update(url)
+
+    cache.release(url)
+    assert cache.evict() == []
+
+    cache.release(url)
+    assert cache.evict() == [cache.path(url)]
+
+
+@requires_git
+def test_evict_skips_mirrors_used_by_other_processes(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"), max_size=0)
+    mirror = cache.update(url)
+    assert mirror is not None
+    cache.release(url)
+    assert list(mirror.joinpath(IN_USE).iterdir()) == []
+
+    # Another pytoil, mid clone
+    other = mirror.joinpath(IN_USE, "999999999")
+    other.touch()
+    assert cache.evict() == []
+
+    # One that never finished
+    os.utime(other, (1000, 1000))
+    assert cache.evict() == [mirror]
+
+
+@requires_git
+def test_clone_engine_uses_mirrors(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+    engine = CloneEngine(mirrors=cache)
+
+    (result,) = engine.run(
+        [CloneJob(name="project", url=url, dest=tmp_path.joinpath("clone"))]
+    )
+
+    assert result.ok
+    assert cache.mirrors() == [cache.path(url)]
+    assert not tmp_path.joinpath(
+        "clone", ".git", "objects", "info", "alternates"
+    ).exists()
+    # Released once the clone finished
+    cache.max_size = 0
+    assert cache.evict() == [cache.path(url)]
+
+
+@requires_git
+def test_clone_engine_skips_mirrors_for_cheap_modes(tmp_path: Path) -> None:
+    url = make_source(tmp_path, "project")
+    cache = MirrorCache(root=tmp_path.joinpath("mirrors"))
+    engine = CloneEngine(mirrors=cache)
+
+    (result,) = engine.run(
+        [
+            CloneJob(
+                name="project",
+                url=url,
+                dest=tmp_path.joinpath("clone"),
+                options=("--depth", "1"),
+            )
+        ]
+    )
+
+    assert result.ok
+    assert cache.mirrors() == []
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+from pytoil.api import AsyncPaginator, Paginator
+
+
+def make_pages(*pages: list[int]) -> list[dict[str, Any]]:
+    """
+    Build a list of connection objects, one per page of node ids.
+    """
+    connections: list[dict[str, Any]] = []
+    for index, ids in enumerate(pages):
+        last = index == len(pages) - 1
+        connections.append(
+            {
+                "totalCount": sum(len(page) for page in pages),
+                "pageInfo": {
+                    "hasNextPage": not last,
+                    "endCursor": None if last else f"cursor{index}",
+                },
+                "nodes": [{"id": id_} for id_ in ids],
+            }
+        )
+    return connections
+
+
+class FakeConnection:
+    def __init__(self, connections: list[dict[str, Any]]) -> None:
+        self.connections = connections
+        self.calls: list[dict[str, Any]] = []
+
+    def fetch(self, variables: dict[str, Any]) -> dict[str, Any]:
+        self.calls.append(variables)
+        return self.connections[len(self.calls) - 1]
+
+    async def afetch(self, variables: dict[str, Any]) -> dict[str, Any]:
+        return self.fetch(variables)
+
+
+def test_paginator_walks_every_page() -> None:
+    conn = FakeConnection(make_pages([1, 2], [3, 4], [5]))
+
+    paginator = Paginator(fetch=conn.fetch, page_size=2)
+
+    assert [node["id"] for node in paginator] == [1, 2, 3, 4, 5]
+    assert paginator.total == 5
+    assert conn.calls == [
+        {"limit": 2, "after": None},
+        {"limit": 2, "after": "cursor0"},
+        {"limit": 2, "after": "cursor1"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("limit", "want_ids", "want_calls"),
+    [
+        (1, [1], [{"limit": 1, "after": None}]),
+        (2, [1, 2], [{"limit": 2, "after": None}]),
+        (
+            3,
+            [1, 2, 3],
+            [{"limit": 2, "after": None}, {"limit": 1, "after": "cursor0"}],
+        ),
+        (0, [], []),
+    ],
+)
+def test_paginator_stops_at_limit(
+    limit: int, want_ids: list[int], want_calls: list[dict[str, Any]]
+) -> None:
+    conn = FakeConnection(make_pages([1, 2], [3, 4], [5]))
+
+    paginator = Paginator(fetch=conn.fetch, limit=limit, page_size=2)
+
+    assert [node["id"] for node in paginator] == want_ids
+    assert conn.calls == want_calls
+
+
+def test_paginator_only_fetches_what_is_consumed() -> None:
+    conn = FakeConnection(make_pages([1, 2], [3, 4], [5]))
+
+    for node in Paginator(fetch=conn.fetch, page_size=2):
+        if node["id"] == 2:
+            break
+
+    assert len(conn.calls) == 1
+
+
+def test_paginator_without_page_info_is_a_single_page() -> None:
+    conn = FakeConnection([{"nodes": [{"id": 1}, {"id": 2}]}])
+
+    paginator = Paginator(fetch=conn.fetch)
+
+    assert [node["id"] for node in paginator] == [1, 2]
+    assert paginator.total is None
+
+
+def test_async_paginator_walks_every_page() -> None:
+    conn = FakeConnection(make_pages([1, 2], [3]))
+
+    async def collect() -> list[int]:
+        return [node["id"] async for node in AsyncPaginator(conn.afetch, page_size=2)]
+
+    assert asyncio.run(collect()) == [1, 2, 3]
+    assert len(conn.calls) == 2
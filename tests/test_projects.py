@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from pytoil.config import Config
+from pytoil.projects import LocalProjects, Project
+from pytoil.projects.scan import ProjectEntry, scan
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from pytest_mock import MockerFixture
+
+
+@pytest.fixture()
+def projects_dir(tmp_path: Path) -> Path:
+    root = tmp_path.joinpath("projects")
+    root.mkdir()
+    for name in ("pytoil", "Another", "gitproject"):
+        root.joinpath(name).mkdir()
+
+    root.joinpath("pytoil", "requirements.txt").touch()
+    root.joinpath("gitproject", ".git").mkdir()
+    root.joinpath("gitproject", ".git", "HEAD").write_text(
+        "ref: refs/heads/main\n", encoding="utf-8"
+    )
+
+    # Neither of these are projects
+    root.joinpath(".hidden").mkdir()
+    root.joinpath("notes.txt").touch()
+    return root
+
+
+@pytest.fixture()
+def index(tmp_path: Path) -> Path:
+    return tmp_path.joinpath("cache", "projects.sqlite3")
+
+
+def symlink_project(root: Path, target: Path, name: str) -> None:
+    target.mkdir()
+    try:
+        root.joinpath(name).symlink_to(target, target_is_directory=True)
+    except OSError:  # pragma: no cover
+        pytest.skip("Symlinks not supported here")
+
+
+def bump_mtime(path: Path) -> None:
+    # Filesystem timestamps can be coarse, make sure the change is visible
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def inspected(exists: MagicMock) -> set[str]:
+    """
+    The projects a scan looked inside, given a spy on Path.exists.
+    """
+    return {
+        call.args[0].parent.name
+        for call in exists.call_args_list
+        if call.args[0].name == ".git"
+    }
+
+
+def test_lists_project_directories(projects_dir: Path, index: Path) -> None:
+    projects = LocalProjects(Config(projects_dir=projects_dir), index=index)
+
+    assert projects.names() == {"pytoil", "Another", "gitproject"}
+    assert [p.name for p in projects.projects()] == ["Another", "gitproject", "pytoil"]
+    assert len(projects) == 3
+    assert "pytoil" in projects
+    assert ".hidden" not in projects
+    assert "notes.txt" not in projects
+
+
+def test_records_project_metadata(projects_dir: Path, index: Path) -> None:
+    projects = LocalProjects(Config(projects_dir=projects_dir), index=index)
+
+    pytoil = projects.get("pytoil")
+    git_project = projects.get("gitproject")
+
+    assert pytoil is not None
+    assert pytoil.path == projects_dir.joinpath("pytoil")
+    assert pytoil.env is None
+    assert not pytoil.env_detected
+    assert pytoil.is_git is False
+    assert pytoil.modified == pytest.approx(
+        projects_dir.joinpath("pytoil").stat().st_mtime
+    )
+
+    assert git_project is not None
+    assert git_project.is_git is True
+
+    assert projects.get("missing") is None
+
+
+def test_environments_are_detected_lazily(
+    projects_dir: Path, index: Path, mocker: MockerFixture
+) -> None:
+    config = Config(projects_dir=projects_dir)
+    detect = mocker.spy(LocalProjects, "_detect_env")
+
+    projects = LocalProjects(config, index=index)
+    assert projects.names() == {"pytoil", "Another", "gitproject"}
+    detect.assert_not_called()
+
+    assert projects.environments(["pytoil", "gitproject", "missing"]) == {
+        "pytoil": "requirements file",
+        "gitproject": None,
+    }
+    assert detect.call_count == 2
+
+    # Saved to the index, so only the one not asked for yet is detected
+    again = LocalProjects(config, index=index)
+    assert set(again.environments()) == {"pytoil", "Another", "gitproject"}
+    assert [call.args[1] for call in detect.call_args_list[2:]] == ["Another"]
+
+    pytoil = again.get("pytoil")
+    assert pytoil is not None
+    assert pytoil.env == "requirements file"
+    assert pytoil.env_detected
+
+
+def test_changed_projects_are_detected_again(
+    projects_dir: Path, index: Path, mocker: MockerFixture
+) -> None:
+    config = Config(projects_dir=projects_dir)
+    LocalProjects(config, index=index).environments()
+
+    projects_dir.joinpath("gitproject", "requirements.txt").touch()
+    bump_mtime(projects_dir.joinpath("gitproject"))
+    bump_mtime(projects_dir)
+
+    detect = mocker.spy(LocalProjects, "_detect_env")
+    environments = LocalProjects(config, index=index).environments()
+
+    assert environments["gitproject"] == "requirements file"
+    assert [call.args[1] for call in detect.call_args_list] == ["gitproject"]
+
+
+def test_index_is_reused_when_directory_unchanged(
+    projects_dir: Path, index: Path, mocker: MockerFixture
+) -> None:
+    config = Config(projects_dir=projects_dir)
+    first = LocalProjects(config, index=index).projects()
+
+    scan = mocker.patch.object(LocalProjects, "_scan", autospec=True)
+    second = LocalProjects(config, index=index).projects()
+
+    scan.assert_not_called()
+    assert second == first
+
+
+def test_only_new_projects_are_inspected(
+    projects_dir: Path, index: Path, mocker: MockerFixture
+) -> None:
+    config = Config(projects_dir=projects_dir)
+    LocalProjects(config, index=index).names()
+
+    projects_dir.joinpath("new").mkdir()
+    bump_mtime(projects_dir)
+
+    exists = mocker.spy(Path, "exists")
+    projects = LocalProjects(config, index=index)
+
+    assert "new" in projects
+    assert inspected(exists) == {"new"}
+
+
+def test_removed_projects_are_dropped(projects_dir: Path, index: Path) -> None:
+    config = Config(projects_dir=projects_dir)
+    LocalProjects(config, index=index).names()
+
+    projects_dir.joinpath("Another").rmdir()
+    bump_mtime(projects_dir)
+
+    assert LocalProjects(config, index=index).names() == {"pytoil", "gitproject"}
+
+
+def test_refresh_rescans_everything(
+    projects_dir: Path, index: Path, mocker: MockerFixture
+) -> None:
+    config = Config(projects_dir=projects_dir)
+    LocalProjects(config, index=index).names()
+
+    exists = mocker.spy(Path, "exists")
+    LocalProjects(config, index=index, refresh=True).names()
+
+    assert inspected(exists) == {"pytoil", "Another", "gitproject"}
+
+
+def test_works_without_an_index(projects_dir: Path) -> None:
+    projects = LocalProjects(Config(projects_dir=projects_dir), index=None)
+
+    assert projects.names() == {"pytoil", "Another", "gitproject"}
+
+
+def test_unusable_cache_dir_falls_back_to_scanning(
+    projects_dir: Path, tmp_path: Path
+) -> None:
+    # A file where the cache directory should be, so it can't be created
+    tmp_path.joinpath("cache").write_text("", encoding="utf-8")
+    projects = LocalProjects(
+        Config(projects_dir=projects_dir), index=tmp_path.joinpath("cache", "index")
+    )
+
+    assert projects.names() == {"pytoil", "Another", "gitproject"}
+    assert projects.environments() == {
+        "pytoil": "requirements file",
+        "Another": None,
+        "gitproject": None,
+    }
+
+
+def test_corrupt_index_is_rebuilt(projects_dir: Path, index: Path) -> None:
+    index.parent.mkdir(parents=True)
+    index.write_text("definitely not sqlite", encoding="utf-8")
+    config = Config(projects_dir=projects_dir)
+
+    assert LocalProjects(config, index=index).names() == {
+        "pytoil",
+        "Another",
+        "gitproject",
+    }
+    assert LocalProjects(config, index=index).names() == {
+        "pytoil",
+        "Another",
+        "gitproject",
+    }
+
+
+def test_malformed_pyproject_is_not_fatal(projects_dir: Path, index: Path) -> None:
+    projects_dir.joinpath("Another", "pyproject.toml").write_text(
+        "[not valid", encoding="utf-8"
+    )
+
+    projects = LocalProjects(Config(projects_dir=projects_dir), index=index)
+
+    assert projects.environments(["Another"]) == {"Another": None}
+
+
+def test_project_equality() -> None:
+    project = Project(name="a", path=Path("a"), created=1.0, mtime_ns=1)
+
+    assert project == Project(name="a", path=Path("a"), created=1.0, mtime_ns=1)
+    assert project != Project(name="b", path=Path("b"), created=1.0, mtime_ns=1)
+    assert project != "a"
+
+
+def test_scan(projects_dir: Path) -> None:
+    entries = {entry.name: entry for entry in scan(projects_dir)}
+
+    assert set(entries) == {"pytoil", "Another", "gitproject"}
+
+    pytoil = entries["pytoil"]
+    stat = projects_dir.joinpath("pytoil").stat()
+    assert isinstance(pytoil, ProjectEntry)
+    assert pytoil.to_path() == projects_dir.joinpath("pytoil")
+    assert pytoil.mtime_ns == stat.st_mtime_ns
+    assert pytoil.is_symlink is False
+
+
+def test_scan_symlinks(projects_dir: Path, tmp_path: Path) -> None:
+    symlink_project(projects_dir, tmp_path.joinpath("elsewhere"), "linked")
+    projects_dir.joinpath("dangling").symlink_to(tmp_path.joinpath("missing"))
+
+    followed = {entry.name: entry for entry in scan(projects_dir)}
+    not_followed = {entry.name for entry in scan(projects_dir, follow_symlinks=False)}
+
+    assert "linked" in followed
+    assert followed["linked"].is_symlink is True
+    assert "dangling" not in followed
+    assert not_followed == {"pytoil", "Another", "gitproject"}
+
+
+def test_follow_symlinks_change_rebuilds_index(
+    projects_dir: Path, index: Path, tmp_path: Path
+) -> None:
+    symlink_project(projects_dir, tmp_path.joinpath("elsewhere"), "linked")
+
+    assert "linked" in LocalProjects(Config(projects_dir=projects_dir), index=index)
+    assert "linked" not in LocalProjects(
+        Config(projects_dir=projects_dir, follow_symlinks=False), index=index
+    )
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import random
+
+import httpx
+import pytest
+from pytoil.api.ratelimit import RateLimiter
+
+NOW = 1_700_000_000.0
+
+
+def make_limiter(**kwargs: float) -> RateLimiter:
+    return RateLimiter(clock=lambda: NOW, rng=random.Random(1), **kwargs)  # type: ignore[arg-type]
+
+
+def test_update_reads_headers() -> None:
+    limiter = make_limiter()
+    response = httpx.Response(
+        200,
+        headers={
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "4999",
+            "X-RateLimit-Reset": str(int(NOW + 3600)),
+        },
+    )
+
+    limiter.update(response)
+
+    assert limiter.limit == 5000
+    assert limiter.remaining == 4999
+    assert limiter.reset_at == NOW + 3600
+
+
+def test_update_ignores_missing_headers() -> None:
+    limiter = make_limiter()
+
+    limiter.update(httpx.Response(200))
+
+    assert limiter.remaining is None
+    assert limiter.reset_at is None
+
+
+def test_update_graphql() -> None:
+    limiter = make_limiter()
+
+    limiter.update_graphql(
+        {
+            "data": {
+                "rateLimit": {
+                    "cost": 2,
+                    "remaining": 4321,
+                    "resetAt": "2023-11-14T22:13:20Z",
+                }
+            }
+        }
+    )
+
+    assert limiter.cost == 2
+    assert limiter.remaining == 4321
+    assert limiter.reset_at == NOW
+
+
+def test_update_graphql_without_rate_limit() -> None:
+    limiter = make_limiter()
+
+    limiter.update_graphql({"data": {"repository": None}})
+    limiter.update_graphql({"errors": []})
+
+    assert limiter.remaining is None
+
+
+@pytest.mark.parametrize(
+    ("remaining", "want"),
+    [
+        (None, 0.0),
+        (4000, 0.0),
+        (50, 0.0),
+        (10, 6.0),
+        (1, 60.0),
+        (0, 60.0),
+    ],
+)
+def test_delay_paces_low_budget(remaining: int | None, want: float) -> None:
+    limiter = make_limiter(max_delay=60)
+    limiter.remaining = remaining
+    limiter.reset_at = NOW + 60
+
+    assert limiter.delay() == want
+
+
+def test_delay_doesnt_wait_for_distant_reset() -> None:
+    limiter = make_limiter(max_delay=60)
+    limiter.remaining = 0
+    limiter.reset_at = NOW + 3600
+
+    assert limiter.delay() == 0
+
+
+def test_delay_after_reset_is_zero() -> None:
+    limiter = make_limiter()
+    limiter.remaining = 0
+    limiter.reset_at = NOW - 10
+
+    assert limiter.delay() == 0
+
+
+@pytest.mark.parametrize(
+    ("response", "want"),
+    [
+        (httpx.Response(429), True),
+        (httpx.Response(403, headers={"Retry-After": "1"}), True),
+        (httpx.Response(403, headers={"X-RateLimit-Remaining": "0"}), True),
+        (httpx.Response(403), False),
+        (httpx.Response(502), False),
+        (httpx.Response(200), False),
+    ],
+)
+def test_is_throttled(response: httpx.Response, want: bool) -> None:
+    assert make_limiter().is_throttled(response) is want
+
+
+@pytest.mark.parametrize(
+    ("status", "idempotent", "want"),
+    [
+        (200, True, False),
+        (401, True, False),
+        (403, True, False),
+        (404, True, False),
+        (429, True, True),
+        (429, False, True),
+        (502, True, True),
+        (502, False, False),
+        (503, True, True),
+        (504, True, True),
+    ],
+)
+def test_should_retry(status: int, idempotent: bool, want: bool) -> None:
+    limiter = make_limiter()
+
+    assert (
+        limiter.should_retry(httpx.Response(status), attempt=0, idempotent=idempotent)
+        is want
+    )
+
+
+def test_should_retry_gives_up_after_retries() -> None:
+    limiter = make_limiter(retries=2)
+
+    assert limiter.should_retry(httpx.Response(502), attempt=1)
+    assert not limiter.should_retry(httpx.Response(502), attempt=2)
+
+
+def test_should_not_wait_for_distant_reset() -> None:
+    limiter = make_limiter(max_delay=60)
+    limiter.reset_at = NOW + 3600
+    response = httpx.Response(403, headers={"X-RateLimit-Remaining": "0"})
+
+    assert not limiter.should_retry(response, attempt=0)
+
+
+def test_backoff_honours_retry_after() -> None:
+    limiter = make_limiter(max_delay=60)
+
+    assert (
+        limiter.backoff_delay(0, httpx.Response(429, headers={"Retry-After": "7"})) == 7
+    )
+    assert (
+        limiter.backoff_delay(0, httpx.Response(429, headers={"Retry-After": "600"}))
+        == 60
+    )
+
+
+def test_backoff_waits_for_reset_when_throttled() -> None:
+    limiter = make_limiter()
+    limiter.reset_at = NOW + 12
+
+    assert limiter.backoff_delay(0, httpx.Response(429)) == 12
+
+
+def test_backoff_is_jittered_exponential() -> None:
+    limiter = make_limiter(backoff=1, max_delay=60)
+
+    for attempt in range(10):
+        delay = limiter.backoff_delay(attempt, httpx.Response(502))
+        assert 0 <= delay <= min(2**attempt, 60)
+
+    delays = {limiter.backoff_delay(3) for _ in range(10)}
+    assert len(delays) > 1
@@ -10,6 +10,7 @@ from pytest_mock import MockerFixture
 from pytoil.api import API
 from pytoil.config import Config
 from pytoil.environments import Conda, Flit, Poetry, Requirements, Venv
+from pytoil.exceptions import RepoNotFoundError
 from pytoil.repo import Repo
 
 PROJECT_ROOT = Path(__file__).parent.parent.resolve()
@@ -112,6 +113,63 @@ def test_remote_info_returns_correct_details(
     }
 
 
+@freeze_time("2022-01-22 09:00")
+def test_info_makes_a_single_request_when_remote(
+    httpx_mock: HTTPXMock, fake_repo_info_response: dict[str, Any]
+) -> None:
+    api = API(username="me", token="something")
+    repo = Repo(owner="me", name="pytoil", local_path=Path("not/here"))
+
+    httpx_mock.add_response(url=api.url, json=fake_repo_info_response, status_code=200)
+
+    info = repo.info(api)
+
+    assert info["Name"] == "pytoil"
+    assert info["Remote"] is True
+    assert info["Local"] is False
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_info_makes_a_single_request_when_local_only(
+    httpx_mock: HTTPXMock,
+    fake_repo_exists_false_response: dict[str, Any],
+    mocker: MockerFixture,
+) -> None:
+    api = API(username="me", token="something")
+    repo = Repo(owner="me", name="test", local_path=PROJECT_ROOT)
+
+    mocker.patch(
+        "pytoil.repo.Repo._local_info",
+        autospec=True,
+        return_value={"Name": "test", "Local": True},
+    )
+
+    httpx_mock.add_response(
+        url=api.url, json=fake_repo_exists_false_response, status_code=200
+    )
+
+    info = repo.info(api)
+
+    assert info == {"Name": "test", "Local": True, "Remote": False}
+    assert len(httpx_mock.get_requests()) == 1
+
+
+def test_info_raises_when_missing_everywhere(
+    httpx_mock: HTTPXMock, fake_repo_exists_false_response: dict[str, Any]
+) -> None:
+    api = API(username="me", token="something")
+    repo = Repo(owner="me", name="test", local_path=Path("not/here"))
+
+    httpx_mock.add_response(
+        url=api.url, json=fake_repo_exists_false_response, status_code=200
+    )
+
+    with pytest.raises(RepoNotFoundError):
+        repo.info(api)
+
+    assert len(httpx_mock.get_requests()) == 1
+
+
 @pytest.mark.parametrize(
     ("file", "exists"),
     [
@@ -394,3 +452,16 @@ def test_dispatch_env_returns_none_if_it_cant_detect(mocker: MockerFixture) -> N
     env = repo.dispatch_env(config=Config())
 
     assert env is None
+
+
+def test_dispatch_env_only_needs_a_valid_installer_for_venvs(
+    fake_poetry_project: Path, requirements_project: Path
+) -> None:
+    config = Config(installer="pipp")
+
+    poetry = Repo(name="test", owner="me", local_path=fake_poetry_project)
+    requirements = Repo(name="test", owner="me", local_path=requirements_project)
+
+    assert isinstance(poetry.dispatch_env(config=config), Poetry)
+    with pytest.raises(ValueError, match="Unknown installer 'pipp'"):
+        requirements.dispatch_env(config=config)
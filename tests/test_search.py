@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from pytoil.cli.picker import IndexCompleter
+from pytoil.search import MatchCache, Matcher, NameIndex
+from pytoil.search.index import trigrams
+from pytoil.search.matcher import MAX_CACHED_QUERIES, normalise
+
+NAMES = {
+    "pytoil",
+    "pytoil-docs",
+    "my_project",
+    "another-project",
+    "dotfiles",
+    "rust-playground",
+}
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("pytoil", "pytoil"),
+        ("My_Project", "my project"),
+        ("  some-thing!  ", "some thing"),
+    ],
+)
+def test_normalise(name: str, expected: str) -> None:
+    assert normalise(name) == expected
+
+
+def test_extract() -> None:
+    matcher = Matcher(NAMES)
+
+    matches = matcher.extract("pytoil", limit=2)
+
+    assert [name for name, _ in matches] == ["pytoil", "pytoil-docs"]
+    assert matches[0][1] == 100
+    assert matches[0][1] >= matches[1][1]
+
+
+def test_extract_ignores_case_and_punctuation() -> None:
+    matcher = Matcher(NAMES)
+
+    assert matcher.extract("MY-PROJECT", limit=1) == [("my_project", 100)]
+
+
+def test_extract_respects_cutoff() -> None:
+    matcher = Matcher(NAMES)
+
+    assert matcher.extract("dingledangledongle") == []
+    assert all(score >= 90 for _, score in matcher.extract("project", score_cutoff=90))
+
+
+def test_best() -> None:
+    matcher = Matcher(NAMES)
+
+    assert matcher.best("dotfile") is not None
+    assert matcher.best("dotfile")[0] == "dotfiles"  # type: ignore[index]
+    assert matcher.best("dingledangledongle") is None
+
+
+def test_fingerprint_follows_names() -> None:
+    assert Matcher(NAMES).fingerprint == Matcher(sorted(NAMES)).fingerprint
+    assert Matcher(NAMES).fingerprint != Matcher(NAMES | {"new"}).fingerprint
+
+
+def test_cache_round_trip(tmp_path: Path) -> None:
+    cache = MatchCache(tmp_path.joinpath("matches.json"))
+    expected = Matcher(NAMES, cache=cache).extract("pytoil")
+
+    # A cache hit doesn't score (or even normalise) anything
+    matcher = Matcher(NAMES, cache=cache)
+    assert matcher.extract("pytoil") == expected
+    assert matcher._normalised is None
+
+
+def test_cache_is_dropped_when_names_change(tmp_path: Path) -> None:
+    cache = MatchCache(tmp_path.joinpath("matches.json"))
+    old = Matcher(NAMES, cache=cache)
+    old.extract("pytoil")
+
+    new = Matcher(NAMES | {"pytoil-2"}, cache=cache)
+
+    assert cache.load(new.fingerprint, '["pytoil", 5, 75]') is None
+    assert "pytoil-2" in [name for name, _ in new.extract("pytoil")]
+    assert cache.load(old.fingerprint, '["pytoil", 5, 75]') is None
+
+
+def test_cache_is_bounded(tmp_path: Path) -> None:
+    cache = MatchCache(tmp_path.joinpath("matches.json"))
+    for i in range(MAX_CACHED_QUERIES + 1):
+        cache.store("fingerprint", str(i), [])
+
+    assert cache.load("fingerprint", "0") is None
+    assert cache.load("fingerprint", str(MAX_CACHED_QUERIES)) == []
+
+
+def test_corrupt_cache_is_ignored(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("matches.json")
+    path.write_text("not json")
+    cache = MatchCache(path)
+
+    assert Matcher(NAMES, cache=cache).extract("pytoil", limit=1) == [("pytoil", 100)]
+    assert Matcher(NAMES, cache=cache).extract("pytoil", limit=1) == [("pytoil", 100)]
+
+
+def test_clear(tmp_path: Path) -> None:
+    cache = MatchCache(tmp_path.joinpath("matches.json"))
+    cache.store("fingerprint", "key", [])
+
+    cache.clear()
+    cache.clear()
+
+    assert not cache.path.exists()
+
+
+def test_matcher_repr() -> None:
+    assert repr(Matcher(NAMES)) == "Matcher(choices=<6 names>, cache=None)"
+
+
+def test_trigrams() -> None:
+    assert trigrams("pytoil") == {"pyt", "yto", "toi", "oil"}
+    assert trigrams("py") == set()
+
+
+def test_index_contains() -> None:
+    index = NameIndex(NAMES)
+
+    assert len(index) == len(NAMES)
+    assert "pytoil" in index
+    assert "pytoi" not in index
+    assert 1 not in index
+
+
+def test_index_empty_query_lists_everything() -> None:
+    index = NameIndex(NAMES)
+
+    assert index.search("") == sorted(NAMES)
+    assert index.search("", limit=2) == sorted(NAMES)[:2]
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        # Whole name prefixes
+        ("py", ["pytoil", "pytoil-docs"]),
+        ("PY-TO", ["pytoil", "pytoil-docs"]),
+        # Separators don't matter
+        ("myproj", ["my_project"]),
+        # Later words, after whole name prefixes
+        ("pro", ["another-project", "my_project"]),
+        ("d", ["dotfiles", "pytoil-docs"]),
+        # Anywhere in the name
+        ("ground", ["rust-playground"]),
+        ("oject", ["another-project", "my_project"]),
+        # Typos, only when nothing else matches
+        ("dotfilez", ["dotfiles"]),
+        ("dingledangledongle", []),
+    ],
+)
+def test_index_search(query: str, expected: list[str]) -> None:
+    assert NameIndex(NAMES).search(query) == expected
+
+
+def test_index_search_limit() -> None:
+    index = NameIndex(f"project-{i}" for i in range(100))
+
+    assert index.search("project", limit=3) == ["project-0", "project-1", "project-10"]
+    assert index.search("roject", limit=3) == ["project-0", "project-1", "project-10"]
+
+
+def test_index_completer() -> None:
+    completer = IndexCompleter(NameIndex(NAMES), local={"pytoil"})
+
+    completions = list(
+        completer.get_completions(Document("pyto"), CompleteEvent(text_inserted=True))
+    )
+
+    assert [c.text for c in completions] == ["pytoil", "pytoil-docs"]
+    assert [c.display_meta_text for c in completions] == ["Local", "Remote"]
+    assert all(c.start_position == -4 for c in completions)
+
+
+def test_index_builds_trigrams_lazily() -> None:
+    index = NameIndex(NAMES)
+
+    index.search("py")
+    built = index._trigrams
+    assert built is None
+
+    index.search("toil")
+    built = index._trigrams
+    assert built is not None
+    assert index.warm() is built
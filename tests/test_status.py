@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from pytoil.git import Git, RepoStatus
+from pytoil.git.status import collect, parse_status, repo_status
+
+from tests.git_sources import commit, git, make_source, push_commit, requires_git
+
+PORCELAIN = """\
+# branch.oid 3f1c8ad8f0b6d5b6a4c6a51e3d2f3b1a2c3d4e5f
+# branch.head main
+# branch.upstream origin/main
+# branch.ab +2 -3
+# stash 4
+1 M. N... 100644 100644 100644 1111111 2222222 staged.py
+1 .M N... 100644 100644 100644 1111111 1111111 modified.py
+1 MM N... 100644 100644 100644 1111111 2222222 both.py
+2 R. N... 100644 100644 100644 1111111 1111111 R100 new.py\told.py
+u UU N... 100644 100644 100644 100644 1111111 2222222 3333333 conflict.py
+? untracked.py
+? other.txt
+! ignored.pyc
+"""
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    """
+    A clone of a source repo that's since had a commit pushed to it.
+    """
+    url = make_source(tmp_path, "project")
+    dest = tmp_path.joinpath("projects", "project")
+    git("clone", "-q", url, str(dest), cwd=tmp_path)
+    push_commit(tmp_path, "project", "new.txt")
+    git("fetch", "-q", cwd=dest)
+    return dest
+
+
+def test_parse_status() -> None:
+    status = parse_status("project", Path("project"), PORCELAIN)
+
+    assert status.branch == "main"
+    assert status.upstream == "origin/main"
+    assert (status.ahead, status.behind) == (2, 3)
+    assert status.stashes == 4
+    assert status.staged == 3
+    assert status.modified == 2
+    assert status.conflicted == 1
+    assert status.untracked == 2
+    assert status.dirty
+    assert not status.clean
+
+
+def test_parse_status_detached_no_upstream() -> None:
+    output = "# branch.oid 3f1c8ad\n# branch.head (detached)\n"
+    status = parse_status("project", Path("project"), output)
+
+    assert status.branch is None
+    assert status.upstream is None
+    assert (status.ahead, status.behind) == (0, 0)
+    assert status.clean
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "dirty", "clean"),
+    [
+        ({}, False, True),
+        ({"untracked": 1}, False, False),
+        ({"stashes": 1}, False, False),
+        ({"behind": 1}, False, False),
+        ({"staged": 1}, True, False),
+        ({"conflicted": 1}, True, False),
+        ({"error": "Not a git repo"}, False, False),
+    ],
+)
+def test_repo_status_properties(
+    kwargs: dict[str, int | str], dirty: bool, clean: bool
+) -> None:
+    status = RepoStatus("project", Path("project"), **kwargs)  # type: ignore[arg-type]
+    assert status.dirty is dirty
+    assert status.clean is clean
+
+
+@requires_git
+def test_repo_status(project: Path) -> None:
+    project.joinpath("README.md").write_text("Stashed\n", encoding="utf-8")
+    git("stash", "-q", cwd=project)
+    project.joinpath("README.md").write_text("Changed\n", encoding="utf-8")
+    project.joinpath("scratch.txt").write_text("Scratch\n", encoding="utf-8")
+    project.joinpath("mine.txt").write_text("Mine\n", encoding="utf-8")
+    git("add", "mine.txt", cwd=project)
+
+    status = repo_status(Git(), "project", project)
+
+    assert not status.error
+    assert status.branch in {"main", "master"}
+    assert status.upstream == f"origin/{status.branch}"
+    assert (status.ahead, status.behind) == (0, 1)
+    assert (status.staged, status.modified, status.untracked) == (1, 1, 1)
+    assert status.stashes == 1
+    assert status.last_commit is not None
+    assert datetime.now(tz=timezone.utc) - status.last_commit < timedelta(minutes=5)
+
+
+@requires_git
+def test_repo_status_fsmonitor(project: Path) -> None:
+    plain_status = repo_status(Git(), "project", project)
+    fsmonitor_status = repo_status(Git(), "project", project, fsmonitor=True)
+    assert repr(fsmonitor_status) == repr(plain_status)
+
+
+@requires_git
+def test_repo_status_no_commits(tmp_path: Path) -> None:
+    git("init", "-q", cwd=tmp_path)
+    status = repo_status(Git(), "project", tmp_path)
+
+    assert not status.error
+    assert status.last_commit is None
+
+
+@requires_git
+def test_repo_status_not_a_repo(tmp_path: Path) -> None:
+    status = repo_status(Git(), "project", tmp_path)
+    assert status.error == "Not a git repo"
+    assert not status.clean
+
+
+@requires_git
+def test_collect(project: Path, tmp_path: Path) -> None:
+    other = tmp_path.joinpath("projects", "other")
+    other.mkdir()
+    git("init", "-q", cwd=other)
+    other.joinpath("file.txt").write_text("File\n", encoding="utf-8")
+    commit(other, "Initial")
+
+    results = {
+        status.name: status
+        for status in collect([("project", project), ("other", other)], concurrency=2)
+    }
+
+    assert sorted(results) == ["other", "project"]
+    assert results["project"].behind == 1
+    assert results["other"].clean
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pytoil.git import Git, SyncEngine, SyncResult
+from pytoil.git import sync as outcomes
+from pytoil.git.sync import sync_project
+
+from tests.git_sources import commit, git, make_source, push_commit, requires_git
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    """
+    A clone of a source repo that's since had a commit pushed to it.
+    """
+    url = make_source(tmp_path, "project")
+    dest = tmp_path.joinpath("projects", "project")
+    git("clone", "-q", url, str(dest), cwd=tmp_path)
+    push_commit(tmp_path, "project", "new.txt")
+    return dest
+
+
+@pytest.mark.parametrize(
+    ("outcome", "ok", "skipped"),
+    [
+        (outcomes.UPDATED, True, False),
+        (outcomes.UP_TO_DATE, True, False),
+        (outcomes.AHEAD, True, False),
+        (outcomes.DIVERGED, True, True),
+        (outcomes.DIRTY, True, True),
+        (outcomes.NO_UPSTREAM, True, True),
+        (outcomes.NOT_A_REPO, True, True),
+        (outcomes.FAILED, False, False),
+        (outcomes.CANCELLED, False, False),
+    ],
+)
+def test_sync_result(outcome: str, ok: bool, skipped: bool) -> None:
+    result = SyncResult(name="project", path=Path("project"), outcome=outcome)
+    assert result.ok is ok
+    assert result.skipped is skipped
+
+
+@requires_git
+def test_sync_fast_forwards(project: Path) -> None:
+    result = sync_project(Git(), "project", project)
+
+    assert result.outcome == outcomes.UPDATED
+    assert result.commits == 1
+    assert result.duration > 0
+    assert project.joinpath("new.txt").exists()
+
+
+@requires_git
+def test_sync_up_to_date(project: Path) -> None:
+    sync_project(Git(), "project", project)
+    assert sync_project(Git(), "project", project).outcome == outcomes.UP_TO_DATE
+
+
+@requires_git
+def test_sync_ahead(project: Path) -> None:
+    sync_project(Git(), "project", project)
+    project.joinpath("mine.txt").write_text("mine\n", encoding="utf-8")
+    commit(project, "Mine")
+
+    result = sync_project(Git(), "project", project)
+
+    assert result.outcome == outcomes.AHEAD
+    assert result.detail == "1 commit(s) to push"
+
+
+@requires_git
+def test_sync_skips_dirty(project: Path) -> None:
+    project.joinpath("README.md").write_text("Changed\n", encoding="utf-8")
+
+    result = sync_project(Git(), "project", project)
+
+    assert result.outcome == outcomes.DIRTY
+    assert not project.joinpath("new.txt").exists()
+    # But it was still fetched
+    assert Git().ahead_behind(project) == (0, 1)
+
+
+@requires_git
+def test_sync_untracked_files_dont_block(project: Path) -> None:
+    project.joinpath("scratch.txt").write_text("Scratch\n", encoding="utf-8")
+    assert sync_project(Git(), "project", project).outcome == outcomes.UPDATED
+
+
+@requires_git
+def test_sync_skips_diverged(project: Path) -> None:
+    project.joinpath("mine.txt").write_text("mine\n", encoding="utf-8")
+    commit(project, "Mine")
+
+    result = sync_project(Git(), "project", project)
+
+    assert result.outcome == outcomes.DIVERGED
+    assert not project.joinpath("new.txt").exists()
+
+
+@requires_git
+def test_sync_detached_head(project: Path) -> None:
+    git("checkout", "-q", "--detach", cwd=project)
+    assert sync_project(Git(), "project", project).outcome == outcomes.NO_UPSTREAM
+
+
+@requires_git
+def test_sync_not_a_repo(tmp_path: Path) -> None:
+    result = sync_project(Git(), "project", tmp_path)
+    assert result.outcome == outcomes.NOT_A_REPO
+
+
+@requires_git
+def test_sync_fetch_fails(project: Path, tmp_path: Path) -> None:
+    missing = tmp_path.joinpath("missing.git").as_uri()
+    git("remote", "set-url", "origin", missing, cwd=project)
+
+    result = sync_project(Git(), "project", project)
+
+    assert result.outcome == outcomes.FAILED
+    assert result.detail.startswith("fatal:")
+
+
+@requires_git
+def test_sync_engine(project: Path, tmp_path: Path) -> None:
+    not_a_repo = tmp_path.joinpath("projects", "not_a_repo")
+    not_a_repo.mkdir()
+    done: list[str] = []
+
+    engine = SyncEngine(concurrency=2, on_done=lambda result: done.append(result.name))
+    results = engine.run([("project", project), ("not_a_repo", not_a_repo)])
+
+    assert [result.name for result in results] == ["project", "not_a_repo"]
+    assert [result.outcome for result in results] == [
+        outcomes.UPDATED,
+        outcomes.NOT_A_REPO,
+    ]
+    assert sorted(done) == ["not_a_repo", "project"]
+    assert not engine.cancelled
+
+
+@requires_git
+def test_sync_engine_survives_errors(project: Path, tmp_path: Path) -> None:
+    done: list[SyncResult] = []
+    engine = SyncEngine(
+        git=Git(str(tmp_path.joinpath("not-git"))), concurrency=2, on_done=done.append
+    )
+
+    results = engine.run([("one", project), ("two", project)])
+
+    assert [result.outcome for result in results] == [outcomes.FAILED] * 2
+    assert results[0].detail.startswith("error: [Errno")
+    assert len(done) == 2
+    assert not engine.cancelled
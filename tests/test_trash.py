@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from pytoil.projects.scan import scan
+from pytoil.projects.trash import (
+    PURGING,
+    TRASH_DIR,
+    Trash,
+    TrashEntry,
+    batch_time,
+    main,
+)
+
+
+@pytest.fixture()
+def projects_dir(tmp_path: Path) -> Path:
+    """
+    A projects directory with a few projects in it, one with a .venv.
+    """
+    root = tmp_path.joinpath("projects")
+    for name in ("project1", "project2", "project3"):
+        root.joinpath(name, "src").mkdir(parents=True)
+        root.joinpath(name, "src", "main.py").write_text("print('hello')\n")
+    site_packages = root.joinpath("project1", ".venv", "lib", "site-packages")
+    site_packages.mkdir(parents=True)
+    for i in range(20):
+        site_packages.joinpath(f"module{i}.py").write_text("x = 1\n")
+    return root
+
+
+def test_batch_time() -> None:
+    assert batch_time("1700000000000000000-123") == 1_700_000_000.0
+    assert batch_time("nonsense") == 0.0
+
+
+def test_move(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    start = time.time()
+
+    moved, failed = trash.move(["project1", "project2"])
+
+    assert failed == []
+    assert [entry.name for entry in moved] == ["project1", "project2"]
+    assert not projects_dir.joinpath("project1").exists()
+    assert not projects_dir.joinpath("project2").exists()
+    assert all(entry.path.joinpath("src", "main.py").exists() for entry in moved)
+    assert moved[0].trashed == pytest.approx(start, abs=5)
+    # The trash itself is never mistaken for a project
+    assert [entry.name for entry in scan(projects_dir)] == ["project3"]
+
+
+def test_move_reports_failures(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+
+    moved, failed = trash.move(["missing"])
+
+    assert moved == []
+    assert [failure.name for failure in failed] == ["missing"]
+    assert failed[0].error
+    # No empty batch left behind
+    assert trash.batches() == []
+
+
+def test_entries_newest_first(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+    trash.move(["project2", "project3"])
+
+    entries = trash.entries()
+
+    assert [entry.name for entry in entries] == ["project2", "project3", "project1"]
+    assert len(trash.batches()) == 2
+    assert trash.entries(trash.batches()[0]) == entries[:2]
+
+
+def test_restore(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    moved, _ = trash.move(["project1", "project2"])
+
+    restored, failed = trash.restore(moved)
+
+    assert failed == []
+    assert restored == [projects_dir / "project1", projects_dir / "project2"]
+    assert projects_dir.joinpath("project1", ".venv").exists()
+    assert trash.entries() == []
+    assert trash.batches() == []
+
+
+def test_restore_wont_overwrite(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    moved, _ = trash.move(["project1"])
+    projects_dir.joinpath("project1").mkdir()
+
+    restored, failed = trash.restore(moved)
+
+    assert restored == []
+    assert [failure.name for failure in failed] == ["project1"]
+    assert "already exists" in failed[0].error
+    assert trash.entries() == moved
+
+
+def test_purge(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1", "project2"])
+    assert trash.size() > 0
+
+    assert trash.purge() == []
+
+    assert trash.entries() == []
+    assert trash.size() == 0
+    assert projects_dir.joinpath("project3").exists()
+
+
+def test_purge_older_than(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+
+    assert trash.purge(older_than=60) == []
+    assert [entry.name for entry in trash.entries()] == ["project1"]
+
+
+def test_purge_skips_claimed_batches(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+    (batch,) = trash.batches()
+    claimed = trash.root.joinpath(f"{PURGING}{batch}-{os.getpid()}")
+    trash.root.joinpath(batch).rename(claimed)
+
+    assert trash.purge() == []
+    assert claimed.joinpath("project1").exists()
+
+
+def test_purge_reclaims_abandoned_batches(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+    trash.move(["project2"])
+    dead, stale = trash.batches()
+    # A worker that has exited, and one whose pid has been reused since
+    exited = subprocess.Popen([sys.executable, "-c", ""])
+    exited.wait()
+    trash.root.joinpath(dead).rename(
+        trash.root.joinpath(f"{PURGING}{dead}-{exited.pid}")
+    )
+    held = trash.root.joinpath(f"{PURGING}{stale}-{os.getpid()}")
+    trash.root.joinpath(stale).rename(held)
+    os.utime(held, (0, 0))
+
+    assert [entry.name for entry in trash.entries()] == ["project2", "project1"]
+    assert trash.purge() == []
+    assert list(trash.root.iterdir()) == []
+
+
+def test_purge_reports_what_rmtree_left_behind(
+    projects_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+
+    # As if rmtree gave up on a directory without calling onexc
+    monkeypatch.setattr(shutil, "rmtree", lambda *_, **__: None)
+    failed = trash.purge()
+    monkeypatch.undo()
+
+    assert [failure.name for failure in failed] == ["project1"]
+    (entry,) = trash.entries()
+    assert entry.name == "project1"
+    assert "Could not be deleted completely" in entry.error
+
+
+def test_purge_reports_failures(
+    projects_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1", "project2"])
+    stuck = "module3.py"
+    unlink = os.unlink
+
+    def fake_unlink(path: str | Path, *args: object, **kwargs: object) -> None:
+        if Path(path).name == stuck:
+            raise PermissionError(13, "Permission denied")
+        unlink(path, *args, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(os, "unlink", fake_unlink)
+    failed = trash.purge()
+    monkeypatch.undo()
+
+    assert {failure.name for failure in failed} == {"project1"}
+    assert any(failure.path.name == stuck for failure in failed)
+    assert failed[0].error == "Permission denied"
+
+    # What's left stays in the trash, saying why
+    (entry,) = trash.entries()
+    assert entry.name == "project1"
+    assert "Permission denied" in entry.error
+
+    # And can be purged again later
+    assert trash.purge() == []
+    assert trash.entries() == []
+
+
+def test_purge_worker(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+
+    assert main([str(projects_dir), "--delay", "0"]) == 0
+    assert trash.entries() == []
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Detaches differently")
+def test_spawn_purge(projects_dir: Path) -> None:
+    trash = Trash(projects_dir)
+    trash.move(["project1"])
+
+    process = trash.spawn_purge(delay=0)
+
+    assert process.wait(timeout=30) == 0
+    assert trash.entries() == []
+    assert projects_dir.joinpath(TRASH_DIR).exists()
+
+
+def test_trash_entry_repr() -> None:
+    entry = TrashEntry(name="project", path=Path("trash/project"), batch="1-2")
+    assert (
+        repr(entry)
+        == f"TrashEntry(name='project', path={Path('trash/project')!r}, batch='1-2',"
+        " error='')"
+    )